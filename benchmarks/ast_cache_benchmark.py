@@ -0,0 +1,44 @@
+"""
+Measures how long it takes to get the tree of a large generated program on a cold start, scanning and parsing
+its source code and writing the tree to the AstCache, and on a warm start, loading the tree from the .mojic file
+an earlier run wrote.
+
+Run from the project root with:
+    python -m benchmarks.ast_cache_benchmark
+"""
+import pathlib
+import tempfile
+
+from mojilang.lexer import Lexer
+from mojilang.mojilang import parse
+from mojilang.parser import AstCache
+from benchmarks.utils.source_generator import generate_lexer_source
+from benchmarks.utils.timing import best_of, print_result
+
+TARGET_CHARACTERS = 200_000
+
+
+def cold_start(ast_cache, source_path, source):
+    abstract_syntax_tree = parse(source, Lexer.REGEX_BACKEND)
+    ast_cache.store(source_path, source, abstract_syntax_tree)
+    return abstract_syntax_tree
+
+
+def run():
+    source = generate_lexer_source(TARGET_CHARACTERS)
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = pathlib.Path(directory) / 'program.moji'
+        source_path.write_text(source)
+        ast_cache = AstCache()
+
+        cold_duration = best_of(lambda: cold_start(ast_cache, source_path, source), repeat=3)
+        warm_duration = best_of(lambda: ast_cache.load(source_path, source), repeat=3)
+        print_result('source size', len(source.encode()), 'bytes')
+        print_result('.mojic size', ast_cache.get_cache_path(source_path).stat().st_size, 'bytes')
+        print_result('cold start (scan, parse and store)', cold_duration * 1000, 'ms')
+        print_result('warm start (load)', warm_duration * 1000, 'ms')
+        print_result('speedup', cold_duration / warm_duration, 'x')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,55 @@
+"""
+Measures how long it takes to run many small programs, starting a new Python process for each of them as a job
+runner calling the CLI does, and running them all in one process with the BatchRunner, the first time they run
+(parsing each program) and the next time (taking each tree from the TreeCache).
+
+Run from the project root with:
+    python -m benchmarks.batch_benchmark
+"""
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+from mojilang.batch import BatchRunner
+from benchmarks.utils.timing import best_of, print_result
+
+PROGRAM_COUNT = 20
+SOURCE_CODE = """
+🛠 square(🥸 n) {{ 🫡 n ✖️ n; }}
+🥸 i ✍️ 0;
+🥸 total ✍️ {seed};
+🔁 (i 👇 10) {{
+    total ✍️ total ➕ 👀 square(i);
+    i ✍️ i ➕ 1;
+}}
+🗣️ total;
+"""
+
+
+def run_processes(paths):
+    for path in paths:
+        subprocess.run(
+            [sys.executable, '-m', 'mojilang.mojilang', str(path), '--no-cache'], check=True, capture_output=True
+        )
+
+
+def run():
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(PROGRAM_COUNT):
+            path = pathlib.Path(directory) / f'program_{index:02}.moji'
+            path.write_text(SOURCE_CODE.format(seed=index))
+            paths.append(path)
+
+        process_duration = best_of(lambda: run_processes(paths), repeat=1)
+        batch_runner = BatchRunner()
+        first_duration = best_of(lambda: batch_runner.run_directory(directory), repeat=1)
+        cached_duration = best_of(lambda: batch_runner.run_directory(directory), repeat=3)
+        print_result(f'{PROGRAM_COUNT} processes', process_duration * 1000, 'ms')
+        print_result(f'BatchRunner, {PROGRAM_COUNT} programs parsed', first_duration * 1000, 'ms')
+        print_result(f'BatchRunner, {PROGRAM_COUNT} programs cached', cached_duration * 1000, 'ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,61 @@
+"""
+Measures how long each expression parser takes to parse expressions of a growing number of terms.
+
+The recursive expression parser rescans the tokens of every subexpression once per precedence level,
+so it is only run up to RECURSIVE_MAX_TERMS terms; the Pratt parser is also run on 10k term expressions.
+
+Run from the project root with:
+    python -m benchmarks.expression_parser_benchmark
+"""
+import itertools
+import sys
+
+from mojilang.lexer import Lexer
+from mojilang.parser import Parser
+from benchmarks.utils.timing import best_of, print_result
+
+TERM_COUNTS = [250, 500, 1_000, 2_000, 10_000]
+RECURSIVE_MAX_TERMS = 2_000
+OPERATORS = ['➕', '✖', '➖', '🤝', '➗', 'and', '🥕', '👇']
+
+
+def flat_expression(term_count):
+    """
+    Generates an expression of numbers joined by operators of mixed precedence.
+
+    :param term_count: The number of terms in the expression.
+    :return: The source code of a print statement of the expression.
+    """
+    operators = itertools.cycle(OPERATORS)
+    terms = [str(term) for term in range(term_count)]
+    return '🗣️ ' + ''.join(f'{term} {next(operators)} ' for term in terms[:-1]) + terms[-1] + ';'
+
+
+def parenthesised_expression(term_count):
+    """
+    Generates an expression of parenthesised pairs of numbers, e.g. (1 ➕ 2) ✖ (3 ➕ 4).
+
+    :param term_count: The number of terms in the expression.
+    :return: The source code of a print statement of the expression.
+    """
+    pairs = [f'({term} ➕ {term + 1})' for term in range(0, term_count, 2)]
+    return '🗣️ ' + ' ✖ '.join(pairs) + ';'
+
+
+def run():
+    # The recursive expression parser recurses once per operator.
+    sys.setrecursionlimit(100_000)
+    for shape, generate in [('flat', flat_expression), ('parenthesised', parenthesised_expression)]:
+        for term_count in TERM_COUNTS:
+            lexer = Lexer(generate(term_count))
+            lexer.scan_tokens()
+            tokens = lexer.get_tokens()
+            for expression_parser in Parser.EXPRESSION_PARSERS:
+                if expression_parser == Parser.RECURSIVE_EXPRESSION_PARSER and term_count > RECURSIVE_MAX_TERMS:
+                    continue
+                duration = best_of(lambda: Parser(tokens, expression_parser).parse(), repeat=3)
+                print_result(f'{expression_parser} {shape} {term_count:,} terms', duration * 1000, 'ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,62 @@
+"""
+Measures how long it takes to load the tree of a large generated program, and the memory the loaded tree takes,
+from a .mojic file (see AstCache), whose nodes are rebuilt from its records, and from a memory-mapped .mojif flat
+tree, along with the time it takes to compile each into closures, the ClosureCompiler walking the nodes and the
+FlatTreeCompiler walking the records of the flat tree.
+
+Run from the project root with:
+    python -m benchmarks.flat_tree_benchmark
+"""
+import pathlib
+import tempfile
+
+from mojilang.compiler import ClosureCompiler
+from mojilang.flat import FlatTree, FlatTreeCompiler, FlatTreeEncoder
+from mojilang.lexer import Lexer
+from mojilang.mojilang import parse
+from mojilang.parser import AstCache
+from benchmarks.parser_benchmark import held_memory
+from benchmarks.utils.source_generator import generate_lexer_source
+from benchmarks.utils.timing import best_of, print_result
+
+TARGET_CHARACTERS = 200_000
+
+
+def load_flat_tree(flat_tree_path, flat_trees):
+    # The flat trees are closed once measured, a tree still read from cannot close its mapping.
+    flat_tree = FlatTree.load(flat_tree_path)
+    flat_trees.append(flat_tree)
+    return flat_tree
+
+
+def run():
+    source = generate_lexer_source(TARGET_CHARACTERS)
+    abstract_syntax_tree = parse(source, Lexer.REGEX_BACKEND)
+    with tempfile.TemporaryDirectory() as directory:
+        source_path = pathlib.Path(directory) / 'program.moji'
+        flat_tree_path = pathlib.Path(directory) / 'program.mojif'
+        ast_cache = AstCache()
+        ast_cache.store(source_path, source, abstract_syntax_tree)
+        FlatTreeEncoder().write(abstract_syntax_tree, flat_tree_path)
+        print_result('.mojic size', ast_cache.get_cache_path(source_path).stat().st_size, 'bytes')
+        print_result('.mojif size', flat_tree_path.stat().st_size, 'bytes')
+
+        flat_trees = []
+        mojic_duration = best_of(lambda: ast_cache.load(source_path, source), repeat=3)
+        flat_duration = best_of(lambda: load_flat_tree(flat_tree_path, flat_trees), repeat=3)
+        print_result('load .mojic', mojic_duration * 1000, 'ms')
+        print_result('load .mojif (mmap)', flat_duration * 1000, 'ms')
+        print_result('.mojic tree memory', held_memory(lambda: ast_cache.load(source_path, source)), 'bytes')
+        print_result('.mojif tree memory', held_memory(lambda: load_flat_tree(flat_tree_path, flat_trees)), 'bytes')
+
+        flat_tree = flat_trees[0]
+        tree_compile_duration = best_of(lambda: ClosureCompiler().compile(abstract_syntax_tree), repeat=3)
+        flat_compile_duration = best_of(lambda: FlatTreeCompiler().compile(flat_tree), repeat=3)
+        print_result('compile the tree (ClosureCompiler)', tree_compile_duration * 1000, 'ms')
+        print_result('compile the flat tree (FlatTreeCompiler)', flat_compile_duration * 1000, 'ms')
+        for flat_tree in flat_trees:
+            flat_tree.close()
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,146 @@
+"""
+Measures how long each interpreter backend takes to execute a few generated workloads, from the parsed
+AST to the end of the program (so compiling the AST is included for the backends that compile it). The
+backends are also measured on the AST bound by the Resolver, the way the mojilang CLI runs it, and the speedup
+of the vm backend over the tree-walker is reported.
+
+Run from the project root with:
+    python -m benchmarks.interpreter_benchmark
+"""
+import contextlib
+import io
+
+from mojilang.lexer import Lexer
+from mojilang.parser import Parser
+from mojilang.interpreter import Interpreter, Resolver
+from benchmarks.utils.timing import best_of, print_result
+
+ITERATIONS = 20_000
+
+WORKLOADS = {
+    'arithmetic loop': f"""
+        🥸 i ✍️ 0;
+        🥸 total ✍️ 0;
+        🔁 (i 👇 {ITERATIONS}) {{
+            total ✍️ total ➕ i ✖️ 2 ➖ i 🍕 7;
+            i ✍️ i ➕ 1;
+        }}
+        🗣️ total;
+    """,
+    'conditional loop': f"""
+        🥸 i ✍️ 0;
+        🥸 evens ✍️ 0;
+        🔁 (i 👇 {ITERATIONS}) {{
+            i ✍️ i ➕ 1;
+            🤔 (i 🍕 2 🤝 0) {{
+                evens ✍️ evens ➕ 1;
+            }} 💅 {{
+                🤓;
+            }}
+        }}
+        🗣️ evens;
+    """,
+    'function calls': f"""
+        🛠 square(🥸 n) {{
+            🫡 n ✖️ n;
+        }}
+        🥸 i ✍️ 0;
+        🥸 total ✍️ 0;
+        🔁 (i 👇 {ITERATIONS}) {{
+            total ✍️ total ➕ 👀 square(i);
+            i ✍️ i ➕ 1;
+        }}
+        🗣️ total;
+    """,
+    # Recursive calls, each looking the function up past the frames of its callers.
+    'recursive calls': """
+        🛠 fib(🥸 n) {
+            🤔 (n 👇 2) {
+                🫡 n;
+            } 💅 {
+                🫡 👀 fib(n ➖ 1) ➕ 👀 fib(n ➖ 2);
+            }
+        }
+        🗣️ 👀 fib(18);
+    """,
+    # Many short statements per iteration, each of them checked by the loop body for a break or continue.
+    'statement-heavy loop': f"""
+        🥸 i ✍️ 0;
+        🥸 a ✍️ 0;
+        🥸 b ✍️ 0;
+        🥸 c ✍️ 0;
+        🔁 (i 👇 {ITERATIONS}) {{
+            a ✍️ i;
+            b ✍️ a;
+            c ✍️ b;
+            a ✍️ c;
+            b ✍️ a;
+            c ✍️ b;
+            a ✍️ c;
+            b ✍️ a;
+            c ✍️ b;
+            i ✍️ i ➕ 1;
+        }}
+        🗣️ c;
+    """,
+    # Shaped like sample_mojilang_files/loop/loop.moji: a countdown skipping and ending on given values.
+    'countdown loop': f"""
+        🥸 i ✍️ {ITERATIONS};
+        🥸 skipped ✍️ 0;
+        🔁 (i ☝️ 0) {{
+            i ✍️ i ➖ 1;
+            🤔 (i 🤝 5) {{
+                💥;
+            }} 🙈 (i 🍕 7 🤝 0) {{
+                skipped ✍️ skipped ➕ 1;
+                🤓;
+            }}
+        }}
+        🗣️ skipped;
+    """,
+    # Shaped like sample_mojilang_files/loop/loop2.moji: nested loops declaring variables in their bodies.
+    'nested loops': f"""
+        🥸 i ✍️ {ITERATIONS // 10};
+        🥸 total ✍️ 0;
+        🔁 (i ☝️ 0) {{
+            🥸 inner_i ✍️ 10;
+            🔁 (inner_i ☝️ 0) {{
+                🥸 nested_var ✍️ inner_i ➕ i;
+                total ✍️ total ➕ nested_var;
+                inner_i ✍️ inner_i ➖ 1;
+            }}
+            i ✍️ i ➖ 1;
+        }}
+        🗣️ total;
+    """,
+}
+
+
+def parse(source):
+    lexer = Lexer(source)
+    lexer.scan_tokens()
+    return Parser(lexer.get_tokens()).parse()
+
+
+def execute(abstract_syntax_tree, backend):
+    with contextlib.redirect_stdout(io.StringIO()):
+        Interpreter(abstract_syntax_tree, backend).execute()
+
+
+def run():
+    for workload, source in WORKLOADS.items():
+        abstract_syntax_tree = parse(source)
+        resolved_abstract_syntax_tree = parse(source)
+        Resolver().resolve(resolved_abstract_syntax_tree)
+        resolved_durations = {}
+        for backend in Interpreter.BACKENDS:
+            duration = best_of(lambda: execute(abstract_syntax_tree, backend), repeat=3)
+            print_result(f'{workload} ({backend})', duration * 1000, 'ms')
+            resolved_durations[backend] = best_of(lambda: execute(resolved_abstract_syntax_tree, backend), repeat=3)
+            print_result(f'{workload} ({backend}, resolved)', resolved_durations[backend] * 1000, 'ms')
+        vm_speedup = resolved_durations[Interpreter.TREE_WALKER_BACKEND] / resolved_durations[Interpreter.VM_BACKEND]
+        print_result(f'{workload} ({Interpreter.VM_BACKEND} speedup)', vm_speedup, 'x')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,23 @@
+"""
+Measures lexer throughput in characters per second on a large generated program.
+
+Run from the project root with:
+    python -m benchmarks.lexer_benchmark
+"""
+from mojilang.lexer import Lexer
+from benchmarks.utils.source_generator import generate_lexer_source
+from benchmarks.utils.timing import best_of, print_result
+
+TARGET_CHARACTERS = 2_000_000
+
+
+def run():
+    source = generate_lexer_source(TARGET_CHARACTERS)
+    print_result('characters lexed', len(source), 'chars')
+    for backend in Lexer.BACKENDS:
+        duration = best_of(lambda: Lexer(source, backend).scan_tokens(), repeat=3)
+        print_result(f'{backend} lexer throughput', len(source) / duration, 'chars/s')
+
+
+if __name__ == '__main__':
+    run()
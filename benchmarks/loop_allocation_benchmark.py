@@ -0,0 +1,84 @@
+"""
+Measures how many scope objects (ScopeContext and BlockScopeContext) the tree-walker creates per loop
+iteration, and how long an iteration takes, for a loop body declaring no variables and one declaring a
+variable.
+
+Run from the project root with:
+    python -m benchmarks.loop_allocation_benchmark
+"""
+import contextlib
+import io
+
+from mojilang.lexer import Lexer
+from mojilang.parser import Parser
+from mojilang.interpreter import Interpreter
+from mojilang.interpreter.scope import BlockScopeContext, ScopeContext
+from benchmarks.utils.timing import best_of, print_result
+
+ITERATIONS = 20_000
+
+WORKLOADS = {
+    'no declarations': f"""
+        🥸 i ✍️ 0;
+        🔁 (i 👇 {ITERATIONS}) {{
+            i ✍️ i ➕ 1;
+        }}
+    """,
+    'one declaration': f"""
+        🥸 i ✍️ 0;
+        🔁 (i 👇 {ITERATIONS}) {{
+            🥸 next_i ✍️ i ➕ 1;
+            i ✍️ next_i;
+        }}
+    """,
+}
+
+
+def parse(source):
+    lexer = Lexer(source)
+    lexer.scan_tokens()
+    return Parser(lexer.get_tokens()).parse()
+
+
+def execute(abstract_syntax_tree):
+    with contextlib.redirect_stdout(io.StringIO()):
+        Interpreter(abstract_syntax_tree).execute()
+
+
+def count_scope_objects(abstract_syntax_tree):
+    """
+    Runs the program while counting the scope objects created, the Interpreter's own included.
+
+    :param abstract_syntax_tree: The AST of the program.
+    :return: The number of ScopeContext and BlockScopeContext objects created.
+    """
+    created = 0
+    originals = {cls: cls.__init__ for cls in (ScopeContext, BlockScopeContext)}
+
+    def counting(original):
+        def __init__(self, *args, **kwargs):
+            nonlocal created
+            created += 1
+            original(self, *args, **kwargs)
+        return __init__
+
+    for cls, original in originals.items():
+        cls.__init__ = counting(original)
+    try:
+        execute(abstract_syntax_tree)
+    finally:
+        for cls, original in originals.items():
+            cls.__init__ = original
+    return created
+
+
+def run():
+    for workload, source in WORKLOADS.items():
+        abstract_syntax_tree = parse(source)
+        print_result(f'{workload} scope objects per iteration', count_scope_objects(abstract_syntax_tree) / ITERATIONS, 'objects')
+        duration = best_of(lambda: execute(abstract_syntax_tree), repeat=3)
+        print_result(f'{workload} time per iteration', duration / ITERATIONS * 1e6, 'us')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,89 @@
+"""
+Measures the memory a syntax tree of over 100,000 nodes takes, per node and in total, and how long the tree-walker
+takes to build and run it. The tree is parsed from a generated program of arithmetic declarations, conditionals
+and loops, which runs without failing.
+
+Run from the project root with:
+    python -m benchmarks.node_layout_benchmark
+"""
+import contextlib
+import io
+
+from mojilang.interpreter import Interpreter
+from mojilang.lexer import Lexer
+from mojilang.mojilang import parse, resolve
+from mojilang.parser.nodes import AbstractSyntaxTreeNode
+from benchmarks.parser_benchmark import held_memory
+from benchmarks.utils.timing import best_of, print_result
+
+TARGET_NODES = 100_000
+
+# Each unit declares its own variables, so the units can be repeated as many times as needed.
+UNIT = """
+🥸 a{index} ✍️ ({index} ➕ 2) ✖️ 3 ➖ {index} ➗ 7 🍕 5;
+🥸 b{index} ✍️ a{index} ✖️ a{index} ➕ 1;
+🤔 (a{index} ☝️ b{index} and 🙅 (a{index} 🤝 0)) {{
+    🥸 c{index} ✍️ a{index} ➖ b{index};
+}} 💅 {{
+    🥸 i{index} ✍️ 0;
+    🔁 (i{index} 👇 3) {{ i{index} ✍️ i{index} ➕ 1; }}
+}}
+"""
+
+
+def count_nodes(node):
+    """
+    :param node: The root of a tree.
+    :return: The number of nodes of the tree.
+    """
+    count = 0
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        count += 1
+        for cls in type(node).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                value = getattr(node, name, None)
+                for child in value if isinstance(value, list) else [value]:
+                    if isinstance(child, AbstractSyntaxTreeNode):
+                        stack.append(child)
+    return count
+
+
+def generate_source(target_nodes):
+    """
+    :param target_nodes: The minimum number of nodes the tree of the program should have.
+    :return: The source code of the program.
+    """
+    unit_nodes = count_nodes(parse(UNIT.format(index=0)))
+    # The root block of the program is counted once rather than once per unit.
+    units = target_nodes // (unit_nodes - 1) + 1
+    return ''.join(UNIT.format(index=index) for index in range(units))
+
+
+def build(source):
+    abstract_syntax_tree = parse(source, Lexer.REGEX_BACKEND)
+    resolve(abstract_syntax_tree)
+    return abstract_syntax_tree
+
+
+def execute(abstract_syntax_tree):
+    with contextlib.redirect_stdout(io.StringIO()):
+        Interpreter(abstract_syntax_tree).execute()
+
+
+def run():
+    source = generate_source(TARGET_NODES)
+    abstract_syntax_tree = build(source)
+    node_count = count_nodes(abstract_syntax_tree)
+    print_result('nodes', node_count, 'nodes')
+
+    memory = held_memory(lambda: build(source))
+    print_result('tree memory', memory / 1024 / 1024, 'MiB')
+    print_result('tree memory per node', memory / node_count, 'bytes')
+    print_result('build (scan, parse and resolve)', best_of(lambda: build(source), repeat=3) * 1000, 'ms')
+    print_result('run (tree-walker)', best_of(lambda: execute(abstract_syntax_tree), repeat=3) * 1000, 'ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,56 @@
+"""
+Measures parser throughput in tokens per second on a large generated program, and the memory taken
+by its tokens as a list of Token objects versus the parser's columnar token buffer.
+
+Run from the project root with:
+    python -m benchmarks.parser_benchmark
+"""
+import gc
+import tracemalloc
+
+from mojilang.lexer import Lexer
+from mojilang.parser import Parser
+from mojilang.parser.token_buffer import TokenBuffer
+from benchmarks.utils.source_generator import generate_lexer_source
+from benchmarks.utils.timing import best_of, print_result
+
+TARGET_CHARACTERS = 200_000
+
+
+def held_memory(function):
+    """
+    Runs a function and measures the memory still held by what it returns.
+
+    :param function: A zero argument callable to measure.
+    :return: The memory held once the function returned, in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        gc.collect()
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        del result
+
+
+def lex(source):
+    lexer = Lexer(source)
+    lexer.scan_tokens()
+    return lexer.get_tokens()
+
+
+def run():
+    source = generate_lexer_source(TARGET_CHARACTERS)
+    tokens = lex(source)
+    print_result('tokens parsed', len(tokens), 'tokens')
+
+    duration = best_of(lambda: Parser(tokens).parse(), repeat=3)
+    print_result('parser throughput', len(tokens) / duration, 'tokens/s')
+    print_result('token list memory per token', held_memory(lambda: lex(source)) / len(tokens), 'bytes')
+    print_result('token buffer memory per token', held_memory(lambda: TokenBuffer(tokens)) / len(tokens), 'bytes')
+
+
+if __name__ == '__main__':
+    run()
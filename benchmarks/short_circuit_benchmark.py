@@ -0,0 +1,68 @@
+"""
+Measures how long each interpreter backend takes to run a loop whose `and` and `or` operations guard an
+expensive 👀 call, with the operations short-circuiting (the default) and evaluating both operands (the
+Parser's short_circuit=False compatibility mode). Short-circuiting skips the guarded call on most iterations.
+
+Run from the project root with:
+    python -m benchmarks.short_circuit_benchmark
+"""
+import contextlib
+import io
+
+from mojilang.lexer import Lexer
+from mojilang.parser import Parser
+from mojilang.interpreter import Interpreter, Resolver
+from benchmarks.utils.timing import best_of, print_result
+
+ITERATIONS = 2_000
+
+# Only every tenth iteration calls the function when the operations short-circuit.
+SOURCE = f"""
+    🛠 expensive(🥸 n) {{
+        🥸 j ✍️ 0;
+        🥸 total ✍️ 0;
+        🔁 (j 👇 20) {{
+            total ✍️ total ➕ n ✖️ j;
+            j ✍️ j ➕ 1;
+        }}
+        🫡 total 👇 0;
+    }}
+    🥸 i ✍️ 0;
+    🥸 hits ✍️ 0;
+    🔁 (i 👇 {ITERATIONS}) {{
+        🤔 (i 🍕 10 🤝 0 and 👀 expensive(i)) {{
+            hits ✍️ hits ➕ 1;
+        }}
+        🤔 (i 🍕 10 ☝️ 0 or 👀 expensive(i)) {{
+            hits ✍️ hits ➕ 1;
+        }}
+        i ✍️ i ➕ 1;
+    }}
+    🗣️ hits;
+"""
+
+
+def parse(source, short_circuit):
+    lexer = Lexer(source)
+    lexer.scan_tokens()
+    abstract_syntax_tree = Parser(lexer.get_tokens(), short_circuit=short_circuit).parse()
+    Resolver().resolve(abstract_syntax_tree)
+    return abstract_syntax_tree
+
+
+def execute(abstract_syntax_tree, backend):
+    with contextlib.redirect_stdout(io.StringIO()):
+        Interpreter(abstract_syntax_tree, backend).execute()
+
+
+def run():
+    for short_circuit in (False, True):
+        mode = 'short-circuit' if short_circuit else 'both operands'
+        abstract_syntax_tree = parse(SOURCE, short_circuit)
+        for backend in Interpreter.BACKENDS:
+            duration = best_of(lambda: execute(abstract_syntax_tree, backend), repeat=3)
+            print_result(f'guarded calls, {mode} ({backend})', duration * 1000, 'ms')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,74 @@
+"""
+Measures the peak memory of lexing and parsing a large program read into memory first versus
+streamed from disk with Lexer.iter_tokens.
+
+Run from the project root with:
+    python -m benchmarks.streaming_benchmark
+"""
+import collections
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from mojilang.lexer import Lexer
+from mojilang.parser import Parser
+from benchmarks.utils.source_generator import generate_lexer_source
+from benchmarks.utils.timing import print_result
+
+TARGET_CHARACTERS = 500_000
+
+
+def peak_memory(function):
+    """
+    Runs a function and returns the peak memory allocated while it ran.
+
+    :param function: A zero argument callable to measure.
+    :return: The peak traced memory in bytes.
+    """
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def lex_in_memory(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        lexer = Lexer(file.read(), Lexer.REGEX_BACKEND)
+    lexer.scan_tokens()
+    return lexer.get_tokens()
+
+
+def lex_streamed(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        collections.deque(Lexer().iter_tokens(file), maxlen=0)
+
+
+def parse_in_memory(path):
+    return Parser(lex_in_memory(path)).parse()
+
+
+def parse_streamed(path):
+    with open(path, 'r', encoding='utf-8') as file:
+        return Parser(Lexer().iter_tokens(file)).parse()
+
+
+def run():
+    source = generate_lexer_source(TARGET_CHARACTERS)
+    print_result('characters in program', len(source), 'chars')
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / 'program.moji'
+        path.write_text(source, encoding='utf-8')
+        del source
+        for name, function in [
+            ('in memory lex peak', lex_in_memory),
+            ('streamed lex peak', lex_streamed),
+            ('in memory lex and parse peak', parse_in_memory),
+            ('streamed lex and parse peak', parse_streamed),
+        ]:
+            print_result(name, peak_memory(lambda: function(path)) / 2 ** 20, 'MiB')
+
+
+if __name__ == '__main__':
+    run()
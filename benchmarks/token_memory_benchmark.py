@@ -0,0 +1,61 @@
+"""
+Measures the memory held by the tokens of a program of about a million tokens.
+
+Run from the project root with:
+    python -m benchmarks.token_memory_benchmark
+"""
+import gc
+import tracemalloc
+
+from mojilang.lexer import Lexer
+from benchmarks.utils.source_generator import generate_lexer_source
+from benchmarks.utils.timing import print_result
+
+TARGET_TOKENS = 1_000_000
+
+
+def generate_source(target_tokens):
+    """
+    Generates a program with at least the target number of tokens from the sample programs.
+
+    :param target_tokens: The minimum number of tokens the program should contain.
+    :return: The generated source code.
+    """
+    sample = generate_lexer_source(10_000)
+    lexer = Lexer(sample)
+    lexer.scan_tokens()
+    repetitions = target_tokens // len(lexer.get_tokens()) + 1
+    return sample * repetitions
+
+
+def token_memory(source, backend):
+    """
+    Lexes the source and measures the memory still held once lexing is done, i.e. the tokens,
+    their lexemes and literals and the list holding them.
+
+    :param source: The source code to lex.
+    :param backend: The lexer backend to use.
+    :return: A tuple of the number of tokens and the memory held in bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        lexer = Lexer(source, backend)
+        lexer.scan_tokens()
+        gc.collect()
+        return len(lexer.get_tokens()), tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def run():
+    source = generate_source(TARGET_TOKENS)
+    for backend in Lexer.BACKENDS:
+        token_count, memory = token_memory(source, backend)
+        print_result(f'{backend} lexer tokens', token_count, 'tokens')
+        print_result(f'{backend} lexer token memory', memory / 2 ** 20, 'MiB')
+        print_result(f'{backend} lexer memory per token', memory / token_count, 'bytes')
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+SAMPLE_DIRECTORY = Path(__file__).resolve().parents[2] / 'sample_mojilang_files'
+
+
+def sample_sources():
+    """
+    Reads every sample program shipped with the repository.
+
+    :return: A list of the sample programs' source code, sorted by path.
+    """
+    return [path.read_text(encoding='utf-8') for path in sorted(SAMPLE_DIRECTORY.rglob('*.moji'))]
+
+
+def generate_lexer_source(target_characters):
+    """
+    Generates a large source string by repeating the sample programs until the target size is reached.
+
+    The result is only meant to be lexed, so it does not matter that repeated declarations
+    would fail at runtime.
+
+    :param target_characters: The minimum number of characters the generated source should contain.
+    :return: The generated source code.
+    """
+    corpus = '\n'.join(sample_sources()) + '\n'
+    repetitions = target_characters // len(corpus) + 1
+    return corpus * repetitions
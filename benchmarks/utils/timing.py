@@ -0,0 +1,39 @@
+import gc
+import time
+
+
+def best_of(function, repeat=5):
+    """
+    Runs a function several times and returns the fastest wall-clock duration.
+
+    Taking the minimum filters out noise from the rest of the machine, which is
+    what we want when comparing two implementations of the same thing. Like timeit,
+    the garbage collector is disabled while timing so its pauses do not swamp the result.
+
+    :param function: A zero argument callable to time.
+    :param repeat: How many times to run the callable.
+    :return: The fastest duration in seconds.
+    """
+    durations = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return min(durations)
+
+
+def print_result(name, value, unit):
+    """
+    Prints a single benchmark result in a consistent, aligned format.
+
+    :param name: The name of the measurement.
+    :param value: The measured value.
+    :param unit: The unit the value is expressed in.
+    """
+    print(f'{name:<45} {value:>15,.2f} {unit}')
@@ -0,0 +1,49 @@
+"""
+Measures how long it takes to evaluate an arithmetic function over many rows, calling the function once per row
+with the tree-walker and in one pass per operation with the VectorizedFunction. Needs NumPy.
+
+Run from the project root with:
+    python -m benchmarks.vectorized_benchmark
+"""
+from mojilang.interpreter import VectorizedFunction
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext, ScopeContext
+from mojilang.mojilang import parse
+from benchmarks.utils.timing import best_of, print_result
+
+ROW_COUNT = 100_000
+SOURCE_CODE = "🛠 f(🥸 x, 🥸 y) { 🫡 (x ☝️ y) and (x ➖ y) ➗ (y ➕ 1) or x ✖️ y 🍕 7 ➕ y 🥕 2; }"
+
+
+def evaluate_rows(expression_node, xs, ys):
+    values = []
+    for x, y in zip(xs, ys):
+        context = ScopeContext(BlockScopeContext(BlockScope.GLOBAL))
+        context.assign_value('x', x)
+        context.assign_value('y', y)
+        values.append(expression_node.evaluate(context))
+    return values
+
+
+def run():
+    try:
+        import numpy
+    except ImportError:
+        print('NumPy is not installed, skipping the vectorized benchmark.')
+        return
+    function_node = parse(SOURCE_CODE).get_nodes()[0]
+    expression_node = function_node.get_function_block_node().get_nodes()[0].get_return_value_node()
+    vectorized_function = VectorizedFunction(function_node)
+    random = numpy.random.default_rng(0)
+    xs = random.uniform(0, 100, ROW_COUNT)
+    ys = random.uniform(0, 100, ROW_COUNT)
+    x_list, y_list = xs.tolist(), ys.tolist()
+
+    scalar_duration = best_of(lambda: evaluate_rows(expression_node, x_list, y_list), repeat=3)
+    vectorized_duration = best_of(lambda: vectorized_function(xs, ys), repeat=3)
+    print_result(f'tree-walker, {ROW_COUNT:,} rows', scalar_duration * 1000, 'ms')
+    print_result(f'VectorizedFunction, {ROW_COUNT:,} rows', vectorized_duration * 1000, 'ms')
+    print_result('speedup', scalar_duration / vectorized_duration, 'x')
+
+
+if __name__ == '__main__':
+    run()
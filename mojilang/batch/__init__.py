@@ -0,0 +1,10 @@
+from .batch_runner import BatchRunner, print_batch_report
+from .program_result import ProgramResult
+from .tree_cache import TreeCache
+
+__all__ = [
+    'BatchRunner',
+    'ProgramResult',
+    'TreeCache',
+    'print_batch_report',
+]
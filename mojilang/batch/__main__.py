@@ -0,0 +1,110 @@
+import argparse
+import pathlib
+import sys
+
+from mojilang.batch import BatchRunner, print_batch_report
+from mojilang.batch.tree_cache import DEFAULT_TREE_CACHE_SIZE
+from mojilang.interpreter import Interpreter
+from mojilang.lexer import Lexer
+from mojilang.parser import AstCache
+
+
+def run_cli():
+    """
+    Set up the CLI allowing the user to provide the directory or the manifest of the Mojilang programs to run.
+
+    :return: The parsed command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Run many Mojilang programs in one process, from a directory of .moji files or a manifest "
+                    "listing one .moji file per line."
+    )
+    parser.add_argument(
+        'path',
+        type=str,
+        help='The directory holding the .moji files, or the manifest listing them.'
+    )
+    parser.add_argument(
+        '--lexer',
+        choices=Lexer.BACKENDS,
+        default=Lexer.CHARACTER_BACKEND,
+        help='The tokenizer backend to use. The regex backend is faster on large files.'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=Interpreter.BACKENDS,
+        default=Interpreter.TREE_WALKER_BACKEND,
+        help='The execution backend to use.'
+    )
+    parser.add_argument(
+        '-O', '--optimize',
+        action='store_true',
+        help='Fold the constant expressions of the programs before running them.'
+    )
+    parser.add_argument(
+        '--no-short-circuit',
+        action='store_false',
+        dest='short_circuit',
+        help='Evaluate both operands of the and/or operations, like older versions of Mojilang did.'
+    )
+    parser.add_argument(
+        '--memo-size',
+        type=int,
+        default=Interpreter.DEFAULT_MEMO_SIZE,
+        help='The number of calls the tree-walker remembers the value of per pure function, 0 (the default) to '
+             'remember none.'
+    )
+    parser.add_argument(
+        '--tree-cache-size',
+        type=int,
+        default=DEFAULT_TREE_CACHE_SIZE,
+        help='The number of parsed trees kept in memory, 0 to parse every program each time it runs.'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_false',
+        dest='cache',
+        help='Always parse the files instead of loading their parsed trees from the .mojic files of earlier runs.'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='The directory to cache the parsed trees in, instead of a __mojicache__ directory next to each file.'
+    )
+    return parser.parse_args()
+
+
+def main_batch(path, batch_runner):
+    """
+    Runs the programs of a directory or a manifest, printing what each printed under its path to stdout, and the
+    report of the batch to stderr, see print_batch_report.
+
+    :param path: The path to the directory holding the .moji files, or to the manifest listing them.
+    :param batch_runner: The BatchRunner to run the programs with.
+    :return: The ProgramResult of each program.
+    """
+    path = pathlib.Path(path)
+    results = batch_runner.run_directory(path) if path.is_dir() else batch_runner.run_manifest(path)
+    for result in results:
+        print(f'==> {result.get_path()} <==')
+        print(result.get_output(), end='')
+        if not result.is_successful():
+            print(f'Error: {result.get_error()}', file=sys.stderr)
+    print_batch_report(results)
+    return results
+
+
+if __name__ == '__main__':
+    """Entry point for running a batch of Mojilang programs."""
+    arguments = run_cli()
+    runner = BatchRunner(
+        arguments.lexer, arguments.backend, arguments.optimize, arguments.short_circuit, arguments.memo_size,
+        arguments.tree_cache_size, AstCache(arguments.cache_dir) if arguments.cache else None
+    )
+    try:
+        batch_results = main_batch(arguments.path, runner)
+    except OSError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    sys.exit(0 if all(result.is_successful() for result in batch_results) else 1)
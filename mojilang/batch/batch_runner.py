@@ -0,0 +1,201 @@
+import contextlib
+import io
+import pathlib
+import sys
+import time
+
+from mojilang.batch.program_result import ProgramResult
+from mojilang.batch.tree_cache import DEFAULT_TREE_CACHE_SIZE, TreeCache
+from mojilang.interpreter import Interpreter
+from mojilang.lexer import Lexer
+from mojilang.mojilang import parse, resolve
+
+SOURCE_SUFFIX = '.moji'
+# Manifest lines starting with it are comments.
+MANIFEST_COMMENT = '#'
+
+
+class BatchRunner:
+    """
+    The BatchRunner class runs many Mojilang programs one after the other in the same process, so a job running
+    many small programs pays for starting Python and importing Mojilang once rather than once per program.
+
+    The tree of each program is kept in a TreeCache once parsed and resolved, so a program run again, by the same
+    batch or a later one, is not parsed again. On a miss, the tree is loaded from the AstCache given, if any,
+    before the source code is parsed. Each program runs with its own Interpreter, so with its own global
+    ScopeContext and memo caches, and what it prints is captured rather than written to stdout. A program failing
+    to read, parse or run does not stop the batch, its error is kept in its ProgramResult along with what it
+    printed until then.
+
+    Programs still read their input from stdin.
+
+    Attributes:
+        _lexer_backend (str): The tokenizer backend the Lexer uses, one of Lexer.BACKENDS.
+        _interpreter_backend (str): The execution backend the Interpreter uses, one of Interpreter.BACKENDS.
+        _optimize (bool): Whether to fold the constant expressions of the programs before running them.
+        _short_circuit (bool): Whether the `and` and `or` operations short-circuit, see Parser.
+        _memo_size (int): The number of values the tree-walker remembers per pure function, see Interpreter.
+        _tree_cache (TreeCache): The trees of the programs parsed so far.
+        _ast_cache (AstCache): The cache of the parsed trees on disk, None to use none.
+    """
+
+    def __init__(self, lexer_backend=Lexer.CHARACTER_BACKEND, interpreter_backend=Interpreter.TREE_WALKER_BACKEND,
+                 optimize=False, short_circuit=True, memo_size=Interpreter.DEFAULT_MEMO_SIZE,
+                 tree_cache_size=DEFAULT_TREE_CACHE_SIZE, ast_cache=None):
+        """
+        Initializes the BatchRunner.
+
+        :param lexer_backend: The tokenizer backend the Lexer uses, one of Lexer.BACKENDS.
+        :param interpreter_backend: The execution backend the Interpreter uses, one of Interpreter.BACKENDS.
+        :param optimize: Whether to fold the constant expressions of the programs before running them.
+        :param short_circuit: Whether the `and` and `or` operations skip their right operand when the left one
+                              decides the result, see Parser.
+        :param memo_size: The number of values the tree-walker remembers per pure function, see Interpreter.
+        :param tree_cache_size: The number of trees kept in memory, 0 to parse every program each time it runs.
+        :param ast_cache: The AstCache to load the trees of the programs from, and to store them in once parsed.
+        :raises ValueError: If the backend is unknown, or the memo size or the tree cache size is negative.
+        """
+        if interpreter_backend not in Interpreter.BACKENDS:
+            raise ValueError(
+                f"Unknown interpreter backend '{interpreter_backend}', expected one of {Interpreter.BACKENDS}."
+            )
+        if memo_size < 0:
+            raise ValueError(f"The memo size must not be negative, got {memo_size}.")
+        self._lexer_backend = lexer_backend
+        self._interpreter_backend = interpreter_backend
+        self._optimize = optimize
+        self._short_circuit = short_circuit
+        self._memo_size = memo_size
+        self._tree_cache = TreeCache(tree_cache_size)
+        self._ast_cache = ast_cache
+
+    def run_directory(self, directory):
+        """
+        Runs the .moji files of a directory, in the order of their names. Subdirectories are not searched.
+
+        :param directory: The path to the directory.
+        :return: The ProgramResult of each program, in the order they ran.
+        :raises NotADirectoryError: If the path is not a directory.
+        """
+        directory = pathlib.Path(directory)
+        if not directory.is_dir():
+            raise NotADirectoryError(f"'{directory}' is not a directory.")
+        return self.run_paths(sorted(path for path in directory.glob(f'*{SOURCE_SUFFIX}') if path.is_file()))
+
+    def run_manifest(self, manifest_path):
+        """
+        Runs the programs a manifest lists, a text file holding the path to one program per line. Relative paths
+        are relative to the manifest's directory, and blank lines and lines starting with MANIFEST_COMMENT are
+        skipped. A program listed more than once runs each time.
+
+        :param manifest_path: The path to the manifest.
+        :return: The ProgramResult of each program, in the order they ran.
+        :raises OSError: If the manifest cannot be read.
+        """
+        manifest_path = pathlib.Path(manifest_path)
+        with open(manifest_path, 'r') as manifest:
+            lines = [line.strip() for line in manifest]
+        paths = [
+            manifest_path.parent / line for line in lines if line and not line.startswith(MANIFEST_COMMENT)
+        ]
+        return self.run_paths(paths)
+
+    def run_paths(self, paths):
+        """
+        :param paths: The paths to the programs' source files.
+        :return: The ProgramResult of each program, in the order they ran.
+        """
+        return [self.run_path(path) for path in paths]
+
+    def run_path(self, path):
+        """
+        Runs one program, capturing what it prints.
+
+        :param path: The path to the program's source file.
+        :return: The ProgramResult of the program.
+        """
+        path = pathlib.Path(path)
+        start = time.perf_counter()
+        cached = False
+        try:
+            source_code = path.read_text()
+            abstract_syntax_tree = self._tree_cache.get(source_code, self._get_options())
+            cached = abstract_syntax_tree is not None
+            if not cached:
+                abstract_syntax_tree = self._prepare(path, source_code)
+                self._tree_cache.put(source_code, self._get_options(), abstract_syntax_tree)
+        except Exception as e:
+            return ProgramResult(path, '', e, time.perf_counter() - start, 0.0, cached)
+        parse_duration = time.perf_counter() - start
+
+        output = io.StringIO()
+        error = None
+        start = time.perf_counter()
+        try:
+            with contextlib.redirect_stdout(output):
+                Interpreter(abstract_syntax_tree, self._interpreter_backend, self._memo_size).execute()
+        except Exception as e:
+            error = e
+        return ProgramResult(path, output.getvalue(), error, parse_duration, time.perf_counter() - start, cached)
+
+    def get_tree_cache(self):
+        return self._tree_cache
+
+    def get_ast_cache(self):
+        return self._ast_cache
+
+    def _prepare(self, path, source_code):
+        """
+        Parses a program, or loads its tree from the AstCache, and gets it ready to run like main does.
+
+        :param path: The path to the program's source file.
+        :param source_code: The source code of the program.
+        :return: The tree of the program.
+        :raises SyntaxException: If the program has syntax errors or uses an undefined variable.
+        """
+        abstract_syntax_tree = None
+        if self._ast_cache is not None:
+            abstract_syntax_tree = self._ast_cache.load(path, source_code, self._short_circuit)
+        if abstract_syntax_tree is None:
+            abstract_syntax_tree = parse(source_code, self._lexer_backend, self._short_circuit)
+            if self._ast_cache is not None:
+                self._ast_cache.store(path, source_code, abstract_syntax_tree, self._short_circuit)
+        resolve(abstract_syntax_tree, self._optimize)
+        return abstract_syntax_tree
+
+    def _get_options(self):
+        """
+        :return: The options that change the tree of a program, part of the key of the tree in the TreeCache.
+        """
+        return self._short_circuit, self._optimize
+
+
+def print_batch_report(results, file=None):
+    """
+    Prints how long each program of a batch took to parse and to run, whether its tree was cached, and whether
+    it failed, followed by the totals.
+
+    :param results: The ProgramResult of each program.
+    :param file: The text stream to print to, stderr by default.
+    """
+    file = sys.stderr if file is None else file
+    print('Batch report:', file=file)
+    for result in results:
+        status = 'ok' if result.is_successful() else f'failed: {result.get_error()}'
+        source = 'cached' if result.is_cached() else 'parsed'
+        print(
+            f'  {result.get_path()}: {_milliseconds(result.get_parse_duration())} {source}, '
+            f'{_milliseconds(result.get_run_duration())} run, {status}',
+            file=file
+        )
+    failures = sum(not result.is_successful() for result in results)
+    total_duration = sum(result.get_duration() for result in results)
+    print(f'  total: {len(results)} programs, {failures} failed, {_milliseconds(total_duration)}', file=file)
+
+
+def _milliseconds(duration):
+    """
+    :param duration: A duration in seconds.
+    :return: The duration in milliseconds, as text.
+    """
+    return f'{duration * 1000:.2f} ms'
@@ -0,0 +1,50 @@
+class ProgramResult:
+    """
+    The ProgramResult class holds what running one program of a batch gave, see BatchRunner.
+
+    Attributes:
+        _path (pathlib.Path): The path to the program's source file.
+        _output (str): What the program printed, up to the error if it failed.
+        _error (Exception): The error the program failed with, None if it ran to the end.
+        _parse_duration (float): The seconds spent reading, parsing and resolving the program, or loading its tree.
+        _run_duration (float): The seconds spent running the program.
+        _cached (bool): Whether the tree of the program was taken from the TreeCache.
+    """
+
+    __slots__ = ('_path', '_output', '_error', '_parse_duration', '_run_duration', '_cached')
+
+    def __init__(self, path, output, error, parse_duration, run_duration, cached):
+        self._path = path
+        self._output = output
+        self._error = error
+        self._parse_duration = parse_duration
+        self._run_duration = run_duration
+        self._cached = cached
+
+    def is_successful(self):
+        return self._error is None
+
+    def get_path(self):
+        return self._path
+
+    def get_output(self):
+        return self._output
+
+    def get_error(self):
+        return self._error
+
+    def get_parse_duration(self):
+        return self._parse_duration
+
+    def get_run_duration(self):
+        return self._run_duration
+
+    def get_duration(self):
+        return self._parse_duration + self._run_duration
+
+    def is_cached(self):
+        return self._cached
+
+    def __repr__(self):
+        status = 'ok' if self._error is None else f'failed: {self._error}'
+        return f'ProgramResult({str(self._path)!r}, {status})'
@@ -0,0 +1,92 @@
+import hashlib
+from collections import OrderedDict
+
+DEFAULT_TREE_CACHE_SIZE = 256
+
+
+class TreeCache:
+    """
+    The TreeCache class keeps the trees of the programs a BatchRunner ran in memory, so running a program whose
+    source code it already parsed runs the tree it holds instead of scanning, parsing and resolving the source
+    code again.
+
+    A tree is keyed by the SHA-256 digest of its source code and the options it was prepared with, so files
+    holding the same program share one tree and an edited file is parsed again. The trees are kept ready to run,
+    after the ConstantFolder and the Resolver changed them, since running a tree leaves it as it was. Once the
+    cache holds as many trees as its size, the least recently used tree is evicted to make room for the next one.
+
+    Attributes:
+        _size (int): The maximum number of trees kept.
+        _trees (OrderedDict): The trees kept by key, least recently used first.
+        _hits (int): The number of programs whose tree was kept.
+        _misses (int): The number of programs that were parsed.
+    """
+
+    def __init__(self, size=DEFAULT_TREE_CACHE_SIZE):
+        """
+        Initializes the TreeCache.
+
+        :param size: The maximum number of trees kept, 0 to keep none.
+        :raises ValueError: If the size is negative.
+        """
+        if size < 0:
+            raise ValueError(f"The tree cache size must not be negative, got {size}.")
+        self._size = size
+        self._trees = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, source_code, options):
+        """
+        :param source_code: The source code of a program.
+        :param options: The hashable options the tree of the program was prepared with.
+        :return: The tree kept for the source code and options, or None if there is none.
+        """
+        key = _key(source_code, options)
+        tree = self._trees.get(key)
+        if tree is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._trees.move_to_end(key)
+        return tree
+
+    def put(self, source_code, options, abstract_syntax_tree):
+        """
+        Keeps the tree of a program, evicting the least recently used tree if the cache is full.
+
+        :param source_code: The source code of the program.
+        :param options: The hashable options the tree was prepared with.
+        :param abstract_syntax_tree: The tree, ready to run.
+        """
+        if not self._size:
+            return
+        key = _key(source_code, options)
+        self._trees[key] = abstract_syntax_tree
+        self._trees.move_to_end(key)
+        if len(self._trees) > self._size:
+            self._trees.popitem(last=False)
+
+    def clear(self):
+        self._trees.clear()
+
+    def get_size(self):
+        return self._size
+
+    def get_hits(self):
+        return self._hits
+
+    def get_misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._trees)
+
+
+def _key(source_code, options):
+    """
+    :param source_code: The source code of a program.
+    :param options: The options its tree was prepared with.
+    :return: The key of the tree.
+    """
+    return hashlib.sha256(source_code.encode('utf-8')).digest(), options
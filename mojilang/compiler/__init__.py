@@ -0,0 +1,9 @@
+from .closure_compiler import ClosureCompiler
+from .compiled_function import CompiledFunction
+from .python_compiler import PythonCompiler
+
+__all__ = [
+    'ClosureCompiler',
+    'CompiledFunction',
+    'PythonCompiler',
+]
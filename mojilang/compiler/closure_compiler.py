@@ -0,0 +1,344 @@
+from mojilang.interpreter.scope import BlockScope
+from mojilang.lexer import SyntaxException
+from mojilang.parser.nodes import (
+    AdditionNode,
+    AndNode,
+    AssignmentNode,
+    BlockNode,
+    BreakNode,
+    ConditionalNode,
+    ContinueNode,
+    DivisionNode,
+    EqualsNode,
+    ExponentNode,
+    FunctionCallNode,
+    FunctionNode,
+    GreaterEqualsNode,
+    GreaterNode,
+    LessEqualsNode,
+    LessNode,
+    LiteralNode,
+    LoopNode,
+    ModulusNode,
+    MultiplicationNode,
+    NotEqualsNode,
+    NotNode,
+    OrNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    SubtractionNode,
+    VariableNode,
+)
+from mojilang.compiler.compiled_function import CompiledFunction
+from mojilang.compiler.runtime import (
+    BREAK,
+    CONTINUE,
+    declare_variable,
+    divide,
+    logical_and,
+    logical_or,
+    print_value,
+    reassign_variable,
+)
+
+# Builds the closure of each binary operation from the closures of its operands.
+BINARY_OPERATIONS = {
+    AdditionNode: lambda left, right: lambda context: left(context) + right(context),
+    SubtractionNode: lambda left, right: lambda context: left(context) - right(context),
+    MultiplicationNode: lambda left, right: lambda context: left(context) * right(context),
+    ModulusNode: lambda left, right: lambda context: left(context) % right(context),
+    ExponentNode: lambda left, right: lambda context: left(context) ** right(context),
+    DivisionNode: lambda left, right: lambda context: divide(left(context), right(context)),
+    EqualsNode: lambda left, right: lambda context: left(context) == right(context),
+    NotEqualsNode: lambda left, right: lambda context: left(context) != right(context),
+    LessNode: lambda left, right: lambda context: left(context) < right(context),
+    LessEqualsNode: lambda left, right: lambda context: left(context) <= right(context),
+    GreaterNode: lambda left, right: lambda context: left(context) > right(context),
+    GreaterEqualsNode: lambda left, right: lambda context: left(context) >= right(context),
+    AndNode: lambda left, right: lambda context: logical_and(left(context), right(context)),
+    OrNode: lambda left, right: lambda context: logical_or(left(context), right(context)),
+}
+
+# Builds the closure of each logical operation that short-circuits, which only calls the closure of its right
+# operand when the left one does not decide the result.
+SHORT_CIRCUIT_OPERATIONS = {
+    AndNode: lambda left, right: lambda context: left(context) and right(context),
+    OrNode: lambda left, right: lambda context: left(context) or right(context),
+}
+
+# Tells undefined variables apart from variables holding None.
+_UNDEFINED = object()
+
+
+class ClosureCompiler:
+    """
+    The ClosureCompiler class turns every node of the Abstract Syntax Tree (AST) into a Python closure taking
+    the scope context, with the closures of the node's children already bound. Running the program then
+    calls straight from closure to closure: the getters, the isinstance checks of BlockNode and the dispatch
+    on node types are all paid once, when the closures are built, instead of every time a node is evaluated.
+
+    Each closure returns exactly what the node's evaluate method returns, break and continue markers
+    included, so the program behaves exactly like under the tree-walker. What is known about a block ahead of
+    time is used to pick a simpler closure for it, e.g. a block at the top level of the program is never
+    within a loop, so it never has to check for a break or continue marker. Likewise, the variables and
+    functions the Resolver bound to an address are read from the scope at that address.
+    """
+
+    def compile(self, abstract_syntax_tree):
+        """
+        Compiles a program.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: A closure running the program in the ScopeContext it is given.
+        """
+        return self._compile_block(abstract_syntax_tree, BlockScope.GLOBAL)
+
+    def _compile_block(self, block_node, frame):
+        """
+        Compiles a block, up to the first statement that always ends it.
+
+        :param block_node: The BlockNode.
+        :param frame: BlockScope.LOOP within a loop, BlockScope.FUNCTION within a function outside of any loop
+                      and BlockScope.GLOBAL otherwise.
+        :return: The closure running the block and returning its value.
+        """
+        statements = []
+        for node in block_node.get_nodes():
+            statements.append(self._compile_statement(node, frame))
+            if isinstance(node, ReturnNode) or (frame == BlockScope.LOOP and isinstance(node, (BreakNode, ContinueNode))):
+                break
+        if not statements:
+            return lambda context: None
+        if len(statements) == 1:
+            return statements[0]
+
+        # The value of the last statement is the value of the block whether it is a marker or not.
+        *leading_statements, last_statement = statements
+        leading_statements = tuple(leading_statements)
+        if frame == BlockScope.GLOBAL:
+            def block(context):
+                for statement in leading_statements:
+                    statement(context)
+                return last_statement(context)
+        elif frame == BlockScope.LOOP:
+            def block(context):
+                for statement in leading_statements:
+                    value = statement(context)
+                    if value is BREAK or value is CONTINUE:
+                        return value
+                return last_statement(context)
+        else:
+            def block(context):
+                for statement in leading_statements:
+                    value = statement(context)
+                    if (value is BREAK or value is CONTINUE) and context.within_block_scope(BlockScope.LOOP):
+                        return value
+                return last_statement(context)
+        return block
+
+    def _compile_statement(self, node, frame):
+        """
+        Compiles a statement.
+
+        :param node: The statement node.
+        :param frame: The frame of the block the statement is in, see _compile_block.
+        :return: The closure running the statement and returning its value.
+        """
+        if isinstance(node, ReturnNode):
+            return self._compile_expression(node.get_return_value_node())
+        if isinstance(node, BreakNode):
+            return lambda context: BREAK
+        if isinstance(node, ContinueNode):
+            return lambda context: CONTINUE
+        if isinstance(node, ConditionalNode):
+            return self._compile_conditional(node, frame)
+        if isinstance(node, LoopNode):
+            return self._compile_loop(node)
+        if isinstance(node, PrintNode):
+            expression = self._compile_expression(node.get_node_to_print())
+            return lambda context: print_value(expression(context))
+        if isinstance(node, AssignmentNode):
+            return self._compile_assignment(node)
+        if isinstance(node, FunctionNode):
+            return self._compile_function(node)
+        return self._compile_expression(node)
+
+    def _compile_conditional(self, node, frame):
+        """
+        Compiles a chain of conditionals.
+
+        :param node: The IfNode or ElseIfNode.
+        :param frame: The frame of the block the conditional is in, see _compile_block.
+        :return: The closure running the conditional and returning the value of the block that ran, if any.
+        """
+        condition = self._compile_expression(node.get_condition_node())
+        block = self._compile_conditional_block(node.get_block_node(), frame)
+        next_node = node.get_next_conditional_node()
+        if next_node is None:
+            def conditional(context):
+                if condition(context):
+                    return block(context)
+            return conditional
+
+        if isinstance(next_node, ConditionalNode):
+            otherwise = self._compile_conditional(next_node, frame)
+        else:
+            otherwise = self._compile_conditional_block(next_node.get_block_node(), frame)
+
+        def conditional(context):
+            if condition(context):
+                return block(context)
+            return otherwise(context)
+        return conditional
+
+    def _compile_conditional_block(self, block_node, frame):
+        """
+        Compiles the block of a conditional, run in its own conditional scope unless it is scope-free.
+
+        :param block_node: The BlockNode.
+        :param frame: The frame of the block the conditional is in, see _compile_block.
+        :return: The closure running the block in the scope of the conditional and returning its value.
+        """
+        block = self._compile_block(block_node, frame)
+        if block_node.is_scope_free():
+            return block
+        return lambda context: block(context.create_new_scope_context(BlockScope.CONDITIONAL))
+
+    def _compile_loop(self, node):
+        """
+        Compiles a loop, each iteration run in its own loop scope.
+
+        :param node: The LoopNode.
+        :return: The closure running the loop and returning the value of its last iteration.
+        """
+        condition = self._compile_expression(node.get_condition_node())
+        block = self._compile_block(node.get_block_node(), BlockScope.LOOP)
+
+        def loop(context):
+            value = None
+            while condition(context):
+                value = block(context.create_new_scope_context(BlockScope.LOOP))
+                if value is BREAK:
+                    break
+            return value
+        return loop
+
+    def _compile_assignment(self, node):
+        """
+        Compiles a variable declaration or reassignment.
+
+        :param node: The AssignmentNode or ReassignmentNode.
+        :return: The closure running the assignment.
+        """
+        variable_name = node.get_variable_node().get_name()
+        value = self._compile_expression(node.get_value_node())
+        address = node.get_address()
+        if address is not None:
+            # The Resolver proved the declaration cannot fail, or the variable is declared, see AssignmentNode.
+            if isinstance(node, ReassignmentNode):
+                return lambda context: context.reassign_resolved_value(address, variable_name, value(context))
+            return lambda context: context.assign_resolved_value(address, variable_name, value(context))
+        assign = reassign_variable if isinstance(node, ReassignmentNode) else declare_variable
+        line_number = node.get_line_number()
+        return lambda context: assign(context, variable_name, value(context), line_number)
+
+    def _compile_function(self, node):
+        """
+        Compiles a function declaration.
+
+        :param node: The FunctionNode.
+        :return: The closure assigning the function to its name.
+        """
+        function_name = node.get_function_name()
+        function = CompiledFunction(
+            function_name,
+            tuple(node.get_argument_names()),
+            self._compile_block(node.get_function_block_node(), BlockScope.FUNCTION),
+        )
+        return lambda context: context.assign_value(function_name, function)
+
+    def _compile_expression(self, node):
+        """
+        Compiles an expression.
+
+        :param node: The expression node.
+        :return: The closure evaluating the expression.
+        """
+        node_type = type(node)
+        if isinstance(node, LiteralNode):
+            value = node.get_value()
+            return lambda context: value
+        if node_type is VariableNode:
+            return _compile_variable(node)
+        if node_type in SHORT_CIRCUIT_OPERATIONS and node.is_short_circuit():
+            return SHORT_CIRCUIT_OPERATIONS[node_type](
+                self._compile_expression(node.get_left_operand()),
+                self._compile_expression(node.get_right_operand()),
+            )
+        if node_type in BINARY_OPERATIONS:
+            return BINARY_OPERATIONS[node_type](
+                self._compile_expression(node.get_left_operand()),
+                self._compile_expression(node.get_right_operand()),
+            )
+        if node_type is NotNode:
+            operand = self._compile_expression(node.get_condition_node())
+            return lambda context: not operand(context)
+        if node_type is FunctionCallNode:
+            return self._compile_function_call(node)
+        if node_type is BlockNode:
+            return self._compile_block(node, BlockScope.FUNCTION)
+        # Anything else is evaluated by the node itself.
+        return node.evaluate
+
+    def _compile_function_call(self, node):
+        """
+        Compiles a function call, run in a new function scope.
+
+        :param node: The FunctionCallNode.
+        :return: The closure calling the function and returning its value.
+        """
+        function_name = node.get_function_name()
+        arguments = tuple(self._compile_expression(argument) for argument in node.get_arguments())
+        address = node.get_address()
+        if address is not None:
+            def function_call(context):
+                function = context.retrieve_resolved_value(address, function_name)
+                evaluated_args = [argument(context) for argument in arguments]
+                return function.call(context.create_new_scope_context(BlockScope.FUNCTION), evaluated_args)
+            return function_call
+
+        def function_call(context):
+            function = context.find_variable_value(function_name)
+            evaluated_args = [argument(context) for argument in arguments]
+            return function.call(context.create_new_scope_context(BlockScope.FUNCTION), evaluated_args)
+        return function_call
+
+
+def _compile_variable(node):
+    """
+    Compiles a variable, see VariableNode.
+
+    :param node: The VariableNode.
+    :return: The closure retrieving the variable's value.
+    """
+    variable_name = node.get_name()
+    line_number = node.get_line_number()
+    address = node.get_address()
+    if address is not None:
+        def variable(context):
+            value = context.retrieve_resolved_value(address, variable_name, _UNDEFINED)
+            if value is _UNDEFINED:
+                # An argument the call did not pass is not in the function's scope, it is looked up as usual.
+                value = context.find_variable_value(variable_name, _UNDEFINED)
+                if value is _UNDEFINED:
+                    raise SyntaxException(line_number, f"Undefined variable '{variable_name}'")
+            return value
+        return variable
+
+    def variable(context):
+        value = context.find_variable_value(variable_name, _UNDEFINED)
+        if value is _UNDEFINED:
+            raise SyntaxException(line_number, f"Undefined variable '{variable_name}'")
+        return value
+    return variable
@@ -0,0 +1,41 @@
+from mojilang.parser.nodes.callable import Callable
+
+
+class CompiledFunction(Callable):
+    """
+    The CompiledFunction class is the value a Mojilang function declaration assigns to the function's name
+    when the program is run by the PythonCompiler. It is called exactly like a FunctionNode: the arguments
+    are assigned in the function's new scope and the compiled body is run in it.
+
+    Attributes:
+        _function_name (str): The name of the function.
+        _argument_names (tuple): The names of the function's arguments.
+        _body (function): The Python function the function's block was compiled to, taking the scope context.
+    """
+
+    def __init__(self, function_name, argument_names, body):
+        """
+        Initializes the CompiledFunction.
+
+        :param function_name: The name of the function.
+        :param argument_names: The names of the function's arguments.
+        :param body: The Python function the function's block was compiled to.
+        """
+        self._function_name = function_name
+        self._argument_names = argument_names
+        self._body = body
+
+    def call(self, context, arguments):
+        """
+        Calls the function.
+
+        :param context: The new scope context of the call.
+        :param arguments: The values of the arguments.
+        :return: The value of the function's block.
+        """
+        for arg_name, arg_value in zip(self._argument_names, arguments):
+            context.assign_value(arg_name, arg_value)
+        return self._body(context)
+
+    def get_function_name(self):
+        return self._function_name
@@ -0,0 +1,488 @@
+import ast
+
+from mojilang.interpreter.scope import BlockScope
+from mojilang.parser.nodes import (
+    AdditionNode,
+    AndNode,
+    AssignmentNode,
+    BreakNode,
+    ConditionalNode,
+    ContinueNode,
+    DivisionNode,
+    EqualsNode,
+    ExponentNode,
+    FunctionCallNode,
+    FunctionNode,
+    GreaterEqualsNode,
+    GreaterNode,
+    InputNode,
+    LessEqualsNode,
+    LessNode,
+    LiteralNode,
+    LoopNode,
+    ModulusNode,
+    MultiplicationNode,
+    NotEqualsNode,
+    NotNode,
+    OrNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    SubtractionNode,
+    VariableNode,
+)
+from mojilang.compiler.runtime import RUNTIME_NAMESPACE
+
+ARITHMETIC_OPERATORS = {
+    AdditionNode: ast.Add,
+    SubtractionNode: ast.Sub,
+    MultiplicationNode: ast.Mult,
+    ModulusNode: ast.Mod,
+    ExponentNode: ast.Pow,
+}
+COMPARISON_OPERATORS = {
+    EqualsNode: ast.Eq,
+    NotEqualsNode: ast.NotEq,
+    LessNode: ast.Lt,
+    LessEqualsNode: ast.LtE,
+    GreaterNode: ast.Gt,
+    GreaterEqualsNode: ast.GtE,
+}
+# Logical operations compiled to the Python operator when they short-circuit, like it does.
+LOGICAL_OPERATORS = {
+    AndNode: ast.And,
+    OrNode: ast.Or,
+}
+# Operations compiled to a call of the runtime function of the same semantics.
+RUNTIME_OPERATIONS = {
+    DivisionNode: 'divide',
+    AndNode: 'logical_and',
+    OrNode: 'logical_or',
+}
+# Expressions that can never evaluate to a break or continue marker.
+MARKER_FREE_EXPRESSIONS = (
+    LiteralNode, NotNode, InputNode, DivisionNode, *ARITHMETIC_OPERATORS, *COMPARISON_OPERATORS
+)
+
+PROGRAM_FUNCTION = 'program'
+VALUE = 'value'
+NODES = 'NODES'
+
+
+class PythonCompiler:
+    """
+    The PythonCompiler class lowers the Abstract Syntax Tree (AST) of a program into a Python ast.Module
+    and compiles it with compile(), so the program runs as Python bytecode instead of as recursive
+    evaluate calls, one per node.
+
+    Operators become Python operators, conditionals and loops become Python if and while statements, and
+    every Mojilang function becomes a Python function. Variables still live in ScopeContext objects, so
+    block scoping and shadowing work exactly like in the tree-walking interpreter. The variables and functions
+    the Resolver bound to an address are read from the scope at that address, one of the scope context locals
+    of the Python function for the scopes of the running function, without looking them up along the chain.
+
+    The value a block completes with is kept in a single `value` local, exactly like BlockNode passes it on:
+    it is the value of the block's last statement, a return ends the block it is in, and a break or continue
+    marker ends every block up to the loop (or up to the function when it is called within a loop). Since
+    such a marker always ends all the blocks in between, it jumps straight to the loop's Python break or
+    continue, or to the function's return, instead of being checked by every enclosing block.
+
+    Attributes:
+        _functions (list): The Python function definitions of the Mojilang functions lowered so far.
+        _nodes (list): The nodes the lowered program evaluates with their evaluate method, since they have no
+                       Python equivalent.
+    """
+
+    def __init__(self):
+        """
+        Initializes the PythonCompiler.
+        """
+        self._functions = []
+        self._nodes = []
+
+    def compile(self, abstract_syntax_tree):
+        """
+        Compiles a program.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: A Python function running the program in the ScopeContext it is given.
+        """
+        module = self.lower(abstract_syntax_tree)
+        namespace = dict(RUNTIME_NAMESPACE)
+        namespace[NODES] = self._nodes
+        exec(compile(module, '<mojilang>', 'exec'), namespace)
+        return namespace[PROGRAM_FUNCTION]
+
+    def lower(self, abstract_syntax_tree):
+        """
+        Lowers a program into a Python module defining the `program` function and one function per Mojilang
+        function declaration.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: The ast.Module of the program.
+        """
+        self._functions = []
+        self._nodes = []
+        body = self._compile_block(abstract_syntax_tree.get_nodes(), 0, BlockScope.GLOBAL)
+        program = _function_definition(PROGRAM_FUNCTION, body)
+        module = ast.Module(body=self._functions + [program], type_ignores=[])
+        return ast.fix_missing_locations(module)
+
+    def _compile_block(self, nodes, depth, frame):
+        """
+        Compiles the statements of a block, up to the first one that always ends the block.
+
+        :param nodes: The statement nodes of the block.
+        :param depth: The nesting depth of the block, its scope context is the `context_<depth>` local.
+        :param frame: BlockScope.LOOP within a loop, BlockScope.FUNCTION within a function outside of any loop
+                      and BlockScope.GLOBAL otherwise.
+        :return: The list of Python statements.
+        """
+        statements = []
+        for index, node in enumerate(nodes):
+            is_last = index == len(nodes) - 1
+            node_statements, ends_block = self._compile_statement(node, depth, frame, is_last)
+            statements += node_statements
+            if ends_block:
+                break
+        if not statements:
+            statements.append(_assign(VALUE, ast.Constant(None)))
+        return statements
+
+    def _compile_statement(self, node, depth, frame, is_last):
+        """
+        Compiles a statement. Only the statements whose value can be observed store it in `value`: the last
+        statement of a block and statements that may complete with a break or continue marker.
+
+        :param node: The statement node.
+        :param depth: The nesting depth of the block the statement is in.
+        :param frame: The frame of the block the statement is in, see _compile_block.
+        :param is_last: Whether the statement is the last one of its block.
+        :return: A tuple of the list of Python statements and whether the statement always ends its block.
+        """
+        context = _context(depth)
+        ends_block = False
+        if isinstance(node, ReturnNode):
+            statements = [_assign(VALUE, self._compile_expression(node.get_return_value_node(), depth))]
+            if _may_be_marker(node.get_return_value_node()):
+                statements += _marker_exit(depth, frame)
+            ends_block = True
+        elif isinstance(node, (BreakNode, ContinueNode)):
+            statements, ends_block = _compile_loop_control(node, depth, frame)
+        elif isinstance(node, ConditionalNode):
+            statements = [self._compile_conditional(node, depth, frame, is_last)]
+        elif isinstance(node, LoopNode):
+            statements = self._compile_loop(node, depth, frame, is_last)
+        else:
+            statements = self._compile_simple_statement(node, depth, context)
+            if statements is None:
+                statements = [_assign(VALUE, self._compile_expression(node, depth))]
+                if _may_be_marker(node):
+                    statements += _marker_exit(depth, frame)
+            elif is_last:
+                statements.append(_assign(VALUE, ast.Constant(None)))
+        return _locate(statements, node), ends_block
+
+    def _compile_simple_statement(self, node, depth, context):
+        """
+        Compiles a statement that always completes with None.
+
+        :param node: The statement node.
+        :param depth: The nesting depth of the block the statement is in.
+        :param context: The name of the scope context local.
+        :return: The list of Python statements, or None if the node is not such a statement.
+        """
+        if isinstance(node, PrintNode):
+            return [_expression(_call('print_value', self._compile_expression(node.get_node_to_print(), depth)))]
+        if isinstance(node, AssignmentNode):
+            if node.get_address() is not None:
+                # The Resolver proved the declaration cannot fail, or the variable is declared, see AssignmentNode.
+                is_reassignment = isinstance(node, ReassignmentNode)
+                return [_expression(_method_call(
+                    context,
+                    'reassign_resolved_value' if is_reassignment else 'assign_resolved_value',
+                    ast.Constant(node.get_address()),
+                    ast.Constant(node.get_variable_node().get_name()),
+                    self._compile_expression(node.get_value_node(), depth),
+                ))]
+            runtime_function = 'reassign_variable' if isinstance(node, ReassignmentNode) else 'declare_variable'
+            return [_expression(_call(
+                runtime_function,
+                ast.Name(context, ast.Load()),
+                ast.Constant(node.get_variable_node().get_name()),
+                self._compile_expression(node.get_value_node(), depth),
+                ast.Constant(node.get_line_number()),
+            ))]
+        if isinstance(node, FunctionNode):
+            body = self._compile_block(node.get_function_block_node().get_nodes(), 0, BlockScope.FUNCTION)
+            # Functions declared within the body have been added by now, so the name is still unique.
+            body_name = f'function_{len(self._functions)}'
+            self._functions.append(_function_definition(
+                body_name, [_assign(VALUE, ast.Constant(None))] + body + [ast.Return(ast.Name(VALUE, ast.Load()))]
+            ))
+            function = _call(
+                'CompiledFunction',
+                ast.Constant(node.get_function_name()),
+                ast.Constant(tuple(node.get_argument_names())),
+                ast.Name(body_name, ast.Load()),
+            )
+            return [_expression(
+                _method_call(context, 'assign_value', ast.Constant(node.get_function_name()), function)
+            )]
+        return None
+
+    def _compile_conditional(self, node, depth, frame, is_last):
+        """
+        Compiles a chain of conditionals into an if statement.
+
+        :param node: The IfNode or ElseIfNode.
+        :param depth: The nesting depth of the block the conditional is in.
+        :param frame: The frame of the block the conditional is in, see _compile_block.
+        :param is_last: Whether the conditional is the last statement of its block, in which case it stores
+                        None when no block runs.
+        :return: The Python if statement.
+        """
+        next_node = node.get_next_conditional_node()
+        if next_node is None:
+            orelse = [_assign(VALUE, ast.Constant(None))] if is_last else []
+        elif isinstance(next_node, ConditionalNode):
+            orelse = [self._compile_conditional(next_node, depth, frame, is_last)]
+        else:
+            orelse = self._compile_conditional_block(next_node.get_block_node(), depth, frame)
+        return _locate([ast.If(
+            test=self._compile_expression(node.get_condition_node(), depth),
+            body=self._compile_conditional_block(node.get_block_node(), depth, frame),
+            orelse=orelse,
+        )], node)[0]
+
+    def _compile_loop(self, node, depth, frame, is_last):
+        """
+        Compiles a loop into a while statement, each iteration in its own loop scope.
+
+        :param node: The LoopNode.
+        :param depth: The nesting depth of the block the loop is in.
+        :param frame: The frame of the block the loop is in, see _compile_block.
+        :param is_last: Whether the loop is the last statement of its block.
+        :return: The list of Python statements.
+        """
+        # The value is None when the loop does not run, it is checked below unless at the top level.
+        statements = [_assign(VALUE, ast.Constant(None))] if is_last or frame != BlockScope.GLOBAL else []
+        statements.append(ast.While(
+            test=self._compile_expression(node.get_condition_node(), depth),
+            body=self._compile_scoped_block(node.get_block_node(), depth, BlockScope.LOOP, BlockScope.LOOP),
+            orelse=[],
+        ))
+        # A loop ending with a break or continue passes the marker on, like LoopNode does.
+        return statements + _marker_exit(depth, frame)
+
+    def _compile_conditional_block(self, block_node, depth, frame):
+        """
+        Compiles the block of a conditional, run in its own conditional scope unless it is scope-free.
+
+        :param block_node: The BlockNode.
+        :param depth: The nesting depth of the block the conditional is in.
+        :param frame: The frame of the block, see _compile_block.
+        :return: The list of Python statements.
+        """
+        if block_node.is_scope_free():
+            return self._compile_block(block_node.get_nodes(), depth, frame)
+        return self._compile_scoped_block(block_node, depth, frame, BlockScope.CONDITIONAL)
+
+    def _compile_scoped_block(self, block_node, depth, frame, block_scope):
+        """
+        Compiles a block run in a new scope context.
+
+        :param block_node: The BlockNode.
+        :param depth: The nesting depth of the block the new scope is created in.
+        :param frame: The frame of the block, see _compile_block.
+        :param block_scope: The BlockScope of the new scope.
+        :return: The list of Python statements.
+        """
+        new_context = _method_call(_context(depth), 'create_new_scope_context', ast.Name(block_scope.value, ast.Load()))
+        new_scope = _assign(_context(depth + 1), new_context)
+        return [new_scope] + self._compile_block(block_node.get_nodes(), depth + 1, frame)
+
+    def _compile_expression(self, node, depth):
+        """
+        Compiles an expression.
+
+        :param node: The expression node.
+        :param depth: The nesting depth of the block the expression is in.
+        :return: The Python expression.
+        """
+        context = _context(depth)
+        node_type = type(node)
+        if isinstance(node, LiteralNode):
+            return ast.Constant(node.get_value())
+        if node_type is VariableNode:
+            address = node.get_address()
+            if address is None:
+                return _call(
+                    'load_variable', ast.Name(context, ast.Load()), ast.Constant(node.get_name()),
+                    ast.Constant(node.get_line_number())
+                )
+            if 0 <= address <= depth:
+                # The scope the variable is bound to is one of the scope context locals.
+                context, address = _context(depth - address), 0
+            return _call(
+                'load_resolved_variable', ast.Name(context, ast.Load()), ast.Constant(address),
+                ast.Constant(node.get_name()), ast.Constant(node.get_line_number())
+            )
+        if node_type in ARITHMETIC_OPERATORS:
+            return ast.BinOp(
+                self._compile_expression(node.get_left_operand(), depth),
+                ARITHMETIC_OPERATORS[node_type](),
+                self._compile_expression(node.get_right_operand(), depth),
+            )
+        if node_type in COMPARISON_OPERATORS:
+            return ast.Compare(
+                self._compile_expression(node.get_left_operand(), depth),
+                [COMPARISON_OPERATORS[node_type]()],
+                [self._compile_expression(node.get_right_operand(), depth)],
+            )
+        if node_type in LOGICAL_OPERATORS and node.is_short_circuit():
+            return ast.BoolOp(
+                LOGICAL_OPERATORS[node_type](),
+                [
+                    self._compile_expression(node.get_left_operand(), depth),
+                    self._compile_expression(node.get_right_operand(), depth),
+                ],
+            )
+        if node_type in RUNTIME_OPERATIONS:
+            return _call(
+                RUNTIME_OPERATIONS[node_type],
+                self._compile_expression(node.get_left_operand(), depth),
+                self._compile_expression(node.get_right_operand(), depth),
+            )
+        if node_type is NotNode:
+            return ast.UnaryOp(ast.Not(), self._compile_expression(node.get_condition_node(), depth))
+        if node_type is FunctionCallNode:
+            if node.get_address() is None:
+                function = _method_call(context, 'find_variable_value', ast.Constant(node.get_function_name()))
+            else:
+                function = _method_call(
+                    context, 'retrieve_resolved_value', ast.Constant(node.get_address()),
+                    ast.Constant(node.get_function_name())
+                )
+            return _call(
+                'call_function',
+                function,
+                ast.Name(context, ast.Load()),
+                ast.List([self._compile_expression(argument, depth) for argument in node.get_arguments()], ast.Load()),
+            )
+        if node_type is InputNode:
+            return _call('input', ast.Constant(node.get_input_message()))
+        # Anything else is evaluated by the node itself.
+        self._nodes.append(node)
+        return _method_call(
+            ast.Subscript(ast.Name(NODES, ast.Load()), ast.Constant(len(self._nodes) - 1), ast.Load()),
+            'evaluate', ast.Name(context, ast.Load())
+        )
+
+
+def _compile_loop_control(node, depth, frame):
+    """
+    Compiles a break or continue, which ends the blocks up to the loop. Outside of a loop it is a statement
+    like any other, while a function called within a loop ends the loop it is called in.
+
+    :param node: The BreakNode or ContinueNode.
+    :param depth: The nesting depth of the block the statement is in.
+    :param frame: The frame of the block the statement is in, see _compile_block.
+    :return: A tuple of the list of Python statements and whether the statement always ends its block.
+    """
+    is_break = isinstance(node, BreakNode)
+    statements = [_assign(VALUE, ast.Name('BREAK' if is_break else 'CONTINUE', ast.Load()))]
+    if frame == BlockScope.LOOP:
+        statements.append(ast.Break() if is_break else ast.Continue())
+        return statements, True
+    if frame == BlockScope.FUNCTION:
+        statements.append(ast.If(
+            test=_method_call(_context(depth), 'within_block_scope', ast.Name('LOOP', ast.Load())),
+            body=[ast.Return(ast.Name(VALUE, ast.Load()))],
+            orelse=[],
+        ))
+    return statements, False
+
+
+def _marker_exit(depth, frame):
+    """
+    Builds the statements ending the blocks up to the loop or function when `value` holds a break or
+    continue marker.
+
+    :param depth: The nesting depth of the block.
+    :param frame: The frame of the block, see _compile_block.
+    :return: The list of Python statements.
+    """
+    if frame == BlockScope.LOOP:
+        return [
+            ast.If(test=_is_name(VALUE, 'BREAK'), body=[ast.Break()], orelse=[]),
+            ast.If(test=_is_name(VALUE, 'CONTINUE'), body=[ast.Continue()], orelse=[]),
+        ]
+    if frame == BlockScope.FUNCTION:
+        is_marker = ast.BoolOp(ast.Or(), [_is_name(VALUE, 'BREAK'), _is_name(VALUE, 'CONTINUE')])
+        within_loop = _method_call(_context(depth), 'within_block_scope', ast.Name('LOOP', ast.Load()))
+        return [ast.If(
+            test=ast.BoolOp(ast.And(), [is_marker, within_loop]),
+            body=[ast.Return(ast.Name(VALUE, ast.Load()))],
+            orelse=[],
+        )]
+    # Nothing at the top level of the program is within a loop.
+    return []
+
+
+def _may_be_marker(node):
+    return not isinstance(node, MARKER_FREE_EXPRESSIONS)
+
+
+def _context(depth):
+    return f'context_{depth}'
+
+
+def _function_definition(name, body):
+    arguments = ast.arguments(
+        posonlyargs=[], args=[ast.arg(_context(0))], vararg=None, kwonlyargs=[], kw_defaults=[], kwarg=None,
+        defaults=[]
+    )
+    return ast.FunctionDef(name=name, args=arguments, body=body, decorator_list=[], returns=None)
+
+
+def _assign(name, value):
+    return ast.Assign(targets=[ast.Name(name, ast.Store())], value=value)
+
+
+def _expression(value):
+    return ast.Expr(value)
+
+
+def _call(function_name, *arguments):
+    return ast.Call(ast.Name(function_name, ast.Load()), list(arguments), [])
+
+
+def _method_call(instance, method_name, *arguments):
+    if isinstance(instance, str):
+        instance = ast.Name(instance, ast.Load())
+    return ast.Call(ast.Attribute(instance, method_name, ast.Load()), list(arguments), [])
+
+
+def _is_name(name, other_name):
+    return ast.Compare(ast.Name(name, ast.Load()), [ast.Is()], [ast.Name(other_name, ast.Load())])
+
+
+def _locate(statements, node):
+    """
+    Gives the statements compiled from a node the node's line number, so Python tracebacks point at the
+    line of the Mojilang program. Nested statements that already have a line number keep it.
+
+    :param statements: The Python statements.
+    :param node: The node the statements were compiled from.
+    :return: The statements.
+    """
+    line_number = getattr(node, 'get_line_number', lambda: None)()
+    if not isinstance(line_number, int) or line_number < 1:
+        return statements
+    for statement in statements:
+        for python_node in ast.walk(statement):
+            if 'lineno' in python_node._attributes and not hasattr(python_node, 'lineno'):
+                python_node.lineno = python_node.end_lineno = line_number
+                python_node.col_offset = python_node.end_col_offset = 0
+    return statements
@@ -0,0 +1,124 @@
+from mojilang.interpreter.scope import BlockScope
+from mojilang.lexer import SyntaxException
+from mojilang.parser.runtime_exception import RuntimeException
+from mojilang.parser.nodes import BreakNode, ContinueNode
+from mojilang.compiler.compiled_function import CompiledFunction
+
+# The functions below are what compiled programs call for the parts of the Mojilang semantics that do not
+# map onto a single Python operation. Each behaves exactly like the evaluate method of the node it names.
+
+
+# A block completing because of a break or continue completes with a BreakNode or ContinueNode, exactly
+# like the tree-walker, since the marker is a value that can end up printed or in an error message.
+BREAK = BreakNode(None)
+CONTINUE = ContinueNode(None)
+
+# Tells undefined variables apart from variables holding None.
+_UNDEFINED = object()
+
+
+def load_variable(context, variable_name, line_number):
+    """
+    Retrieves the value of a variable, see VariableNode.
+
+    :raises SyntaxException: If the variable is not defined.
+    """
+    value = context.find_variable_value(variable_name, _UNDEFINED)
+    if value is _UNDEFINED:
+        raise SyntaxException(line_number, f"Undefined variable '{variable_name}'")
+    return value
+
+
+def load_resolved_variable(context, depth, variable_name, line_number):
+    """
+    Retrieves the value of a variable from the scope at the address the Resolver bound it to, see VariableNode.
+
+    :raises SyntaxException: If the variable is not defined.
+    """
+    value = context.retrieve_resolved_value(depth, variable_name, _UNDEFINED)
+    if value is _UNDEFINED:
+        # An argument the call did not pass is not in the function's scope, it is looked up as usual.
+        return load_variable(context, variable_name, line_number)
+    return value
+
+
+def declare_variable(context, variable_name, value, line_number):
+    """
+    Declares a variable in the current scope, see AssignmentNode.
+
+    :raises RuntimeException: If the variable is already declared in the current scope.
+    """
+    if context.current_scope_contains_variable(variable_name):
+        raise RuntimeException("Variable has already been declared. Cannot redeclare.", line_number)
+    context.assign_value(variable_name, value)
+
+
+def reassign_variable(context, variable_name, value, line_number):
+    """
+    Reassigns a declared variable, see ReassignmentNode.
+
+    :raises RuntimeException: If the variable is not declared in the current scope.
+    """
+    if not context.current_scope_contains_variable(variable_name):
+        raise RuntimeException("Variable has not been declared yet.", line_number)
+    context.reassign_value(variable_name, value)
+
+
+def call_function(function, context, arguments):
+    """
+    Calls a function in a new function scope, see FunctionCallNode.
+    """
+    return function.call(context.create_new_scope_context(BlockScope.FUNCTION), arguments)
+
+
+def divide(left_value, right_value):
+    """
+    Divides two values, see DivisionNode.
+
+    :raises ZeroDivisionError: If the right value is zero.
+    """
+    if right_value == 0:
+        raise ZeroDivisionError("Attempting to divide by zero.")
+    return left_value / right_value
+
+
+def logical_and(left_value, right_value):
+    """
+    Both operands are evaluated before the operation, see AndNode when it does not short-circuit.
+    """
+    return left_value and right_value
+
+
+def logical_or(left_value, right_value):
+    """
+    Both operands are evaluated before the operation, see OrNode when it does not short-circuit.
+    """
+    return left_value or right_value
+
+
+def print_value(value_to_print):
+    """
+    Prints a value, booleans as emoji, see PrintNode.
+    """
+    if isinstance(value_to_print, bool):
+        value_to_print = "😤" if value_to_print else "😔"
+    print(value_to_print)
+
+
+# The globals compiled programs run with.
+RUNTIME_NAMESPACE = {
+    'BREAK': BREAK,
+    'CONTINUE': CONTINUE,
+    'LOOP': BlockScope.LOOP,
+    'CONDITIONAL': BlockScope.CONDITIONAL,
+    'CompiledFunction': CompiledFunction,
+    'load_variable': load_variable,
+    'load_resolved_variable': load_resolved_variable,
+    'declare_variable': declare_variable,
+    'reassign_variable': reassign_variable,
+    'call_function': call_function,
+    'divide': divide,
+    'logical_and': logical_and,
+    'logical_or': logical_or,
+    'print_value': print_value,
+}
@@ -0,0 +1,13 @@
+from .flat_tree import FlatTree
+from .flat_tree_compiler import FlatTreeCompiler
+from .flat_tree_decoder import FlatTreeDecoder
+from .flat_tree_encoder import FlatTreeEncoder
+from .node_kind import NodeKind
+
+__all__ = [
+    'FlatTree',
+    'FlatTreeCompiler',
+    'FlatTreeDecoder',
+    'FlatTreeEncoder',
+    'NodeKind',
+]
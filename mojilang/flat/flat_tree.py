@@ -0,0 +1,235 @@
+import mmap
+import struct
+import sys
+from array import array
+
+from mojilang.flat.node_kind import KIND_MASK, RECORD_SIZE
+
+FLAT_TREE_VERSION = 1
+MAGIC = b'MOJIF'
+FLAT_TREE_SUFFIX = '.mojif'
+
+# The magic, the version, the byte order, the root record and the size of each section.
+HEADER = struct.Struct('<5sBcxiiiiii')
+# The arrays are read as they are, in the byte order of the machine that wrote them.
+BYTE_ORDER = b'<' if sys.byteorder == 'little' else b'>'
+
+# Every section starts at a multiple of the alignment, so the 8 byte numbers are aligned.
+ALIGNMENT = 8
+
+
+class FlatTree:
+    """
+    The FlatTree class holds an Abstract Syntax Tree (AST) flattened into a handful of contiguous arrays instead
+    of a graph of node objects, see FlatTreeEncoder. It reads the arrays straight from the buffer it is given,
+    e.g. a memory-mapped .mojif file, so loading a tree never deserializes its nodes, and a compiler walks the
+    records directly, see FlatTreeCompiler.
+
+    The buffer holds the HEADER followed by five sections, each aligned to ALIGNMENT bytes:
+        records: RECORD_SIZE 32-bit integers per node, see NodeKind.
+        lists: 32-bit integers, each list being its length followed by its items.
+        numbers: 64-bit floats, the number pool.
+        string offsets: one 32-bit integer per string plus one, where each string of the string data starts.
+        string data: the UTF-8 encoded strings of the string pool, one after the other.
+    The header is little-endian, the sections are in the byte order of the machine that wrote them, which the
+    header records, since they are read without converting them.
+
+    Attributes:
+        _buffer (memoryview): The buffer holding the tree.
+        _mapping (mmap.mmap): The memory-mapped file the buffer is read from, if any.
+        _root (int): The index of the record of the BlockNode at the root of the program.
+        _records (memoryview): The records, as 32-bit integers.
+        _lists (memoryview): The lists, as 32-bit integers.
+        _numbers (memoryview): The number pool, as 64-bit floats.
+        _string_offsets (memoryview): The start of each string in the string data.
+        _string_data (memoryview): The string data, as bytes.
+    """
+
+    def __init__(self, buffer, mapping=None):
+        """
+        Initializes the FlatTree over a buffer, without copying it.
+
+        :param buffer: An object supporting the buffer protocol holding the tree, see to_bytes.
+        :param mapping: The memory-mapped file the buffer is read from, closed along with the tree.
+        :raises ValueError: If the buffer does not hold a flat tree of this version.
+        """
+        # The buffer is only viewed once its header is checked, so a rejected mapping has no view left to close.
+        self._root, section_sizes = _read_header(buffer)
+        self._buffer = memoryview(buffer)
+        self._mapping = mapping
+
+        sections = []
+        offset = HEADER.size
+        for size in section_sizes:
+            offset = _align(offset)
+            sections.append(self._buffer[offset:offset + size])
+            offset += size
+        records, lists, numbers, string_offsets, self._string_data = sections
+        self._records = records.cast('i')
+        self._lists = lists.cast('i')
+        self._numbers = numbers.cast('d')
+        self._string_offsets = string_offsets.cast('i')
+
+    @classmethod
+    def load(cls, path):
+        """
+        Maps a .mojif file into memory and reads the tree it holds from it, the file is only read as the tree is.
+
+        :param path: The path to the .mojif file.
+        :return: The FlatTree, to be closed once it is no longer needed.
+        :raises ValueError: If the file does not hold a flat tree of this version.
+        """
+        with open(path, 'rb') as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(mapping, mapping)
+        except ValueError:
+            mapping.close()
+            raise
+
+    @staticmethod
+    def to_bytes(root, records, lists, numbers, strings):
+        """
+        Lays out the arrays of a tree in the format the FlatTree reads.
+
+        :param root: The index of the root record.
+        :param records: The array('i') of the records.
+        :param lists: The array('i') of the lists.
+        :param numbers: The array('d') of the number pool.
+        :param strings: The strings of the string pool.
+        :return: The bytes holding the tree.
+        """
+        encoded_strings = [string.encode('utf-8') for string in strings]
+        string_offsets = [0]
+        for encoded_string in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(encoded_string))
+        string_data = b''.join(encoded_strings)
+
+        data = bytearray(HEADER.pack(
+            MAGIC, FLAT_TREE_VERSION, BYTE_ORDER, root, len(records) // RECORD_SIZE, len(lists), len(numbers),
+            len(strings), len(string_data),
+        ))
+        sections = (
+            records.tobytes(), lists.tobytes(), numbers.tobytes(), array('i', string_offsets).tobytes(), string_data
+        )
+        for section in sections:
+            data += bytes(_align(len(data)) - len(data))
+            data += section
+        return bytes(data)
+
+    def close(self):
+        """
+        Releases the buffer, and closes the memory-mapped file it is read from if any.
+        """
+        for view in (self._records, self._lists, self._numbers, self._string_offsets, self._string_data,
+                     self._buffer):
+            view.release()
+        if self._mapping is not None:
+            self._mapping.close()
+            self._mapping = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def get_root(self):
+        return self._root
+
+    def get_record_count(self):
+        return len(self._records) // RECORD_SIZE
+
+    def get_record(self, index):
+        """
+        :param index: The index of a record.
+        :return: The RECORD_SIZE integers of the record, see NodeKind.
+        """
+        start = index * RECORD_SIZE
+        return tuple(self._records[start:start + RECORD_SIZE])
+
+    def get_kind(self, index):
+        """
+        :param index: The index of a record.
+        :return: The NodeKind of the record, without its flags.
+        """
+        return self._records[index * RECORD_SIZE] & KIND_MASK
+
+    def get_flags(self, index):
+        """
+        :param index: The index of a record.
+        :return: The flags of the record.
+        """
+        return self._records[index * RECORD_SIZE] & ~KIND_MASK
+
+    def get_line_number(self, index):
+        """
+        :param index: The index of a record.
+        :return: The line number of the node, None if unknown.
+        """
+        line_number = self._records[index * RECORD_SIZE + 1]
+        return None if line_number < 0 else line_number
+
+    def get_operands(self, index):
+        """
+        :param index: The index of a record.
+        :return: The three operands of the record, see NodeKind.
+        """
+        start = index * RECORD_SIZE + 2
+        return tuple(self._records[start:start + 3])
+
+    def get_list(self, offset):
+        """
+        :param offset: The offset of a list in the list array.
+        :return: The items of the list.
+        """
+        return tuple(self._lists[offset + 1:offset + 1 + self._lists[offset]])
+
+    def get_number(self, index):
+        return self._numbers[index]
+
+    def get_string(self, index):
+        """
+        :param index: The index of a string of the string pool.
+        :return: The string, decoded from the string data.
+        """
+        return str(self._string_data[self._string_offsets[index]:self._string_offsets[index + 1]], 'utf-8')
+
+
+def _read_header(buffer):
+    """
+    Reads the header of a buffer and checks that the buffer holds the whole tree it describes.
+
+    :param buffer: An object supporting the buffer protocol holding the tree.
+    :return: The index of the root record, and the size of each section in bytes.
+    :raises ValueError: If the buffer does not hold a flat tree of this version.
+    """
+    with memoryview(buffer) as view:
+        buffer_size = view.nbytes
+        if buffer_size < HEADER.size:
+            raise ValueError('The buffer is too short to hold a flat tree.')
+        (magic, version, byte_order, root, record_count, list_length,
+         number_count, string_count, string_data_size) = HEADER.unpack_from(view)
+    if magic != MAGIC or version != FLAT_TREE_VERSION:
+        raise ValueError(f'The buffer does not hold a flat tree of version {FLAT_TREE_VERSION}.')
+    if byte_order != BYTE_ORDER:
+        raise ValueError('The flat tree was written on a machine of a different byte order.')
+    section_sizes = (
+        record_count * RECORD_SIZE * 4, list_length * 4, number_count * 8, (string_count + 1) * 4, string_data_size
+    )
+    offset = HEADER.size
+    for size in section_sizes:
+        if size < 0:
+            raise ValueError('The header of the flat tree is corrupt.')
+        offset = _align(offset) + size
+    if offset > buffer_size:
+        raise ValueError('The buffer is too short to hold the flat tree its header describes.')
+    return root, section_sizes
+
+
+def _align(offset):
+    """
+    :param offset: An offset in the buffer.
+    :return: The first offset aligned to ALIGNMENT bytes at or past it.
+    """
+    return -(-offset // ALIGNMENT) * ALIGNMENT
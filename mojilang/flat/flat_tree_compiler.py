@@ -0,0 +1,346 @@
+from mojilang.interpreter.scope import BlockScope
+from mojilang.lexer import SyntaxException
+from mojilang.compiler.closure_compiler import BINARY_OPERATIONS, SHORT_CIRCUIT_OPERATIONS
+from mojilang.compiler.compiled_function import CompiledFunction
+from mojilang.compiler.runtime import BREAK, CONTINUE, declare_variable, print_value, reassign_variable
+from mojilang.flat.flat_tree_encoder import BINARY_OPERATION_KINDS
+from mojilang.flat.node_kind import INTEGER, KIND_MASK, NodeKind, SCOPE_FREE, SHORT_CIRCUIT
+
+# The node class of each binary operation kind, whose closure the ClosureCompiler builds.
+BINARY_OPERATION_CLASSES = {kind: node_class for node_class, kind in BINARY_OPERATION_KINDS.items()}
+
+# The kinds of the statements ending the block they are in, the break and continue ones only within a loop.
+RETURN_KIND = NodeKind.RETURN
+MARKER_KINDS = frozenset((NodeKind.BREAK, NodeKind.CONTINUE))
+
+# Tells undefined variables apart from variables holding None.
+_UNDEFINED = object()
+
+
+class FlatTreeCompiler:
+    """
+    The FlatTreeCompiler class turns the records of a FlatTree into Python closures, exactly like the
+    ClosureCompiler turns the nodes of an Abstract Syntax Tree (AST) into them, so the program behaves
+    exactly like under the tree-walker. It reads the records straight from the flat tree's arrays and never
+    builds the nodes, so running a program loaded from a memory-mapped .mojif file only touches the records
+    it compiles.
+
+    Each method compiles a record given as the tuple of its integers, see FlatTree.get_record, and the methods
+    compiling each kind of record are looked up in a table rather than tested one after the other.
+
+    Attributes:
+        _flat_tree (FlatTree): The flat tree being compiled.
+        _statement_compilers (dict): The method compiling each kind of statement that is not an expression.
+        _expression_compilers (dict): The method compiling each kind of expression.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FlatTreeCompiler.
+        """
+        self._flat_tree = None
+        self._statement_compilers = {
+            NodeKind.RETURN: lambda record, frame: self._compile_expression(self._flat_tree.get_record(record[2])),
+            NodeKind.BREAK: lambda record, frame: lambda context: BREAK,
+            NodeKind.CONTINUE: lambda record, frame: lambda context: CONTINUE,
+            NodeKind.IF: self._compile_conditional,
+            NodeKind.ELSE_IF: self._compile_conditional,
+            NodeKind.LOOP: lambda record, frame: self._compile_loop(record),
+            NodeKind.PRINT: lambda record, frame: self._compile_print(record),
+            NodeKind.ASSIGNMENT: lambda record, frame: self._compile_assignment(record, declare_variable),
+            NodeKind.REASSIGNMENT: lambda record, frame: self._compile_assignment(record, reassign_variable),
+            NodeKind.FUNCTION: lambda record, frame: self._compile_function(record),
+        }
+        self._expression_compilers = {
+            NodeKind.BLOCK: lambda record: self._compile_block(record, BlockScope.FUNCTION),
+            NodeKind.NUMBER: self._compile_literal,
+            NodeKind.STRING: self._compile_literal,
+            NodeKind.BOOLEAN: self._compile_literal,
+            NodeKind.VARIABLE: self._compile_variable,
+            NodeKind.INPUT: self._compile_input,
+            NodeKind.NOT: self._compile_not,
+            NodeKind.FUNCTION_CALL: self._compile_function_call,
+        }
+        for kind in BINARY_OPERATION_CLASSES:
+            self._expression_compilers[kind] = self._compile_binary_operation
+
+    def compile(self, flat_tree):
+        """
+        Compiles a program.
+
+        :param flat_tree: The FlatTree of the program.
+        :return: A closure running the program in the ScopeContext it is given.
+        """
+        self._flat_tree = flat_tree
+        try:
+            return self._compile_block(flat_tree.get_record(flat_tree.get_root()), BlockScope.GLOBAL)
+        finally:
+            self._flat_tree = None
+
+    def _compile_block(self, record, frame):
+        """
+        Compiles a block, up to the first statement that always ends it, see ClosureCompiler._compile_block.
+
+        :param record: The BLOCK record.
+        :param frame: BlockScope.LOOP within a loop, BlockScope.FUNCTION within a function outside of any loop
+                      and BlockScope.GLOBAL otherwise.
+        :return: The closure running the block and returning its value.
+        """
+        flat_tree = self._flat_tree
+        in_loop = frame == BlockScope.LOOP
+        statements = []
+        for statement_index in flat_tree.get_list(record[2]):
+            statement_record = flat_tree.get_record(statement_index)
+            statements.append(self._compile_statement(statement_record, frame))
+            kind = statement_record[0] & KIND_MASK
+            if kind == RETURN_KIND or (in_loop and kind in MARKER_KINDS):
+                break
+        if not statements:
+            return lambda context: None
+        if len(statements) == 1:
+            return statements[0]
+
+        # The value of the last statement is the value of the block whether it is a marker or not.
+        *leading_statements, last_statement = statements
+        leading_statements = tuple(leading_statements)
+        if frame == BlockScope.GLOBAL:
+            def block(context):
+                for statement in leading_statements:
+                    statement(context)
+                return last_statement(context)
+        elif in_loop:
+            def block(context):
+                for statement in leading_statements:
+                    value = statement(context)
+                    if value is BREAK or value is CONTINUE:
+                        return value
+                return last_statement(context)
+        else:
+            def block(context):
+                for statement in leading_statements:
+                    value = statement(context)
+                    if (value is BREAK or value is CONTINUE) and context.within_block_scope(BlockScope.LOOP):
+                        return value
+                return last_statement(context)
+        return block
+
+    def _compile_statement(self, record, frame):
+        """
+        Compiles a statement.
+
+        :param record: The statement's record.
+        :param frame: The frame of the block the statement is in, see _compile_block.
+        :return: The closure running the statement and returning its value.
+        """
+        compile_statement = self._statement_compilers.get(record[0] & KIND_MASK)
+        if compile_statement is None:
+            return self._compile_expression(record)
+        return compile_statement(record, frame)
+
+    def _compile_conditional(self, record, frame):
+        """
+        Compiles a chain of conditionals.
+
+        :param record: The IF or ELSE_IF record.
+        :param frame: The frame of the block the conditional is in, see _compile_block.
+        :return: The closure running the conditional and returning the value of the block that ran, if any.
+        """
+        flat_tree = self._flat_tree
+        _, _, condition_index, block_index, next_index = record
+        condition = self._compile_expression(flat_tree.get_record(condition_index))
+        block = self._compile_conditional_block(flat_tree.get_record(block_index), frame)
+        if next_index < 0:
+            def conditional(context):
+                if condition(context):
+                    return block(context)
+            return conditional
+
+        next_record = flat_tree.get_record(next_index)
+        if next_record[0] & KIND_MASK == NodeKind.ELSE_IF:
+            otherwise = self._compile_conditional(next_record, frame)
+        else:
+            otherwise = self._compile_conditional_block(flat_tree.get_record(next_record[2]), frame)
+
+        def conditional(context):
+            if condition(context):
+                return block(context)
+            return otherwise(context)
+        return conditional
+
+    def _compile_conditional_block(self, record, frame):
+        """
+        Compiles the block of a conditional, run in its own conditional scope unless it is scope-free.
+
+        :param record: The BLOCK record.
+        :param frame: The frame of the block the conditional is in, see _compile_block.
+        :return: The closure running the block in the scope of the conditional and returning its value.
+        """
+        block = self._compile_block(record, frame)
+        if record[0] & SCOPE_FREE:
+            return block
+        return lambda context: block(context.create_new_scope_context(BlockScope.CONDITIONAL))
+
+    def _compile_loop(self, record):
+        """
+        Compiles a loop, each iteration run in its own loop scope.
+
+        :param record: The LOOP record.
+        :return: The closure running the loop and returning the value of its last iteration.
+        """
+        condition = self._compile_expression(self._flat_tree.get_record(record[2]))
+        block = self._compile_block(self._flat_tree.get_record(record[3]), BlockScope.LOOP)
+
+        def loop(context):
+            value = None
+            while condition(context):
+                value = block(context.create_new_scope_context(BlockScope.LOOP))
+                if value is BREAK:
+                    break
+            return value
+        return loop
+
+    def _compile_print(self, record):
+        """
+        Compiles a print statement.
+
+        :param record: The PRINT record.
+        :return: The closure printing the value.
+        """
+        expression = self._compile_expression(self._flat_tree.get_record(record[2]))
+        return lambda context: print_value(expression(context))
+
+    def _compile_assignment(self, record, assign):
+        """
+        Compiles a variable declaration or reassignment.
+
+        :param record: The ASSIGNMENT or REASSIGNMENT record.
+        :param assign: The runtime function declaring or reassigning the variable.
+        :return: The closure running the assignment.
+        """
+        _, line_number, name_index, value_index, _ = record
+        variable_name = self._flat_tree.get_string(name_index)
+        value = self._compile_expression(self._flat_tree.get_record(value_index))
+        line_number = None if line_number < 0 else line_number
+        return lambda context: assign(context, variable_name, value(context), line_number)
+
+    def _compile_function(self, record):
+        """
+        Compiles a function declaration.
+
+        :param record: The FUNCTION record.
+        :return: The closure assigning the function to its name.
+        """
+        flat_tree = self._flat_tree
+        _, _, name_index, block_index, argument_names_offset = record
+        function_name = flat_tree.get_string(name_index)
+        function = CompiledFunction(
+            function_name,
+            tuple(flat_tree.get_string(name) for name in flat_tree.get_list(argument_names_offset)),
+            self._compile_block(flat_tree.get_record(block_index), BlockScope.FUNCTION),
+        )
+        return lambda context: context.assign_value(function_name, function)
+
+    def _compile_expression(self, record):
+        """
+        Compiles an expression.
+
+        :param record: The expression's record.
+        :return: The closure evaluating the expression.
+        :raises ValueError: If the record is not an expression.
+        """
+        kind = record[0] & KIND_MASK
+        compile_expression = self._expression_compilers.get(kind)
+        if compile_expression is None:
+            raise ValueError(f'Cannot compile a {NodeKind(kind).name} record as an expression.')
+        return compile_expression(record)
+
+    def _compile_binary_operation(self, record):
+        """
+        Compiles a binary operation, see ClosureCompiler.
+
+        :param record: The record of the operation.
+        :return: The closure evaluating the operation.
+        """
+        kind_and_flags, _, left_index, right_index, _ = record
+        operations = SHORT_CIRCUIT_OPERATIONS if kind_and_flags & SHORT_CIRCUIT else BINARY_OPERATIONS
+        return operations[BINARY_OPERATION_CLASSES[kind_and_flags & KIND_MASK]](
+            self._compile_expression(self._flat_tree.get_record(left_index)),
+            self._compile_expression(self._flat_tree.get_record(right_index)),
+        )
+
+    def _compile_literal(self, record):
+        """
+        Compiles a literal.
+
+        :param record: The NUMBER, STRING or BOOLEAN record.
+        :return: The closure returning the value of the literal.
+        """
+        kind_and_flags, _, operand, _, _ = record
+        kind = kind_and_flags & KIND_MASK
+        if kind == NodeKind.BOOLEAN:
+            value = bool(operand)
+        elif kind == NodeKind.STRING:
+            value = self._flat_tree.get_string(operand)
+        elif kind_and_flags & INTEGER:
+            value = int(self._flat_tree.get_string(operand))
+        else:
+            value = self._flat_tree.get_number(operand)
+        return lambda context: value
+
+    def _compile_variable(self, record):
+        """
+        Compiles a variable, see VariableNode.
+
+        :param record: The VARIABLE record.
+        :return: The closure retrieving the variable's value.
+        """
+        _, line_number, name_index, _, _ = record
+        variable_name = self._flat_tree.get_string(name_index)
+        line_number = None if line_number < 0 else line_number
+
+        def variable(context):
+            value = context.find_variable_value(variable_name, _UNDEFINED)
+            if value is _UNDEFINED:
+                raise SyntaxException(line_number, f"Undefined variable '{variable_name}'")
+            return value
+        return variable
+
+    def _compile_input(self, record):
+        """
+        Compiles an input expression, see InputNode.
+
+        :param record: The INPUT record.
+        :return: The closure reading a line from the standard input.
+        """
+        message = self._flat_tree.get_string(record[2])
+        return lambda context: input(message)
+
+    def _compile_not(self, record):
+        """
+        Compiles a not operation.
+
+        :param record: The NOT record.
+        :return: The closure negating the operand.
+        """
+        operand = self._compile_expression(self._flat_tree.get_record(record[2]))
+        return lambda context: not operand(context)
+
+    def _compile_function_call(self, record):
+        """
+        Compiles a function call, run in a new function scope.
+
+        :param record: The FUNCTION_CALL record.
+        :return: The closure calling the function and returning its value.
+        """
+        flat_tree = self._flat_tree
+        _, _, name_index, arguments_offset, _ = record
+        function_name = flat_tree.get_string(name_index)
+        arguments = tuple(
+            self._compile_expression(flat_tree.get_record(argument)) for argument in flat_tree.get_list(arguments_offset)
+        )
+
+        def function_call(context):
+            function = context.find_variable_value(function_name)
+            evaluated_args = [argument(context) for argument in arguments]
+            return function.call(context.create_new_scope_context(BlockScope.FUNCTION), evaluated_args)
+        return function_call
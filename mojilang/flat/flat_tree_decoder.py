@@ -0,0 +1,174 @@
+from mojilang.flat.flat_tree_encoder import BINARY_OPERATION_KINDS
+from mojilang.flat.node_kind import INTEGER, KIND_MASK, NodeKind, SCOPE_FREE, SHORT_CIRCUIT
+from mojilang.parser.nodes import (
+    AndNode,
+    AssignmentNode,
+    BlockNode,
+    BooleanLiteralNode,
+    BreakNode,
+    ContinueNode,
+    ElseIfNode,
+    ElseNode,
+    FunctionCallNode,
+    FunctionNode,
+    IfNode,
+    InputNode,
+    LoopNode,
+    NotNode,
+    NumberLiteralNode,
+    OrNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    StringLiteralNode,
+    VariableNode,
+)
+
+# The node class of each binary operation kind.
+BINARY_OPERATION_CLASSES = {kind: node_class for node_class, kind in BINARY_OPERATION_KINDS.items()}
+
+
+class FlatTreeDecoder:
+    """
+    The FlatTreeDecoder class rebuilds the nodes of an Abstract Syntax Tree (AST) from the records of a FlatTree,
+    the reverse of the FlatTreeEncoder, so a tree kept as records can be run by any backend.
+
+    The records are only read as data, a corrupt flat tree raises a ValueError rather than building nodes the
+    Parser could not have built: every record must be of a known kind, refer to records encoded before it only,
+    so the records always form a tree, and hold a block wherever the Parser puts one.
+
+    Attributes:
+        _flat_tree (FlatTree): The flat tree being decoded.
+        _decoders (dict): The method decoding each kind of record.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FlatTreeDecoder.
+        """
+        self._flat_tree = None
+        self._decoders = {
+            NodeKind.BLOCK: self._decode_block,
+            NodeKind.NUMBER: self._decode_number,
+            NodeKind.STRING: lambda index, line_number, flags, operands: StringLiteralNode(
+                self._flat_tree.get_string(operands[0]), line_number
+            ),
+            NodeKind.BOOLEAN: lambda index, line_number, flags, operands: BooleanLiteralNode(
+                bool(operands[0]), line_number
+            ),
+            NodeKind.VARIABLE: lambda index, line_number, flags, operands: VariableNode(
+                self._flat_tree.get_string(operands[0]), line_number
+            ),
+            NodeKind.INPUT: lambda index, line_number, flags, operands: InputNode(
+                self._flat_tree.get_string(operands[0]), line_number
+            ),
+            NodeKind.NOT: lambda index, line_number, flags, operands: NotNode(
+                self._decode_child(operands[0], index), line_number
+            ),
+            NodeKind.PRINT: lambda index, line_number, flags, operands: PrintNode(
+                self._decode_child(operands[0], index), line_number
+            ),
+            NodeKind.ASSIGNMENT: self._decode_assignment,
+            NodeKind.REASSIGNMENT: self._decode_assignment,
+            NodeKind.RETURN: lambda index, line_number, flags, operands: ReturnNode(
+                self._decode_child(operands[0], index), line_number
+            ),
+            NodeKind.BREAK: lambda index, line_number, flags, operands: BreakNode(line_number),
+            NodeKind.CONTINUE: lambda index, line_number, flags, operands: ContinueNode(line_number),
+            NodeKind.IF: self._decode_conditional,
+            NodeKind.ELSE_IF: self._decode_conditional,
+            NodeKind.ELSE: lambda index, line_number, flags, operands: ElseNode(
+                self._decode_child(operands[0], index, NodeKind.BLOCK), line_number
+            ),
+            NodeKind.LOOP: lambda index, line_number, flags, operands: LoopNode(
+                self._decode_child(operands[0], index), self._decode_child(operands[1], index, NodeKind.BLOCK),
+                line_number
+            ),
+            NodeKind.FUNCTION: self._decode_function,
+            NodeKind.FUNCTION_CALL: lambda index, line_number, flags, operands: FunctionCallNode(
+                self._flat_tree.get_string(operands[0]),
+                [self._decode_child(argument, index) for argument in self._flat_tree.get_list(operands[1])],
+                line_number
+            ),
+        }
+        for kind in BINARY_OPERATION_CLASSES:
+            self._decoders[kind] = self._decode_binary_operation
+
+    def decode(self, flat_tree):
+        """
+        Decodes a program.
+
+        :param flat_tree: The FlatTree of the program.
+        :return: The BlockNode at the root of the program.
+        :raises ValueError: If the flat tree is corrupt.
+        """
+        self._flat_tree = flat_tree
+        try:
+            root = flat_tree.get_root()
+            return self._decode_child(root, root + 1, NodeKind.BLOCK)
+        except IndexError:
+            raise ValueError('The flat tree refers to a record, list, number or string it does not hold.') from None
+        finally:
+            self._flat_tree = None
+
+    def _decode_child(self, index, parent_index, expected_kind=None):
+        """
+        Decodes a record and the records it refers to.
+
+        :param index: The index of the record.
+        :param parent_index: The index of the record referring to it.
+        :param expected_kind: The NodeKind the record must be of, None if it may be of any kind.
+        :return: The node of the record.
+        :raises ValueError: If the record is corrupt.
+        """
+        if not 0 <= index < parent_index:
+            raise ValueError(f'The record {parent_index} of the flat tree refers to the record {index}.')
+        kind_and_flags, line_number, *operands = self._flat_tree.get_record(index)
+        kind = kind_and_flags & KIND_MASK
+        if kind not in self._decoders or expected_kind is not None and kind != expected_kind:
+            raise ValueError(f'The record {index} of the flat tree is of an unexpected kind.')
+        line_number = None if line_number < 0 else line_number
+        return self._decoders[kind](index, line_number, kind_and_flags & ~KIND_MASK, operands)
+
+    def _decode_block(self, index, line_number, flags, operands):
+        block_node = BlockNode(
+            [self._decode_child(statement, index) for statement in self._flat_tree.get_list(operands[0])],
+            line_number
+        )
+        block_node.set_scope_free(bool(flags & SCOPE_FREE))
+        return block_node
+
+    def _decode_number(self, index, line_number, flags, operands):
+        if flags & INTEGER:
+            return NumberLiteralNode(int(self._flat_tree.get_string(operands[0])), line_number)
+        return NumberLiteralNode(self._flat_tree.get_number(operands[0]), line_number)
+
+    def _decode_binary_operation(self, index, line_number, flags, operands):
+        node_class = BINARY_OPERATION_CLASSES[self._flat_tree.get_kind(index)]
+        left_operand = self._decode_child(operands[0], index)
+        right_operand = self._decode_child(operands[1], index)
+        if node_class is AndNode or node_class is OrNode:
+            return node_class(left_operand, right_operand, line_number, bool(flags & SHORT_CIRCUIT))
+        return node_class(left_operand, right_operand, line_number)
+
+    def _decode_assignment(self, index, line_number, flags, operands):
+        # The record only keeps the name of the variable, which the Parser reads on the line of the assignment.
+        variable_node = VariableNode(self._flat_tree.get_string(operands[0]), line_number)
+        node_class = ReassignmentNode if self._flat_tree.get_kind(index) == NodeKind.REASSIGNMENT else AssignmentNode
+        return node_class(variable_node, self._decode_child(operands[1], index), line_number)
+
+    def _decode_conditional(self, index, line_number, flags, operands):
+        condition_node = self._decode_child(operands[0], index)
+        block_node = self._decode_child(operands[1], index, NodeKind.BLOCK)
+        next_conditional_node = None
+        if operands[2] != -1:
+            next_conditional_node = self._decode_child(operands[2], index)
+            if not isinstance(next_conditional_node, (ElseIfNode, ElseNode)):
+                raise ValueError(f'The record {index} of the flat tree is followed by a record that is no branch.')
+        node_class = IfNode if self._flat_tree.get_kind(index) == NodeKind.IF else ElseIfNode
+        return node_class(condition_node, block_node, next_conditional_node, line_number)
+
+    def _decode_function(self, index, line_number, flags, operands):
+        argument_names = [self._flat_tree.get_string(name) for name in self._flat_tree.get_list(operands[2])]
+        function_block_node = self._decode_child(operands[1], index, NodeKind.BLOCK)
+        return FunctionNode(self._flat_tree.get_string(operands[0]), argument_names, function_block_node, line_number)
@@ -0,0 +1,239 @@
+from array import array
+
+from mojilang.flat.flat_tree import FlatTree
+from mojilang.flat.node_kind import INTEGER, NodeKind, RECORD_SIZE, SCOPE_FREE, SHORT_CIRCUIT
+from mojilang.parser.nodes import (
+    AdditionNode,
+    AndNode,
+    AssignmentNode,
+    BlockNode,
+    BreakNode,
+    ContinueNode,
+    DivisionNode,
+    ElseIfNode,
+    ElseNode,
+    EqualsNode,
+    ExponentNode,
+    FunctionCallNode,
+    FunctionNode,
+    GreaterEqualsNode,
+    GreaterNode,
+    IfNode,
+    InputNode,
+    LessEqualsNode,
+    LessNode,
+    LiteralNode,
+    LoopNode,
+    ModulusNode,
+    MultiplicationNode,
+    NotEqualsNode,
+    NotNode,
+    OrNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    SubtractionNode,
+    VariableNode,
+)
+
+# The kind of the record of each binary operation.
+BINARY_OPERATION_KINDS = {
+    AdditionNode: NodeKind.ADDITION,
+    SubtractionNode: NodeKind.SUBTRACTION,
+    MultiplicationNode: NodeKind.MULTIPLICATION,
+    DivisionNode: NodeKind.DIVISION,
+    ModulusNode: NodeKind.MODULUS,
+    ExponentNode: NodeKind.EXPONENT,
+    EqualsNode: NodeKind.EQUALS,
+    NotEqualsNode: NodeKind.NOT_EQUALS,
+    LessNode: NodeKind.LESS,
+    LessEqualsNode: NodeKind.LESS_EQUALS,
+    GreaterNode: NodeKind.GREATER,
+    GreaterEqualsNode: NodeKind.GREATER_EQUALS,
+    AndNode: NodeKind.AND,
+    OrNode: NodeKind.OR,
+}
+
+
+class FlatTreeEncoder:
+    """
+    The FlatTreeEncoder class flattens an Abstract Syntax Tree (AST) into the arrays of a FlatTree: one record per
+    node, the lists of statements, arguments and argument names, and the pools of the numbers and strings of the
+    program, each number and string stored once however many nodes use it.
+
+    The tree is encoded as the program runs it: what the Resolver and the analyzers added to the nodes is left
+    out, the FlatTreeCompiler looks variables up by name like the ClosureCompiler does. Children are encoded
+    before their parents, so the root record is the last one.
+
+    Attributes:
+        _records (array): The records encoded so far.
+        _lists (array): The lists encoded so far.
+        _numbers (array): The number pool.
+        _number_indices (dict): The index of each number of the pool by its hexadecimal representation.
+        _strings (dict): The index of each string of the string pool, in the order they were added.
+    """
+
+    def __init__(self):
+        """
+        Initializes the FlatTreeEncoder.
+        """
+        self._records = array('i')
+        self._lists = array('i')
+        self._numbers = array('d')
+        self._number_indices = {}
+        self._strings = {}
+
+    def encode(self, abstract_syntax_tree):
+        """
+        Encodes a program.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: The bytes holding the flat tree, see FlatTree.
+        :raises ValueError: If the program holds a literal value that cannot be encoded.
+        """
+        self._records = array('i')
+        self._lists = array('i')
+        self._numbers = array('d')
+        self._number_indices = {}
+        self._strings = {}
+        root = self._encode_node(abstract_syntax_tree)
+        return FlatTree.to_bytes(root, self._records, self._lists, self._numbers, list(self._strings))
+
+    def write(self, abstract_syntax_tree, path):
+        """
+        Encodes a program into a .mojif file, to be loaded with FlatTree.load.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :param path: The path to the file to write.
+        """
+        data = self.encode(abstract_syntax_tree)
+        with open(path, 'wb') as file:
+            file.write(data)
+
+    def _encode_node(self, node):
+        """
+        Encodes a node and its children.
+
+        :param node: The node.
+        :return: The index of the node's record.
+        :raises ValueError: If the node cannot be encoded.
+        """
+        node_type = type(node)
+        line_number = node.get_line_number()
+        if node_type is BlockNode:
+            statements = self._encode_list([self._encode_node(statement) for statement in node.get_nodes()])
+            flags = SCOPE_FREE if node.is_scope_free() else 0
+            return self._add_record(NodeKind.BLOCK, line_number, statements, flags=flags)
+        if isinstance(node, LiteralNode):
+            return self._encode_literal(node.get_value(), line_number)
+        if node_type is VariableNode:
+            return self._add_record(NodeKind.VARIABLE, line_number, self._add_string(node.get_name()))
+        if node_type is InputNode:
+            return self._add_record(NodeKind.INPUT, line_number, self._add_string(node.get_input_message()))
+        if node_type in BINARY_OPERATION_KINDS:
+            left = self._encode_node(node.get_left_operand())
+            right = self._encode_node(node.get_right_operand())
+            flags = SHORT_CIRCUIT if node_type in (AndNode, OrNode) and node.is_short_circuit() else 0
+            return self._add_record(BINARY_OPERATION_KINDS[node_type], line_number, left, right, flags=flags)
+        if node_type is NotNode:
+            return self._add_record(NodeKind.NOT, line_number, self._encode_node(node.get_condition_node()))
+        if node_type is PrintNode:
+            return self._add_record(NodeKind.PRINT, line_number, self._encode_node(node.get_node_to_print()))
+        if node_type in (AssignmentNode, ReassignmentNode):
+            kind = NodeKind.REASSIGNMENT if node_type is ReassignmentNode else NodeKind.ASSIGNMENT
+            name = self._add_string(node.get_variable_node().get_name())
+            return self._add_record(kind, line_number, name, self._encode_node(node.get_value_node()))
+        if node_type is ReturnNode:
+            return self._add_record(NodeKind.RETURN, line_number, self._encode_node(node.get_return_value_node()))
+        if node_type is BreakNode:
+            return self._add_record(NodeKind.BREAK, line_number)
+        if node_type is ContinueNode:
+            return self._add_record(NodeKind.CONTINUE, line_number)
+        if node_type in (IfNode, ElseIfNode):
+            condition = self._encode_node(node.get_condition_node())
+            block = self._encode_node(node.get_block_node())
+            next_node = node.get_next_conditional_node()
+            next_record = -1 if next_node is None else self._encode_node(next_node)
+            kind = NodeKind.IF if node_type is IfNode else NodeKind.ELSE_IF
+            return self._add_record(kind, line_number, condition, block, next_record)
+        if node_type is ElseNode:
+            return self._add_record(NodeKind.ELSE, line_number, self._encode_node(node.get_block_node()))
+        if node_type is LoopNode:
+            condition = self._encode_node(node.get_condition_node())
+            return self._add_record(NodeKind.LOOP, line_number, condition, self._encode_node(node.get_block_node()))
+        if node_type is FunctionNode:
+            name = self._add_string(node.get_function_name())
+            block = self._encode_node(node.get_function_block_node())
+            argument_names = self._encode_list([self._add_string(name) for name in node.get_argument_names()])
+            return self._add_record(NodeKind.FUNCTION, line_number, name, block, argument_names)
+        if node_type is FunctionCallNode:
+            name = self._add_string(node.get_function_name())
+            arguments = self._encode_list([self._encode_node(argument) for argument in node.get_arguments()])
+            return self._add_record(NodeKind.FUNCTION_CALL, line_number, name, arguments)
+        raise ValueError(f'Cannot encode a {node_type.__name__} into a flat tree.')
+
+    def _encode_literal(self, value, line_number):
+        """
+        Encodes the value of a literal, according to its type rather than to the class of its node, since the
+        ConstantFolder may fold a number into an integer.
+
+        :param value: The value of the literal.
+        :param line_number: The line number of the literal.
+        :return: The index of the literal's record.
+        :raises ValueError: If the value is of no type of Mojilang.
+        """
+        if isinstance(value, bool):
+            return self._add_record(NodeKind.BOOLEAN, line_number, int(value))
+        if isinstance(value, int):
+            return self._add_record(NodeKind.NUMBER, line_number, self._add_string(str(value)), flags=INTEGER)
+        if isinstance(value, float):
+            return self._add_record(NodeKind.NUMBER, line_number, self._add_number(value))
+        if isinstance(value, str):
+            return self._add_record(NodeKind.STRING, line_number, self._add_string(value))
+        raise ValueError(f'Cannot encode the literal value {value!r} into a flat tree.')
+
+    def _add_record(self, kind, line_number, first=0, second=0, third=0, flags=0):
+        """
+        :param kind: The NodeKind of the record.
+        :param line_number: The line number of the node, None if unknown.
+        :param first: The first operand.
+        :param second: The second operand.
+        :param third: The third operand.
+        :param flags: The flags of the record.
+        :return: The index of the record.
+        """
+        self._records.extend((kind | flags, -1 if line_number is None else line_number, first, second, third))
+        return len(self._records) // RECORD_SIZE - 1
+
+    def _encode_list(self, items):
+        """
+        :param items: The integers of a list.
+        :return: The offset of the list.
+        """
+        offset = len(self._lists)
+        self._lists.append(len(items))
+        self._lists.extend(items)
+        return offset
+
+    def _add_number(self, value):
+        """
+        :param value: A float.
+        :return: The index of the float in the number pool, added unless it already was.
+        """
+        # Keyed by the representation, since 0.0 and -0.0 are equal but print differently.
+        key = value.hex()
+        index = self._number_indices.get(key)
+        if index is None:
+            index = self._number_indices[key] = len(self._numbers)
+            self._numbers.append(value)
+        return index
+
+    def _add_string(self, string):
+        """
+        :param string: A string.
+        :return: The index of the string in the string pool, added unless it already was.
+        """
+        index = self._strings.get(string)
+        if index is None:
+            index = self._strings[string] = len(self._strings)
+        return index
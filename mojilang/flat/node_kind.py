@@ -0,0 +1,64 @@
+from enum import IntEnum
+
+
+class NodeKind(IntEnum):
+    """
+    The NodeKind Enum defines the kind of each node record of a FlatTree, one per node class of the parser.
+
+    Every record is a tuple of RECORD_SIZE integers: the kind along with its flags, the line number (-1 if
+    unknown) and up to three operands. An operand is the index of another record, of a string in the string
+    pool, of a number in the number pool, or of a list in the list array, which holds the length of the list
+    followed by its items.
+    """
+
+    # Blocks, the list holds the records of the statements
+    BLOCK = 0               # (list)
+
+    # Literals and variables
+    NUMBER = 1              # (number): the number of the number pool, or with INTEGER (string) the decimal digits
+                            # of an integer the ConstantFolder computed
+    STRING = 2              # (string)
+    BOOLEAN = 3             # (value): 1 for 😤, 0 for 😔
+    VARIABLE = 4            # (string): the name of the variable
+    INPUT = 5               # (string): the message printed before reading the line
+
+    # Operations
+    ADDITION = 6            # (left, right)
+    SUBTRACTION = 7
+    MULTIPLICATION = 8
+    DIVISION = 9
+    MODULUS = 10
+    EXPONENT = 11
+    EQUALS = 12
+    NOT_EQUALS = 13
+    LESS = 14
+    LESS_EQUALS = 15
+    GREATER = 16
+    GREATER_EQUALS = 17
+    AND = 18                # (left, right), with SHORT_CIRCUIT if the right operand is only evaluated when needed
+    OR = 19
+    NOT = 20                # (operand)
+
+    # Statements
+    PRINT = 21              # (value)
+    ASSIGNMENT = 22         # (string, value): declares the variable of the name
+    REASSIGNMENT = 23       # (string, value): reassigns the variable of the name
+    RETURN = 24             # (value)
+    BREAK = 25              # ()
+    CONTINUE = 26           # ()
+    IF = 27                 # (condition, block, next): next is the ELSE_IF or ELSE record following it, or -1
+    ELSE_IF = 28            # (condition, block, next)
+    ELSE = 29               # (block)
+    LOOP = 30               # (condition, block)
+    FUNCTION = 31           # (string, block, list): the name, the body and the list of the argument names
+    FUNCTION_CALL = 32      # (string, list): the name and the list of the argument records
+
+
+# The flags of a record, stored above the kind.
+KIND_MASK = 0xFF
+SHORT_CIRCUIT = 1 << 8      # An AND or OR operation short-circuits, see AndNode.
+SCOPE_FREE = 1 << 9         # A BLOCK runs in the scope of the enclosing block, see BlockNode.is_scope_free.
+INTEGER = 1 << 10           # A NUMBER is an integer rather than a float.
+
+# The number of integers of a record: the kind and flags, the line number and three operands.
+RECORD_SIZE = 5
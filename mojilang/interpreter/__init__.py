@@ -1 +1,7 @@
 from .interpreter import Interpreter
+from .constant_folder import ConstantFolder
+from .memo_cache import MemoCache
+from .purity_analyzer import PurityAnalyzer
+from .resolver import Resolver
+from .tail_call_analyzer import TailCallAnalyzer
+from .vectorized_function import VectorizedFunction
@@ -0,0 +1,229 @@
+from mojilang.parser.nodes import (
+    AndNode,
+    AssignmentNode,
+    BooleanLiteralNode,
+    ConditionalNode,
+    ElseIfNode,
+    FunctionCallNode,
+    FunctionNode,
+    IfNode,
+    LiteralNode,
+    LoopNode,
+    NotNode,
+    NumberLiteralNode,
+    OperationNode,
+    OrNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    StringLiteralNode,
+)
+
+# The literal node holding a folded value of each type. Values of any other type are not folded.
+LITERAL_NODES = {
+    bool: BooleanLiteralNode,
+    str: StringLiteralNode,
+    int: NumberLiteralNode,
+    float: NumberLiteralNode,
+}
+
+
+class ConstantFolder:
+    """
+    The ConstantFolder class is an optimization pass run once the Resolver has checked the program for undefined
+    variables, when the mojilang CLI is given -O (see mojilang.resolve).
+    It rewrites the AST so the expressions whose value is known before the program runs are not evaluated again
+    every time the statement holding them runs:
+
+    - an operation or 🙅 whose operands are all literals is replaced by a literal holding its value, unless
+      evaluating it fails (e.g. a division by zero), which is left to happen at run time;
+    - a literal left operand decides some logical operations: `😤 and x` is x and `😔 or x` is x, and when
+      they short-circuit `😔 and x` is 😔 and `😤 or x` is 😤;
+    - a 🙅 of a 🙅 of a 🙅 is a single 🙅, they all compute the same boolean;
+    - the branches of a conditional whose condition is a falsy literal are dropped, and so are the branches
+      following a condition that is a truthy literal.
+
+    Every rewrite keeps the value of the expression exactly, the printed output and the errors of the program do
+    not change. Since Mojilang values are dynamically typed, identities such as `x ➕ 0` or `x ✖️ 1` are not
+    applied: they do not hold when x is a string, a boolean (which the operation turns into a number) or -0.0.
+    """
+
+    def fold(self, abstract_syntax_tree):
+        """
+        Folds the constant expressions of a program.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program, rewritten in place.
+        :return: The BlockNode at the root of the program.
+        """
+        self._fold_block(abstract_syntax_tree)
+        return abstract_syntax_tree
+
+    def _fold_block(self, block_node):
+        """
+        Folds the statements of a block, dropping the conditionals none of whose branches can run.
+
+        :param block_node: The BlockNode.
+        """
+        nodes = block_node.get_nodes()
+        folded_nodes = []
+        for index, node in enumerate(nodes):
+            folded_node = self._fold_statement(node)
+            # The value of a block is the value of its last statement, a conditional running no branch included.
+            if folded_node is not None or index == len(nodes) - 1:
+                folded_nodes.append(node if folded_node is None else folded_node)
+        if folded_nodes != nodes:
+            block_node.set_nodes(folded_nodes)
+
+    def _fold_statement(self, node):
+        """
+        Folds a statement.
+
+        :param node: The statement node.
+        :return: The folded statement, or None if it is a conditional none of whose branches can run.
+        """
+        if isinstance(node, ConditionalNode):
+            return self._fold_conditional(node)
+        if isinstance(node, LoopNode):
+            self._fold_block(node.get_block_node())
+            condition_node = self._fold_expression(node.get_condition_node())
+            if condition_node is node.get_condition_node():
+                return node
+            return LoopNode(condition_node, node.get_block_node(), node.get_line_number())
+        if isinstance(node, FunctionNode):
+            self._fold_block(node.get_function_block_node())
+            return node
+        if isinstance(node, AssignmentNode):
+            value_node = self._fold_expression(node.get_value_node())
+            if value_node is node.get_value_node():
+                return node
+            assignment_class = ReassignmentNode if isinstance(node, ReassignmentNode) else AssignmentNode
+            return assignment_class(node.get_variable_node(), value_node, node.get_line_number())
+        if isinstance(node, ReturnNode):
+            value_node = self._fold_expression(node.get_return_value_node())
+            if value_node is node.get_return_value_node():
+                return node
+            return ReturnNode(value_node, node.get_line_number())
+        if isinstance(node, PrintNode):
+            node_to_print = self._fold_expression(node.get_node_to_print())
+            if node_to_print is node.get_node_to_print():
+                return node
+            return PrintNode(node_to_print, node.get_line_number())
+        return self._fold_expression(node)
+
+    def _fold_conditional(self, node):
+        """
+        Folds a chain of conditionals, dropping the branches that can never run.
+
+        :param node: The IfNode at the head of the chain.
+        :return: The folded chain, or None if none of its branches can run.
+        """
+        branches = []
+        else_node = None
+        while isinstance(node, ConditionalNode):
+            self._fold_block(node.get_block_node())
+            condition_node = self._fold_expression(node.get_condition_node())
+            if not (isinstance(condition_node, LiteralNode) and not condition_node.get_value()):
+                branches.append((condition_node, node))
+                if isinstance(condition_node, LiteralNode):
+                    break
+            node = node.get_next_conditional_node()
+        else:
+            if node is not None:
+                self._fold_block(node.get_block_node())
+                else_node = node
+
+        if not branches:
+            if else_node is None:
+                return None
+            # Only the else branch can run, and always does.
+            return IfNode(
+                BooleanLiteralNode(True, else_node.get_line_number()), else_node.get_block_node(), None,
+                else_node.get_line_number()
+            )
+
+        next_conditional_node = else_node
+        for index in range(len(branches) - 1, -1, -1):
+            condition_node, conditional_node = branches[index]
+            conditional_class = IfNode if index == 0 else ElseIfNode
+            next_conditional_node = conditional_class(
+                condition_node, conditional_node.get_block_node(), next_conditional_node,
+                conditional_node.get_line_number()
+            )
+        return next_conditional_node
+
+    def _fold_expression(self, node):
+        """
+        Folds an expression.
+
+        :param node: The expression node.
+        :return: The folded expression, the node itself if nothing could be folded.
+        """
+        if isinstance(node, OperationNode):
+            return self._fold_operation(node)
+        if isinstance(node, NotNode):
+            return self._fold_not(node)
+        if isinstance(node, FunctionCallNode):
+            arguments = [self._fold_expression(argument) for argument in node.get_arguments()]
+            if all(argument is original for argument, original in zip(arguments, node.get_arguments())):
+                return node
+            return FunctionCallNode(node.get_function_name(), arguments, node.get_line_number())
+        return node
+
+    def _fold_operation(self, node):
+        """
+        Folds a binary operation.
+
+        :param node: The OperationNode.
+        :return: The folded expression.
+        """
+        left_operand = self._fold_expression(node.get_left_operand())
+        right_operand = self._fold_expression(node.get_right_operand())
+        is_logical = isinstance(node, (AndNode, OrNode))
+        if is_logical and isinstance(left_operand, LiteralNode):
+            if bool(left_operand.get_value()) == isinstance(node, AndNode):
+                # The right operand is evaluated either way, and is the value of the operation.
+                return right_operand
+            if node.is_short_circuit():
+                # The right operand is never evaluated.
+                return left_operand
+        if left_operand is not node.get_left_operand() or right_operand is not node.get_right_operand():
+            if is_logical:
+                node = type(node)(left_operand, right_operand, node.get_line_number(), node.is_short_circuit())
+            else:
+                node = type(node)(left_operand, right_operand, node.get_line_number())
+        if isinstance(left_operand, LiteralNode) and isinstance(right_operand, LiteralNode):
+            return self._fold_constant(node)
+        return node
+
+    def _fold_not(self, node):
+        """
+        Folds a 🙅.
+
+        :param node: The NotNode.
+        :return: The folded expression.
+        """
+        condition_node = self._fold_expression(node.get_condition_node())
+        if isinstance(condition_node, NotNode) and isinstance(condition_node.get_condition_node(), NotNode):
+            return condition_node.get_condition_node()
+        if condition_node is not node.get_condition_node():
+            node = NotNode(condition_node, node.get_line_number())
+        if isinstance(condition_node, LiteralNode):
+            return self._fold_constant(node)
+        return node
+
+    @staticmethod
+    def _fold_constant(node):
+        """
+        Replaces an expression of literals by a literal holding its value.
+
+        :param node: The expression node, whose operands are all literals.
+        :return: The literal, or the node itself if evaluating it fails or gives a value no literal can hold.
+        """
+        try:
+            value = node.evaluate(None)
+        except Exception:
+            return node
+        literal_class = LITERAL_NODES.get(type(value))
+        if literal_class is None:
+            return node
+        return literal_class(value, node.get_line_number())
@@ -1,6 +1,10 @@
 from mojilang.interpreter.scope.scope_context import ScopeContext
 from mojilang.interpreter.scope import BlockScopeContext
 from mojilang.interpreter.scope import BlockScope
+from mojilang.interpreter.memo_cache import MemoCache
+from mojilang.interpreter.purity_analyzer import PurityAnalyzer
+from mojilang.compiler import ClosureCompiler, PythonCompiler
+from mojilang.vm import BytecodeCompiler, VirtualMachine
 
 
 class Interpreter:
@@ -8,15 +12,46 @@ class Interpreter:
     The Interpreter class is responsible for executing the Abstract Syntax Tree (AST).
     It takes an AST, processes it, and evaluates the expressions and operations defined within.
     The interpreter uses a context (a dictionary) to store variable values during execution.
+
+    By default the AST is executed by evaluating its nodes (the tree-walker backend). The pycompile backend
+    compiles the AST to Python bytecode first (see PythonCompiler), which runs the same program faster. The
+    closure backend compiles every node into a Python closure instead (see ClosureCompiler), which is cheaper
+    to compile and still runs the program faster than evaluating its nodes. The vm backend compiles the AST to
+    bytecode for the VirtualMachine (see BytecodeCompiler), which keeps local variables in array slots.
+
+    Given a memo_size, the tree-walker remembers the values of the calls to the pure functions of the program
+    (see PurityAnalyzer), up to memo_size values per function, once the TailCallAnalyzer has found the variables
+    they look up. The MemoCache of each function counts the calls it answered and the calls that ran the function.
+    It is off by default, since every call to a pure function then pays for building its key, which slows down
+    the programs that rarely call a function with the same arguments twice.
     """
 
-    def __init__(self, abstract_syntax_tree):
+    TREE_WALKER_BACKEND = 'treewalker'
+    PYCOMPILE_BACKEND = 'pycompile'
+    CLOSURE_BACKEND = 'closure'
+    VM_BACKEND = 'vm'
+    BACKENDS = (TREE_WALKER_BACKEND, PYCOMPILE_BACKEND, CLOSURE_BACKEND, VM_BACKEND)
+
+    DEFAULT_MEMO_SIZE = 0
+
+    def __init__(self, abstract_syntax_tree, backend=TREE_WALKER_BACKEND, memo_size=DEFAULT_MEMO_SIZE):
         """
         Initializes the Interpreter with an Abstract Syntax Tree (AST).
 
         :param abstract_syntax_tree: The AST to be executed. This represents the parsed structure of the program.
+        :param backend: The execution backend to use, one of Interpreter.BACKENDS.
+        :param memo_size: The number of values the tree-walker remembers per pure function, 0 (the default) to
+                          remember none.
+        :raises ValueError: If the backend is unknown or the memo size is negative.
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown interpreter backend '{backend}', expected one of {self.BACKENDS}.")
+        if memo_size < 0:
+            raise ValueError(f"The memo size must not be negative, got {memo_size}.")
         self._abstract_syntax_tree = abstract_syntax_tree
+        self._backend = backend
+        self._memo_size = memo_size
+        self._memo_caches = []
         self._context = ScopeContext(BlockScopeContext(BlockScope.GLOBAL))
 
     def execute(self):
@@ -27,7 +62,40 @@ class Interpreter:
         :return: 0 if execution is successful, raises an error if execution fails.
         """
         try:
-            self._abstract_syntax_tree.evaluate(self._context)
+            if self._backend == self.PYCOMPILE_BACKEND:
+                program = PythonCompiler().compile(self._abstract_syntax_tree)
+                program(self._context)
+            elif self._backend == self.CLOSURE_BACKEND:
+                program = ClosureCompiler().compile(self._abstract_syntax_tree)
+                program(self._context)
+            elif self._backend == self.VM_BACKEND:
+                code_object = BytecodeCompiler().compile(self._abstract_syntax_tree)
+                VirtualMachine().run(code_object)
+            else:
+                self._evaluate()
             return 0
         except Exception as e:
             raise RuntimeError(f"Execution error: {e}")
+
+    def get_memo_caches(self):
+        """
+        :return: The MemoCache of each pure function of the last tree-walker run, in the order of the program.
+        """
+        return self._memo_caches
+
+    def _evaluate(self):
+        """
+        Evaluates the Abstract Syntax Tree (AST) with the tree-walker, remembering the values of the pure functions
+        for the run only.
+        """
+        purity_analyzer = PurityAnalyzer()
+        function_nodes = purity_analyzer.analyze(self._abstract_syntax_tree) if self._memo_size else []
+        local_names = purity_analyzer.get_local_names()
+        self._memo_caches = [MemoCache(function_node, self._memo_size, local_names) for function_node in function_nodes]
+        for function_node, memo_cache in zip(function_nodes, self._memo_caches):
+            function_node.set_memo_cache(memo_cache)
+        try:
+            self._abstract_syntax_tree.evaluate(self._context)
+        finally:
+            for function_node in function_nodes:
+                function_node.set_memo_cache(None)
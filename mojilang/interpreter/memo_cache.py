@@ -0,0 +1,177 @@
+from collections import OrderedDict
+
+from mojilang.interpreter.scope import ScopeContext
+from mojilang.parser.nodes.control.marker import marker_status
+
+# Tells undefined variables apart from variables holding None.
+_UNDEFINED = object()
+# Tells values missing from the cache apart from values that are None.
+_MISSING = object()
+
+
+class MemoCache:
+    """
+    The MemoCache class remembers the values a pure function (see PurityAnalyzer) returned, so calling it again
+    with the same values returns the value it remembered instead of running the function's block again.
+
+    Since Mojilang scopes are dynamic, the value of a function also depends on the variables it looks up past its
+    own scope (see FunctionNode.get_free_variable_names), so the values these have in the calling scopes are part
+    of the key along with the arguments. Values are keyed with their type, 1 and 😤 are equal in Python but not
+    in Mojilang, and so are 0 and -0. Calls passing fewer or more arguments than the function declares, or a break
+    or continue marker, are not remembered. Once the cache holds as many values as its size, the least recently
+    used value is evicted to make room for the next one.
+
+    The variables no scope but the global one declares are read from the global scope, so the key of a call does
+    not walk the scope chain for them, which grows with each nested call of a recursion.
+
+    Attributes:
+        _function_name (str): The name of the function.
+        _argument_count (int): The number of arguments of the function.
+        _free_variable_names (tuple): The names the function may look up past its own scope, in a scope other
+                                      than the global one.
+        _global_variable_names (tuple): The names the function may look up past its own scope, only ever declared
+                                        in the global scope.
+        _size (int): The maximum number of values remembered.
+        _values (OrderedDict): The values remembered by key, least recently used first.
+        _hits (int): The number of calls whose value was remembered.
+        _misses (int): The number of calls that ran the function's block.
+    """
+
+    def __init__(self, function_node, size, local_names=None):
+        """
+        Initializes the MemoCache of a function.
+
+        :param function_node: The pure FunctionNode.
+        :param size: The maximum number of values remembered, at least 1.
+        :param local_names: The names the program declares in a scope other than the global one (see
+                            PurityAnalyzer.get_local_names), None if any name may be.
+        """
+        self._function_name = function_node.get_function_name()
+        self._argument_count = len(function_node.get_argument_names())
+        free_variable_names = sorted(function_node.get_free_variable_names())
+        self._free_variable_names = tuple(
+            name for name in free_variable_names if local_names is None or name in local_names
+        )
+        self._global_variable_names = tuple(
+            name for name in free_variable_names if local_names is not None and name not in local_names
+        )
+        self._size = size
+        self._values = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def call(self, run, context, arguments):
+        """
+        Returns the value the function remembered for the call, or runs the function and remembers its value.
+
+        :param run: The function running the function's block, taking the context and the arguments.
+        :param context: The new scope context of the call.
+        :param arguments: The values of the arguments.
+        :return: The value of the function.
+        """
+        key = self._key(context, arguments)
+        if key is None:
+            return run(context, arguments)
+        value = self._recall(key)
+        if value is _MISSING:
+            value = run(context, arguments)
+            self._remember(key, value)
+        return value
+
+    def call_steps(self, run_steps, context, arguments):
+        """
+        Returns the value the function remembered for the call like call, as a generator run on the call stack of
+        run_on_call_stack.
+
+        :param run_steps: The generator function running the function's block, taking the context and the
+                          arguments.
+        :param context: The new scope context of the call.
+        :param arguments: The values of the arguments.
+        :return: The value of the function.
+        """
+        key = self._key(context, arguments)
+        if key is None:
+            return (yield from run_steps(context, arguments))
+        value = self._recall(key)
+        if value is _MISSING:
+            value = yield from run_steps(context, arguments)
+            self._remember(key, value)
+        return value
+
+    def _recall(self, key):
+        """
+        :param key: The key of the call.
+        :return: The value remembered for the key, or _MISSING if the function's block has to run.
+        """
+        values = self._values
+        value = values.get(key, _MISSING)
+        if value is _MISSING:
+            self._misses += 1
+        else:
+            self._hits += 1
+            values.move_to_end(key)
+        return value
+
+    def _remember(self, key, value):
+        """
+        Remembers the value of a call, evicting the least recently used value if the cache is full.
+
+        :param key: The key of the call.
+        :param value: The value of the function.
+        """
+        values = self._values
+        values[key] = value
+        if len(values) > self._size:
+            values.popitem(last=False)
+
+    def _key(self, context, arguments):
+        """
+        Computes the key of a call.
+
+        :param context: The new scope context of the call.
+        :param arguments: The values of the arguments.
+        :return: The tuple of the values the function depends on, or None if the call cannot be remembered.
+        """
+        if len(arguments) != self._argument_count:
+            return None
+        key = []
+        for value in arguments:
+            if marker_status(value):
+                return None
+            key.append(_key_item(value))
+        for variable_name in self._free_variable_names:
+            value = context.find_variable_value(variable_name, _UNDEFINED)
+            if marker_status(value):
+                return None
+            key.append(_key_item(value))
+        for variable_name in self._global_variable_names:
+            value = context.retrieve_resolved_value(ScopeContext.GLOBAL_DEPTH, variable_name, _UNDEFINED)
+            if marker_status(value):
+                return None
+            key.append(_key_item(value))
+        return tuple(key)
+
+    def get_function_name(self):
+        return self._function_name
+
+    def get_size(self):
+        return self._size
+
+    def get_hits(self):
+        return self._hits
+
+    def get_misses(self):
+        return self._misses
+
+    def __len__(self):
+        return len(self._values)
+
+
+def _key_item(value):
+    """
+    :param value: A value the function depends on.
+    :return: The value along with what tells it apart from the equal values printing differently.
+    """
+    if value.__class__ is float and value == 0.0:
+        return float, str(value)
+    return value.__class__, value
@@ -0,0 +1,214 @@
+from mojilang.parser.nodes import (
+    AssignmentNode,
+    BreakNode,
+    ConditionalNode,
+    ContinueNode,
+    FunctionCallNode,
+    FunctionNode,
+    InputNode,
+    LoopNode,
+    NotNode,
+    OperationNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+)
+
+
+class PurityAnalyzer:
+    """
+    The PurityAnalyzer class is a semantic pass run after the TailCallAnalyzer. It finds the pure functions of a
+    program, whose value only depends on their arguments and the variables they look up past their own scope,
+    and which change nothing else, so calling them again with the same values can be skipped (see MemoCache).
+
+    A function is pure if it does not print, read the input, break or continue (which ends the loop it is
+    called in, or not, depending on the caller), or reassign a variable it did not declare itself, and if it only
+    calls pure functions. A variable declared outside of any function is never reassigned either, since
+    reassigning a variable two scopes out or more reassigns the global of the same name too.
+
+    Attributes:
+        _functions (dict): The FunctionNodes of the program by name.
+        _variable_names (set): The names declared as variables or arguments anywhere in the program.
+        _program_names (set): The names declared outside of any function, which may be globals.
+        _local_names (set): The names declared in a scope other than the global one, as variables, arguments or
+                            functions.
+        _calls (dict): The names each FunctionNode calls.
+    """
+
+    def __init__(self):
+        """
+        Initializes the PurityAnalyzer.
+        """
+        self._functions = {}
+        self._variable_names = set()
+        self._program_names = set()
+        self._local_names = set()
+        self._calls = {}
+
+    def analyze(self, abstract_syntax_tree):
+        """
+        Finds the pure functions of a program.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: The list of pure FunctionNodes, in the order of the program.
+        """
+        self._functions = {}
+        self._variable_names = set()
+        self._program_names = set()
+        self._local_names = set()
+        self._calls = {}
+        self._collect_block(abstract_syntax_tree, in_function=False, in_global_scope=True)
+
+        function_nodes = [function_node for nodes in self._functions.values() for function_node in nodes]
+        pure_function_nodes = {
+            function_node for function_node in function_nodes
+            if self._has_no_side_effects(function_node)
+        }
+        # A function calling a function that is not pure is not pure either.
+        changed = True
+        while changed:
+            changed = False
+            for function_node in list(pure_function_nodes):
+                if not all(self._is_pure_call(name, pure_function_nodes) for name in self._calls[function_node]):
+                    pure_function_nodes.discard(function_node)
+                    changed = True
+        return sorted(pure_function_nodes, key=function_nodes.index)
+
+    def _collect_block(self, block_node, in_function, in_global_scope=False):
+        """
+        Collects the functions and variable names declared in a block and the blocks within it.
+
+        :param block_node: The BlockNode.
+        :param in_function: Whether the block is within the body of a function.
+        :param in_global_scope: Whether the block is the program's, which declares its names in the global scope.
+        """
+        for node in block_node.get_nodes():
+            if isinstance(node, AssignmentNode):
+                self._variable_names.add(node.get_variable_node().get_name())
+                if not in_function:
+                    self._program_names.add(node.get_variable_node().get_name())
+                if not in_global_scope and not isinstance(node, ReassignmentNode):
+                    self._local_names.add(node.get_variable_node().get_name())
+            elif isinstance(node, FunctionNode):
+                self._functions.setdefault(node.get_function_name(), []).append(node)
+                self._variable_names.update(node.get_argument_names())
+                self._local_names.update(node.get_argument_names())
+                if not in_function:
+                    self._program_names.add(node.get_function_name())
+                if not in_global_scope:
+                    self._local_names.add(node.get_function_name())
+                self._collect_block(node.get_function_block_node(), in_function=True)
+            elif isinstance(node, LoopNode):
+                self._collect_block(node.get_block_node(), in_function)
+            elif isinstance(node, ConditionalNode):
+                for conditional_block in node.get_branch_block_nodes():
+                    self._collect_block(conditional_block, in_function)
+
+    def _has_no_side_effects(self, function_node):
+        """
+        Checks the statements of a function for side effects, and records the functions it calls.
+
+        :param function_node: The FunctionNode.
+        :return: Whether the function has no side effects of its own.
+        """
+        self._calls[function_node] = set()
+        if function_node.get_free_variable_names() is None:
+            return False
+        scopes = [set(function_node.get_argument_names())]
+        return self._block_has_no_side_effects(function_node, function_node.get_function_block_node(), scopes)
+
+    def _block_has_no_side_effects(self, function_node, block_node, scopes):
+        """
+        Checks the statements of a block of a function for side effects.
+
+        :param function_node: The FunctionNode.
+        :param block_node: The BlockNode.
+        :param scopes: The names declared in each enclosing block of the function, innermost last.
+        :return: Whether the statements have no side effects.
+        """
+        for node in block_node.get_nodes():
+            if isinstance(node, (PrintNode, BreakNode, ContinueNode)):
+                return False
+            if isinstance(node, AssignmentNode):
+                if not self._expression_has_no_side_effects(function_node, node.get_value_node()):
+                    return False
+                variable_name = node.get_variable_node().get_name()
+                if isinstance(node, ReassignmentNode):
+                    if variable_name in self._program_names or not any(variable_name in scope for scope in scopes):
+                        return False
+                else:
+                    scopes[-1].add(variable_name)
+            elif isinstance(node, FunctionNode):
+                scopes[-1].add(node.get_function_name())
+            elif isinstance(node, ConditionalNode):
+                for conditional_node in node.get_conditional_nodes():
+                    if not self._expression_has_no_side_effects(function_node, conditional_node.get_condition_node()):
+                        return False
+                for conditional_block in node.get_branch_block_nodes():
+                    if not self._scoped_block_has_no_side_effects(function_node, conditional_block, scopes):
+                        return False
+            elif isinstance(node, LoopNode):
+                if not self._expression_has_no_side_effects(function_node, node.get_condition_node()):
+                    return False
+                if not self._scoped_block_has_no_side_effects(function_node, node.get_block_node(), scopes):
+                    return False
+            elif isinstance(node, ReturnNode):
+                if not self._expression_has_no_side_effects(function_node, node.get_return_value_node()):
+                    return False
+            elif not self._expression_has_no_side_effects(function_node, node):
+                return False
+        return True
+
+    def _scoped_block_has_no_side_effects(self, function_node, block_node, scopes):
+        """
+        Checks a block run in a new scope context for side effects.
+
+        :param function_node: The FunctionNode.
+        :param block_node: The BlockNode.
+        :param scopes: The names declared in each enclosing block of the function, innermost last.
+        :return: Whether the statements of the block have no side effects.
+        """
+        scopes.append(set())
+        has_no_side_effects = self._block_has_no_side_effects(function_node, block_node, scopes)
+        scopes.pop()
+        return has_no_side_effects
+
+    def _expression_has_no_side_effects(self, function_node, node):
+        """
+        Checks an expression of a function for side effects, and records the functions it calls.
+
+        :param function_node: The FunctionNode.
+        :param node: The expression node.
+        :return: Whether the expression has no side effects, the functions it calls aside.
+        """
+        if isinstance(node, InputNode):
+            return False
+        if isinstance(node, OperationNode):
+            return (
+                self._expression_has_no_side_effects(function_node, node.get_left_operand())
+                and self._expression_has_no_side_effects(function_node, node.get_right_operand())
+            )
+        if isinstance(node, NotNode):
+            return self._expression_has_no_side_effects(function_node, node.get_condition_node())
+        if isinstance(node, FunctionCallNode):
+            self._calls[function_node].add(node.get_function_name())
+            return all(self._expression_has_no_side_effects(function_node, argument) for argument in node.get_arguments())
+        return True
+
+    def _is_pure_call(self, function_name, pure_function_nodes):
+        """
+        :param function_name: The name called.
+        :param pure_function_nodes: The FunctionNodes found pure so far.
+        :return: Whether the name can only hold pure functions, a variable may hold any value.
+        """
+        function_nodes = self._functions.get(function_name)
+        if function_nodes is None or function_name in self._variable_names:
+            return False
+        return all(function_node in pure_function_nodes for function_node in function_nodes)
+
+    def get_local_names(self):
+        """
+        :return: The names the last program analyzed declares in a scope other than the global one, the other
+                 names are only ever looked up in the global scope.
+        """
+        return self._local_names
@@ -0,0 +1,290 @@
+from mojilang.interpreter.scope.scope_context import ScopeContext
+from mojilang.lexer import SyntaxException
+from mojilang.parser.nodes import (
+    AssignmentNode,
+    BreakNode,
+    ConditionalNode,
+    ContinueNode,
+    FunctionCallNode,
+    FunctionNode,
+    LoopNode,
+    NotNode,
+    OperationNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    VariableNode,
+)
+
+
+class Resolver:
+    """
+    The Resolver class is a semantic pass run after Parser.parse. It binds each VariableNode, AssignmentNode
+    and ReassignmentNode it can to the address of the scope holding the variable at run time (see
+    ScopeContext), so the tree-walker reads the variable from that scope instead of walking the whole scope
+    chain, twice, on every access.
+
+    Since Mojilang scopes are dynamic, only the variables declared in the blocks of the same function (or of
+    the top level of the program, outside of any function) are bound: every block declaring variables runs
+    in a scope of its own, so a variable declared earlier in an enclosing block is always found the same
+    number of scopes up, and no scope in between can declare it again. Any other variable may be declared
+    by the caller, and is looked up by name at run time.
+
+    Outside of functions every variable is declared by the program itself, so a variable without an address
+    there is undefined, as is a variable whose name the program never declares. These are reported instead
+    of being left to fail once the program runs.
+
+    A function call is bound to the global context when the program never declares the name it calls anywhere
+    but at its top level, so no scope can shadow the global binding and the call reads it straight from the
+    global context instead of walking the scope chain, wherever it is made from. Since the call reads the
+    binding rather than a value remembered earlier, a function declared again or a reassigned name is always
+    seen.
+
+    Attributes:
+        _scopes (list): The names declared so far in each enclosing block of the function being resolved,
+                        innermost last. A name maps to False for an argument, which is only declared if the
+                        call passed a value for it.
+        _in_function (bool): Whether the blocks being resolved are the body of a function.
+        _in_loop (bool): Whether the blocks being resolved are within a loop of the same function.
+        _declared_names (set): The names of all variables, arguments and functions declared so far.
+        _undefined_variable_nodes (list): The variables that are undefined whenever they are evaluated.
+        _unbound_variable_nodes (list): The variables of functions that could not be bound.
+        _local_names (set): The names declared anywhere but at the top level of the program.
+        _function_call_nodes (list): The function calls of the program.
+    """
+
+    def __init__(self):
+        """
+        Initializes the Resolver.
+        """
+        self._scopes = []
+        self._in_function = False
+        self._in_loop = False
+        self._declared_names = set()
+        self._undefined_variable_nodes = []
+        self._unbound_variable_nodes = []
+        self._local_names = set()
+        self._function_call_nodes = []
+
+    def resolve(self, abstract_syntax_tree):
+        """
+        Binds the variables of a program to their addresses.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: A list of SyntaxException, one per use of an undefined variable, in the order of the lines.
+        """
+        self._scopes = [{}]
+        self._in_function = False
+        self._in_loop = False
+        self._declared_names = set()
+        self._undefined_variable_nodes = []
+        self._unbound_variable_nodes = []
+        self._local_names = set()
+        self._function_call_nodes = []
+        self._resolve_block(abstract_syntax_tree)
+
+        for node in self._function_call_nodes:
+            if node.get_function_name() not in self._local_names:
+                node.set_address(ScopeContext.GLOBAL_DEPTH)
+
+        undefined_variable_nodes = self._undefined_variable_nodes + [
+            node for node in self._unbound_variable_nodes if node.get_name() not in self._declared_names
+        ]
+        undefined_variable_nodes.sort(key=lambda node: node.get_line_number())
+        return [
+            SyntaxException(node.get_line_number(), f"Undefined variable '{node.get_name()}'")
+            for node in undefined_variable_nodes
+        ]
+
+    def _resolve_block(self, block_node):
+        """
+        Resolves the statements of a block, up to the first statement that always ends it.
+
+        :param block_node: The BlockNode.
+        """
+        for node in block_node.get_nodes():
+            self._resolve_statement(node)
+            if isinstance(node, ReturnNode) or (self._in_loop and isinstance(node, (BreakNode, ContinueNode))):
+                return
+
+    def _resolve_scoped_block(self, block_node):
+        """
+        Resolves a block run in a new scope context.
+
+        :param block_node: The BlockNode.
+        """
+        self._scopes.append({})
+        self._resolve_block(block_node)
+        self._scopes.pop()
+
+    def _resolve_statement(self, node):
+        """
+        Resolves a statement.
+
+        :param node: The statement node.
+        """
+        if isinstance(node, ReturnNode):
+            self._resolve_expression(node.get_return_value_node())
+        elif isinstance(node, ConditionalNode):
+            self._resolve_conditional(node)
+        elif isinstance(node, LoopNode):
+            self._resolve_expression(node.get_condition_node())
+            in_loop = self._in_loop
+            self._in_loop = True
+            self._resolve_scoped_block(node.get_block_node())
+            self._in_loop = in_loop
+        elif isinstance(node, PrintNode):
+            self._resolve_expression(node.get_node_to_print())
+        elif isinstance(node, ReassignmentNode):
+            self._resolve_expression(node.get_value_node())
+            self._resolve_reassignment(node)
+        elif isinstance(node, AssignmentNode):
+            self._resolve_expression(node.get_value_node())
+            self._resolve_declaration(node)
+        elif isinstance(node, FunctionNode):
+            self._resolve_function(node)
+        elif not isinstance(node, (BreakNode, ContinueNode)):
+            self._resolve_expression(node)
+
+    def _resolve_conditional(self, node):
+        """
+        Resolves a chain of conditionals.
+
+        :param node: The IfNode or ElseIfNode.
+        """
+        self._resolve_expression(node.get_condition_node())
+        self._resolve_conditional_block(node.get_block_node())
+        next_node = node.get_next_conditional_node()
+        if isinstance(next_node, ConditionalNode):
+            self._resolve_conditional(next_node)
+        elif next_node is not None:
+            self._resolve_conditional_block(next_node.get_block_node())
+
+    def _resolve_conditional_block(self, block_node):
+        """
+        Resolves the block of a conditional, which runs in the enclosing scope if it is scope-free.
+
+        :param block_node: The BlockNode.
+        """
+        if block_node.is_scope_free():
+            self._resolve_block(block_node)
+        else:
+            self._resolve_scoped_block(block_node)
+
+    def _resolve_declaration(self, node):
+        """
+        Binds a variable declaration if the variable cannot be declared yet when it runs, so the declaration
+        does not have to check. A declaration within a block of a function checks the calling frames too,
+        so it is only bound at the top level of the function.
+
+        :param node: The AssignmentNode.
+        """
+        variable_name = node.get_variable_node().get_name()
+        self._declared_names.add(variable_name)
+        self._record_declaration(variable_name)
+        if self._find_binding(variable_name) is None and (not self._in_function or len(self._scopes) == 1):
+            node.set_address(self._address(len(self._scopes) - 1))
+        # Past the declaration the variable is declared, or the program has failed.
+        self._scopes[-1][variable_name] = True
+
+    def _resolve_reassignment(self, node):
+        """
+        Binds a variable reassignment if the variable is always declared when it runs.
+
+        :param node: The ReassignmentNode.
+        """
+        binding = self._find_binding(node.get_variable_node().get_name())
+        if binding is not None and binding[1]:
+            node.set_address(self._address(binding[0]))
+
+    def _resolve_function(self, node):
+        """
+        Resolves a function declaration. The body is resolved on its own, since the scopes it runs within are
+        only known at run time.
+
+        :param node: The FunctionNode.
+        """
+        self._declared_names.add(node.get_function_name())
+        self._declared_names.update(node.get_argument_names())
+        self._record_declaration(node.get_function_name())
+        self._local_names.update(node.get_argument_names())
+        self._scopes[-1][node.get_function_name()] = True
+
+        scopes, in_function, in_loop = self._scopes, self._in_function, self._in_loop
+        self._scopes = [{argument_name: False for argument_name in node.get_argument_names()}]
+        self._in_function = True
+        self._in_loop = False
+        self._resolve_block(node.get_function_block_node())
+        self._scopes, self._in_function, self._in_loop = scopes, in_function, in_loop
+
+    def _resolve_expression(self, node):
+        """
+        Resolves the variables of an expression.
+
+        :param node: The expression node.
+        """
+        if isinstance(node, VariableNode):
+            self._resolve_variable(node)
+        elif isinstance(node, OperationNode):
+            self._resolve_expression(node.get_left_operand())
+            self._resolve_expression(node.get_right_operand())
+        elif isinstance(node, NotNode):
+            self._resolve_expression(node.get_condition_node())
+        elif isinstance(node, FunctionCallNode):
+            self._function_call_nodes.append(node)
+            for argument in node.get_arguments():
+                self._resolve_expression(argument)
+
+    def _resolve_variable(self, node):
+        """
+        Binds a variable to the scope declaring it, or records it as undefined.
+
+        :param node: The VariableNode.
+        """
+        binding = self._find_binding(node.get_name())
+        if binding is not None:
+            node.set_address(self._address(binding[0]))
+        elif self._in_function:
+            self._unbound_variable_nodes.append(node)
+        else:
+            self._undefined_variable_nodes.append(node)
+
+    def _record_declaration(self, variable_name):
+        """
+        Records a name declared in a scope other than the global context, which may shadow the global binding.
+
+        :param variable_name: The name declared.
+        """
+        if self._in_function or len(self._scopes) > 1:
+            self._local_names.add(variable_name)
+
+    def get_function_call_nodes(self):
+        """
+        :return: The function calls of the program last resolved, in the order of the program.
+        """
+        return self._function_call_nodes
+
+    def _find_binding(self, variable_name):
+        """
+        Finds the innermost enclosing block of the same function declaring a variable.
+
+        :param variable_name: The name of the variable.
+        :return: A tuple of the index of the block in _scopes and whether the variable is always declared,
+                 or None if no block declares it.
+        """
+        for index in range(len(self._scopes) - 1, -1, -1):
+            if variable_name in self._scopes[index]:
+                return index, self._scopes[index][variable_name]
+        return None
+
+    def _address(self, index):
+        """
+        Computes the address of the scope of a block from the innermost block.
+
+        :param index: The index of the block in _scopes.
+        :return: The number of scopes up to the block, or ScopeContext.GLOBAL_DEPTH for the top level of the
+                 program, whose variables are global.
+        """
+        if index == 0 and not self._in_function:
+            return ScopeContext.GLOBAL_DEPTH
+        return len(self._scopes) - 1 - index
@@ -11,6 +11,8 @@ class BlockScopeContext:
     Attributes:
         _block_scope the active block scope.
         _parent_scope (BlockScopeContext): The parent scope of the current block, representing the outer block.
+        _loop_depth (int): The number of loop scopes in the scope chain, the current one included.
+        _function_depth (int): The number of function scopes in the scope chain, the current one included.
     """
     def __init__(self, block_scope, parent_scope=None):
         """
@@ -21,6 +23,13 @@ class BlockScopeContext:
         """
         self._block_scope = block_scope
         self._parent_scope = parent_scope
+        # Counted when the scope is entered, so checking for a loop or function never walks the chain.
+        self._loop_depth = parent_scope._loop_depth if parent_scope else 0
+        self._function_depth = parent_scope._function_depth if parent_scope else 0
+        if block_scope == BlockScope.LOOP:
+            self._loop_depth += 1
+        elif block_scope == BlockScope.FUNCTION:
+            self._function_depth += 1
 
     def enter_scope(self, new_block_scope):
         """
@@ -52,12 +61,30 @@ class BlockScopeContext:
         Checks if a specific scope type is present in the scope chain.
 
         This method can be used to verify whether a certain block scope (e.g. a loop)
-        is currently active within the nested block structure.
+        is currently active within the nested block structure. Loops and functions are
+        checked in constant time from the depth counters, other scopes by walking the chain.
 
         :param block_scope: The type of scope to check for (e.g. BlockScope.LOOP).
         :return: True if the scope type is in the chain, False otherwise.
         """
-        return block_scope == self._block_scope or (self._parent_scope.within_block_scope(block_scope) if self._parent_scope else False)
+        if block_scope == BlockScope.LOOP:
+            return self._loop_depth > 0
+        if block_scope == BlockScope.FUNCTION:
+            return self._function_depth > 0
+        scope = self
+        while scope is not None:
+            if scope._block_scope == block_scope:
+                return True
+            scope = scope._parent_scope
+        return False
+
+    def get_loop_depth(self):
+        """Returns the number of loop scopes in the scope chain."""
+        return self._loop_depth
+
+    def get_function_depth(self):
+        """Returns the number of function scopes in the scope chain."""
+        return self._function_depth
 
     def __repr__(self):
         return f'block_scope: {self._block_scope}'
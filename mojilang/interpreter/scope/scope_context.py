@@ -4,8 +4,17 @@ class ScopeContext:
 
     ScopeContext is responsible for storing and handling variable assignments and lookups.
     It allows for the distinction between local, parent, and global variables
+
+    Variables bound by the Resolver are accessed by their address instead: the number of parent contexts
+    up from the context the node is evaluated in, or GLOBAL_DEPTH for the global context.
     """
 
+    GLOBAL_DEPTH = -1
+
+    # The value of the last statement run in the context, set by the nodes' execute method along with the
+    # completion status they return (see AbstractSyntaxTreeNode.execute).
+    completion_value = None
+
     def __init__(self, block_scope_context, context=None, parent_context=None, global_context=None, ):
         """
         Initializes a new ScopeContext with blockScopeContext, optional local, parent, and global contexts.
@@ -34,8 +43,9 @@ class ScopeContext:
         """
         Reassigns a value to a variable in the current context.
 
-        The method first checks local, then it recursively traverses
-        the parent scopes, then finally checks global.
+        The method first checks local, then it traverses the parent scopes in a loop, then finally checks
+        global. A variable found two or more scopes up also reassigns the global variable of the same name,
+        if there is one.
 
         :param variable_name: The name of the variable to reassign.
         :param value: The value to reassign to the variable.
@@ -44,8 +54,16 @@ class ScopeContext:
             self._local_context[variable_name] = value
             return True
 
-        if self._parent_context and self._parent_context.reassign_value(variable_name, value):
-            return
+        context = self._parent_context
+        depth = 1
+        while context is not None:
+            if variable_name in context._local_context:
+                context._local_context[variable_name] = value
+                if depth == 1:
+                    return
+                break
+            context = context._parent_context
+            depth += 1
 
         if variable_name in self._global_context:
             self._global_context[variable_name] = value
@@ -54,20 +72,78 @@ class ScopeContext:
         """
         Retrieves the value of a variable from the scopes.
 
-        The method first checks local, then it recursively traverses
-        the parent scopes, then finally checks global.
+        The method first checks local, then it traverses the parent scopes, then finally checks global,
+        see find_variable_value.
 
         :param variable_name: The name of the variable to retrieve.
         :return: The value assigned to the variable.
         """
-        if self.local_contains_variable(variable_name):
-            return self._local_context[variable_name]
+        return self.find_variable_value(variable_name)
 
-        if self._parent_context:
-            return self._parent_context.retrieve_variable_value(variable_name)
+    def find_variable_value(self, variable_name, default=None):
+        """
+        Retrieves the value of a variable from the scopes in the same order as retrieve_variable_value,
+        but walking up the parent scopes in a loop, and tells undefined variables apart in the same walk
+        instead of checking contains_variable first.
 
-        if variable_name in self._global_context:
-            return self._global_context[variable_name]
+        :param variable_name: The name of the variable to retrieve.
+        :param default: The value to return if the variable is not defined.
+        :return: The value assigned to the variable, or the default.
+        """
+        context = self
+        while context is not None:
+            if variable_name in context._local_context:
+                return context._local_context[variable_name]
+            context = context._parent_context
+        return self._global_context.get(variable_name, default)
+
+    def retrieve_resolved_value(self, depth, variable_name, default=None):
+        """
+        Retrieves the value of a variable from the scope at the address the Resolver bound it to.
+
+        :param depth: The number of parent contexts up to the scope, or GLOBAL_DEPTH for the global context.
+        :param variable_name: The name of the variable to retrieve.
+        :param default: The value to return if the variable is not defined in that scope.
+        :return: The value assigned to the variable, or the default.
+        """
+        if depth == self.GLOBAL_DEPTH:
+            return self._global_context.get(variable_name, default)
+        context = self
+        for _ in range(depth):
+            context = context._parent_context
+        return context._local_context.get(variable_name, default)
+
+    def assign_resolved_value(self, depth, variable_name, value):
+        """
+        Declares a variable in the scope at the address the Resolver bound it to, the current scope or the
+        global context.
+
+        :param depth: 0 for the current scope, or GLOBAL_DEPTH for the global context.
+        :param variable_name: The name of the variable to assign.
+        :param value: The value to assign to the variable.
+        """
+        scope = self._global_context if depth == self.GLOBAL_DEPTH else self._local_context
+        scope[variable_name] = value
+
+    def reassign_resolved_value(self, depth, variable_name, value):
+        """
+        Reassigns a value to a variable in the scope at the address the Resolver bound it to, with the same
+        effect as reassign_value: a variable found two or more scopes up also reassigns the global variable of
+        the same name, if there is one.
+
+        :param depth: The number of parent contexts up to the scope, or GLOBAL_DEPTH for the global context.
+        :param variable_name: The name of the variable to reassign.
+        :param value: The value to reassign to the variable.
+        """
+        if depth == self.GLOBAL_DEPTH:
+            self._global_context[variable_name] = value
+            return
+        context = self
+        for _ in range(depth):
+            context = context._parent_context
+        context._local_context[variable_name] = value
+        if depth >= 2 and variable_name in self._global_context:
+            self._global_context[variable_name] = value
 
     def local_contains_variable(self, variable_name):
         """
@@ -85,13 +161,12 @@ class ScopeContext:
         :param variable_name: The name of the variable to check.
         :return: True if the variable exists in the local scope, False otherwise.
         """
-        return (
-            self.local_contains_variable(variable_name)
-        ) or (
-            self._parent_context.contains_variable(variable_name) if self._parent_context else False
-        ) or (
-            variable_name in self._global_context
-        )
+        context = self
+        while context is not None:
+            if variable_name in context._local_context:
+                return True
+            context = context._parent_context
+        return variable_name in self._global_context
 
     def current_scope_contains_variable(self, variable_name):
         """
@@ -125,6 +200,36 @@ class ScopeContext:
         new_block_scope_context = self._block_scope_context.enter_scope(block_scope)
         return ScopeContext(block_scope_context=new_block_scope_context, global_context=self._global_context, parent_context=self)
 
+    def reuse_for_tail_call(self, variable_names):
+        """
+        Provides the ScopeContext of a function called in tail position by emptying the function scope of the
+        running function, which the call replaces along with the conditional scopes within it, up to the current
+        one, instead of extending them. The scope chain then does not grow with each tail call.
+
+        The function called only sees a difference if it looks up a variable declared in one of the replaced
+        scopes, so none of them may declare any of the variables it may look up past its own scope.
+
+        :param variable_names: The names the function called may look up past its own scope.
+        :return: The running function's ScopeContext, emptied, or None if a replaced scope declares one of the
+                 variables.
+        """
+        context = self
+        while True:
+            if not variable_names.isdisjoint(context._local_context):
+                return None
+            if context._block_scope_context.is_function_scope():
+                break
+            context = context._parent_context
+        context._local_context.clear()
+        return context
+
+    def clear_local_context(self):
+        """
+        Removes every variable from the local scope, so the context can be reused for another run of the
+        same block (e.g. the next iteration of a loop) instead of creating a new one.
+        """
+        self._local_context.clear()
+
     def is_block_scope(self, block_scope):
         """Returns if the current block scope is the expected one."""
         return self._block_scope_context.is_block_scope(block_scope)
@@ -133,5 +238,9 @@ class ScopeContext:
         """Checks if a specific scope type is present in the scope chain."""
         return self._block_scope_context.within_block_scope(block_scope)
 
+    def get_function_depth(self):
+        """Returns the number of function scopes in the scope chain, the number of calls the context is nested in."""
+        return self._block_scope_context.get_function_depth()
+
     def __repr__(self):
         return f'local_context: {self._local_context}, global_context: {self._global_context}, block_scope_context: {self._block_scope_context}'
@@ -0,0 +1,233 @@
+from mojilang.parser.nodes import (
+    AssignmentNode,
+    ConditionalNode,
+    FunctionCallNode,
+    FunctionNode,
+    LoopNode,
+    NotNode,
+    OperationNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    VariableNode,
+)
+
+
+class TailCallAnalyzer:
+    """
+    The TailCallAnalyzer class is a semantic pass run after Parser.parse. It marks the function calls in tail
+    position, whose value is the value the calling function returns, so the tree-walker can run them without
+    growing the Python stack or the scope chain (see FunctionNode.call and FunctionCallNode).
+
+    A return only ends the block it is in, so a call is in tail position if it is the last statement of the
+    body of a function, or the value of a return statement there, and likewise within the blocks of a
+    conditional that is the last statement of the body. Calls within loops are never in tail position.
+
+    Since Mojilang scopes are dynamic, a function called in tail position could still look up the variables of
+    the calling function. The analyzer records on each FunctionNode the names it may look up past its own
+    scope, including those of the functions it calls, and the call only replaces the caller's scopes at run
+    time if they declare none of them.
+
+    Attributes:
+        _functions (dict): The FunctionNodes of the program by name.
+        _variable_names (set): The names declared as variables or arguments anywhere in the program.
+        _free_variable_names (dict): The names each FunctionNode looks up past its own scope, calls excluded.
+        _calls (dict): The names each FunctionNode calls, with the number of arguments of each call.
+    """
+
+    def __init__(self):
+        """
+        Initializes the TailCallAnalyzer.
+        """
+        self._functions = {}
+        self._variable_names = set()
+        self._free_variable_names = {}
+        self._calls = {}
+
+    def analyze(self, abstract_syntax_tree):
+        """
+        Marks the calls in tail position and records the names each function may look up past its own scope.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        """
+        self._functions = {}
+        self._variable_names = set()
+        self._free_variable_names = {}
+        self._calls = {}
+        self._collect_block(abstract_syntax_tree)
+
+        for function_nodes in self._functions.values():
+            for function_node in function_nodes:
+                self._analyze_function(function_node)
+                self._mark_tail_calls(function_node.get_function_block_node())
+
+        for function_node, free_variable_names in self._close_free_variable_names().items():
+            function_node.set_free_variable_names(free_variable_names)
+
+    def _collect_block(self, block_node):
+        """
+        Collects the functions and variable names declared in a block and the blocks within it.
+
+        :param block_node: The BlockNode.
+        """
+        for node in block_node.get_nodes():
+            if isinstance(node, AssignmentNode):
+                self._variable_names.add(node.get_variable_node().get_name())
+            elif isinstance(node, FunctionNode):
+                self._functions.setdefault(node.get_function_name(), []).append(node)
+                self._variable_names.update(node.get_argument_names())
+                self._collect_block(node.get_function_block_node())
+            elif isinstance(node, LoopNode):
+                self._collect_block(node.get_block_node())
+            elif isinstance(node, ConditionalNode):
+                for conditional_block in node.get_branch_block_nodes():
+                    self._collect_block(conditional_block)
+
+    def _analyze_function(self, function_node):
+        """
+        Finds the names a function looks up past its own scope, and the functions it calls.
+
+        :param function_node: The FunctionNode.
+        """
+        self._free_variable_names[function_node] = set()
+        self._calls[function_node] = []
+        scopes = [set(function_node.get_argument_names())]
+        self._analyze_block(function_node, function_node.get_function_block_node(), scopes)
+
+    def _analyze_block(self, function_node, block_node, scopes):
+        """
+        Finds the names the statements of a block of a function look up past the function's scope.
+
+        :param function_node: The FunctionNode.
+        :param block_node: The BlockNode.
+        :param scopes: The names declared in each enclosing block of the function, innermost last.
+        """
+        for node in block_node.get_nodes():
+            if isinstance(node, AssignmentNode):
+                self._analyze_expression(function_node, node.get_value_node(), scopes)
+                variable_name = node.get_variable_node().get_name()
+                # Only the function's own scope is checked at its top level, within a block the whole scope
+                # chain is.
+                if len(scopes) > 1:
+                    self._analyze_name(function_node, variable_name, scopes)
+                if not isinstance(node, ReassignmentNode):
+                    scopes[-1].add(variable_name)
+            elif isinstance(node, FunctionNode):
+                scopes[-1].add(node.get_function_name())
+            elif isinstance(node, ConditionalNode):
+                for conditional_node in node.get_conditional_nodes():
+                    self._analyze_expression(function_node, conditional_node.get_condition_node(), scopes)
+                for conditional_block in node.get_branch_block_nodes():
+                    self._analyze_scoped_block(function_node, conditional_block, scopes)
+            elif isinstance(node, LoopNode):
+                self._analyze_expression(function_node, node.get_condition_node(), scopes)
+                self._analyze_scoped_block(function_node, node.get_block_node(), scopes)
+            elif isinstance(node, ReturnNode):
+                self._analyze_expression(function_node, node.get_return_value_node(), scopes)
+            elif isinstance(node, PrintNode):
+                self._analyze_expression(function_node, node.get_node_to_print(), scopes)
+            else:
+                self._analyze_expression(function_node, node, scopes)
+
+    def _analyze_scoped_block(self, function_node, block_node, scopes):
+        """
+        Finds the names looked up past the function's scope by a block run in a new scope context.
+
+        :param function_node: The FunctionNode.
+        :param block_node: The BlockNode.
+        :param scopes: The names declared in each enclosing block of the function, innermost last.
+        """
+        scopes.append(set())
+        self._analyze_block(function_node, block_node, scopes)
+        scopes.pop()
+
+    def _analyze_expression(self, function_node, node, scopes):
+        """
+        Finds the names an expression of a function looks up past the function's scope.
+
+        :param function_node: The FunctionNode.
+        :param node: The expression node.
+        :param scopes: The names declared in each enclosing block of the function, innermost last.
+        """
+        if isinstance(node, VariableNode):
+            self._analyze_name(function_node, node.get_name(), scopes)
+        elif isinstance(node, OperationNode):
+            self._analyze_expression(function_node, node.get_left_operand(), scopes)
+            self._analyze_expression(function_node, node.get_right_operand(), scopes)
+        elif isinstance(node, NotNode):
+            self._analyze_expression(function_node, node.get_condition_node(), scopes)
+        elif isinstance(node, FunctionCallNode):
+            self._analyze_name(function_node, node.get_function_name(), scopes)
+            self._calls[function_node].append((node.get_function_name(), len(node.get_arguments())))
+            for argument in node.get_arguments():
+                self._analyze_expression(function_node, argument, scopes)
+
+    def _analyze_name(self, function_node, variable_name, scopes):
+        """
+        Records a name looked up by a function if no enclosing block of the function declares it.
+
+        :param function_node: The FunctionNode.
+        :param variable_name: The name looked up.
+        :param scopes: The names declared in each enclosing block of the function, innermost last.
+        """
+        if not any(variable_name in scope for scope in scopes):
+            self._free_variable_names[function_node].add(variable_name)
+
+    def _close_free_variable_names(self):
+        """
+        Adds the names looked up past their own scope by the functions each function calls, which run in scopes
+        within the calling function's.
+
+        :return: The frozenset of names each FunctionNode may look up past its own scope, or None if it calls a
+                 value that may not be one of the program's functions.
+        """
+        free_variable_names = {function_node: set(names) for function_node, names in self._free_variable_names.items()}
+        changed = True
+        while changed:
+            changed = False
+            for function_node, calls in self._calls.items():
+                if free_variable_names[function_node] is None:
+                    continue
+                for function_name, argument_count in calls:
+                    called_nodes = self._functions.get(function_name)
+                    if called_nodes is None or function_name in self._variable_names:
+                        free_variable_names[function_node] = None
+                        changed = True
+                        break
+                    for called_node in called_nodes:
+                        called_names = free_variable_names[called_node]
+                        if called_names is None:
+                            free_variable_names[function_node] = None
+                            changed = True
+                            break
+                        # An argument the call does not pass is looked up like any other name.
+                        called_names = called_names.union(called_node.get_argument_names()[argument_count:])
+                        if not called_names <= free_variable_names[function_node]:
+                            free_variable_names[function_node] |= called_names
+                            changed = True
+                    if free_variable_names[function_node] is None:
+                        break
+        return {
+            function_node: None if names is None else frozenset(names)
+            for function_node, names in free_variable_names.items()
+        }
+
+    def _mark_tail_calls(self, block_node):
+        """
+        Marks the calls in tail position of a block whose value is the value its function returns.
+
+        :param block_node: The BlockNode.
+        """
+        nodes = block_node.get_nodes()
+        for index, node in enumerate(nodes):
+            if isinstance(node, ReturnNode):
+                if isinstance(node.get_return_value_node(), FunctionCallNode):
+                    node.get_return_value_node().set_tail_call(True)
+                # The statements after a return never run.
+                return
+            if index == len(nodes) - 1:
+                if isinstance(node, FunctionCallNode):
+                    node.set_tail_call(True)
+                elif isinstance(node, ConditionalNode):
+                    for conditional_block in node.get_branch_block_nodes():
+                        self._mark_tail_calls(conditional_block)
@@ -0,0 +1,341 @@
+import operator
+
+from mojilang.compiler.runtime import divide
+from mojilang.lexer import Lexer, SyntaxException
+from mojilang.parser import Parser
+from mojilang.parser.nodes import (
+    AdditionNode,
+    AndNode,
+    BooleanLiteralNode,
+    DivisionNode,
+    EqualsNode,
+    ExponentNode,
+    FunctionNode,
+    GreaterEqualsNode,
+    GreaterNode,
+    LessEqualsNode,
+    LessNode,
+    ModulusNode,
+    MultiplicationNode,
+    NotEqualsNode,
+    NotNode,
+    NumberLiteralNode,
+    OrNode,
+    ReturnNode,
+    SubtractionNode,
+    VariableNode,
+)
+
+# The scalar function of each operation, exactly what the operation's node evaluates.
+SCALAR_OPERATIONS = {
+    AdditionNode: operator.add,
+    SubtractionNode: operator.sub,
+    MultiplicationNode: operator.mul,
+    DivisionNode: divide,
+    ModulusNode: operator.mod,
+    ExponentNode: operator.pow,
+    EqualsNode: operator.eq,
+    NotEqualsNode: operator.ne,
+    LessNode: operator.lt,
+    LessEqualsNode: operator.le,
+    GreaterNode: operator.gt,
+    GreaterEqualsNode: operator.ge,
+}
+
+# The name of the NumPy ufunc computing each operation elementwise.
+UFUNC_NAMES = {
+    AdditionNode: 'add',
+    SubtractionNode: 'subtract',
+    MultiplicationNode: 'multiply',
+    DivisionNode: 'true_divide',
+    ModulusNode: 'remainder',
+    ExponentNode: 'power',
+    EqualsNode: 'equal',
+    NotEqualsNode: 'not_equal',
+    LessNode: 'less',
+    LessEqualsNode: 'less_equal',
+    GreaterNode: 'greater',
+    GreaterEqualsNode: 'greater_equal',
+}
+
+ARITHMETIC_OPERATIONS = (AdditionNode, SubtractionNode, MultiplicationNode, DivisionNode, ModulusNode, ExponentNode)
+# The operations whose integer results NumPy computes differently from Python, e.g. 1 🍕 0 is 0 rather than an
+# error, and 2 🥕 (0 ➖ 1) an error rather than 0.5.
+INTEGER_UNSAFE_OPERATIONS = (ModulusNode, ExponentNode)
+
+
+def _import_numpy():
+    """
+    Imports NumPy, which only the VectorizedFunction needs, once it is first used.
+
+    :return: The numpy module.
+    :raises ImportError: If NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError('Evaluating Mojilang over arrays needs NumPy, install it with `pip install numpy`.') from e
+    return numpy
+
+
+class VectorizedFunction:
+    """
+    The VectorizedFunction class evaluates an arithmetic expression, or a function returning one, over NumPy arrays
+    bound to its arguments in one vectorized pass per operation, rather than calling the function once per row
+    in a 🔁 loop. NumPy is only imported once a VectorizedFunction is built, Mojilang does not depend on it
+    otherwise.
+
+    The result of each row is the value evaluating the expression with the values of the row would return:
+    numbers are floats, comparisons and 🙅 give booleans, and `and` and `or` pick one of their operands per row,
+    and only evaluate their right operand for the rows the left one does not decide when they short-circuit.
+    Booleans are numbers in arithmetic (😤 ➕ 😤 is the integer 2). Rows whose operation has no finite result,
+    e.g. a division by zero, are computed again one by one with the scalar operation, so they raise the error the
+    scalar evaluation raises (the first such row's, for the first operation reaching one), or give the value it
+    gives. Where a value is not a float, e.g. the complex root of a negative number, or where the operands of an
+    `and` or `or` differ in type, the result becomes an array of Python objects, whose operations are evaluated
+    one by one from there on.
+
+    Only literals, variables, operations and 🙅 can be vectorized. A function must be made of a single 🫡
+    statement, whose expression only uses the function's arguments.
+
+    Attributes:
+        _numpy (module): The numpy module.
+        _expression_node (AbstractSyntaxTreeNode): The expression evaluated.
+        _argument_names (tuple): The names of the arrays the expression is evaluated over, in order.
+    """
+
+    def __init__(self, node, argument_names=None):
+        """
+        Initializes the VectorizedFunction of an expression or a function.
+
+        :param node: The expression node, or the FunctionNode whose block is a single ReturnNode.
+        :param argument_names: The names of the arrays of an expression, in the order they are passed. Defaults to
+                               the names of its variables in the order they appear, a function's are its arguments.
+        :raises ImportError: If NumPy is not installed.
+        :raises ValueError: If the node cannot be vectorized, or uses variables that are not arguments.
+        """
+        self._numpy = _import_numpy()
+        if isinstance(node, FunctionNode):
+            statements = node.get_function_block_node().get_nodes()
+            if len(statements) != 1 or not isinstance(statements[0], ReturnNode):
+                raise ValueError(
+                    f"The function '{node.get_function_name()}' must be made of a single 🫡 statement to be vectorized."
+                )
+            node, argument_names = statements[0].get_return_value_node(), node.get_argument_names()
+        variable_names = _variable_names(node)
+        if argument_names is None:
+            argument_names = variable_names
+        undefined_names = [name for name in variable_names if name not in argument_names]
+        if undefined_names:
+            raise ValueError(f"The expression uses variables that are not arguments: {undefined_names}.")
+        self._expression_node = node
+        self._argument_names = tuple(argument_names)
+
+    @classmethod
+    def from_source(cls, source_code, function_name):
+        """
+        Parses a program and vectorizes one of the functions it declares at its top level.
+
+        :param source_code: The source code of the program.
+        :param function_name: The name of the function, the last one declared under the name.
+        :return: The VectorizedFunction of the function.
+        :raises SyntaxException: If the source code has syntax errors.
+        :raises ValueError: If the program declares no such function, or it cannot be vectorized.
+        """
+        lexer = Lexer(source_code)
+        exceptions = lexer.scan_tokens()
+        if exceptions:
+            raise SyntaxException(12, f'Found the following syntax errors: {exceptions}')
+        function_nodes = [
+            node for node in Parser(lexer.get_tokens()).parse().get_nodes()
+            if isinstance(node, FunctionNode) and node.get_function_name() == function_name
+        ]
+        if not function_nodes:
+            raise ValueError(f"The program declares no function '{function_name}'.")
+        return cls(function_nodes[-1])
+
+    def __call__(self, *arrays, **named_arrays):
+        """
+        Evaluates the expression over arrays.
+
+        :param arrays: The arrays of the arguments, in order. A scalar stands for an array repeating it.
+        :param named_arrays: The arrays of the arguments, by name.
+        :return: The 1-dimensional array of the value of each row.
+        :raises ValueError: If the arrays are missing, unknown or not 1-dimensional arrays of the same length.
+        :raises ZeroDivisionError: If a row divides by zero, like the scalar evaluation does.
+        """
+        numpy = self._numpy
+        if len(arrays) > len(self._argument_names):
+            raise ValueError(f'Expected at most {len(self._argument_names)} arrays, got {len(arrays)}.')
+        bound_arrays = dict(zip(self._argument_names, arrays))
+        for name, array in named_arrays.items():
+            if name not in self._argument_names or name in bound_arrays:
+                raise ValueError(f"Unexpected or repeated array for '{name}'.")
+            bound_arrays[name] = array
+        missing_names = [name for name in self._argument_names if name not in bound_arrays]
+        if missing_names:
+            raise ValueError(f'Missing the arrays of {missing_names}.')
+
+        names = list(bound_arrays)
+        values = [_as_mojilang_array(numpy, numpy.asarray(bound_arrays[name])) for name in names]
+        if any(value.ndim > 1 for value in values):
+            raise ValueError('The arrays must be 1-dimensional.')
+        values = numpy.broadcast_arrays(*[numpy.atleast_1d(value) for value in values]) if values else []
+        size = len(values[0]) if values else 1
+        result = self._evaluate(self._expression_node, dict(zip(names, values)), size)
+        return numpy.broadcast_to(result, (size,)).copy()
+
+    def get_argument_names(self):
+        return self._argument_names
+
+    def _evaluate(self, node, arrays, size):
+        """
+        Evaluates an expression over the rows of the arrays.
+
+        :param node: The expression node.
+        :param arrays: The array of each variable, with a value per row.
+        :param size: The number of rows.
+        :return: The array of the value of each row, or a 0-dimensional array if the value is the same for all.
+        """
+        numpy = self._numpy
+        node_type = type(node)
+        if node_type is VariableNode:
+            return arrays[node.get_name()]
+        if node_type in (NumberLiteralNode, BooleanLiteralNode):
+            return numpy.asarray(node.get_value())
+        if node_type is NotNode:
+            return ~self._truthy(self._evaluate(node.get_condition_node(), arrays, size))
+        if node_type in (AndNode, OrNode):
+            return self._evaluate_logical_operation(node, arrays, size)
+        if node_type in SCALAR_OPERATIONS:
+            left = self._evaluate(node.get_left_operand(), arrays, size)
+            right = self._evaluate(node.get_right_operand(), arrays, size)
+            return self._evaluate_operation(node_type, left, right)
+        raise ValueError(f'Cannot vectorize a {node_type.__name__} on line {node.get_line_number()}.')
+
+    def _evaluate_operation(self, node_type, left, right):
+        """
+        Evaluates an arithmetic operation or a comparison elementwise.
+
+        :param node_type: The class of the operation's node.
+        :param left: The values of the left operand.
+        :param right: The values of the right operand.
+        :return: The values of the operation.
+        """
+        numpy = self._numpy
+        operation = SCALAR_OPERATIONS[node_type]
+        if left.dtype == object or right.dtype == object or (
+            node_type in INTEGER_UNSAFE_OPERATIONS and (left.dtype.kind in 'biu' or right.dtype.kind in 'biu')
+        ):
+            return self._evaluate_one_by_one(operation, left, right)
+        if node_type in ARITHMETIC_OPERATIONS:
+            # NumPy adds booleans as a logical or, Python as the integers 0 and 1.
+            left = left.astype(numpy.int64) if left.dtype == bool else left
+            right = right.astype(numpy.int64) if right.dtype == bool else right
+        with numpy.errstate(all='ignore'):
+            result = getattr(numpy, UFUNC_NAMES[node_type])(left, right)
+        if node_type not in ARITHMETIC_OPERATIONS:
+            return result
+
+        suspect = ~numpy.isfinite(result)
+        if node_type in (DivisionNode, ModulusNode):
+            suspect |= right == 0
+        if not suspect.any():
+            return result
+        # The rows without a finite result raise an error or give a value NumPy may not agree on, e.g. a complex one.
+        # Constant operands are 0-dimensional, their single value is computed again like a row.
+        left, right, result, suspect = (
+            numpy.array(values) for values in numpy.broadcast_arrays(*numpy.atleast_1d(left, right, result, suspect))
+        )
+        rows = numpy.flatnonzero(suspect)
+        values = [operation(left[row].item(), right[row].item()) for row in rows]
+        if any(type(value) is not type(result[row].item()) for row, value in zip(rows, values)):
+            result = result.astype(object)
+        result[rows] = values
+        return result
+
+    def _evaluate_logical_operation(self, node, arrays, size):
+        """
+        Evaluates an `and` or `or` operation elementwise, which picks the left operand or the right one per row.
+
+        :param node: The AndNode or OrNode.
+        :param arrays: The array of each variable, with a value per row.
+        :param size: The number of rows.
+        :return: The values of the operation.
+        """
+        numpy = self._numpy
+        left = numpy.broadcast_to(self._evaluate(node.get_left_operand(), arrays, size), (size,))
+        truthy = self._truthy(left)
+        # The rows the right operand decides.
+        rows = truthy if type(node) is AndNode else ~truthy
+        if node.is_short_circuit():
+            if not rows.any():
+                # A constant right operand would still be evaluated over no rows, and may raise.
+                return left
+            right_rows = {name: values[rows] for name, values in arrays.items()}
+            right = numpy.broadcast_to(self._evaluate(node.get_right_operand(), right_rows, int(rows.sum())), (int(rows.sum()),))
+        else:
+            right = numpy.broadcast_to(self._evaluate(node.get_right_operand(), arrays, size), (size,))[rows]
+        result = left.astype(object) if left.dtype != right.dtype else left.copy()
+        result[rows] = right
+        return result
+
+    def _truthy(self, values):
+        """
+        :param values: The values of an expression.
+        :return: The boolean array of which values are truthy, as Python tells them.
+        """
+        numpy = self._numpy
+        if values.dtype == object:
+            # frompyfunc returns a Python bool rather than an array for a 0-dimensional array.
+            return numpy.asarray(numpy.frompyfunc(bool, 1, 1)(values), dtype=bool)
+        # NaN is truthy, like in Python.
+        return values != 0
+
+    def _evaluate_one_by_one(self, operation, left, right):
+        """
+        Evaluates an operation one row at a time with the scalar operation.
+
+        :param operation: The scalar operation.
+        :param left: The values of the left operand.
+        :param right: The values of the right operand.
+        :return: The array of Python objects of the values of the operation.
+        """
+        numpy = self._numpy
+        return numpy.asarray(numpy.frompyfunc(operation, 2, 1)(left.astype(object), right.astype(object)), dtype=object)
+
+
+def _as_mojilang_array(numpy, array):
+    """
+    :param numpy: The numpy module.
+    :param array: The array bound to an argument.
+    :return: The array of the values the argument holds in Mojilang: booleans stay booleans, numbers are floats,
+             anything else is evaluated as Python objects.
+    """
+    if array.dtype == bool or array.dtype == object:
+        return array
+    if array.dtype.kind in 'iuf':
+        return array.astype(numpy.float64)
+    return array.astype(object)
+
+
+def _variable_names(node):
+    """
+    :param node: An expression node.
+    :return: The names of the variables of the expression, in the order they appear.
+    :raises ValueError: If the expression holds a node that cannot be vectorized.
+    """
+    names = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, VariableNode):
+            if node.get_name() not in names:
+                names.append(node.get_name())
+        elif isinstance(node, NotNode):
+            stack.append(node.get_condition_node())
+        elif isinstance(node, (AndNode, OrNode)) or type(node) in SCALAR_OPERATIONS:
+            stack.extend((node.get_right_operand(), node.get_left_operand()))
+        elif type(node) not in (NumberLiteralNode, BooleanLiteralNode):
+            raise ValueError(f'Cannot vectorize a {type(node).__name__} on line {node.get_line_number()}.')
+    return names
@@ -1,6 +1,21 @@
+import string
+import sys
+from functools import partial
+
 from .token import Token
 from .token_type import TokenType
 from .syntax_exception import SyntaxException
+from .regex_scanner import RegexScanner
+from .token_table import (
+    SINGLE_CHARACTER_TOKENS,
+    ONE_OR_TWO_CHARACTER_TOKENS,
+    FIXED_LEXEMES,
+    IGNORE_CHARACTERS,
+    SPECIAL_IDENTIFIER_CHARACTERS,
+    NEWLINE,
+    COMMENT,
+    STRING_DELIMITER,
+)
 
 
 class Lexer:
@@ -9,15 +24,35 @@ class Lexer:
 
     It processes the source code character by character, grouping characters into tokens based on the
     predefined rules of the mojilang language. It also tracks line numbers for error reporting.
+    Each character is looked up in two tables: one mapping it straight to its token type and one mapping
+    it to the routine scanning longer tokens, so the cost of scanning a character does not grow with the
+    number of token types.
+
+    Alternatively, the regex backend tokenizes the source with a single compiled regular expression
+    (see RegexScanner), which produces the same tokens at a higher throughput on large inputs.
+
+    Source code can also be streamed with iter_tokens, which reads a text stream chunk by chunk and
+    yields tokens as soon as they are scanned instead of building the whole list of tokens up front.
     """
 
-    def __init__(self, source):
+    CHARACTER_BACKEND = 'character'
+    REGEX_BACKEND = 'regex'
+    BACKENDS = (CHARACTER_BACKEND, REGEX_BACKEND)
+
+    STREAM_CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, source='', backend=CHARACTER_BACKEND):
         """
         Initializes the Lexer with the source code to be scanned.
 
-        :param source: The source code as a string.
+        :param source: The source code as a string, not needed when streaming tokens with iter_tokens.
+        :param backend: The tokenizer backend to use, one of Lexer.BACKENDS.
+        :raises ValueError: If the backend is unknown.
         """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown lexer backend '{backend}', expected one of {self.BACKENDS}.")
         self._source = source
+        self._backend = backend
 
         self._exceptions = []
         self._tokens = []
@@ -25,8 +60,10 @@ class Lexer:
         self._current = 0
         self._line = 1
 
-        self._special_identifier_characters = {'_'}
-        self._ignore_characters = {' ', '\r', '\t', '\n', '\u200B', '\uFE0F'}
+        self._special_identifier_characters = SPECIAL_IDENTIFIER_CHARACTERS
+        self._ignore_characters = IGNORE_CHARACTERS
+        self._token_table = SINGLE_CHARACTER_TOKENS
+        self._dispatch_table = self._build_dispatch_table()
 
     def scan_tokens(self):
         """
@@ -34,15 +71,84 @@ class Lexer:
 
         This method loops through the source code, scanning each character until
         the end of the source is reached. Once all tokens are scanned, an EOF token is added.
+
+        :return: The list of syntax exceptions found while scanning.
         """
-        while not self._is_at_end():
+        if self._backend == self.REGEX_BACKEND:
+            return self._scan_tokens_with_regex()
+
+        source = self._source
+        source_length = len(source)
+        tokens = self._tokens
+        token_table = self._token_table
+        fixed_lexemes = FIXED_LEXEMES
+        dispatch_table = self._dispatch_table
+        ignore_characters = self._ignore_characters
+        while self._current < source_length:
             self._start = self._current
-            self._scan_token()
+            character = source[self._current]
+            self._current += 1
+            token_type = token_table.get(character)
+            if token_type is not None:
+                tokens.append(Token(token_type, fixed_lexemes[character], None, self._line))
+                continue
+            handler = dispatch_table.get(character)
+            if handler is not None:
+                handler()
+            elif character not in ignore_characters:
+                self._scan_unmapped_character(character)
 
         end_of_file_token = Token(TokenType.EOF, "", None, self._line)
         self._tokens.append(end_of_file_token)
         return self._exceptions
 
+    def _scan_tokens_with_regex(self):
+        """
+        Scans the source code with the regex backend and adds the EOF token.
+
+        :return: The list of syntax exceptions found while scanning.
+        """
+        scanner = RegexScanner(self._tokens, self._exceptions)
+        scanner.scan(self._source)
+        self._line = scanner.get_line()
+        self._current = len(self._source)
+
+        end_of_file_token = Token(TokenType.EOF, "", None, self._line)
+        self._tokens.append(end_of_file_token)
+        return self._exceptions
+
+    def iter_tokens(self, stream, chunk_size=STREAM_CHUNK_SIZE):
+        """
+        Lazily scans the source code read from a text stream, yielding each token as it is scanned and
+        ending with the EOF token.
+
+        The stream is read chunk_size characters at a time. A token that reaches the end of a chunk, such
+        as '🙅' which could still become '🙅🤝' or a string whose closing quotation mark is in a later
+        chunk, is carried over to the next chunk, so tokens crossing chunk boundaries are scanned exactly
+        like they would be in one piece (see RegexScanner.feed). Only the current chunk, the tokens scanned
+        from it and the text of a string crossing chunks are held in memory at any time.
+
+        Streaming always scans with the regex backend since it is the one able to resume scanning in the
+        middle of the source. Syntax exceptions found along the way are recorded rather than raised and
+        are available from get_exceptions once the stream has been consumed.
+
+        :param stream: A text stream (e.g. a file opened in text mode) to read the source code from.
+        :param chunk_size: The number of characters to read from the stream at a time.
+        :return: A generator of Token objects.
+        """
+        tokens = []
+        scanner = RegexScanner(tokens, self._exceptions)
+        while True:
+            chunk = stream.read(chunk_size)
+            scanner.feed(chunk)
+            yield from tokens
+            tokens.clear()
+            if not chunk:
+                break
+
+        self._line = scanner.get_line()
+        yield Token(TokenType.EOF, "", None, self._line)
+
     def _is_at_end(self):
         """
         Checks if the lexer has reached the end of the source code.
@@ -51,109 +157,71 @@ class Lexer:
         """
         return self._current >= len(self._source)
 
-    def _scan_token(self):
-        """
-        Scans the next character in the source code and converts it into a token.
-
-        Depending on the character, this method generates the appropriate token or handles
-        special cases like whitespace, comments, strings, and numbers.
-        """
-        character = self._advance()
-        if character == '(':
-            self._add_token(TokenType.LEFT_PAREN)
-        elif character == ')':
-            self._add_token(TokenType.RIGHT_PAREN)
-        elif character == '{':
-            self._add_token(TokenType.LEFT_BRACE)
-        elif character == '}':
-            self._add_token(TokenType.RIGHT_BRACE)
-        elif character == ';':
-            self._add_token(TokenType.SEMI_COLON)
-        elif character == ',':
-            self._add_token(TokenType.COMMA)
-        elif character == '.':
-            self._add_token(TokenType.PERIOD)
-        elif character == '✍':
-            self._add_token(TokenType.EQUAL)
-        elif character == '🤝':
-            self._add_token(TokenType.EQUAL_EQUAL)
-        elif character == '=':
-            self._add_token(TokenType.EQUAL_EQUAL if self._match('=') else TokenType.EQUAL)
-        elif character == '🙅':
-            self._add_token(TokenType.BANG_EQUAL if self._match('🤝') else TokenType.BANG)
-        elif character == '!':
-            self._add_token(TokenType.BANG_EQUAL if self._match('=') else TokenType.BANG)
-        elif character == '<':
-            self._add_token(TokenType.LESS_EQUAL if self._match('=') else TokenType.LESS)
-        elif character == '👇':
-            self._add_token(TokenType.LESS_EQUAL if self._match('🤝') else TokenType.LESS)
-        elif character == '☝':
-            self._add_token(TokenType.GREATER_EQUAL if self._match('🤝') else TokenType.GREATER)
-        elif character == '>':
-            self._add_token(TokenType.GREATER_EQUAL if self._match('=') else TokenType.GREATER)
-        elif character == '🖊':
-            self._add_token(TokenType.INPUT)
-        elif character == '💥':
-            self._add_token(TokenType.BREAK)
-        elif character == '🤓':
-            self._add_token(TokenType.CONTINUE)
-        elif character == '🫡':
-            self._add_token(TokenType.RETURN)
-        elif character == '🛠':
-            self._add_token(TokenType.FUNCTION)
-        elif character == '👀':
-            self._add_token(TokenType.FUNCTION_CALL)
-        elif character == '😤':
-            self._add_token(TokenType.TRUE)
-        elif character == '😔':
-            self._add_token(TokenType.FALSE)
-        elif character == '🤔':
-            self._add_token(TokenType.IF)
-        elif character == '🙈':
-            self._add_token(TokenType.ELSEIF)
-        elif character == '💅':
-            self._add_token(TokenType.ELSE)
-        elif character == '🔁':
-            self._add_token(TokenType.LOOP)
-        elif character == '🗣':
-            self._add_token(TokenType.PRINT)
-        elif character == '🥸':
-            self._add_token(TokenType.VAR)
-        elif character == '➕' or character == '+':
-            self._add_token(TokenType.PLUS)
-        elif character == '➖' or character == '-':
-            self._add_token(TokenType.MINUS)
-        elif character == '✖' or character == '*':
-            self._add_token(TokenType.MULTIPLY)
-        elif character == '➗' or character == '/':
-            self._add_token(TokenType.DIVIDE)
-        elif character == '🍕' or character == '%':
-            self._add_token(TokenType.MODULUS)
-        elif character == '🥕' or character == '^':
-            self._add_token(TokenType.EXPONENT)
-        elif character == '🧐':
-            while self._peek() != '\n' and not self._is_at_end():
-                self._advance()
-        elif character in self._ignore_characters:
-            if character == '\n':
-                self._line += 1
-        elif character == '"':
-            self._string()
+    def _build_dispatch_table(self):
+        """
+        Builds the table mapping each character that needs more than a single character token
+        to the zero argument routine that scans it.
+
+        :return: A dictionary from character to scanning routine.
+        """
+        dispatch_table = {}
+        for character, (next_character, two_character_type, one_character_type) in ONE_OR_TWO_CHARACTER_TOKENS.items():
+            dispatch_table[character] = partial(
+                self._add_one_or_two_character_token, next_character, two_character_type, one_character_type
+            )
+        dispatch_table[NEWLINE] = self._newline
+        dispatch_table[COMMENT] = self._comment
+        dispatch_table[STRING_DELIMITER] = self._string
+        for character in string.digits:
+            dispatch_table[character] = self._number
+        for character in string.ascii_letters + ''.join(self._special_identifier_characters):
+            dispatch_table[character] = self._identifier_or_keyword
+        return dispatch_table
+
+    def _scan_unmapped_character(self, character):
+        """
+        Scans a character that has no entry in either table, such as a non-ASCII letter or digit
+        or a character that is not part of the language.
+
+        :param character: The character that was just consumed.
+        """
+        if character.isdecimal():
+            self._number()
+        elif self._is_valid_identifier_character(character):
+            self._identifier_or_keyword()
+        else:
+            unexpected_character_exception = SyntaxException(self._line, f"Unexpected character [{character}]")
+            self._exceptions.append(unexpected_character_exception)
+
+    def _add_one_or_two_character_token(self, next_character, two_character_type, one_character_type):
+        """
+        Adds the two character token if the next character matches, otherwise the one character token.
+
+        :param next_character: The character completing the two character token (e.g. '🤝' for '🙅🤝').
+        :param two_character_type: The token type to add when the next character matches.
+        :param one_character_type: The token type to add otherwise.
+        """
+        self._add_fixed_token(two_character_type if self._match(next_character) else one_character_type)
+
+    def _newline(self):
+        """Skips over a newline, keeping track of the current line number."""
+        self._line += 1
+
+    def _comment(self):
+        """Skips over a comment which runs until the end of the line."""
+        while self._peek() != '\n' and not self._is_at_end():
+            self._advance()
+
+    def _identifier_or_keyword(self):
+        """Scans the 'and' and 'or' keywords, falling back to an identifier otherwise."""
+        if self._peek_next(2) == 'and':
+            self._current += 2
+            self._add_fixed_token(TokenType.AND)
+        elif self._peek_next(1) == 'or':
+            self._current += 1
+            self._add_fixed_token(TokenType.OR)
         else:
-            if character.isdigit():
-                self._number()
-            elif self._is_valid_identifier_character(character):
-                if self._peek_next(2) == 'and':
-                    self._current += 2
-                    self._add_token(TokenType.AND)
-                elif self._peek_next(1) == 'or':
-                    self._current += 1
-                    self._add_token(TokenType.OR)
-                else:
-                    self._identifier()
-            else:
-                unexpected_character_exception = SyntaxException(self._line, f"Unexpected character [{character}]")
-                self._exceptions.append(unexpected_character_exception)
+            self._identifier()
 
     def _advance(self):
         """
@@ -176,6 +244,16 @@ class Lexer:
         new_token = Token(token_type, text, literal, self._line)
         self._tokens.append(new_token)
 
+    def _add_fixed_token(self, token_type):
+        """
+        Adds a new token whose lexeme always produces the same token type, sharing the interned copy
+        of the lexeme rather than a slice of the source code.
+
+        :param token_type: The type of the token (e.g., LESS_EQUAL, AND).
+        """
+        lexeme = FIXED_LEXEMES[self._source[self._start:self._current]]
+        self._tokens.append(Token(token_type, lexeme, None, self._line))
+
     def _match(self, expected):
         """
         Checks if the next character matches the expected character, and advances if it does.
@@ -204,7 +282,7 @@ class Lexer:
         """
         Handles string literals by scanning until the closing quotation mark or end of the source.
 
-        Raises a SyntaxException if the string is unterminated.
+        Records a SyntaxException, without adding a token, if the string is unterminated.
         """
         while self._peek() != '"' and not self._is_at_end():
             if self._peek() == '\n':
@@ -214,6 +292,7 @@ class Lexer:
         if self._is_at_end():
             unterminated_string_exception = SyntaxException(self._line, "Unterminated string.")
             self._exceptions.append(unterminated_string_exception)
+            return
 
         self._advance()
 
@@ -222,17 +301,26 @@ class Lexer:
 
     def _number(self):
         """Scans a numeric literal, handling integers and floating-point numbers."""
-        while self._peek().isdigit():
-            self._advance()
-
+        self._current = self._skip_digits(self._current)
         if self._peek() == '.':
-            self._advance()
-            while self._peek().isdigit():
-                self._advance()
+            self._current = self._skip_digits(self._current + 1)
 
         number = self._source[self._start: self._current]
         self._add_token(TokenType.NUMBER, float(number))
 
+    def _skip_digits(self, index):
+        """
+        Finds the end of a run of digits.
+
+        :param index: The index the run of digits starts at.
+        :return: The index of the first character after the run of digits.
+        """
+        source = self._source
+        source_length = len(source)
+        while index < source_length and source[index].isdecimal():
+            index += 1
+        return index
+
     def _peek_next(self, next_count):
         """
         Peeks ahead to check the next 'next_count' characters without advancing the index.
@@ -247,9 +335,15 @@ class Lexer:
 
     def _identifier(self):
         """Scans an identifier (variable name or keyword) from the source code."""
-        while self._is_valid_identifier_character(self._peek()):
-            self._advance()
-        self._add_token(TokenType.IDENTIFIER)
+        source = self._source
+        source_length = len(source)
+        current = self._current
+        while current < source_length and self._is_valid_identifier_character(source[current]):
+            current += 1
+        self._current = current
+        # Identifiers repeat throughout a program, so every occurrence shares one interned name.
+        identifier = sys.intern(source[self._start:current])
+        self._tokens.append(Token(TokenType.IDENTIFIER, identifier, None, self._line))
 
     def _is_valid_identifier_character(self, character):
         """Determines if a character is alphanumeric or a valid special character for identifiers (variables names)."""
@@ -262,3 +356,11 @@ class Lexer:
         :return: A list of Token objects.
         """
         return self._tokens
+
+    def get_exceptions(self):
+        """
+        Returns the syntax exceptions found so far.
+
+        :return: A list of SyntaxException objects.
+        """
+        return self._exceptions
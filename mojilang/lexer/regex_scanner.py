@@ -0,0 +1,203 @@
+import re
+import sys
+
+from .token import Token
+from .token_type import TokenType
+from .syntax_exception import SyntaxException
+from .token_table import (
+    SINGLE_CHARACTER_TOKENS,
+    ONE_OR_TWO_CHARACTER_TOKENS,
+    KEYWORD_TOKENS,
+    FIXED_LEXEMES,
+    IGNORE_CHARACTERS,
+    SPECIAL_IDENTIFIER_CHARACTERS,
+    NEWLINE,
+    COMMENT,
+    STRING_DELIMITER,
+)
+
+
+def _build_fixed_tokens():
+    """
+    Builds the table of every lexeme that always produces the same token type.
+
+    :return: A dictionary from lexeme to token type.
+    """
+    fixed_tokens = dict(SINGLE_CHARACTER_TOKENS)
+    for character, (next_character, two_character_type, one_character_type) in ONE_OR_TWO_CHARACTER_TOKENS.items():
+        fixed_tokens[character] = one_character_type
+        fixed_tokens[character + next_character] = two_character_type
+    return fixed_tokens
+
+
+def _build_token_pattern(fixed_tokens):
+    """
+    Builds the master regular expression matching one token, preceded by any whitespace, at a time.
+
+    The whole token is captured in the single LEXEME group and classified afterwards by looking at its
+    text, which lets the scanner collect every lexeme with a single findall call instead of creating a
+    match object per token. The order of the alternatives matters since the first alternative that
+    matches wins, e.g. numbers take priority over identifiers and 'and'/'or' take priority over identifiers.
+
+    :param fixed_tokens: The table of lexemes that always produce the same token type.
+    :return: The compiled master regular expression.
+    """
+    single_characters = ''.join(re.escape(lexeme) for lexeme in fixed_tokens if len(lexeme) == 1)
+    # Longer lexemes first so '🙅🤝' is preferred over '🙅'.
+    longer_lexemes = '|'.join(
+        re.escape(lexeme) for lexeme in sorted(fixed_tokens, key=len, reverse=True) if len(lexeme) > 1
+    )
+    whitespace = ''.join(re.escape(character) for character in sorted(IGNORE_CHARACTERS - {NEWLINE}))
+    delimiter = re.escape(STRING_DELIMITER)
+    alternatives = [
+        longer_lexemes,                             # two character operators
+        f'[{single_characters}]',                   # single character operators and emoji keywords
+        re.escape(NEWLINE),                         # newlines, counted to track line numbers
+        f'{re.escape(COMMENT)}[^\\n]*',            # comments, running until the end of the line
+        f'{delimiter}[^{delimiter}]*{delimiter}?',  # strings, unterminated when missing the closing quote
+        r'\d+(?:\.\d*)?',                          # numbers
+        # The character lexer only recognises 'and'/'or' when at least one more character follows.
+        r'and(?=[\s\S])',
+        r'or(?=[\s\S])',
+        r'\w+',                                     # identifiers
+        f'[^{whitespace}]',                         # anything else is an unexpected character
+    ]
+    return re.compile(f'[{whitespace}]*(?P<LEXEME>' + '|'.join(alternatives) + ')')
+
+
+FIXED_TOKENS = {**_build_fixed_tokens(), **KEYWORD_TOKENS}
+TOKEN_PATTERN = _build_token_pattern(FIXED_TOKENS)
+
+
+class RegexScanner:
+    """
+    The RegexScanner class is an alternative backend for the Lexer which tokenizes text with a single
+    compiled master regular expression instead of stepping through it one character at a time.
+
+    It produces exactly the same tokens, line numbers and syntax exceptions as the character by character
+    backend. Text can be scanned in one piece or fed in consecutive chunks, which is what allows the lexer to
+    stream tokens out of a file without reading it into memory first.
+
+    Attributes:
+        _tokens (list): The list scanned tokens are appended to.
+        _exceptions (list): The list syntax exceptions are appended to.
+        _line (int): The line number the next piece of text starts on.
+        _remainder (str): The text of the fed chunks that was not consumed yet, see scan.
+        _open_terminator (str): The character ending the string or comment the fed chunks end in, None if they do
+                                not end in one.
+        _open_parts (list): The text of the open string read so far, in pieces.
+    """
+
+    def __init__(self, tokens, exceptions):
+        """
+        Initializes the RegexScanner with the lists it appends its results to.
+
+        :param tokens: The list scanned tokens are appended to.
+        :param exceptions: The list syntax exceptions are appended to.
+        """
+        self._tokens = tokens
+        self._exceptions = exceptions
+        self._line = 1
+        self._remainder = ''
+        self._open_terminator = None
+        self._open_parts = []
+
+    def feed(self, chunk):
+        """
+        Scans the next chunk of a text fed in consecutive chunks, carrying the end of the chunk that the next one
+        could still extend over to it, see scan.
+
+        A string or comment still open at the end of a chunk can be arbitrarily long, so it is not rescanned with
+        every chunk: only the new chunk is searched for its closing quotation mark or newline, and the string is
+        scanned once it is complete.
+
+        :param chunk: The next chunk of the text, empty once the text has ended.
+        """
+        if self._open_terminator is not None:
+            if chunk:
+                end = chunk.find(self._open_terminator)
+                if end == -1:
+                    if self._open_terminator == STRING_DELIMITER:
+                        self._open_parts.append(chunk)
+                    return
+                if self._open_terminator == STRING_DELIMITER:
+                    end += 1
+                    self._open_parts.append(chunk[:end])
+                chunk = chunk[end:]
+            # A comment produces no token, the newline ending it is scanned with the rest of the chunk.
+            if self._open_parts:
+                self.scan(''.join(self._open_parts))
+            self._open_terminator = None
+            self._open_parts = []
+
+        text = self._remainder + chunk
+        consumed = self.scan(text, is_final=not chunk)
+        self._remainder = text[consumed:]
+        if self._remainder.startswith(COMMENT):
+            self._open_terminator = NEWLINE
+            self._remainder = ''
+        elif self._remainder.startswith(STRING_DELIMITER) and (
+            len(self._remainder) == 1 or not self._remainder.endswith(STRING_DELIMITER)
+        ):
+            self._open_terminator = STRING_DELIMITER
+            self._open_parts = [self._remainder]
+            self._remainder = ''
+
+    def scan(self, text, is_final=True):
+        """
+        Scans the given text, appending the tokens and syntax exceptions found in it.
+
+        When more text may follow, a token that runs up to the very end of the text is not consumed since the
+        following text could still extend it (an identifier or number continuing, '🙅' becoming '🙅🤝', a string
+        being closed, etc.). The caller is expected to prepend the unconsumed remainder to the next piece of text,
+        which feed does.
+
+        :param text: The text to scan.
+        :param is_final: Whether this is the last piece of text.
+        :return: The index of the first character of the text that was not consumed.
+        """
+        lexemes = TOKEN_PATTERN.findall(text)
+        consumed = len(text)
+        trailing_identifier = None
+        # Only the last lexeme can reach the end of the text, the text after any other lexeme is matched too.
+        if lexemes and text.endswith(lexemes[-1]):
+            if not is_final:
+                consumed -= len(lexemes.pop())
+            elif lexemes[-1] in KEYWORD_TOKENS:
+                # 'and'/'or' are only keywords when at least one more character follows.
+                trailing_identifier = lexemes.pop()
+
+        tokens = self._tokens
+        fixed_tokens = FIXED_TOKENS
+        fixed_lexemes = FIXED_LEXEMES
+        line = self._line
+        for lexeme in lexemes:
+            token_type = fixed_tokens.get(lexeme)
+            if token_type is not None:
+                tokens.append(Token(token_type, fixed_lexemes[lexeme], None, line))
+                continue
+            if lexeme == NEWLINE:
+                line += 1
+                continue
+
+            first_character = lexeme[0]
+            if first_character.isdecimal():
+                tokens.append(Token(TokenType.NUMBER, lexeme, float(lexeme), line))
+            elif first_character.isalnum() or first_character in SPECIAL_IDENTIFIER_CHARACTERS:
+                tokens.append(Token(TokenType.IDENTIFIER, sys.intern(lexeme), None, line))
+            elif first_character == STRING_DELIMITER:
+                line += lexeme.count(NEWLINE)
+                if len(lexeme) > 1 and lexeme.endswith(STRING_DELIMITER):
+                    tokens.append(Token(TokenType.STRING, lexeme, lexeme[1:-1], line))
+                else:
+                    self._exceptions.append(SyntaxException(line, "Unterminated string."))
+            elif first_character != COMMENT:
+                self._exceptions.append(SyntaxException(line, f"Unexpected character [{lexeme}]"))
+
+        if trailing_identifier is not None:
+            tokens.append(Token(TokenType.IDENTIFIER, sys.intern(trailing_identifier), None, line))
+        self._line = line
+        return consumed
+
+    def get_line(self):
+        return self._line
@@ -5,8 +5,14 @@ class Token:
     A token consists of a type, a lexeme (the string representation of the token),
     an optional literal value (such as a number or string), and the line number
     where the token appears in the source code.
+
+    Programs are made of a large number of tokens, so tokens use __slots__ instead of a per instance
+    __dict__, and the lexer hands them shared interned strings as lexemes for fixed lexeme token types
+    and identifiers rather than a fresh slice of the source code each.
     """
 
+    __slots__ = ('_token_type', '_lexeme', '_literal', '_line')
+
     def __init__(self, token_type, lexeme, literal, line):
         """
         Initializes a Token instance with its type, lexeme, literal value, and line number.
@@ -0,0 +1,83 @@
+import sys
+
+from .token_type import TokenType
+
+# Characters that always produce the same token on their own.
+SINGLE_CHARACTER_TOKENS = {
+    '(': TokenType.LEFT_PAREN,
+    ')': TokenType.RIGHT_PAREN,
+    '{': TokenType.LEFT_BRACE,
+    '}': TokenType.RIGHT_BRACE,
+    ';': TokenType.SEMI_COLON,
+    ',': TokenType.COMMA,
+    '.': TokenType.PERIOD,
+    '✍': TokenType.EQUAL,
+    '🤝': TokenType.EQUAL_EQUAL,
+    '🖊': TokenType.INPUT,
+    '💥': TokenType.BREAK,
+    '🤓': TokenType.CONTINUE,
+    '🫡': TokenType.RETURN,
+    '🛠': TokenType.FUNCTION,
+    '👀': TokenType.FUNCTION_CALL,
+    '😤': TokenType.TRUE,
+    '😔': TokenType.FALSE,
+    '🤔': TokenType.IF,
+    '🙈': TokenType.ELSEIF,
+    '💅': TokenType.ELSE,
+    '🔁': TokenType.LOOP,
+    '🗣': TokenType.PRINT,
+    '🥸': TokenType.VAR,
+    '➕': TokenType.PLUS,
+    '+': TokenType.PLUS,
+    '➖': TokenType.MINUS,
+    '-': TokenType.MINUS,
+    '✖': TokenType.MULTIPLY,
+    '*': TokenType.MULTIPLY,
+    '➗': TokenType.DIVIDE,
+    '/': TokenType.DIVIDE,
+    '🍕': TokenType.MODULUS,
+    '%': TokenType.MODULUS,
+    '🥕': TokenType.EXPONENT,
+    '^': TokenType.EXPONENT,
+}
+
+# Characters that produce a two character token when followed by a specific character.
+# Maps the first character to (second character, two character token, one character token).
+ONE_OR_TWO_CHARACTER_TOKENS = {
+    '=': ('=', TokenType.EQUAL_EQUAL, TokenType.EQUAL),
+    '🙅': ('🤝', TokenType.BANG_EQUAL, TokenType.BANG),
+    '!': ('=', TokenType.BANG_EQUAL, TokenType.BANG),
+    '<': ('=', TokenType.LESS_EQUAL, TokenType.LESS),
+    '👇': ('🤝', TokenType.LESS_EQUAL, TokenType.LESS),
+    '☝': ('🤝', TokenType.GREATER_EQUAL, TokenType.GREATER),
+    '>': ('=', TokenType.GREATER_EQUAL, TokenType.GREATER),
+}
+
+# Words that are keywords rather than identifiers.
+KEYWORD_TOKENS = {
+    'and': TokenType.AND,
+    'or': TokenType.OR,
+}
+
+IGNORE_CHARACTERS = {' ', '\r', '\t', '\n', '\u200B', '\uFE0F'}
+SPECIAL_IDENTIFIER_CHARACTERS = {'_'}
+
+NEWLINE = '\n'
+COMMENT = '🧐'
+STRING_DELIMITER = '"'
+
+
+def _intern_fixed_lexemes():
+    """
+    Interns every lexeme that always produces the same token type, so tokens of those types can all
+    share one copy of their lexeme instead of each holding its own slice of the source code.
+
+    :return: A dictionary from each fixed lexeme to its interned copy.
+    """
+    lexemes = list(SINGLE_CHARACTER_TOKENS) + list(KEYWORD_TOKENS)
+    for character, (next_character, _, _) in ONE_OR_TWO_CHARACTER_TOKENS.items():
+        lexemes += [character, character + next_character]
+    return {lexeme: sys.intern(lexeme) for lexeme in lexemes}
+
+
+FIXED_LEXEMES = _intern_fixed_lexemes()
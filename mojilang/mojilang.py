@@ -2,36 +2,213 @@ import sys
 import argparse
 
 from mojilang.lexer import Lexer
-from mojilang.parser import Parser
-from mojilang.interpreter import Interpreter
+from mojilang.parser import AstCache, Parser
+from mojilang.interpreter import ConstantFolder, Interpreter, Resolver, TailCallAnalyzer
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext, ScopeContext
+from mojilang.flat import FlatTree, FlatTreeCompiler, FlatTreeEncoder
+from mojilang.flat.flat_tree import FLAT_TREE_SUFFIX
 from mojilang.lexer import SyntaxException
 
 
-def main(source_code):
+def main(source_code, lexer_backend=Lexer.CHARACTER_BACKEND, interpreter_backend=Interpreter.TREE_WALKER_BACKEND,
+         optimize=False, short_circuit=True, memo_size=Interpreter.DEFAULT_MEMO_SIZE, profile=False,
+         source_path=None, ast_cache=None, flat_tree_path=None):
     """
     Main function that initializes the Lexer, Parser, and Interpreter
     to run Mojilang code from the provided source code.
 
     :param source_code: The source code of Mojilang program as a string.
+    :param lexer_backend: The tokenizer backend the Lexer uses, one of Lexer.BACKENDS.
+    :param interpreter_backend: The execution backend the Interpreter uses, one of Interpreter.BACKENDS.
+    :param optimize: Whether to fold the constant expressions of the program before running it.
+    :param short_circuit: Whether the `and` and `or` operations skip their right operand when the left one decides
+                          the result, see Parser.
+    :param memo_size: The number of values the tree-walker remembers per pure function, see Interpreter.
+    :param profile: Whether to print how the function calls of the program looked up the function they call to
+                    stderr once it has run, see print_call_profile.
+    :param source_path: The path to the file the source code was read from, if any.
+    :param ast_cache: The AstCache to load the tree of the file from, and to store it in once parsed. The tree is
+                      only cached if the source_path is given too.
+    :param flat_tree_path: The path to write the flat tree of the program to instead of running it, see main_flat.
+    """
+    abstract_syntax_tree = None
+    if ast_cache is not None and source_path is not None:
+        abstract_syntax_tree = ast_cache.load(source_path, source_code, short_circuit)
+    if abstract_syntax_tree is None:
+        abstract_syntax_tree = parse(source_code, lexer_backend, short_circuit)
+        if ast_cache is not None and source_path is not None:
+            ast_cache.store(source_path, source_code, abstract_syntax_tree, short_circuit)
+    function_call_nodes = resolve(abstract_syntax_tree, optimize)
+    if flat_tree_path is not None:
+        FlatTreeEncoder().write(abstract_syntax_tree, flat_tree_path)
+        return
+
+    # Initialize Interpreter and run it
+    interpreter = Interpreter(abstract_syntax_tree, interpreter_backend, memo_size)
+    try:
+        interpreter.execute()
+    finally:
+        if profile:
+            print_call_profile(function_call_nodes)
+
+
+def parse(source_code, lexer_backend=Lexer.CHARACTER_BACKEND, short_circuit=True):
+    """
+    Scans and parses the provided source code.
+
+    :param source_code: The source code of Mojilang program as a string.
+    :param lexer_backend: The tokenizer backend the Lexer uses, one of Lexer.BACKENDS.
+    :param short_circuit: Whether the `and` and `or` operations skip their right operand when the left one decides
+                          the result, see Parser.
+    :return: The AST of the program.
+    :raises SyntaxException: If the source code has syntax errors.
     """
     # Initialize Lexer and scan token
-    lexer = Lexer(source_code)
+    lexer = Lexer(source_code, lexer_backend)
     exceptions = lexer.scan_tokens()
     if exceptions:
         raise SyntaxException(12, f'Found the following syntax errors: {exceptions}')
     tokens = lexer.get_tokens()
 
     # Initialize Parser
-    parser = Parser(tokens)
-    abstract_syntax_tree = parser.parse()
+    parser = Parser(tokens, short_circuit=short_circuit)
+    return parser.parse()
+
+
+def main_stream(stream, chunk_size=Lexer.STREAM_CHUNK_SIZE, interpreter_backend=Interpreter.TREE_WALKER_BACKEND,
+                optimize=False, short_circuit=True, memo_size=Interpreter.DEFAULT_MEMO_SIZE, profile=False,
+                flat_tree_path=None):
+    """
+    Runs Mojilang code read from a text stream, parsing the tokens while the Lexer is still
+    scanning the stream so the source code never has to be held in memory in full. The stream is
+    always scanned with the regex backend (see Lexer.iter_tokens), and its tree is never cached.
+
+    :param stream: A text stream (e.g. an open .moji file) to read the Mojilang program from.
+    :param chunk_size: The number of characters the Lexer reads from the stream at a time.
+    :param interpreter_backend: The execution backend the Interpreter uses, one of Interpreter.BACKENDS.
+    :param optimize: Whether to fold the constant expressions of the program before running it.
+    :param short_circuit: Whether the `and` and `or` operations skip their right operand when the left one decides
+                          the result, see Parser.
+    :param memo_size: The number of values the tree-walker remembers per pure function, see Interpreter.
+    :param profile: Whether to print how the function calls of the program looked up the function they call to
+                    stderr once it has run, see print_call_profile.
+    :param flat_tree_path: The path to write the flat tree of the program to instead of running it, see main_flat.
+    """
+    # Initialize Lexer and Parser, the parser pulls tokens as the lexer scans them
+    lexer = Lexer(backend=Lexer.REGEX_BACKEND)
+    parser = Parser(lexer.iter_tokens(stream, chunk_size), short_circuit=short_circuit)
+    try:
+        abstract_syntax_tree = parser.parse()
+    except SyntaxException:
+        # A parse error may just be a symptom of a character the lexer had to skip
+        if lexer.get_exceptions():
+            raise SyntaxException(12, f'Found the following syntax errors: {lexer.get_exceptions()}')
+        raise
+    if lexer.get_exceptions():
+        raise SyntaxException(12, f'Found the following syntax errors: {lexer.get_exceptions()}')
+    function_call_nodes = resolve(abstract_syntax_tree, optimize)
+    if flat_tree_path is not None:
+        FlatTreeEncoder().write(abstract_syntax_tree, flat_tree_path)
+        return
 
     # Initialize Interpreter and run it
-    interpreter = Interpreter(abstract_syntax_tree)
-    interpreter.execute()
+    interpreter = Interpreter(abstract_syntax_tree, interpreter_backend, memo_size)
+    try:
+        interpreter.execute()
+    finally:
+        if profile:
+            print_call_profile(function_call_nodes)
+
+
+def main_flat(flat_tree_path):
+    """
+    Runs a Mojilang program from the .mojif file its flat tree was written to (see main), mapping the file into
+    memory rather than parsing the program, see FlatTree.
+
+    :param flat_tree_path: The path to the .mojif file.
+    :raises ValueError: If the file does not hold a flat tree of this version.
+    """
+    with FlatTree.load(flat_tree_path) as flat_tree:
+        run_flat_tree(flat_tree)
+
+
+def run_flat_tree(flat_tree):
+    """
+    Runs the program of a flat tree, see FlatTreeCompiler.
+
+    :param flat_tree: The FlatTree of the program.
+    :raises RuntimeError: If the program fails to execute, like the Interpreter does.
+    """
+    try:
+        program = FlatTreeCompiler().compile(flat_tree)
+        program(ScopeContext(BlockScopeContext(BlockScope.GLOBAL)))
+    except Exception as e:
+        raise RuntimeError(f"Execution error: {e}")
+
+
+def resolve(abstract_syntax_tree, optimize=False):
+    """
+    Binds the variables of the program to their scopes and marks its calls in tail position before it runs,
+    see Resolver and TailCallAnalyzer.
+
+    The undefined variables are looked for before the constant expressions are folded, so the branches the
+    ConstantFolder drops, and the declarations within them, never change which programs are rejected.
+
+    :param abstract_syntax_tree: The AST of the program.
+    :param optimize: Whether to fold the constant expressions of the program, see ConstantFolder.
+    :return: The function calls of the program.
+    :raises SyntaxException: If the program uses a variable that is undefined whenever it is evaluated.
+    """
+    resolver = Resolver()
+    exceptions = resolver.resolve(abstract_syntax_tree)
+    if exceptions:
+        raise exceptions[0]
+    if optimize:
+        ConstantFolder().fold(abstract_syntax_tree)
+        # The nodes the folder rebuilt are bound too. The declarations it dropped could never run, so the variables
+        # no longer found are looked up at run time, as they would be in the unfolded program.
+        resolver.resolve(abstract_syntax_tree)
+    TailCallAnalyzer().analyze(abstract_syntax_tree)
+    return resolver.get_function_call_nodes()
+
+
+def print_call_profile(function_call_nodes, file=None):
+    """
+    Prints how many times each function call of the program ran, and how many of these read the function from
+    the global context the Resolver bound the call to rather than looking it up along the scope chain. Only the
+    tree-walker counts the lookups, the other backends look functions up their own way.
+
+    :param function_call_nodes: The function calls of the program, see resolve.
+    :param file: The text stream to print to, stderr by default.
+    """
+    file = sys.stderr if file is None else file
+    total_calls = total_bound_calls = 0
+    print('Function call profile:', file=file)
+    for node in function_call_nodes:
+        bound_calls = node.get_address_lookups()
+        calls = bound_calls + node.get_chain_lookups()
+        total_calls += calls
+        total_bound_calls += bound_calls
+        print(f'  line {node.get_line_number()} {node.get_function_name()}: {_lookup_summary(calls, bound_calls)}', file=file)
+    print(f'  total: {_lookup_summary(total_calls, total_bound_calls)}', file=file)
+
+
+def _lookup_summary(calls, bound_calls):
+    """
+    :param calls: The number of calls.
+    :param bound_calls: The number of calls that read the function from the global context.
+    :return: The calls and the share of them that skipped the scope chain, as text.
+    """
+    rate = bound_calls / calls if calls else 0.0
+    return f'{calls} calls, {bound_calls} bound lookups ({rate:.0%})'
 
 
 def run_cli():
-    """Set up the CLI allowing the user to provide the Mojilang file path to execute."""
+    """
+    Set up the CLI allowing the user to provide the Mojilang file path to execute.
+
+    :return: The parsed command line arguments.
+    """
     parser = argparse.ArgumentParser(description="Run a Mojilang program from a .moji file.")
 
     parser.add_argument(
@@ -39,13 +216,132 @@ def run_cli():
         type=str,
         help='The path to the .moji file containing the Mojilang source code.'
     )
+    parser.add_argument(
+        '--lexer',
+        choices=Lexer.BACKENDS,
+        default=None,
+        help=f'The tokenizer backend to use, {Lexer.CHARACTER_BACKEND} by default. The regex backend is faster on '
+             f'large files, and the only one --stream can use.'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Lex and parse the file while reading it in chunks instead of reading it into memory first. The '
+             'streamed file is scanned with the regex lexer, and its parsed tree is never cached.'
+    )
+    parser.add_argument(
+        '--backend',
+        choices=Interpreter.BACKENDS,
+        default=Interpreter.TREE_WALKER_BACKEND,
+        help='The execution backend to use. The pycompile backend compiles the program to Python bytecode first. '
+             'The pycompile and closure backends run every call on the Python stack, so they cannot recurse deeply.'
+    )
+    parser.add_argument(
+        '--vm',
+        action='store_const',
+        const=Interpreter.VM_BACKEND,
+        dest='backend',
+        help='Run the program on the bytecode virtual machine, the same as --backend vm.'
+    )
+
+    parser.add_argument(
+        '-O', '--optimize',
+        action='store_true',
+        help='Fold the constant expressions of the program and drop the branches that can never run before running it.'
+    )
+    parser.add_argument(
+        '--no-short-circuit',
+        action='store_false',
+        dest='short_circuit',
+        help='Evaluate both operands of the and/or operations, like older versions of Mojilang did.'
+    )
+    parser.add_argument(
+        '--memo-size',
+        type=int,
+        default=Interpreter.DEFAULT_MEMO_SIZE,
+        help='The number of calls the tree-walker remembers the value of per pure function, 0 (the default) to '
+             'remember none.'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print how many times each function call ran and how many of them skipped the scope chain to stderr.'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_false',
+        dest='cache',
+        help='Always parse the file instead of loading its parsed tree from the .mojic file cached by an earlier run.'
+    )
+    parser.add_argument(
+        '--emit-flat',
+        type=str,
+        default=None,
+        metavar='PATH',
+        help=f'Write the flat tree of the program to a {FLAT_TREE_SUFFIX} file instead of running it, folded if '
+             f'--optimize is passed too. A {FLAT_TREE_SUFFIX} file is run by passing it in place of the .moji file, '
+             f'without any other option: it always runs as closures that make every call on the Python stack, '
+             f'like the closure backend, so it cannot recurse deeply, and its pure functions are not memoized.'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help='The directory to cache the parsed trees in, instead of a __mojicache__ directory next to each file.'
+    )
 
     args = parser.parse_args()
-    if not args.filepath.endswith('.moji'):
-        print(f"Error: The file '{args.filepath}' must have a '.moji' extension.")
+    if not args.filepath.endswith(('.moji', FLAT_TREE_SUFFIX)):
+        print(f"Error: The file '{args.filepath}' must have a '.moji' or '{FLAT_TREE_SUFFIX}' extension.")
         sys.exit(1)
+    if args.filepath.endswith(FLAT_TREE_SUFFIX):
+        source_options = [option for option, given in (
+            ('--lexer', args.lexer is not None),
+            ('--stream', args.stream),
+            ('--backend', args.backend != Interpreter.TREE_WALKER_BACKEND),
+            ('--optimize', args.optimize),
+            ('--no-short-circuit', not args.short_circuit),
+            ('--memo-size', args.memo_size != Interpreter.DEFAULT_MEMO_SIZE),
+            ('--profile', args.profile),
+            ('--no-cache', not args.cache),
+            ('--emit-flat', args.emit_flat is not None),
+            ('--cache-dir', args.cache_dir is not None),
+        ) if given]
+        if source_options:
+            print(f"Error: {', '.join(source_options)} cannot be used to run a {FLAT_TREE_SUFFIX} file, which always "
+                  f"runs as it was written, see --emit-flat.")
+            sys.exit(1)
+    if args.stream:
+        stream_options = [option for option, given in (
+            ('--lexer', args.lexer not in (None, Lexer.REGEX_BACKEND)),
+            ('--cache-dir', args.cache_dir is not None),
+        ) if given]
+        if stream_options:
+            print(f"Error: {', '.join(stream_options)} cannot be used with --stream, which always scans the file "
+                  f"with the {Lexer.REGEX_BACKEND} lexer and never caches its parsed tree.")
+            sys.exit(1)
+    if args.lexer is None:
+        args.lexer = Lexer.REGEX_BACKEND if args.stream else Lexer.CHARACTER_BACKEND
+
+    return args
+
+
+def open_source_code(file_path):
+    """
+    Opens the provided file path for streaming its source code.
 
-    return args.filepath
+    :param file_path: The path to the Mojilang source code file.
+    :return: The file opened in text mode.
+    :raises FileNotFoundError: If the file does not exist.
+    """
+    try:
+        return open(file_path, 'r')
+    except FileNotFoundError:
+        print(f"Error: File '{file_path}' not found.")
+        sys.exit(1)
+    except Exception as e:
+        print(f"An error occurred: {e}")
+        sys.exit(1)
 
 
 def read_source_code(file_path):
@@ -70,6 +366,24 @@ def read_source_code(file_path):
 
 if __name__ == '__main__':
     """Entry point for Mojilang."""
-    f_path = run_cli()
-    source = read_source_code(f_path)
-    main(source)
+    arguments = run_cli()
+    if arguments.filepath.endswith(FLAT_TREE_SUFFIX):
+        try:
+            main_flat(arguments.filepath)
+        except ValueError as e:
+            print(f"Error: Cannot run '{arguments.filepath}': {e}")
+            sys.exit(1)
+    elif arguments.stream:
+        with open_source_code(arguments.filepath) as source_stream:
+            main_stream(
+                source_stream, interpreter_backend=arguments.backend, optimize=arguments.optimize,
+                short_circuit=arguments.short_circuit, memo_size=arguments.memo_size, profile=arguments.profile,
+                flat_tree_path=arguments.emit_flat
+            )
+    else:
+        source = read_source_code(arguments.filepath)
+        main(
+            source, arguments.lexer, arguments.backend, arguments.optimize, arguments.short_circuit,
+            arguments.memo_size, arguments.profile, arguments.filepath,
+            AstCache(arguments.cache_dir) if arguments.cache else None, arguments.emit_flat
+        )
@@ -1,2 +1,3 @@
 from .parser import Parser
 from .runtime_exception import RuntimeException
+from .ast_cache import AstCache
@@ -0,0 +1,128 @@
+import hashlib
+import os
+import pathlib
+import tempfile
+import zlib
+
+from mojilang.flat import FlatTree, FlatTreeDecoder, FlatTreeEncoder
+
+# The AST_CACHE_VERSION must be bumped whenever the nodes or the Parser change the trees they build, so the cache
+# files written by older versions of Mojilang are parsed again rather than loaded.
+AST_CACHE_VERSION = 3
+MAGIC = b'MOJIC'
+CACHE_DIRECTORY_NAME = '__mojicache__'
+CACHE_SUFFIX = '.mojic'
+
+
+class AstCache:
+    """
+    The AstCache class keeps the trees the Parser built on disk, so running a program again loads its tree
+    instead of scanning and parsing its source code.
+
+    A .mojic file holds a header, MAGIC, the AST_CACHE_VERSION and whether the `and` and `or` operations of the
+    tree short-circuit (see Parser), followed by the SHA-256 digest of the source code and the tree encoded as a
+    FlatTree compressed with zlib. A file is only loaded if the whole header matches, so a file written for
+    different source code, by a different version or with different parser options is parsed again and
+    overwritten. The files are written next to the source files, in a __mojicache__ directory, or in the cache
+    directory given.
+
+    The records of the flat tree are plain data the FlatTreeDecoder rebuilds the nodes from, so loading a .mojic
+    file never runs code, and a corrupt or forged one is parsed again like a stale one.
+
+    The tree must be stored as the Parser built it, before the ConstantFolder or the Resolver changed it.
+
+    Attributes:
+        _cache_directory (pathlib.Path): The directory holding every cache file, or None to write each one next
+                                         to its source file.
+    """
+
+    def __init__(self, cache_directory=None):
+        """
+        Initializes the AstCache.
+
+        :param cache_directory: The directory to keep the cache files in, None to keep them in a __mojicache__
+                                directory next to each source file.
+        """
+        self._cache_directory = None if cache_directory is None else pathlib.Path(cache_directory)
+
+    def load(self, source_path, source_code, short_circuit=True):
+        """
+        Loads the tree of a source file from its cache file.
+
+        :param source_path: The path to the source file.
+        :param source_code: The source code of the file.
+        :param short_circuit: Whether the `and` and `or` operations of the tree short-circuit.
+        :return: The BlockNode at the root of the tree, or None if the cache holds no tree for the source code.
+        """
+        header = _header(source_code, short_circuit)
+        try:
+            with open(self.get_cache_path(source_path), 'rb') as cache_file:
+                if cache_file.read(len(header)) != header:
+                    return None
+                data = zlib.decompress(cache_file.read())
+            with FlatTree(data) as flat_tree:
+                return FlatTreeDecoder().decode(flat_tree)
+        except (OSError, zlib.error, ValueError, RecursionError):
+            # A missing, truncated or corrupt cache file is parsed again, like a stale one.
+            return None
+
+    def store(self, source_path, source_code, abstract_syntax_tree, short_circuit=True):
+        """
+        Writes the tree of a source file to its cache file. The cache is best effort, a tree that cannot be
+        written, e.g. because the directory is read-only, is parsed again on the next run.
+
+        :param source_path: The path to the source file.
+        :param source_code: The source code of the file.
+        :param abstract_syntax_tree: The BlockNode at the root of the tree the Parser built.
+        :param short_circuit: Whether the `and` and `or` operations of the tree short-circuit.
+        :return: Whether the tree was written.
+        """
+        try:
+            data = zlib.compress(FlatTreeEncoder().encode(abstract_syntax_tree), 1)
+        except RecursionError:
+            # Encoding recurses into each node, an expression nested too deeply is not worth caching.
+            return False
+        cache_path = self.get_cache_path(source_path)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Written to a temporary file first, so a run reading the cache never sees a partly written file.
+            descriptor, temporary_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+            try:
+                with os.fdopen(descriptor, 'wb') as cache_file:
+                    cache_file.write(_header(source_code, short_circuit))
+                    cache_file.write(data)
+                os.replace(temporary_path, cache_path)
+            except BaseException:
+                os.unlink(temporary_path)
+                raise
+        except OSError:
+            return False
+        return True
+
+    def get_cache_path(self, source_path):
+        """
+        :param source_path: The path to a source file.
+        :return: The path to the cache file of the source file.
+        """
+        source_path = pathlib.Path(source_path)
+        if self._cache_directory is None:
+            return source_path.parent / CACHE_DIRECTORY_NAME / (source_path.stem + CACHE_SUFFIX)
+        # Source files of the same name in different directories share the cache directory.
+        path_digest = hashlib.sha256(str(source_path.resolve()).encode()).hexdigest()[:16]
+        return self._cache_directory / f'{source_path.stem}-{path_digest}{CACHE_SUFFIX}'
+
+    def get_cache_directory(self):
+        return self._cache_directory
+
+
+def _header(source_code, short_circuit):
+    """
+    :param source_code: The source code of a file.
+    :param short_circuit: Whether the `and` and `or` operations of its tree short-circuit.
+    :return: The header of the cache file holding its tree.
+    """
+    return (
+        MAGIC
+        + bytes((AST_CACHE_VERSION, int(short_circuit)))
+        + hashlib.sha256(source_code.encode('utf-8')).digest()
+    )
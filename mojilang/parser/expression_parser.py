@@ -3,6 +3,26 @@ from mojilang.parser.nodes import (
     BinaryOperationContext,
     UnaryOperationContext,
 )
+from mojilang.parser.token_buffer import TOKEN_TYPE_CODES
+from mojilang.parser.parser_state import NO_MATCHING_PARENTHESIS
+
+# Operators from the lowest to the highest precedence, as token type codes.
+OPERATOR_PRECEDENCE = [
+    {TokenType.OR},
+    {TokenType.AND},
+    {TokenType.EQUAL_EQUAL, TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LESS_EQUAL, TokenType.LESS,
+     TokenType.BANG_EQUAL},
+    {TokenType.BANG},
+    {TokenType.MINUS, TokenType.PLUS},
+    {TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULUS},
+    {TokenType.EXPONENT},
+    {TokenType.FUNCTION_CALL}
+]
+OPERATOR_PRECEDENCE_CODES = [
+    {TOKEN_TYPE_CODES[token_type] for token_type in operators} for operators in OPERATOR_PRECEDENCE
+]
+LEFT_PAREN_CODE = TOKEN_TYPE_CODES[TokenType.LEFT_PAREN]
+FUNCTION_CALL_CODE = TOKEN_TYPE_CODES[TokenType.FUNCTION_CALL]
 
 
 class ExpressionParser:
@@ -12,6 +32,9 @@ class ExpressionParser:
     operations, ensuring that they are evaluated following operator precedence and parentheses
     and finally converts them into AST nodes.
 
+    Token ranges are scanned through the type codes of the parser state's columnar token buffer,
+    so no Token objects are created while searching for operators and parentheses.
+
     Attributes:
         _parser (Parser): A reference to the main parser instance, which allows this class to delegate
                           other parts of the parsing process.
@@ -53,8 +76,10 @@ class ExpressionParser:
         """
         index = self._state.get_current()
         valid_expression_tokens = TokenType.valid_expression_types()
-        while not self._state.retrieve_token(index).get_token_type() in end_tokens and (self._state.retrieve_token(index).get_token_type() in valid_expression_tokens):
+        token_type = self._state.token_type_at(index)
+        while token_type not in end_tokens and token_type in valid_expression_tokens:
             index += 1
+            token_type = self._state.token_type_at(index)
         return index
 
     def _parse_expression_recursive(self, left_index, right_index):
@@ -65,43 +90,33 @@ class ExpressionParser:
         :param right_index: The right bound of the token range.
         :return: The parsed expression node.
         """
-        left_token, right_token = self._state.retrieve_token(left_index), self._state.retrieve_token(right_index)
         index_delta = right_index - left_index
         if index_delta == 0:
-            token_type = left_token.get_token_type()
+            token_type = self._state.token_type_at(left_index)
             if token_type not in TokenType.valid_expression_types():
-                raise SyntaxException(left_token.get_line(), f"Invalid token in expression: {token_type}")
+                raise SyntaxException(self._state.line_at(left_index), f"Invalid token in expression: {token_type}")
             return self._parser.handle_token(left_index)
         if self._is_nested_parens(left_index, right_index):
             return self._parse_expression_recursive(left_index + 1, right_index - 1)
-        operator_precedence = [
-            {TokenType.OR},
-            {TokenType.AND},
-            {TokenType.EQUAL_EQUAL, TokenType.GREATER, TokenType.GREATER_EQUAL, TokenType.LESS_EQUAL, TokenType.LESS,
-             TokenType.BANG_EQUAL},
-            {TokenType.BANG},
-            {TokenType.MINUS, TokenType.PLUS},
-            {TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULUS},
-            {TokenType.EXPONENT},
-            {TokenType.FUNCTION_CALL}
-        ]
-        for operators in operator_precedence:
+        type_codes = self._state.type_codes_between(left_index, right_index)
+        for operators in OPERATOR_PRECEDENCE_CODES:
             index = left_index
             while index < right_index:
-                token = self._state.retrieve_token(index)
-                if token.is_token_type(TokenType.LEFT_PAREN):
+                type_code = type_codes[index - left_index]
+                if type_code == LEFT_PAREN_CODE:
                     index = self._skip_parentheses(index, right_index)
-                if token.is_token_type(TokenType.FUNCTION_CALL):
+                if type_code == FUNCTION_CALL_CODE:
                     expected_index = self._skip_function_call(index, right_index)
                     if expected_index != right_index:
                         index = expected_index
-                node = self._handle_by_operations(operators, left_index, right_index, index)
-                if node:
-                    return node
+                if type_codes[index - left_index] in operators:
+                    node = self._handle_operation(left_index, right_index, index)
+                    if node:
+                        return node
                 index += 1
 
         raise SyntaxException(
-            self._state.retrieve_token(left_index).get_line(),
+            self._state.line_at(left_index),
             "Invalid expression: no valid operations found."
         )
 
@@ -117,39 +132,24 @@ class ExpressionParser:
         if not self._within_parens(left_index, right_index):
             return False
 
-        paren_counter, end_index = self._find_parenthesis_count(left_index, right_index)
-        return paren_counter == 0 and end_index == right_index
+        return self._find_closing_parenthesis(left_index, right_index) == right_index
 
-    def _find_parenthesis_count(self, left_index, right_index):
+    def _find_closing_parenthesis(self, left_index, right_index):
         """
-        Scans the tokens between `left_index` and `right_index` to find where a set of parentheses closes
-        and the balance of parentheses between the bounds.
+        Finds where the parentheses opened at `left_index` close, looking the matching parenthesis up
+        in the parser state's parenthesis index.
 
-        :param left_index: The index of the left parenthesis `'('` where the search begins.
+        :param left_index: The index of the left parenthesis `'('`.
         :param right_index: The index of the right bound for the search.
-        :return: A tuple containing:
-            - `paren_counter` (int): The final count of parentheses (should be zero if parentheses are balanced).
-            - `current_index` (int): The index at which the parentheses balance returns to zero.
-        :raises SyntaxException: If there are unmatched left or right parentheses within the given range.
-        """
-        paren_counter = 0
-        current_index = left_index
-        while current_index <= right_index:
-            token = self._state.retrieve_token(current_index)
-            if token.is_token_type(TokenType.LEFT_PAREN):
-                paren_counter += 1
-            if token.is_token_type(TokenType.RIGHT_PAREN):
-                paren_counter -= 1
-            if paren_counter == 0:
-                break
-            current_index += 1
-
-        token_line = self._state.retrieve_token(right_index).get_line()
-        if paren_counter > 0:
-            raise SyntaxException(token_line, 'Left parenthesis missing closing right.')
-        elif paren_counter < 0:
-            raise SyntaxException(token_line, 'Right parenthesis missing corresponding left.')
-        return paren_counter, current_index
+        :return: The index of the matching right parenthesis, or `left_index` if it is not a left parenthesis.
+        :raises SyntaxException: If the parentheses do not close within the given range.
+        """
+        if self._state.token_type_at(left_index) != TokenType.LEFT_PAREN:
+            return left_index
+        closing_index = self._state.matching_parenthesis_index(left_index)
+        if closing_index == NO_MATCHING_PARENTHESIS or closing_index > right_index:
+            raise SyntaxException(self._state.line_at(right_index), 'Left parenthesis missing closing right.')
+        return closing_index
 
     def _within_parens(self, left_index, right_index):
         """
@@ -159,8 +159,8 @@ class ExpressionParser:
         :param right_index: The right token index.
         :return: True if the tokens are within parentheses, False otherwise.
         """
-        left_token, right_token = self._state.retrieve_token(left_index), self._state.retrieve_token(right_index)
-        return left_token.is_token_type(TokenType.LEFT_PAREN) and right_token.is_token_type(TokenType.RIGHT_PAREN)
+        return (self._state.token_type_at(left_index) == TokenType.LEFT_PAREN
+                and self._state.token_type_at(right_index) == TokenType.RIGHT_PAREN)
 
     def _skip_parentheses(self, left_index, right_index):
         """
@@ -170,7 +170,7 @@ class ExpressionParser:
         :param right_index: The ending index.
         :return: The index of the token after the closing parenthesis.
         """
-        paren_counter, end_index = self._find_parenthesis_count(left_index, right_index)
+        end_index = self._find_closing_parenthesis(left_index, right_index)
         return min(end_index + 1, right_index)
 
     def _skip_function_call(self, left_index, right_index):
@@ -183,25 +183,22 @@ class ExpressionParser:
         """
         return self._skip_parentheses(left_index + 2, right_index)
 
-    def _handle_by_operations(self, operations, left_index, right_index, index):
+    def _handle_operation(self, left_index, right_index, index):
         """
-        Handles binary and unary operations based on operator precedence.
+        Handles the binary or unary operation, or function call, found at the given index.
 
-        :param operations: Set of operations to process.
         :param left_index: Left bound of the expression.
         :param right_index: Right bound of the expression.
-        :param index: Current token index.
-        :return: Node representing the operation, or None if no operation was found.
-        """
-        token = self._state.retrieve_token(index)
-        token_type = token.get_token_type()
-        if token_type in operations:
-            if token_type == TokenType.FUNCTION_CALL:
-                return self._handle_function_call(index)
-            elif token_type in TokenType.unary_operations():
-                return self._handle_unary_operation(index, right_index)
-            else:
-                return self._handle_binary_operation(left_index, index, right_index)
+        :param index: The index of the operator.
+        :return: Node representing the operation.
+        """
+        token_type = self._state.token_type_at(index)
+        if token_type == TokenType.FUNCTION_CALL:
+            return self._handle_function_call(index)
+        elif token_type in TokenType.unary_operations():
+            return self._handle_unary_operation(index, right_index)
+        else:
+            return self._handle_binary_operation(left_index, index, right_index)
 
     def _handle_function_call(self, index):
         """
@@ -221,10 +218,9 @@ class ExpressionParser:
         :param right_index: The right bound of the expression.
         :return: Node representing the unary operation.
         """
-        token = self._state.retrieve_token(index)
         right_node = self._parse_expression_recursive(index + 1, right_index)
         if right_node is None:
-            raise SyntaxException(token.get_line(), "Invalid expression: missing right operand.")
+            raise SyntaxException(self._state.line_at(index), "Invalid expression: missing right operand.")
         context = UnaryOperationContext(right_node)
         return self._parser.handle_token(index, context)
 
@@ -237,14 +233,14 @@ class ExpressionParser:
         :param right_index: Right bound of the right operand.
         :return: Node representing the binary operation.
         """
-        token = self._state.retrieve_token(index)
+        line_number = self._state.line_at(index)
         left_node = self._parse_expression_recursive(left_index, index - 1)
         if left_node is None:
-            raise SyntaxException(token.get_line(), "Invalid expression: missing left operand.")
+            raise SyntaxException(line_number, "Invalid expression: missing left operand.")
 
         right_node = self._parse_expression_recursive(index + 1, right_index)
         if right_node is None:
-            raise SyntaxException(token.get_line(), "Invalid expression: missing right operand.")
+            raise SyntaxException(line_number, "Invalid expression: missing right operand.")
 
         context = BinaryOperationContext(left_node, right_node)
         return self._parser.handle_token(index, context)
@@ -1,7 +1,19 @@
 from abc import ABC, abstractmethod
 
+from mojilang.parser.nodes.completion import NORMAL
+
 
 class AbstractSyntaxTreeNode(ABC):
+    """
+    The AbstractSyntaxTreeNode class is the base class of the nodes of the Abstract Syntax Tree (AST).
+
+    Programs are made of a large number of nodes, so every node class lists the attributes it adds in __slots__
+    instead of keeping them in a per instance __dict__, and the nodes read their own attributes directly rather
+    than through their getters while they are evaluated.
+    """
+
+    __slots__ = ('_line_number',)
+
     def __init__(self, line_number):
         self._line_number = line_number
 
@@ -9,5 +21,46 @@ class AbstractSyntaxTreeNode(ABC):
     def evaluate(self, context):
         pass
 
+    def execute(self, context):
+        """
+        Runs the node as a statement of a block. The value of the statement is left in the context's
+        completion_value, and the returned completion status tells the block whether to go on with the next
+        statement (see the completion module), so the block does not have to inspect the value.
+
+        Nodes that can evaluate to a break or continue marker override this method.
+
+        :param context: The scope context the statement runs in.
+        :return: The completion status of the statement.
+        """
+        context.completion_value = self.evaluate(context)
+        return NORMAL
+
+    def evaluate_steps(self, context):
+        """
+        Evaluates the node like evaluate, as a generator run on the call stack of run_on_call_stack: the function
+        calls the node makes are yielded to it as (function, new scope context, arguments) tuples instead of being
+        run in the Python stack, and the value of each call is sent back.
+
+        Nodes that can make function calls override this method, the others are evaluated with evaluate.
+
+        :param context: The scope context the node is evaluated in.
+        :return: The value of the node.
+        """
+        return self.evaluate(context)
+        yield  # Makes the method a generator.
+
+    def execute_steps(self, context):
+        """
+        Runs the node as a statement like execute, as a generator run on the call stack of run_on_call_stack,
+        see evaluate_steps.
+
+        Nodes that override execute override this method as well.
+
+        :param context: The scope context the statement runs in.
+        :return: The completion status of the statement.
+        """
+        context.completion_value = yield from self.evaluate_steps(context)
+        return NORMAL
+
     def get_line_number(self):
         return self._line_number
@@ -3,20 +3,38 @@ from mojilang.parser.runtime_exception import RuntimeException
 
 
 class AssignmentNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_variable_node', '_value_node', '_address')
+
     def __init__(self, variable_node, value_node, line_number):
         super().__init__(line_number)
         self._variable_node = variable_node
         self._value_node = value_node
+        self._address = None
 
     def evaluate(self, context):
-        new_value = self._value_node.evaluate(context)
+        self._assign(context, self._value_node.evaluate(context))
+
+    def evaluate_steps(self, context):
+        self._assign(context, (yield from self._value_node.evaluate_steps(context)))
+
+    def _assign(self, context, new_value):
         variable_name = self._variable_node.get_name()
+        if self._address is not None:
+            # The Resolver proved the variable cannot be declared yet.
+            context.assign_resolved_value(self._address, variable_name, new_value)
+            return
         if context.current_scope_contains_variable(variable_name):
-            raise RuntimeException("Variable has already been declared. Cannot redeclare.", self.get_line_number())
-        context.assign_value(self._variable_node.get_name(), new_value)
+            raise RuntimeException("Variable has already been declared. Cannot redeclare.", self._line_number)
+        context.assign_value(variable_name, new_value)
 
     def get_variable_node(self):
         return self._variable_node
 
     def get_value_node(self):
         return self._value_node
+
+    def get_address(self):
+        return self._address
+
+    def set_address(self, address):
+        self._address = address
@@ -1,24 +1,98 @@
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
-from mojilang.parser.nodes.control.return_node import ReturnNode
-from mojilang.parser.nodes.control.break_node import BreakNode
-from mojilang.parser.nodes.control.continue_node import ContinueNode
+from mojilang.parser.nodes.assignment_node import AssignmentNode
+from mojilang.parser.nodes.reassignment_node import ReassignmentNode
+from mojilang.parser.nodes.control.function_node import FunctionNode
+from mojilang.parser.nodes.completion import MARKERS, NORMAL, RETURN
 from mojilang.interpreter.scope import BlockScope
 
 
 class BlockNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_nodes', '_declares_variables', '_scope_free')
+
     def __init__(self, nodes, line_number):
         super().__init__(line_number)
-        self._nodes = nodes
+        self._scope_free = False
+        self.set_nodes(nodes)
 
     def evaluate(self, context):
-        return_value = None
+        self.execute(context)
+        return context.completion_value
+
+    def execute(self, context):
+        """
+        Runs the statements of the block until one returns, or completes with a break or continue marker within a
+        loop. The value of the block is the value of the last statement that ran.
+
+        :param context: The scope context the block runs in.
+        :return: The status of the marker the block completes with, if any, see the completion module.
+        """
+        context.completion_value = None
+        status = NORMAL
         for node in self._nodes:
-            return_value = node.evaluate(context)
-            if isinstance(node, ReturnNode):
-                return return_value
-            if (isinstance(return_value, BreakNode) or isinstance(return_value, ContinueNode)) and context.within_block_scope(BlockScope.LOOP):
-                return return_value
-        return return_value
+            status = node.execute(context)
+            if status and (status & RETURN or context.within_block_scope(BlockScope.LOOP)):
+                return status & MARKERS
+        return status
+
+    def evaluate_steps(self, context):
+        yield from self.execute_steps(context)
+        return context.completion_value
+
+    def execute_steps(self, context):
+        context.completion_value = None
+        status = NORMAL
+        for node in self._nodes:
+            status = yield from node.execute_steps(context)
+            if status and (status & RETURN or context.within_block_scope(BlockScope.LOOP)):
+                return status & MARKERS
+        return status
+
+    def execute_branch(self, context):
+        """
+        Runs the block as a branch of a conditional: in the enclosing scope if it is scope free, otherwise in a new
+        conditional scope, whose value becomes the value of the enclosing one.
+
+        :param context: The scope context the conditional runs in.
+        :return: The completion status of the block.
+        """
+        if self._scope_free:
+            return self.execute(context)
+        new_context = context.create_new_scope_context(BlockScope.CONDITIONAL)
+        status = self.execute(new_context)
+        context.completion_value = new_context.completion_value
+        return status
+
+    def execute_branch_steps(self, context):
+        """
+        Runs the block as a branch of a conditional like execute_branch, as a generator run on the call stack of
+        run_on_call_stack.
+
+        :param context: The scope context the conditional runs in.
+        :return: The completion status of the block.
+        """
+        if self._scope_free:
+            return (yield from self.execute_steps(context))
+        new_context = context.create_new_scope_context(BlockScope.CONDITIONAL)
+        status = yield from self.execute_steps(new_context)
+        context.completion_value = new_context.completion_value
+        return status
 
     def get_nodes(self):
         return self._nodes
+
+    def set_nodes(self, nodes):
+        self._nodes = nodes
+        self._declares_variables = any(
+            isinstance(node, (AssignmentNode, FunctionNode)) and not isinstance(node, ReassignmentNode) for node in nodes
+        )
+
+    def declares_variables(self):
+        """Returns if the block declares variables or functions in the scope it runs in."""
+        return self._declares_variables
+
+    def is_scope_free(self):
+        """Returns if the block can run in the scope of the enclosing block, see scope_analysis.is_scope_free."""
+        return self._scope_free
+
+    def set_scope_free(self, scope_free):
+        self._scope_free = scope_free
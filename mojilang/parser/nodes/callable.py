@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class Callable(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def call(self, context, arguments):
         pass
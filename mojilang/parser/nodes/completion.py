@@ -0,0 +1,9 @@
+# The completion statuses of a statement, see AbstractSyntaxTreeNode.execute. A statement completing with
+# a break or continue marker as its value (a BreakNode or ContinueNode) has the status of the marker, and a
+# return statement adds RETURN to the status of its value. Any other statement completes NORMAL, so a block
+# only has to check whether the status is nonzero after each statement.
+NORMAL = 0
+BREAK = 1
+CONTINUE = 2
+MARKERS = BREAK | CONTINUE
+RETURN = 4
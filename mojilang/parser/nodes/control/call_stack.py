@@ -0,0 +1,35 @@
+# The number of function calls the tree-walker nests in the Python stack, counted by the function scopes of the
+# scope chain of a call, see FunctionNode.call. Every call takes about ten Python frames, so the calls past this
+# number would soon exceed Python's recursion limit.
+MAX_NESTED_CALLS = 32
+
+
+def run_on_call_stack(function, context, arguments):
+    """
+    Runs a function call on an explicit call stack instead of the Python stack, so recursions of any depth run
+    in constant Python stack.
+
+    Each function runs as a generator (see FunctionNode.call_steps) yielding the calls it makes, which are pushed
+    on the stack in place of their caller. Once the function called returns, its caller is popped and resumed
+    with the value it returned.
+
+    :param function: The FunctionNode called.
+    :param context: The new scope context of the call.
+    :param arguments: The values of the arguments.
+    :return: The value of the call.
+    """
+    callers = []
+    steps = function.call_steps(context, arguments)
+    value = None
+    while True:
+        try:
+            function, context, arguments = steps.send(value)
+        except StopIteration as stop:
+            if not callers:
+                return stop.value
+            steps = callers.pop()
+            value = stop.value
+            continue
+        callers.append(steps)
+        steps = function.call_steps(context, arguments)
+        value = None
@@ -1,5 +1,5 @@
-from mojilang.interpreter.scope import BlockScope
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
+from mojilang.parser.nodes.completion import NORMAL
 
 
 class ConditionalNode(AbstractSyntaxTreeNode):
@@ -11,6 +11,8 @@ class ConditionalNode(AbstractSyntaxTreeNode):
     it delegates evaluation to the next conditional node, if it's present.
     """
 
+    __slots__ = ('_condition_node', '_block_node', '_next_conditional_node')
+
     def __init__(self, condition_node, block_node, next_conditional_node, line_number):
         """
         Initializes the ConditionalNode.
@@ -32,9 +34,65 @@ class ConditionalNode(AbstractSyntaxTreeNode):
         :return: The result of evaluating the block if the condition is true, or the result of the next
                  conditional node's evaluation if the condition is false. Returns None if no conditions match.
         """
+        self.execute(context)
+        return context.completion_value
+
+    def execute(self, context):
+        """
+        Runs the block if the condition is true, otherwise runs the next conditional node.
+
+        :param context: The current execution context in which the condition and block are evaluated.
+        :return: The completion status of the block that ran, or NORMAL if no conditions match.
+        """
         if self._condition_node.evaluate(context):
-            new_context = context.create_new_scope_context(BlockScope.CONDITIONAL)
-            return self._block_node.evaluate(new_context)
-        else:
-            if self._next_conditional_node:
-                return self._next_conditional_node.evaluate(context)
+            return self._block_node.execute_branch(context)
+        if self._next_conditional_node:
+            return self._next_conditional_node.execute(context)
+        context.completion_value = None
+        return NORMAL
+
+    def evaluate_steps(self, context):
+        yield from self.execute_steps(context)
+        return context.completion_value
+
+    def execute_steps(self, context):
+        if (yield from self._condition_node.evaluate_steps(context)):
+            return (yield from self._block_node.execute_branch_steps(context))
+        if self._next_conditional_node:
+            return (yield from self._next_conditional_node.execute_steps(context))
+        context.completion_value = None
+        return NORMAL
+
+    def get_condition_node(self):
+        return self._condition_node
+
+    def get_block_node(self):
+        return self._block_node
+
+    def get_next_conditional_node(self):
+        return self._next_conditional_node
+
+    def get_conditional_nodes(self):
+        """
+        :return: The node and the ElseIfNodes following it in the chain of conditionals.
+        """
+        conditional_nodes = []
+        node = self
+        while isinstance(node, ConditionalNode):
+            conditional_nodes.append(node)
+            node = node._next_conditional_node
+        return conditional_nodes
+
+    def get_branch_block_nodes(self):
+        """
+        :return: The blocks of the node and of the nodes following it in the chain of conditionals, the
+                 ElseNode's included.
+        """
+        block_nodes = []
+        node = self
+        while isinstance(node, ConditionalNode):
+            block_nodes.append(node._block_node)
+            node = node._next_conditional_node
+        if node is not None:
+            block_nodes.append(node.get_block_node())
+        return block_nodes
@@ -1,9 +1,20 @@
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
+from mojilang.parser.nodes.completion import CONTINUE
 
 
 class ContinueNode(AbstractSyntaxTreeNode):
+    __slots__ = ()
+
     def __init__(self, line_number):
         super().__init__(line_number)
 
     def evaluate(self, context):
         return self
+
+    def execute(self, context):
+        context.completion_value = self
+        return CONTINUE
+
+    def execute_steps(self, context):
+        return self.execute(context)
+        yield  # Makes the method a generator.
@@ -1,12 +1,26 @@
-from mojilang.interpreter.scope import BlockScope
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
 
 
 class ElseNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_block_node',)
+
     def __init__(self, block_node, line_number):
         super().__init__(line_number)
         self._block_node = block_node
 
     def evaluate(self, context):
-        new_context = context.create_new_scope_context(BlockScope.CONDITIONAL)
-        return self._block_node.evaluate(new_context)
+        self.execute(context)
+        return context.completion_value
+
+    def execute(self, context):
+        return self._block_node.execute_branch(context)
+
+    def evaluate_steps(self, context):
+        yield from self.execute_steps(context)
+        return context.completion_value
+
+    def execute_steps(self, context):
+        return (yield from self._block_node.execute_branch_steps(context))
+
+    def get_block_node(self):
+        return self._block_node
@@ -1,15 +1,108 @@
 from mojilang.interpreter.scope import BlockScope
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
+from mojilang.parser.nodes.control.function_node import FunctionNode
+from mojilang.parser.nodes.control.marker import marker_status
+from mojilang.parser.nodes.control.tail_call import TailCall
 
 
 class FunctionCallNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_function_name', '_arguments', '_tail_call', '_address', '_address_lookups', '_chain_lookups')
+
     def __init__(self, function_name, arguments, line_number):
         super().__init__(line_number)
         self._function_name = function_name
         self._arguments = arguments
+        self._tail_call = False
+        self._address = None
+        # The number of calls that read the function from the address the Resolver bound it to, and the number
+        # of calls that looked it up along the scope chain.
+        self._address_lookups = 0
+        self._chain_lookups = 0
 
     def evaluate(self, context):
-        function = context.retrieve_variable_value(self._function_name)
+        function = self._retrieve_function(context)
         evaluated_args = [argument.evaluate(context) for argument in self._arguments]
-        new_context = context.create_new_scope_context(BlockScope.FUNCTION)
-        return function.call(new_context, evaluated_args)
+        call_context = self._call_context(function, context, evaluated_args)
+        if call_context.__class__ is TailCall:
+            return call_context
+        return function.call(call_context, evaluated_args)
+
+    def execute(self, context):
+        value = self.evaluate(context)
+        context.completion_value = value
+        return marker_status(value)
+
+    def evaluate_steps(self, context):
+        function = self._retrieve_function(context)
+        evaluated_args = []
+        for argument in self._arguments:
+            evaluated_args.append((yield from argument.evaluate_steps(context)))
+        call_context = self._call_context(function, context, evaluated_args)
+        if call_context.__class__ is TailCall:
+            return call_context
+        if function.__class__ is not FunctionNode:
+            return function.call(call_context, evaluated_args)
+        # The call is run by run_on_call_stack, which sends its value back.
+        return (yield function, call_context, evaluated_args)
+
+    def execute_steps(self, context):
+        value = yield from self.evaluate_steps(context)
+        context.completion_value = value
+        return marker_status(value)
+
+    def _retrieve_function(self, context):
+        """
+        Looks the function called up from the address the Resolver bound it to, or along the scope chain.
+
+        :param context: The scope context the call is made from.
+        :return: The function called.
+        """
+        if self._address is not None:
+            self._address_lookups += 1
+            return context.retrieve_resolved_value(self._address, self._function_name)
+        self._chain_lookups += 1
+        return context.find_variable_value(self._function_name)
+
+    def _call_context(self, function, context, arguments):
+        """
+        Provides the scope the function called runs in. A call in tail position is made in place of the running
+        function if the function called cannot tell the difference: it must not look up any variable the scopes of
+        the running function declare, and all of its arguments must be passed, since a missing argument is looked
+        up in the calling scopes.
+
+        :param function: The function called.
+        :param context: The scope context the call is made from.
+        :param arguments: The values of the arguments.
+        :return: The TailCall for FunctionNode.call to run, or the new scope context of the call.
+        """
+        if self._tail_call and function.__class__ is FunctionNode:
+            free_variable_names = function.get_free_variable_names()
+            if free_variable_names is not None and len(arguments) >= len(function.get_argument_names()):
+                tail_call_context = context.reuse_for_tail_call(free_variable_names)
+                if tail_call_context is not None:
+                    return TailCall(function, tail_call_context, arguments)
+        return context.create_new_scope_context(BlockScope.FUNCTION)
+
+    def get_function_name(self):
+        return self._function_name
+
+    def get_arguments(self):
+        return self._arguments
+
+    def is_tail_call(self):
+        return self._tail_call
+
+    def set_tail_call(self, tail_call):
+        self._tail_call = tail_call
+
+    def get_address(self):
+        return self._address
+
+    def set_address(self, address):
+        self._address = address
+
+    def get_address_lookups(self):
+        return self._address_lookups
+
+    def get_chain_lookups(self):
+        return self._chain_lookups
@@ -1,18 +1,85 @@
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
 from mojilang.parser.nodes.callable import Callable
+from mojilang.parser.nodes.control.call_stack import MAX_NESTED_CALLS, run_on_call_stack
+from mojilang.parser.nodes.control.tail_call import TailCall
 
 
 class FunctionNode(AbstractSyntaxTreeNode, Callable):
+    __slots__ = ('_function_name', '_argument_names', '_function_block_node', '_free_variable_names', '_memo_cache')
+
     def __init__(self, function_name, argument_names, function_block_node, line_number):
         super().__init__(line_number)
         self._function_name = function_name
         self._argument_names = argument_names
         self._function_block_node = function_block_node
+        # The names the function may look up past its own scope, None if unknown, see TailCallAnalyzer.
+        self._free_variable_names = None
+        # The values of the calls remembered while the function is pure, see PurityAnalyzer and MemoCache.
+        self._memo_cache = None
 
     def evaluate(self, context):
         context.assign_value(self._function_name, self)
 
     def call(self, context, arguments):
-        for arg_name, arg_value in zip(self._argument_names, arguments):
-            context.assign_value(arg_name, arg_value)
-        return self._function_block_node.evaluate(context)
+        if context.get_function_depth() > MAX_NESTED_CALLS:
+            # The deeper calls run on an explicit call stack instead, see run_on_call_stack.
+            return run_on_call_stack(self, context, arguments)
+        if self._memo_cache is not None:
+            return self._memo_cache.call(self._run, context, arguments)
+        return self._run(context, arguments)
+
+    def call_steps(self, context, arguments):
+        """
+        Calls the function like call, as a generator run on the call stack of run_on_call_stack.
+
+        :param context: The new scope context of the call.
+        :param arguments: The values of the arguments.
+        :return: The value of the function.
+        """
+        if self._memo_cache is not None:
+            return (yield from self._memo_cache.call_steps(self._run_steps, context, arguments))
+        return (yield from self._run_steps(context, arguments))
+
+    def _run(self, context, arguments):
+        function = self
+        # The calls in tail position of the function are run here, one after the other, instead of recursing.
+        while True:
+            for arg_name, arg_value in zip(function._argument_names, arguments):
+                context.assign_value(arg_name, arg_value)
+            function._function_block_node.execute(context)
+            value = context.completion_value
+            if value.__class__ is not TailCall:
+                return value
+            function, context, arguments = value.function, value.context, value.arguments
+
+    def _run_steps(self, context, arguments):
+        function = self
+        while True:
+            for arg_name, arg_value in zip(function._argument_names, arguments):
+                context.assign_value(arg_name, arg_value)
+            yield from function._function_block_node.execute_steps(context)
+            value = context.completion_value
+            if value.__class__ is not TailCall:
+                return value
+            function, context, arguments = value.function, value.context, value.arguments
+
+    def get_function_name(self):
+        return self._function_name
+
+    def get_argument_names(self):
+        return self._argument_names
+
+    def get_function_block_node(self):
+        return self._function_block_node
+
+    def get_free_variable_names(self):
+        return self._free_variable_names
+
+    def set_free_variable_names(self, free_variable_names):
+        self._free_variable_names = free_variable_names
+
+    def get_memo_cache(self):
+        return self._memo_cache
+
+    def set_memo_cache(self, memo_cache):
+        self._memo_cache = memo_cache
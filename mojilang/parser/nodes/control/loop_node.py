@@ -1,22 +1,64 @@
 from mojilang.interpreter.scope import BlockScope
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
-from mojilang.parser.nodes.control.break_node import BreakNode
-from mojilang.parser.nodes.control.continue_node import ContinueNode
+from mojilang.parser.nodes.completion import BREAK, NORMAL
 
 
 class LoopNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_condition_node', '_block_node', '_block_declares_variables')
+
     def __init__(self, condition_node, block_node, line_number):
         super().__init__(line_number)
         self._condition_node = condition_node
         self._block_node = block_node
+        self._block_declares_variables = block_node.declares_variables()
 
     def evaluate(self, context):
-        value = None
+        self.execute(context)
+        return context.completion_value
+
+    def execute(self, context):
+        """
+        Runs the block as long as the condition is true, or until it completes with a break marker. The value of
+        the loop is the value of its last iteration, a break or continue marker included, which the enclosing
+        block passes on to an outer loop.
+
+        :param context: The scope context the loop runs in.
+        :return: The completion status of the last iteration, or NORMAL if the block never ran.
+        """
+        status = NORMAL
+        # Every iteration runs in the same scope, emptied of the variables the previous iteration declared.
+        new_context = None
         while self._condition_node.evaluate(context):
-            new_context = context.create_new_scope_context(BlockScope.LOOP)
-            value = self._block_node.evaluate(new_context)
-            if isinstance(value, BreakNode):
+            if new_context is None:
+                new_context = context.create_new_scope_context(BlockScope.LOOP)
+            elif self._block_declares_variables:
+                new_context.clear_local_context()
+            status = self._block_node.execute(new_context)
+            if status == BREAK:
+                break
+        context.completion_value = None if new_context is None else new_context.completion_value
+        return status
+
+    def evaluate_steps(self, context):
+        yield from self.execute_steps(context)
+        return context.completion_value
+
+    def execute_steps(self, context):
+        status = NORMAL
+        new_context = None
+        while (yield from self._condition_node.evaluate_steps(context)):
+            if new_context is None:
+                new_context = context.create_new_scope_context(BlockScope.LOOP)
+            elif self._block_declares_variables:
+                new_context.clear_local_context()
+            status = yield from self._block_node.execute_steps(new_context)
+            if status == BREAK:
                 break
-            if isinstance(value, ContinueNode):
-                continue
-        return value
+        context.completion_value = None if new_context is None else new_context.completion_value
+        return status
+
+    def get_condition_node(self):
+        return self._condition_node
+
+    def get_block_node(self):
+        return self._block_node
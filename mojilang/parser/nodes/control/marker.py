@@ -0,0 +1,17 @@
+from mojilang.parser.nodes.completion import BREAK, CONTINUE, NORMAL
+from mojilang.parser.nodes.control.break_node import BreakNode
+from mojilang.parser.nodes.control.continue_node import ContinueNode
+
+
+def marker_status(value):
+    """
+    Returns the completion status of a statement completing with a value.
+
+    :param value: The value of the statement.
+    :return: BREAK or CONTINUE if the value is a break or continue marker, NORMAL otherwise.
+    """
+    if isinstance(value, BreakNode):
+        return BREAK
+    if isinstance(value, ContinueNode):
+        return CONTINUE
+    return NORMAL
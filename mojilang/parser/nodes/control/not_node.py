@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class NotNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_condition_node',)
+
     def __init__(self, condition_node, line_number):
         super().__init__(line_number)
         self._condition_node = condition_node
@@ -9,3 +11,8 @@ class NotNode(AbstractSyntaxTreeNode):
     def evaluate(self, context):
         return not self._condition_node.evaluate(context)
 
+    def evaluate_steps(self, context):
+        return not (yield from self._condition_node.evaluate_steps(context))
+
+    def get_condition_node(self):
+        return self._condition_node
@@ -1,10 +1,30 @@
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
+from mojilang.parser.nodes.completion import RETURN
+from mojilang.parser.nodes.control.marker import marker_status
 
 
 class ReturnNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_return_value_node',)
+
     def __init__(self, return_value_node, line_number):
         super().__init__(line_number)
         self._return_value_node = return_value_node
 
     def evaluate(self, context):
         return self._return_value_node.evaluate(context)
+
+    def execute(self, context):
+        value = self._return_value_node.evaluate(context)
+        context.completion_value = value
+        return RETURN | marker_status(value)
+
+    def evaluate_steps(self, context):
+        return (yield from self._return_value_node.evaluate_steps(context))
+
+    def execute_steps(self, context):
+        value = yield from self._return_value_node.evaluate_steps(context)
+        context.completion_value = value
+        return RETURN | marker_status(value)
+
+    def get_return_value_node(self):
+        return self._return_value_node
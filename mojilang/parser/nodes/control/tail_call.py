@@ -0,0 +1,25 @@
+class TailCall:
+    """
+    The TailCall class is the value a function call in tail position completes with in place of the value of
+    the call: the function running the call returns it to FunctionNode.call, which runs the called function
+    in the same Python frame instead of recursing, see FunctionCallNode.
+
+    Attributes:
+        function (FunctionNode): The function called.
+        context (ScopeContext): The new scope context of the call.
+        arguments (list): The values of the arguments.
+    """
+
+    __slots__ = ('function', 'context', 'arguments')
+
+    def __init__(self, function, context, arguments):
+        """
+        Initializes the TailCall.
+
+        :param function: The function called.
+        :param context: The new scope context of the call.
+        :param arguments: The values of the arguments.
+        """
+        self.function = function
+        self.context = context
+        self.arguments = arguments
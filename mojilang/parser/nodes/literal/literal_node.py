@@ -2,6 +2,8 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class LiteralNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_value',)
+
     def __init__(self, value, line_number):
         super().__init__(line_number)
         self._value = value
@@ -11,3 +13,6 @@ class LiteralNode(AbstractSyntaxTreeNode):
 
     def __repr__(self):
         return str(self._value)
+
+    def get_value(self):
+        return self._value
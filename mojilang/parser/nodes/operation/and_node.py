@@ -1,11 +1,39 @@
 from mojilang.parser.nodes.operation.operation_node import OperationNode
+from mojilang.parser.nodes.control.marker import marker_status
 
 
 class AndNode(OperationNode):
-    def __init__(self, left_operand, right_operand, line_number):
+    __slots__ = ('_short_circuit',)
+
+    def __init__(self, left_operand, right_operand, line_number, short_circuit=True):
         super().__init__(left_operand, right_operand, 'and', line_number)
+        self._short_circuit = short_circuit
 
     def evaluate(self, context):
-        left_value = self.get_left_operand().evaluate(context)
-        right_value = self.get_right_operand().evaluate(context)
+        left_value = self._left_operand.evaluate(context)
+        if self._short_circuit:
+            # The right operand is only evaluated if the left one is truthy.
+            return left_value and self._right_operand.evaluate(context)
+        return self.operate(left_value, self._right_operand.evaluate(context))
+
+    def execute(self, context):
+        value = self.evaluate(context)
+        context.completion_value = value
+        return marker_status(value)
+
+    def evaluate_steps(self, context):
+        left_value = yield from self._left_operand.evaluate_steps(context)
+        if self._short_circuit:
+            return left_value and (yield from self._right_operand.evaluate_steps(context))
+        return self.operate(left_value, (yield from self._right_operand.evaluate_steps(context)))
+
+    def execute_steps(self, context):
+        value = yield from self.evaluate_steps(context)
+        context.completion_value = value
+        return marker_status(value)
+
+    def operate(self, left_value, right_value):
         return left_value and right_value
+
+    def is_short_circuit(self):
+        return self._short_circuit
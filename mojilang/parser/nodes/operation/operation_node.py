@@ -3,14 +3,31 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class OperationNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_left_operand', '_right_operand', 'value')
+
     def __init__(self, left_operand, right_operand, value, line_number):
         super().__init__(line_number)
         self._left_operand = left_operand
         self._right_operand = right_operand
         self.value = value
 
-    @abstractmethod
     def evaluate(self, context):
+        return self.operate(self._left_operand.evaluate(context), self._right_operand.evaluate(context))
+
+    def evaluate_steps(self, context):
+        left_value = yield from self._left_operand.evaluate_steps(context)
+        right_value = yield from self._right_operand.evaluate_steps(context)
+        return self.operate(left_value, right_value)
+
+    @abstractmethod
+    def operate(self, left_value, right_value):
+        """
+        Applies the operation to the values of its operands, once evaluate or evaluate_steps has evaluated them.
+
+        :param left_value: The value of the left operand.
+        :param right_value: The value of the right operand.
+        :return: The value of the operation.
+        """
         pass
 
     def get_left_operand(self):
@@ -2,12 +2,20 @@ from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNo
 
 
 class PrintNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_node_to_print',)
+
     def __init__(self, node_to_print, line_number):
         super().__init__(line_number)
         self._node_to_print = node_to_print
 
     def evaluate(self, context):
-        value_to_print = self._node_to_print.evaluate(context)
+        self._print(self._node_to_print.evaluate(context))
+
+    def evaluate_steps(self, context):
+        self._print((yield from self._node_to_print.evaluate_steps(context)))
+
+    @staticmethod
+    def _print(value_to_print):
         if isinstance(value_to_print, bool):
             value_to_print = "😤" if value_to_print else "😔"
         print(value_to_print)
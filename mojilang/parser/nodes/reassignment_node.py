@@ -3,12 +3,17 @@ from mojilang.parser.runtime_exception import RuntimeException
 
 
 class ReassignmentNode(AssignmentNode):
+    __slots__ = ()
+
     def __init__(self, variable_node, value_node, line_number):
         super().__init__(variable_node, value_node, line_number)
 
-    def evaluate(self, context):
-        new_value = self._value_node.evaluate(context)
+    def _assign(self, context, new_value):
         variable_name = self._variable_node.get_name()
+        if self._address is not None:
+            # The Resolver proved the variable is declared.
+            context.reassign_resolved_value(self._address, variable_name, new_value)
+            return
         if not context.current_scope_contains_variable(variable_name):
-            raise RuntimeException("Variable has not been declared yet.", self.get_line_number())
-        context.reassign_value(self._variable_node.get_name(), new_value)
+            raise RuntimeException("Variable has not been declared yet.", self._line_number)
+        context.reassign_value(variable_name, new_value)
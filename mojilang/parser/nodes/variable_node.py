@@ -1,16 +1,44 @@
 from mojilang.parser.nodes.abstract_syntax_tree_node import AbstractSyntaxTreeNode
 from mojilang.lexer import SyntaxException
+from mojilang.parser.nodes.control.marker import marker_status
+
+# Tells undefined variables apart from variables holding None.
+_UNDEFINED = object()
 
 
 class VariableNode(AbstractSyntaxTreeNode):
+    __slots__ = ('_name', '_address')
+
     def __init__(self, name, line_number):
         super().__init__(line_number)
         self._name = name
+        self._address = None
 
     def evaluate(self, context):
-        if not context.contains_variable(self._name):
+        if self._address is not None:
+            # An argument the call did not pass is not in the function's scope, it is looked up as usual.
+            value = context.retrieve_resolved_value(self._address, self._name, _UNDEFINED)
+            if value is not _UNDEFINED:
+                return value
+        value = context.find_variable_value(self._name, _UNDEFINED)
+        if value is _UNDEFINED:
             raise SyntaxException(self._line_number, f"Undefined variable '{self._name}'")
-        return context.retrieve_variable_value(self._name)
+        return value
+
+    def execute(self, context):
+        value = self.evaluate(context)
+        context.completion_value = value
+        return marker_status(value)
+
+    def execute_steps(self, context):
+        return self.execute(context)
+        yield  # Makes the method a generator.
 
     def get_name(self):
         return self._name
+
+    def get_address(self):
+        return self._address
+
+    def set_address(self, address):
+        self._address = address
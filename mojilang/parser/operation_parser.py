@@ -24,8 +24,21 @@ class OperationParser:
 
     This class focuses on parsing operations like addition, subtraction, multiplication, division,
     logical comparisons, and boolean logic, converting them into appropriate AST nodes.
+
+    The `and` and `or` operations short-circuit, they only evaluate their right operand when the left one does
+    not decide the result, unless the OperationParser is told otherwise for compatibility with the programs
+    relying on both operands being evaluated.
     """
 
+    def __init__(self, short_circuit=True):
+        """
+        Initializes the OperationParser.
+
+        :param short_circuit: Whether the `and` and `or` operations skip their right operand when the left one
+                              decides the result.
+        """
+        self._short_circuit = short_circuit
+
     def parse(self, token, context):
         """
         Parses an operation token and returns the appropriate operation node based on the context.
@@ -55,6 +68,8 @@ class OperationParser:
         if token_type in binary_operation_map:
             operation_class = binary_operation_map[token_type]
             left_operand, right_operand = context.get_left_operand(), context.get_right_operand()
+            if operation_class is AndNode or operation_class is OrNode:
+                return operation_class(left_operand, right_operand, line_number, self._short_circuit)
             return operation_class(left_operand, right_operand, line_number)
 
         if token.is_token_type(TokenType.BANG):
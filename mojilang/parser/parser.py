@@ -20,7 +20,9 @@ from mojilang.parser.nodes import (
 )
 from mojilang.parser.parser_state import ParserState
 from mojilang.parser.expression_parser import ExpressionParser
+from mojilang.parser.pratt_expression_parser import PrattExpressionParser
 from mojilang.parser.operation_parser import OperationParser
+from mojilang.parser.scope_analysis import is_scope_free
 
 
 class Parser:
@@ -28,30 +30,58 @@ class Parser:
     The Parser class is responsible for transforming a list of tokens into an Abstract Syntax Tree (AST).
     It handles parsing variable assignments, expressions, operations, and print statements.
     The algorithm used here to construct the AST is recursive descent parsing.
+
+    Expressions are parsed by precedence climbing in a single pass (see PrattExpressionParser). The
+    original recursive expression parser, which rescans each subexpression once per precedence level,
+    can still be selected with expression_parser='recursive', e.g. for differential testing.
+
+    The `and` and `or` operations short-circuit (see AndNode and OrNode). Passing short_circuit=False parses
+    them to evaluate both operands, the way Mojilang always did before.
     """
 
-    def __init__(self, tokens):
+    PRATT_EXPRESSION_PARSER = 'pratt'
+    RECURSIVE_EXPRESSION_PARSER = 'recursive'
+    EXPRESSION_PARSERS = (PRATT_EXPRESSION_PARSER, RECURSIVE_EXPRESSION_PARSER)
+
+    def __init__(self, tokens, expression_parser=PRATT_EXPRESSION_PARSER, short_circuit=True):
         """
         Initializes the parser with a list of tokens.
 
-        :param tokens: The list of tokens generated by the lexer.
-        """
+        :param tokens: The list of tokens generated by the lexer, or an iterator yielding them
+                       (e.g. Lexer.iter_tokens) to parse while the source is still being lexed.
+        :param expression_parser: The expression parser to use, one of Parser.EXPRESSION_PARSERS.
+        :param short_circuit: Whether the `and` and `or` operations skip their right operand when the left one
+                              decides the result.
+        :raises ValueError: If the expression parser is unknown.
+        """
+        if expression_parser not in self.EXPRESSION_PARSERS:
+            raise ValueError(
+                f"Unknown expression parser '{expression_parser}', expected one of {self.EXPRESSION_PARSERS}."
+            )
         self._state = ParserState(tokens)
-        self._expression_parser = ExpressionParser(self)
-        self._operation_parser = OperationParser()
+        if expression_parser == self.PRATT_EXPRESSION_PARSER:
+            self._expression_parser = PrattExpressionParser(self)
+        else:
+            self._expression_parser = ExpressionParser(self)
+        self._operation_parser = OperationParser(short_circuit)
 
     def parse(self):
         """
         The main entry point for parsing. It loops through the tokens and parses each one,
         generating a BlockNode (AST root) containing all parsed nodes.
 
+        Unbalanced parentheses are reported before anything is parsed.
+
         :return: BlockNode representing the entire parsed program.
+        :raises SyntaxException: If the program is not syntactically valid.
         """
+        self._state.validate_parentheses()
         line_number = self._state.current_line_number()
         nodes = []
         while self._state.in_bounds(self._state.get_current()) and not self._state.is_eof_token():
             node = self.handle_token()
             nodes.append(node)
+            self._state.release_parsed_tokens()
         return BlockNode(nodes, line_number)
 
     def handle_token(self, index=None, context=None):
@@ -65,33 +95,33 @@ class Parser:
         """
         if index is None:
             index = self._state.get_current()
-        token = self._state.retrieve_token(index)
-        if token.is_token_type(TokenType.PRINT):
+        token_type = self._state.token_type_at(index)
+        if token_type == TokenType.PRINT:
             return self._parse_statement(self._parse_print_token())
-        if token.is_token_type(TokenType.IDENTIFIER):
+        if token_type == TokenType.IDENTIFIER:
             if self._is_reassignment_statement(index):
                 return self._parse_statement(self._parse_reassignment())
             return self._parse_identifier_token(index)
-        if token.is_token_type(TokenType.VAR):
+        if token_type == TokenType.VAR:
             return self._parse_statement(self._parse_var_token())
-        if token.is_token_type(TokenType.IF):
+        if token_type == TokenType.IF:
             return self._parse_if_statement()
-        if token.is_token_type(TokenType.BREAK):
+        if token_type == TokenType.BREAK:
             return self._parse_statement(self._parse_break())
-        if token.is_token_type(TokenType.CONTINUE):
+        if token_type == TokenType.CONTINUE:
             return self._parse_statement(self._parse_continue())
-        if token.is_token_type(TokenType.LOOP):
+        if token_type == TokenType.LOOP:
             return self._parse_loop()
-        if token.is_token_type(TokenType.FUNCTION):
+        if token_type == TokenType.FUNCTION:
             return self._parse_function_declaration()
-        if token.is_token_type(TokenType.RETURN):
+        if token_type == TokenType.RETURN:
             return self._parse_statement(self._parse_return())
-        if token.is_token_type(TokenType.FUNCTION_CALL):
+        if token_type == TokenType.FUNCTION_CALL:
             return self._parse_statement(self.parse_function_call())
-        if token.get_token_type() in TokenType.literal_types():
-            return self._parse_literal(token)
-        if token.get_token_type() in TokenType.operation_types():
-            return self._operation_parser.parse(token, context)
+        if token_type in TokenType.literal_types():
+            return self._parse_literal(self._state.retrieve_token(index))
+        if token_type in TokenType.operation_types():
+            return self._operation_parser.parse(self._state.retrieve_token(index), context)
 
     def _parse_statement(self, node):
         """
@@ -122,10 +152,9 @@ class Parser:
         :param valid_token_types: A set of token types that are valid while parsing this token.
         :param error_message: The error message to raise if validation fails.
         """
-        current_token = self._state.current_token()
-        token_line_number = current_token.get_line()
-        if current_token.get_token_type() not in valid_token_types:
-            raise SyntaxException(token_line_number, f'{error_message} was {current_token}')
+        token_line_number = self._state.current_line_number()
+        if self._state.current_token_type() not in valid_token_types:
+            raise SyntaxException(token_line_number, f'{error_message} was {self._state.current_token()}')
         self._state.advance_current()
         return token_line_number
 
@@ -137,8 +166,9 @@ class Parser:
         :param index: The index of the identifier token.
         :return: if the statement is for variable reassignment.
         """
-        previous_token, next_token = self._state.retrieve_token(index - 1), self._state.retrieve_token(index + 1)
-        return next_token.is_token_type(TokenType.EQUAL) and not previous_token.is_token_type(TokenType.VAR)
+        previous_token_type = self._state.token_type_at(index - 1)
+        next_token_type = self._state.token_type_at(index + 1)
+        return next_token_type == TokenType.EQUAL and previous_token_type != TokenType.VAR
 
     def _parse_identifier_token(self, index):
         """
@@ -148,8 +178,7 @@ class Parser:
         :param index: The index of the identifier token.
         :return: VariableNode representing the variable or ReassignmentNode with variable and new value.
         """
-        identifier_token = self._state.retrieve_token(index)
-        return VariableNode(identifier_token.get_lexeme(), identifier_token.get_line())
+        return VariableNode(self._state.lexeme_at(index), self._state.line_at(index))
 
     def _parse_reassignment(self):
         """
@@ -213,18 +242,21 @@ class Parser:
     def _parse_block(self):
         """
         Parses a block of code enclosed in curly braces `{}`. If no closing brace
-        is found, it raises a SyntaxException.
+        is found, it raises a SyntaxException. The block is marked if it does not need a scope of its own, so
+        a conditional runs it in the enclosing scope, see scope_analysis.is_scope_free.
 
         :return: A BlockNode representing the parsed block of code.
         """
         line_number = self._state.current_line_number()
         nodes = []
-        while not self._state.current_token().is_token_type(TokenType.RIGHT_BRACE):
+        while self._state.current_token_type() != TokenType.RIGHT_BRACE:
             if self._state.is_eof_token():
-                raise SyntaxException(self._state.current_token().get_line(), "Missing closing right brace.")
+                raise SyntaxException(self._state.current_line_number(), "Missing closing right brace.")
             node = self.handle_token()
             nodes.append(node)
-        return BlockNode(nodes, line_number)
+        block_node = BlockNode(nodes, line_number)
+        block_node.set_scope_free(is_scope_free(block_node))
+        return block_node
 
     def _parse_next_if_conditional(self):
         """
@@ -232,12 +264,12 @@ class Parser:
 
         :return: A BlockNode representing the elseif node or None if not present.
         """
-        current_token = self._state.current_token()
-        if current_token.is_token_type(TokenType.ELSE):
+        current_token_type = self._state.current_token_type()
+        if current_token_type == TokenType.ELSE:
             return self._parse_else()
-        if current_token.get_token_type() not in TokenType.if_statement_tokens():
+        if current_token_type not in TokenType.if_statement_tokens():
             return
-        if current_token.is_token_type(TokenType.ELSEIF):
+        if current_token_type == TokenType.ELSEIF:
             line_number = self._validate_token({TokenType.ELSEIF}, "Expected '🙈' for elseif statement.")
             condition_node, block_node = self._parse_conditional()
             next_conditional = self._parse_next_if_conditional()
@@ -249,7 +281,7 @@ class Parser:
 
         :return: A BlockNode representing the else block or None if no else block is present.
         """
-        if self._state.current_token().is_token_type(TokenType.ELSE):
+        if self._state.current_token_type() == TokenType.ELSE:
             line_number = self._validate_token({TokenType.ELSE}, "Expected '💅' for else.")
             self._validate_token({TokenType.LEFT_BRACE}, "Expected '{' to begin else block.")
             else_block_node = self._parse_block()
@@ -312,8 +344,7 @@ class Parser:
         :return: FunctionNameNode representing the function name.
         :raises SyntaxException: If the function name is not a valid identifier.
         """
-        identifier_token = self._state.current_token()
-        return identifier_token.get_lexeme()
+        return self._state.lexeme_at(self._state.get_current())
 
     def _parse_function_argument_names(self):
         """
@@ -324,7 +355,7 @@ class Parser:
         """
         self._validate_token({TokenType.LEFT_PAREN}, "Expected left parenthesis for function declaration.")
         arguments = []
-        while self._state.current_token().is_token_type(TokenType.VAR):
+        while self._state.current_token_type() == TokenType.VAR:
             argument = self._parse_function_argument_name()
             arguments.append(argument)
         self._validate_token({TokenType.RIGHT_PAREN}, "Expected right parenthesis for function declaration.")
@@ -338,11 +369,11 @@ class Parser:
         :raises SyntaxException: If the argument declaration is malformed.
         """
         self._validate_token({TokenType.VAR}, "Expected '🥸' for function argument declaration.")
-        identifier_token = self._state.current_token()
+        argument_name = self._state.lexeme_at(self._state.get_current())
         self._validate_token({TokenType.IDENTIFIER}, "Expected an identifier for function argument declaration.")
-        if self._state.current_token().is_token_type(TokenType.COMMA):
+        if self._state.current_token_type() == TokenType.COMMA:
             self._validate_token({TokenType.COMMA}, "Expected a comma for function argument declaration.")
-        return identifier_token.get_lexeme()
+        return argument_name
 
     def _parse_return(self):
         """
@@ -363,10 +394,10 @@ class Parser:
         :raises SyntaxException: If the function call is malformed.
         """
         line_number = self._validate_token({TokenType.FUNCTION_CALL}, "Expected '👀' for a function call.")
-        identifier_token = self._state.current_token()
+        function_name = self._state.lexeme_at(self._state.get_current())
         self._validate_token({TokenType.IDENTIFIER}, "Expected an identifier for function call.")
         arguments = self._parse_function_call_arguments()
-        return FunctionCallNode(identifier_token.get_lexeme(), arguments, line_number)
+        return FunctionCallNode(function_name, arguments, line_number)
 
     def _parse_function_call_arguments(self):
         """
@@ -377,10 +408,10 @@ class Parser:
         """
         self._validate_token({TokenType.LEFT_PAREN}, "Expected left parenthesis for function declaration.")
         arguments = []
-        while not self._state.current_token().is_token_type(TokenType.RIGHT_PAREN):
+        while self._state.current_token_type() != TokenType.RIGHT_PAREN:
             argument_node = self._expression_parser.parse({TokenType.COMMA, TokenType.RIGHT_PAREN})
             arguments.append(argument_node)
-            if self._state.current_token().is_token_type(TokenType.COMMA):
+            if self._state.current_token_type() == TokenType.COMMA:
                 self._validate_token({TokenType.COMMA}, "Expected a comma for function call argument.")
         self._validate_token({TokenType.RIGHT_PAREN}, "Expected right parenthesis for function call.")
         return arguments
@@ -1,4 +1,13 @@
-from mojilang.lexer import TokenType
+from array import array
+
+from mojilang.lexer import TokenType, SyntaxException
+from mojilang.parser.token_buffer import TokenBuffer, TOKEN_TYPE_CODES
+
+LEFT_PAREN_CODE = TOKEN_TYPE_CODES[TokenType.LEFT_PAREN]
+RIGHT_PAREN_CODE = TOKEN_TYPE_CODES[TokenType.RIGHT_PAREN]
+
+# Marks a token without a matching parenthesis in the parenthesis index.
+NO_MATCHING_PARENTHESIS = -1
 
 
 class ParserState:
@@ -8,27 +17,67 @@ class ParserState:
     It provides methods to retrieve and advance tokens, check for end-of-file
     during the parsing process.
 
+    The tokens are kept in a columnar TokenBuffer. The token_type_at, line_at, lexeme_at and literal_at
+    methods read a single attribute of a token without creating a Token object, which retrieve_token
+    only does on demand.
+
+    The tokens can also be given as an iterator (e.g. Lexer.iter_tokens), in which case they are pulled
+    from it only once the parser needs them, letting parsing begin before lexing has finished. Token
+    indices always count from the first token of the program, even once the tokens of statements that
+    were already parsed have been released.
+
+    Every parenthesis is matched with its partner in a single pass as tokens are added, so finding the
+    parenthesis closing (or opening) another is a single lookup, and unbalanced parentheses are known
+    before parsing starts.
+
     Attributes:
-        _tokens (list): A list of tokens generated by the lexer.
+        _tokens (TokenBuffer): The tokens generated by the lexer.
+        _pending_tokens (iterator): The tokens yet to be pulled into _tokens, or None once all are there.
+        _released (bool): Whether tokens may be released once parsed, only when they are streamed.
+        _offset (int): The index of the first token still held in _tokens.
         _current (int): The current index in the list of tokens.
+        _matching_parentheses (array): The index of the matching parenthesis of each token in _tokens,
+                                       NO_MATCHING_PARENTHESIS for other tokens and unbalanced parentheses.
+        _open_parentheses (list): The (index, line) of the left parentheses not matched yet.
+        _unbalanced_parentheses (list): The (line, lexeme) of every unbalanced parenthesis found.
     """
 
     def __init__(self, tokens):
         """
         Initializes the parser state with a list of tokens.
 
-        :param tokens: The list of tokens generated by the lexer.
+        :param tokens: The list of tokens generated by the lexer, or an iterator yielding them.
         """
-        self._tokens = tokens
+        if isinstance(tokens, list):
+            self._tokens = TokenBuffer(tokens)
+            self._pending_tokens = None
+        else:
+            self._tokens = TokenBuffer()
+            self._pending_tokens = iter(tokens)
+        self._released = self._pending_tokens is not None
+        self._offset = 0
         self._current = 0
 
+        self._matching_parentheses = array('i')
+        self._open_parentheses = []
+        self._unbalanced_parentheses = []
+        self._index_parentheses()
+
     def current_line_number(self):
         """
         Retrieves the line number of the current token being processed.
 
         :return: The line number of the current token.
         """
-        return self.current_token().get_line()
+        return self.line_at(self._current)
+
+    def current_token_type(self):
+        """
+        Retrieves the type of the current token being processed.
+
+        :return: The TokenType of the current token.
+        """
+        return self.token_type_at(self._current)
 
     def current_token(self):
         """
@@ -45,10 +94,67 @@ class ParserState:
         :param index: The index of the token.
         :return: The token at the specified index.
         """
+        return self._tokens.get_token(self._buffer_index(index))
+
+    def token_type_at(self, index):
+        """
+        Retrieves the type of the token at a specified index.
+
+        :param index: The index of the token.
+        :return: The TokenType of the token at the specified index.
+        """
+        return self._tokens.get_token_type(self._buffer_index(index))
+
+    def line_at(self, index):
+        """
+        Retrieves the line number of the token at a specified index.
+
+        :param index: The index of the token.
+        :return: The line number of the token at the specified index.
+        """
+        return self._tokens.get_line(self._buffer_index(index))
+
+    def lexeme_at(self, index):
+        """
+        Retrieves the lexeme of the token at a specified index.
+
+        :param index: The index of the token.
+        :return: The lexeme of the token at the specified index.
+        """
+        return self._tokens.get_lexeme(self._buffer_index(index))
+
+    def literal_at(self, index):
+        """
+        Retrieves the literal value of the token at a specified index.
+
+        :param index: The index of the token.
+        :return: The literal value of the token at the specified index.
+        """
+        return self._tokens.get_literal(self._buffer_index(index))
+
+    def type_codes_between(self, left_index, right_index):
+        """
+        Retrieves the type codes (see TOKEN_TYPE_CODES) of the tokens in an inclusive range of indices,
+        letting a range of tokens be scanned as a buffer of integers.
+
+        :param left_index: The index of the first token of the range.
+        :param right_index: The index of the last token of the range.
+        :return: An array of the type codes of the tokens in the range.
+        """
+        self._buffer_index(right_index)
+        return self._tokens.get_type_codes(left_index - self._offset, right_index - self._offset + 1)
+
+    def _buffer_index(self, index):
+        """
+        Converts a token index into an index of the token buffer, pulling pending tokens if needed.
+
+        :param index: The index of the token.
+        :return: The index of the token within the token buffer.
+        :raises IndexError: If there is no token at the specified index.
+        """
         if self.in_bounds(index):
-            return self._tokens[index]
-        else:
-            raise IndexError("Attempted to retrieve token past the end of tokens")
+            return index - self._offset
+        raise IndexError("Attempted to retrieve token past the end of tokens")
 
     def in_bounds(self, index):
         """
@@ -57,7 +163,104 @@ class ParserState:
         :param index: Index to check.
         :return: True if the index is within the bounds, False otherwise.
         """
-        return index < len(self._tokens)
+        if index - self._offset < len(self._tokens):
+            return True
+        return self._pull_tokens(index)
+
+    def _pull_tokens(self, index):
+        """
+        Pulls tokens from the pending tokens until the token at the given index is available.
+
+        :param index: Index of the token needed.
+        :return: True if the token at the index is now available, False if the tokens ran out first.
+        """
+        if self._pending_tokens is None:
+            return False
+        tokens = self._tokens
+        is_available = False
+        for token in self._pending_tokens:
+            tokens.append(token)
+            if index - self._offset < len(tokens):
+                is_available = True
+                break
+        else:
+            self._pending_tokens = None
+        self._index_parentheses()
+        return is_available
+
+    def _index_parentheses(self):
+        """
+        Matches the parentheses among the tokens added since the last call, recording the index of the
+        matching parenthesis of each one. Once all tokens have been added, any left parenthesis still open
+        is recorded as unbalanced.
+        """
+        matching_parentheses = self._matching_parentheses
+        open_parentheses = self._open_parentheses
+        start = len(matching_parentheses)
+        matching_parentheses.extend([NO_MATCHING_PARENTHESIS] * (len(self._tokens) - start))
+        for buffer_index, type_code in enumerate(self._tokens.get_type_codes(start, len(self._tokens)), start):
+            if type_code == LEFT_PAREN_CODE:
+                open_parentheses.append((buffer_index + self._offset, self._tokens.get_line(buffer_index)))
+            elif type_code == RIGHT_PAREN_CODE:
+                if open_parentheses:
+                    left_index, _ = open_parentheses.pop()
+                    matching_parentheses[buffer_index] = left_index
+                    if left_index >= self._offset:
+                        matching_parentheses[left_index - self._offset] = buffer_index + self._offset
+                else:
+                    self._unbalanced_parentheses.append((self._tokens.get_line(buffer_index), ')'))
+
+        if self._pending_tokens is None:
+            for _, line in open_parentheses:
+                self._unbalanced_parentheses.append((line, '('))
+            open_parentheses.clear()
+            self._unbalanced_parentheses.sort()
+
+    def matching_parenthesis_index(self, index):
+        """
+        Retrieves the index of the parenthesis matching the parenthesis at a specified index. When tokens
+        are streamed, tokens are pulled until the matching parenthesis is found.
+
+        :param index: The index of a parenthesis.
+        :return: The index of the matching parenthesis, or NO_MATCHING_PARENTHESIS if the parenthesis is
+                 unbalanced or the token is not a parenthesis.
+        """
+        buffer_index = self._buffer_index(index)
+        is_left_parenthesis = self._tokens.get_type_code(buffer_index) == LEFT_PAREN_CODE
+        while (self._matching_parentheses[buffer_index] == NO_MATCHING_PARENTHESIS and is_left_parenthesis
+               and self._pull_tokens(self._offset + len(self._tokens))):
+            pass
+        return self._matching_parentheses[buffer_index]
+
+    def validate_parentheses(self):
+        """
+        Validates that every parenthesis found so far is balanced, reporting all unbalanced parentheses at
+        once. When tokens are given as a list this covers the whole program.
+
+        :raises SyntaxException: If any parenthesis is unbalanced.
+        """
+        if not self._unbalanced_parentheses:
+            return
+        descriptions = ', '.join(
+            f"unmatched '{lexeme}' on line {line}" for line, lexeme in self._unbalanced_parentheses
+        )
+        raise SyntaxException(self._unbalanced_parentheses[0][0], f'Unbalanced parentheses: {descriptions}.')
+
+    def release_parsed_tokens(self):
+        """
+        Releases the tokens before the current one that are no longer needed, keeping memory bounded by
+        the size of a statement rather than the size of the program when tokens are streamed. The token
+        just before the current one is kept since it is looked at to tell reassignments from declarations.
+
+        Tokens given as a list are all available up front anyway, so they are kept.
+        """
+        if not self._released:
+            return
+        released_count = self._current - 1 - self._offset
+        if released_count > 0:
+            self._tokens.release(released_count)
+            del self._matching_parentheses[:released_count]
+            self._offset += released_count
 
     def is_eof_token(self):
         """
@@ -65,8 +268,7 @@ class ParserState:
 
         :return: True if the current token is EOF, False otherwise.
         """
-        token = self.current_token()
-        return token.is_token_type(TokenType.EOF)
+        return self.current_token_type() == TokenType.EOF
 
     def advance_current(self, steps=1):
         """
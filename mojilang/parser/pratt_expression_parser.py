@@ -0,0 +1,163 @@
+from mojilang.lexer import TokenType, SyntaxException
+from mojilang.parser.nodes import (
+    BinaryOperationContext,
+    UnaryOperationContext,
+)
+from mojilang.parser.expression_parser import OPERATOR_PRECEDENCE
+
+# The precedence level of each binary operator and of the unary operators, higher binds tighter.
+BINARY_OPERATOR_LEVELS = {
+    token_type: level
+    for level, operators in enumerate(OPERATOR_PRECEDENCE)
+    for token_type in operators
+    if token_type not in TokenType.unary_operations() and token_type != TokenType.FUNCTION_CALL
+}
+UNARY_OPERATOR_LEVELS = {
+    token_type: level
+    for level, operators in enumerate(OPERATOR_PRECEDENCE)
+    for token_type in operators
+    if token_type in TokenType.unary_operations()
+}
+OPERAND_TYPES = TokenType.literal_types() | {TokenType.IDENTIFIER}
+
+# Marks an open parenthesis on the operator stack. It has the lowest level so it is never reduced.
+_PARENTHESIS = (-1, None, None)
+
+
+class PrattExpressionParser:
+    """
+    The PrattExpressionParser class parses expressions by precedence climbing in a single left to right
+    pass over the tokens, as opposed to the ExpressionParser which rescans the token range of every
+    subexpression once per precedence level.
+
+    It builds the same trees as the ExpressionParser: operators follow the same precedence levels and
+    operators of the same level group to the right (e.g. a ➖ b ➕ c is a ➖ (b ➕ c)). Pending operators
+    and parentheses are kept on an explicit stack instead of the call stack, so neither long chains of
+    operators nor deeply nested parentheses are limited by the recursion limit.
+
+    Attributes:
+        _parser (Parser): A reference to the main parser instance, which allows this class to delegate
+                          other parts of the parsing process.
+        _state (ParserState): A reference to the current state of the parser, which manages tokens,
+                              token positions, and block scopes.
+    """
+    def __init__(self, parser):
+        """
+        Initializes the PrattExpressionParser with a reference to the main parser and its state.
+
+        :param parser: The main Parser instance, which this class uses to delegate
+                       other parsing tasks.
+        """
+        self._parser = parser
+        self._state = parser.get_state()
+
+    def parse(self, end_tokens=None):
+        """
+        Parses an expression starting at the current token, up to the first token that cannot continue it.
+
+        :param: end_tokens: optional tokens that the expression is expected to end on (such as a comma
+                            between function call arguments).
+        :return: The root node of the parsed expression.
+        :raises SyntaxException: If the tokens do not form a valid expression.
+        """
+        if end_tokens is None:
+            end_tokens = {}
+        index = self._state.get_current()
+        operands = []
+        operators = []
+        open_parenthesis_count = 0
+        expect_operand = True
+        while True:
+            token_type = self._state.token_type_at(index)
+            if expect_operand:
+                if token_type == TokenType.LEFT_PAREN:
+                    operators.append(_PARENTHESIS)
+                    open_parenthesis_count += 1
+                    index += 1
+                elif token_type in UNARY_OPERATOR_LEVELS:
+                    operators.append((UNARY_OPERATOR_LEVELS[token_type], index, UnaryOperationContext))
+                    index += 1
+                else:
+                    index = self._parse_operand(index, operators, operands)
+                    expect_operand = False
+            elif token_type in BINARY_OPERATOR_LEVELS:
+                level = BINARY_OPERATOR_LEVELS[token_type]
+                self._reduce(operators, operands, level)
+                operators.append((level, index, BinaryOperationContext))
+                expect_operand = True
+                index += 1
+            elif token_type == TokenType.RIGHT_PAREN and open_parenthesis_count > 0:
+                self._reduce(operators, operands, _PARENTHESIS[0])
+                operators.pop()
+                open_parenthesis_count -= 1
+                index += 1
+            else:
+                break
+
+        if open_parenthesis_count > 0:
+            raise SyntaxException(self._state.line_at(index), 'Left parenthesis missing closing right.')
+        self._reduce(operators, operands, _PARENTHESIS[0])
+        self._validate_end_of_expression(index, end_tokens)
+        self._state.set_current(index)
+        return operands[0]
+
+    def _parse_operand(self, index, operators, operands):
+        """
+        Parses the operand (literal, variable or function call) starting at the given index.
+
+        :param index: The index of the first token of the operand.
+        :param operators: The stack of pending operators.
+        :param operands: The stack of parsed operands the operand is pushed onto.
+        :return: The index of the token after the operand.
+        :raises SyntaxException: If there is no operand at the index.
+        """
+        token_type = self._state.token_type_at(index)
+        if token_type == TokenType.FUNCTION_CALL:
+            self._state.set_current(index)
+            operands.append(self._parser.parse_function_call())
+            return self._state.get_current()
+        if token_type in OPERAND_TYPES:
+            operands.append(self._parser.handle_token(index))
+            return index + 1
+
+        line_number = self._state.line_at(index)
+        if token_type in BINARY_OPERATOR_LEVELS:
+            raise SyntaxException(line_number, "Invalid expression: missing left operand.")
+        if operators and operators[-1] is not _PARENTHESIS:
+            raise SyntaxException(self._state.line_at(operators[-1][1]), "Invalid expression: missing right operand.")
+        raise SyntaxException(line_number, "Invalid expression: no valid operations found.")
+
+    def _reduce(self, operators, operands, level):
+        """
+        Builds the nodes of the pending operators binding tighter than the given level. Operators of the
+        same level are left pending so they group to the right.
+
+        :param operators: The stack of pending operators.
+        :param operands: The stack of parsed operands.
+        :param level: The level of the operator about to be pushed.
+        """
+        while operators and operators[-1][0] > level:
+            _, operator_index, context_class = operators.pop()
+            if context_class is UnaryOperationContext:
+                context = UnaryOperationContext(operands.pop())
+            else:
+                right_operand = operands.pop()
+                context = BinaryOperationContext(operands.pop(), right_operand)
+            operands.append(self._parser.handle_token(operator_index, context))
+
+    def _validate_end_of_expression(self, index, end_tokens):
+        """
+        Validates that the expression ends on a token that cannot be part of an expression, or one of the
+        expected end tokens.
+
+        :param index: The index of the token after the expression.
+        :param end_tokens: The tokens the expression is expected to end on.
+        :raises SyntaxException: If the token after the expression should have continued it.
+        """
+        token_type = self._state.token_type_at(index)
+        if token_type in end_tokens or token_type not in TokenType.valid_expression_types():
+            return
+        line_number = self._state.line_at(index)
+        if token_type == TokenType.RIGHT_PAREN:
+            raise SyntaxException(line_number, 'Right parenthesis missing corresponding left.')
+        raise SyntaxException(line_number, f"Invalid expression: unexpected token {token_type}.")
@@ -0,0 +1,39 @@
+from mojilang.parser.nodes import ConditionalNode, ElseNode, LoopNode, ReassignmentNode
+
+
+def is_scope_free(block_node):
+    """
+    Checks if a block can run in the scope of the block enclosing it instead of a new scope of its own,
+    without any observable difference.
+
+    The block must not declare variables or functions, since they would outlive it. It must not reassign
+    variables either, within it or within the blocks nested in it: a reassignment directly in the block
+    checks every scope up to the variable (while one directly in a function only checks the function's
+    scope), and a variable found two or more scopes up also reassigns the global variable of the same name
+    (see ScopeContext.reassign_value), so the scope of the block can change the effect of the reassignment.
+    Calling functions is fine, since a function can only reassign the variables of its callers from a block
+    of its own, already more than two scopes up from the variables.
+
+    :param block_node: The BlockNode.
+    :return: True if the block can run in the enclosing scope, False otherwise.
+    """
+    return not block_node.declares_variables() and not _reassigns_variables(block_node)
+
+
+def _reassigns_variables(block_node):
+    """
+    Checks if a block or a block nested in it (but not in a function declared in it) reassigns a variable.
+
+    :param block_node: The BlockNode.
+    :return: True if a reassignment runs in the block or in a block nested in it, False otherwise.
+    """
+    for node in block_node.get_nodes():
+        if isinstance(node, ReassignmentNode):
+            return True
+        if isinstance(node, LoopNode) and _reassigns_variables(node.get_block_node()):
+            return True
+        while isinstance(node, (ConditionalNode, ElseNode)):
+            if _reassigns_variables(node.get_block_node()):
+                return True
+            node = node.get_next_conditional_node() if isinstance(node, ConditionalNode) else None
+    return False
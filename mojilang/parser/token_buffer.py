@@ -0,0 +1,110 @@
+from array import array
+
+from mojilang.lexer import Token, TokenType
+
+# Every token type is stored in the buffer as its position in TokenType.
+TOKEN_TYPES = tuple(TokenType)
+TOKEN_TYPE_CODES = {token_type: code for code, token_type in enumerate(TOKEN_TYPES)}
+
+
+class TokenBuffer:
+    """
+    The TokenBuffer class is a columnar store for the tokens of a program.
+
+    Instead of a list of Token objects, the token type codes and line numbers are kept in compact
+    array('i') buffers and the lexemes and literals in side tables, one column per token attribute.
+    Scanning a range of tokens (e.g. for parentheses) then walks a contiguous buffer of machine
+    integers and never has to create or dereference Token objects. Token objects are only created
+    on demand by get_token.
+
+    Attributes:
+        _type_codes (array): The code of each token's type, see TOKEN_TYPE_CODES.
+        _lines (array): The line number of each token.
+        _lexemes (list): The lexeme of each token.
+        _literals (list): The literal value of each token, None for tokens without one.
+    """
+
+    def __init__(self, tokens=()):
+        """
+        Initializes the TokenBuffer with the given tokens.
+
+        :param tokens: The tokens to store.
+        """
+        self._type_codes = array('i')
+        self._lines = array('i')
+        self._lexemes = []
+        self._literals = []
+        self.extend(tokens)
+
+    def __len__(self):
+        return len(self._type_codes)
+
+    def append(self, token):
+        """
+        Adds a token to the end of the buffer.
+
+        :param token: The token to add.
+        """
+        self._type_codes.append(TOKEN_TYPE_CODES[token.get_token_type()])
+        self._lines.append(token.get_line())
+        self._lexemes.append(token.get_lexeme())
+        self._literals.append(token.get_literal())
+
+    def extend(self, tokens):
+        """
+        Adds tokens to the end of the buffer.
+
+        :param tokens: The tokens to add.
+        """
+        tokens = list(tokens)
+        self._type_codes.extend([TOKEN_TYPE_CODES[token.get_token_type()] for token in tokens])
+        self._lines.extend([token.get_line() for token in tokens])
+        self._lexemes.extend([token.get_lexeme() for token in tokens])
+        self._literals.extend([token.get_literal() for token in tokens])
+
+    def release(self, count):
+        """
+        Removes the first tokens of the buffer, shifting the index of every remaining token down.
+
+        :param count: The number of tokens to remove.
+        """
+        del self._type_codes[:count]
+        del self._lines[:count]
+        del self._lexemes[:count]
+        del self._literals[:count]
+
+    def get_token(self, index):
+        """
+        Creates the Token object for the token at the given index.
+
+        :param index: The index of the token.
+        :return: The token at the index.
+        """
+        return Token(
+            TOKEN_TYPES[self._type_codes[index]], self._lexemes[index], self._literals[index], self._lines[index]
+        )
+
+    def get_token_type(self, index):
+        return TOKEN_TYPES[self._type_codes[index]]
+
+    def get_type_code(self, index):
+        return self._type_codes[index]
+
+    def get_type_codes(self, start, stop):
+        """
+        Returns the type codes of a range of tokens.
+
+        :param start: The index of the first token of the range.
+        :param stop: The index after the last token of the range.
+        :return: An array of the type codes of the tokens in the range.
+        """
+        return self._type_codes[start:stop]
+
+    def get_line(self, index):
+        return self._lines[index]
+
+    def get_lexeme(self, index):
+        return self._lexemes[index]
+
+    def get_literal(self, index):
+        return self._literals[index]
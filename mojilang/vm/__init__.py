@@ -0,0 +1,17 @@
+from .bytecode_compiler import BytecodeCompiler
+from .call_site import CallSite
+from .code_object import CodeObject
+from .frame import Frame
+from .function import Function
+from .opcode import Opcode
+from .virtual_machine import VirtualMachine
+
+__all__ = [
+    'BytecodeCompiler',
+    'CallSite',
+    'CodeObject',
+    'Frame',
+    'Function',
+    'Opcode',
+    'VirtualMachine',
+]
@@ -0,0 +1,623 @@
+from mojilang.interpreter.scope import BlockScope
+from mojilang.parser.nodes import (
+    AdditionNode,
+    AndNode,
+    AssignmentNode,
+    BreakNode,
+    ConditionalNode,
+    ContinueNode,
+    DivisionNode,
+    EqualsNode,
+    ExponentNode,
+    FunctionCallNode,
+    FunctionNode,
+    GreaterEqualsNode,
+    GreaterNode,
+    InputNode,
+    LessEqualsNode,
+    LessNode,
+    LiteralNode,
+    LoopNode,
+    ModulusNode,
+    MultiplicationNode,
+    NotEqualsNode,
+    NotNode,
+    OrNode,
+    PrintNode,
+    ReassignmentNode,
+    ReturnNode,
+    SubtractionNode,
+    VariableNode,
+)
+from mojilang.compiler.python_compiler import MARKER_FREE_EXPRESSIONS
+from mojilang.compiler.runtime import BREAK, CONTINUE
+from mojilang.vm.call_site import CallSite
+from mojilang.vm.code_object import CodeObject
+from mojilang.vm.function import Function
+from mojilang.vm.opcode import Opcode
+
+BINARY_OPCODES = {
+    AdditionNode: Opcode.ADD,
+    SubtractionNode: Opcode.SUBTRACT,
+    MultiplicationNode: Opcode.MULTIPLY,
+    DivisionNode: Opcode.DIVIDE,
+    ModulusNode: Opcode.MODULUS,
+    ExponentNode: Opcode.EXPONENT,
+    EqualsNode: Opcode.EQUALS,
+    NotEqualsNode: Opcode.NOT_EQUALS,
+    LessNode: Opcode.LESS,
+    LessEqualsNode: Opcode.LESS_EQUALS,
+    GreaterNode: Opcode.GREATER,
+    GreaterEqualsNode: Opcode.GREATER_EQUALS,
+    AndNode: Opcode.AND,
+    OrNode: Opcode.OR,
+}
+# The jump skipping the right operand of each logical operation that short-circuits.
+SHORT_CIRCUIT_OPCODES = {
+    AndNode: Opcode.JUMP_IF_FALSE_OR_POP,
+    OrNode: Opcode.JUMP_IF_TRUE_OR_POP,
+}
+
+PROGRAM_NAME = '<program>'
+ALREADY_DECLARED = "Variable has already been declared. Cannot redeclare."
+NOT_DECLARED = "Variable has not been declared yet."
+
+# The merged instruction of a load followed by BINARY_CONST, of either of them followed by a store, and of the
+# former followed by JUMP_IF_FALSE, see Opcode.
+LOAD_BINARY_CONST_OPCODES = {
+    Opcode.LOAD_GLOBAL: Opcode.GLOBAL_BINARY_CONST,
+    Opcode.LOAD_LOCAL: Opcode.LOCAL_BINARY_CONST,
+}
+STORE_MERGED_OPCODES = {
+    (Opcode.LOAD_GLOBAL, Opcode.STORE_GLOBAL): Opcode.MOVE_GLOBAL,
+    (Opcode.LOAD_LOCAL, Opcode.STORE_LOCAL): Opcode.MOVE_LOCAL,
+    (Opcode.GLOBAL_BINARY_CONST, Opcode.STORE_GLOBAL): Opcode.UPDATE_GLOBAL,
+    (Opcode.LOCAL_BINARY_CONST, Opcode.STORE_LOCAL): Opcode.UPDATE_LOCAL,
+}
+JUMP_IF_NOT_LOAD_CONST_OPCODES = {
+    Opcode.GLOBAL_BINARY_CONST: Opcode.JUMP_IF_NOT_GLOBAL_CONST,
+    Opcode.LOCAL_BINARY_CONST: Opcode.JUMP_IF_NOT_LOCAL_CONST,
+}
+
+# Where a variable is stored, see Opcode.
+LOCAL = 'LOCAL'
+PARAMETER = 'PARAMETER'
+GLOBAL = 'GLOBAL'
+
+
+class BytecodeCompiler:
+    """
+    The BytecodeCompiler class compiles the Abstract Syntax Tree (AST) of a program into CodeObjects for the
+    VirtualMachine: one for the top level of the program and one per function declaration.
+
+    Every variable declared in a block of a function gets a slot of the function's frame, and every use of a
+    variable is resolved to the slot of the innermost declaration of the same name that has run by then,
+    i.e. that comes before the use in one of the enclosing blocks. Variables that are not declared in the
+    function by then belong to the calling frames, since Mojilang scopes are dynamic, so they are looked up
+    by name at run time. Declarations at the top level of the program are globals.
+
+    The compiled code keeps the semantics of the tree-walker exactly, quirks included: the value a block
+    completes with is kept in the value register like the PythonCompiler keeps it in its `value` local, and
+    the checks of AssignmentNode and ReassignmentNode are made against the same scopes, statically where
+    the resolution tells the outcome ahead of time.
+
+    Attributes:
+        _instructions (list): The instructions of the code being compiled, jump targets still as _Labels.
+        _slot_count (int): The number of slots of the code being compiled.
+        _scopes (list): The variables declared so far in each enclosing block, by name, outermost first.
+        _is_program (bool): Whether the code being compiled is the top level of the program.
+        _loops (list): The (end, start) labels of the enclosing loops of the code being compiled.
+        _jump_target (int): The position of the last _Label placed in the code being compiled. An instruction
+                            emitted there is never merged with the one before it, which the jump skips.
+        _outer_names (set): The names declared at the calls compiled so far, which a called function may find in
+                            the calling frames, see CodeObject.outer_names.
+    """
+
+    def __init__(self):
+        """
+        Initializes the BytecodeCompiler.
+        """
+        self._instructions = []
+        self._slot_count = 0
+        self._scopes = []
+        self._is_program = True
+        self._loops = []
+        self._jump_target = None
+        self._outer_names = set()
+
+    def compile(self, abstract_syntax_tree):
+        """
+        Compiles a program.
+
+        :param abstract_syntax_tree: The BlockNode at the root of the program.
+        :return: The CodeObject of the top level of the program.
+        """
+        self._outer_names = set()
+        self._start_code(is_program=True)
+        self._compile_block(abstract_syntax_tree.get_nodes(), BlockScope.GLOBAL)
+        self._emit(Opcode.RETURN)
+        code_object = self._finish_code(PROGRAM_NAME)
+        code_object.outer_names = frozenset(self._outer_names)
+        return code_object
+
+    def _start_code(self, is_program, argument_names=()):
+        """
+        Starts compiling a new CodeObject.
+
+        :param is_program: Whether the code is the top level of the program.
+        :param argument_names: The names of the function's arguments.
+        :return: The slot of each argument.
+        """
+        self._instructions = []
+        self._slot_count = 0
+        self._scopes = [{}]
+        self._is_program = is_program
+        self._loops = []
+        self._jump_target = None
+        argument_slots = []
+        for argument_name in argument_names:
+            # A repeated argument name is assigned twice, the last value wins like in FunctionNode.
+            binding = self._scopes[0].get(argument_name)
+            if binding is None:
+                binding = self._scopes[0][argument_name] = _Binding(PARAMETER, self._new_slot(), 0)
+            argument_slots.append(binding.slot)
+        return argument_slots
+
+    def _finish_code(self, name, argument_slots=()):
+        """
+        Resolves the jump targets of the code being compiled.
+
+        :param name: The name of the code.
+        :param argument_slots: The slot of each argument.
+        :return: The CodeObject.
+        """
+        instructions = []
+        for opcode, operand in self._instructions:
+            if isinstance(operand, _Label):
+                operand = operand.position
+            elif isinstance(operand, tuple):
+                operand = tuple(item.position if isinstance(item, _Label) else item for item in operand)
+            instructions.append((int(opcode), operand))
+        return CodeObject(name, instructions, self._slot_count, argument_slots)
+
+    def _compile_block(self, nodes, frame):
+        """
+        Compiles the statements of a block, up to the first one that always ends the block.
+
+        :param nodes: The statement nodes of the block.
+        :param frame: BlockScope.LOOP within a loop, BlockScope.FUNCTION within a function outside of any loop
+                      and BlockScope.GLOBAL otherwise.
+        """
+        for index, node in enumerate(nodes):
+            if self._compile_statement(node, frame, index == len(nodes) - 1):
+                break
+        if not nodes:
+            self._emit_value(None)
+
+    def _compile_scoped_block(self, block_node, frame):
+        """
+        Compiles a block run in a new scope.
+
+        :param block_node: The BlockNode.
+        :param frame: The frame of the block, see _compile_block.
+        """
+        self._scopes.append({})
+        self._compile_block(block_node.get_nodes(), frame)
+        self._scopes.pop()
+
+    def _compile_statement(self, node, frame, is_last):
+        """
+        Compiles a statement. Only the statements whose value can be observed store it in the value register:
+        the last statement of a block and statements that may complete with a break or continue marker.
+
+        :param node: The statement node.
+        :param frame: The frame of the block the statement is in, see _compile_block.
+        :param is_last: Whether the statement is the last one of its block.
+        :return: Whether the statement always ends its block.
+        """
+        if isinstance(node, ReturnNode):
+            self._compile_expression(node.get_return_value_node())
+            self._emit(Opcode.STORE_VALUE)
+            if not isinstance(node.get_return_value_node(), MARKER_FREE_EXPRESSIONS):
+                self._emit_marker_exit(frame)
+            return True
+        if isinstance(node, (BreakNode, ContinueNode)):
+            return self._compile_loop_control(node, frame)
+        if isinstance(node, ConditionalNode):
+            self._compile_conditional(node, frame, is_last)
+        elif isinstance(node, LoopNode):
+            self._compile_loop(node, frame, is_last)
+        elif isinstance(node, (PrintNode, AssignmentNode, FunctionNode)):
+            self._compile_simple_statement(node)
+            if is_last:
+                self._emit_value(None)
+        else:
+            self._compile_expression(node)
+            self._emit(Opcode.STORE_VALUE)
+            if not isinstance(node, MARKER_FREE_EXPRESSIONS):
+                self._emit_marker_exit(frame)
+        return False
+
+    def _compile_simple_statement(self, node):
+        """
+        Compiles a statement that always completes with None.
+
+        :param node: The PrintNode, AssignmentNode, ReassignmentNode or FunctionNode.
+        """
+        if isinstance(node, PrintNode):
+            self._compile_expression(node.get_node_to_print())
+            self._emit(Opcode.PRINT)
+        elif isinstance(node, ReassignmentNode):
+            self._compile_expression(node.get_value_node())
+            self._compile_reassignment(node.get_variable_node().get_name(), node.get_line_number())
+        elif isinstance(node, AssignmentNode):
+            self._compile_expression(node.get_value_node())
+            self._compile_declaration(node.get_variable_node().get_name(), node.get_line_number())
+        else:
+            self._emit(Opcode.LOAD_CONST, Function(self._compile_function(node)))
+            self._compile_function_declaration(node.get_function_name())
+
+    def _compile_declaration(self, variable_name, line_number):
+        """
+        Compiles the declaration of a variable with the value on top of the stack. It fails if the variable is
+        already declared in the current scope, see ScopeContext.current_scope_contains_variable.
+
+        :param variable_name: The name of the variable.
+        :param line_number: The line of the declaration.
+        """
+        level = len(self._scopes) - 1
+        scope = self._scopes[-1]
+        binding = scope.get(variable_name)
+        if level == 0 and self._is_program:
+            self._emit(Opcode.DECLARE_GLOBAL, (variable_name, line_number))
+            scope[variable_name] = _Binding(GLOBAL, None, 0)
+        elif level == 0:
+            # Only the function's own scope is checked at its top level.
+            if binding is None:
+                binding = _Binding(LOCAL, self._new_slot(), 0)
+                self._emit_store(Opcode.STORE_LOCAL, binding.slot)
+            elif binding.kind == PARAMETER:
+                self._emit(Opcode.DECLARE_PARAMETER, (binding.slot, line_number))
+            else:
+                self._emit(Opcode.RAISE, (ALREADY_DECLARED, line_number))
+            scope[variable_name] = _Binding(LOCAL, binding.slot, 0)
+        else:
+            # Within a loop or conditional, every enclosing scope is checked.
+            enclosing_binding = binding or self._resolve(variable_name)
+            slot = self._new_slot()
+            if enclosing_binding is None:
+                self._emit(Opcode.DECLARE_CHECKED, (slot, variable_name, line_number, None))
+            elif enclosing_binding.kind == PARAMETER:
+                self._emit(Opcode.DECLARE_CHECKED, (slot, variable_name, line_number, enclosing_binding.slot))
+            else:
+                self._emit(Opcode.RAISE, (ALREADY_DECLARED, line_number))
+            scope[variable_name] = _Binding(LOCAL, slot, level)
+
+    def _compile_reassignment(self, variable_name, line_number):
+        """
+        Compiles the reassignment of a variable to the value on top of the stack. It fails if the variable is
+        not declared in the current scope, see ScopeContext.current_scope_contains_variable, and it reassigns
+        the global of the same name too when the variable is declared two scopes out or more, exactly like
+        ScopeContext.reassign_value.
+
+        :param variable_name: The name of the variable.
+        :param line_number: The line of the reassignment.
+        """
+        level = len(self._scopes) - 1
+        binding = self._resolve(variable_name)
+        if binding is not None and binding.kind == GLOBAL:
+            self._emit_store(Opcode.STORE_GLOBAL, variable_name)
+        elif level == 0 and binding is None and not self._is_program:
+            # Only the function's own scope is checked at its top level.
+            self._emit(Opcode.RAISE, (NOT_DECLARED, line_number))
+        elif binding is None:
+            self._emit(Opcode.REASSIGN_OUTER, (variable_name, line_number, level + 1))
+        elif binding.kind == PARAMETER:
+            self._emit(Opcode.REASSIGN_PARAMETER, (binding.slot, variable_name, line_number, level + 1))
+        elif level - binding.level < 2:
+            self._emit_store(Opcode.STORE_LOCAL, binding.slot)
+        else:
+            self._emit(Opcode.REASSIGN_DEEP, (binding.slot, variable_name))
+
+    def _compile_function_declaration(self, function_name):
+        """
+        Compiles the assignment of the function on top of the stack to its name, which is never checked, see
+        FunctionNode.
+
+        :param function_name: The name of the function.
+        """
+        scope = self._scopes[-1]
+        if len(self._scopes) == 1 and self._is_program:
+            self._emit(Opcode.STORE_GLOBAL, function_name)
+            scope[function_name] = _Binding(GLOBAL, None, 0)
+            return
+        binding = scope.get(function_name)
+        slot = self._new_slot() if binding is None else binding.slot
+        self._emit(Opcode.STORE_LOCAL, slot)
+        scope[function_name] = _Binding(LOCAL, slot, len(self._scopes) - 1)
+
+    def _compile_function(self, node):
+        """
+        Compiles the body of a function into a CodeObject of its own.
+
+        :param node: The FunctionNode.
+        :return: The CodeObject.
+        """
+        enclosing_code = (
+            self._instructions, self._slot_count, self._scopes, self._is_program, self._loops, self._jump_target
+        )
+        argument_slots = self._start_code(is_program=False, argument_names=node.get_argument_names())
+        self._compile_block(node.get_function_block_node().get_nodes(), BlockScope.FUNCTION)
+        self._emit(Opcode.RETURN)
+        code_object = self._finish_code(node.get_function_name(), argument_slots)
+        (
+            self._instructions, self._slot_count, self._scopes, self._is_program, self._loops, self._jump_target
+        ) = enclosing_code
+        return code_object
+
+    def _compile_loop_control(self, node, frame):
+        """
+        Compiles a break or continue, which ends the blocks up to the loop. Outside of a loop it is a statement
+        like any other, while a function called within a loop ends the loop it is called in.
+
+        :param node: The BreakNode or ContinueNode.
+        :param frame: The frame of the block the statement is in, see _compile_block.
+        :return: Whether the statement always ends its block.
+        """
+        is_break = isinstance(node, BreakNode)
+        self._emit_value(BREAK if is_break else CONTINUE)
+        if frame == BlockScope.LOOP:
+            end, start = self._loops[-1]
+            self._emit_jump(end if is_break else start)
+            return True
+        if frame == BlockScope.FUNCTION:
+            self._emit(Opcode.RETURN_IF_MARKER)
+        return False
+
+    def _compile_conditional(self, node, frame, is_last):
+        """
+        Compiles a chain of conditionals, each block in its own scope.
+
+        :param node: The IfNode or ElseIfNode.
+        :param frame: The frame of the block the conditional is in, see _compile_block.
+        :param is_last: Whether the conditional is the last statement of its block, in which case it stores
+                        None when no block runs.
+        """
+        end = _Label()
+        while node is not None:
+            next_condition = _Label()
+            self._compile_expression(node.get_condition_node())
+            self._emit_jump_if_false(next_condition)
+            self._compile_scoped_block(node.get_block_node(), frame)
+            next_node = node.get_next_conditional_node()
+            if next_node is not None or is_last:
+                self._emit_jump(end)
+            self._place(next_condition)
+            if next_node is None:
+                if is_last:
+                    self._emit_value(None)
+                node = None
+            elif isinstance(next_node, ConditionalNode):
+                node = next_node
+            else:
+                self._compile_scoped_block(next_node.get_block_node(), frame)
+                node = None
+        self._place(end)
+
+    def _compile_loop(self, node, frame, is_last):
+        """
+        Compiles a loop, each iteration in its own scope.
+
+        :param node: The LoopNode.
+        :param frame: The frame of the block the loop is in, see _compile_block.
+        :param is_last: Whether the loop is the last statement of its block.
+        """
+        # The value is None when the loop does not run, it is checked below unless at the top level.
+        if is_last or frame != BlockScope.GLOBAL:
+            self._emit_value(None)
+        start, end = _Label(), _Label()
+        self._place(start)
+        self._compile_expression(node.get_condition_node())
+        self._emit_jump_if_false(end)
+        self._loops.append((end, start))
+        self._compile_scoped_block(node.get_block_node(), BlockScope.LOOP)
+        self._loops.pop()
+        self._emit_jump(start)
+        self._place(end)
+        # A loop ending with a break or continue passes the marker on, like LoopNode does.
+        self._emit_marker_exit(frame)
+
+    def _compile_expression(self, node):
+        """
+        Compiles an expression, which pushes its value.
+
+        :param node: The expression node.
+        """
+        node_type = type(node)
+        if isinstance(node, LiteralNode):
+            self._emit(Opcode.LOAD_CONST, node.get_value())
+        elif node_type is VariableNode:
+            self._compile_load(node.get_name(), node.get_line_number())
+        elif node_type in SHORT_CIRCUIT_OPCODES and node.is_short_circuit():
+            # The left operand is the value of the operation when it decides the result.
+            end = _Label()
+            self._compile_expression(node.get_left_operand())
+            self._emit(SHORT_CIRCUIT_OPCODES[node_type], end)
+            self._compile_expression(node.get_right_operand())
+            self._place(end)
+        elif node_type in BINARY_OPCODES:
+            self._compile_expression(node.get_left_operand())
+            self._compile_expression(node.get_right_operand())
+            self._emit_binary_operation(BINARY_OPCODES[node_type])
+        elif node_type is NotNode:
+            self._compile_expression(node.get_condition_node())
+            self._emit(Opcode.NOT)
+        elif node_type is FunctionCallNode:
+            # An undefined function is only reported once the arguments are evaluated, see FunctionCallNode.
+            self._compile_load(node.get_function_name(), None)
+            for argument in node.get_arguments():
+                self._compile_expression(argument)
+            self._emit(Opcode.CALL, (len(node.get_arguments()), self._call_site()))
+        elif node_type is InputNode:
+            self._emit(Opcode.INPUT, node.get_input_message())
+        else:
+            raise TypeError(f"Cannot compile {node_type.__name__} to bytecode.")
+
+    def _compile_load(self, variable_name, line_number):
+        """
+        Compiles the load of a variable.
+
+        :param variable_name: The name of the variable.
+        :param line_number: The line of the variable, None to load None if it is undefined.
+        """
+        binding = self._resolve(variable_name)
+        if binding is None:
+            self._emit(Opcode.LOAD_OUTER, (variable_name, line_number))
+        elif binding.kind == GLOBAL:
+            self._emit(Opcode.LOAD_GLOBAL, variable_name)
+        elif binding.kind == PARAMETER:
+            self._emit(Opcode.LOAD_PARAMETER, (binding.slot, variable_name, line_number))
+        else:
+            self._emit(Opcode.LOAD_LOCAL, binding.slot)
+
+    def _call_site(self):
+        """
+        Describes the current point of the code being compiled for the functions called from it.
+
+        :return: The CallSite.
+        """
+        level = len(self._scopes) - 1
+        names = {}
+        distances = {}
+        for scope in self._scopes:
+            for variable_name, binding in scope.items():
+                if binding.kind != GLOBAL:
+                    names[variable_name] = binding.slot
+                    distances[variable_name] = level - binding.level
+        self._outer_names.update(names)
+        return CallSite(names, distances, level + 1, bool(self._loops))
+
+    def _resolve(self, variable_name):
+        """
+        Finds the innermost declaration of a variable that has run by the current point of the code.
+
+        :param variable_name: The name of the variable.
+        :return: The _Binding, or None if the variable is not declared in the code by then.
+        """
+        for scope in reversed(self._scopes):
+            binding = scope.get(variable_name)
+            if binding is not None:
+                return binding
+        return None
+
+    def _emit_marker_exit(self, frame):
+        """
+        Emits the instruction ending the blocks up to the loop or function when the value register holds a
+        break or continue marker.
+
+        :param frame: The frame of the block, see _compile_block.
+        """
+        if frame == BlockScope.LOOP:
+            self._emit(Opcode.EXIT_IF_MARKER, self._loops[-1])
+        elif frame == BlockScope.FUNCTION:
+            self._emit(Opcode.RETURN_IF_MARKER)
+        # Nothing at the top level of the program is within a loop.
+
+    def _emit_binary_operation(self, opcode):
+        """
+        Emits a binary operation, merged with the load of its right operand if it is a constant, and then with
+        the load of its left operand if it is a global or local variable.
+
+        :param opcode: The opcode of the operation.
+        """
+        previous_opcode, previous_operand = self._instructions[-1]
+        if previous_opcode != Opcode.LOAD_CONST or self._jump_target == len(self._instructions):
+            self._emit(opcode)
+            return
+        self._instructions[-1] = (Opcode.BINARY_CONST, (int(opcode), previous_operand))
+        load_opcode, load_operand = self._instructions[-2]
+        if load_opcode in LOAD_BINARY_CONST_OPCODES and self._jump_target != len(self._instructions) - 1:
+            self._instructions[-2:] = [
+                (LOAD_BINARY_CONST_OPCODES[load_opcode], (load_operand, int(opcode), previous_operand))
+            ]
+
+    def _emit_jump_if_false(self, target):
+        """
+        Emits a jump taken when the condition on top of the stack is falsy, merged with the binary operation
+        computing the condition if any.
+
+        :param target: The _Label to jump to.
+        """
+        previous_opcode, previous_operand = self._instructions[-1]
+        if self._jump_target == len(self._instructions):
+            self._emit(Opcode.JUMP_IF_FALSE, target)
+        elif previous_opcode in BINARY_OPCODES.values():
+            self._instructions[-1] = (Opcode.JUMP_IF_NOT, (int(previous_opcode), target))
+        elif previous_opcode == Opcode.BINARY_CONST:
+            self._instructions[-1] = (Opcode.JUMP_IF_NOT_CONST, (*previous_operand, target))
+        elif previous_opcode in JUMP_IF_NOT_LOAD_CONST_OPCODES:
+            self._instructions[-1] = (JUMP_IF_NOT_LOAD_CONST_OPCODES[previous_opcode], (*previous_operand, target))
+        else:
+            self._emit(Opcode.JUMP_IF_FALSE, target)
+
+    def _emit_store(self, opcode, operand):
+        """
+        Emits a store of the value on top of the stack, merged with the instruction computing the value if it
+        is a load of the same kind of variable, on its own or followed by BINARY_CONST.
+
+        :param opcode: STORE_GLOBAL or STORE_LOCAL.
+        :param operand: The name or slot of the variable.
+        """
+        previous_opcode, previous_operand = self._instructions[-1]
+        merged_opcode = STORE_MERGED_OPCODES.get((previous_opcode, opcode))
+        if merged_opcode is None or self._jump_target == len(self._instructions):
+            self._emit(opcode, operand)
+        elif previous_opcode in LOAD_BINARY_CONST_OPCODES:
+            self._instructions[-1] = (merged_opcode, (previous_operand, operand))
+        else:
+            self._instructions[-1] = (merged_opcode, (*previous_operand, operand))
+
+    def _emit_jump(self, target):
+        """
+        Emits a jump, merged with the instruction setting the value register before it if any.
+
+        :param target: The _Label to jump to.
+        """
+        previous_opcode, previous_operand = self._instructions[-1]
+        if previous_opcode == Opcode.SET_VALUE and self._jump_target != len(self._instructions):
+            self._instructions[-1] = (Opcode.SET_VALUE_AND_JUMP, (previous_operand, target))
+        else:
+            self._emit(Opcode.JUMP, target)
+
+    def _emit_value(self, value):
+        self._emit(Opcode.SET_VALUE, value)
+
+    def _emit(self, opcode, operand=None):
+        self._instructions.append((opcode, operand))
+
+    def _place(self, label):
+        label.position = self._jump_target = len(self._instructions)
+
+    def _new_slot(self):
+        self._slot_count += 1
+        return self._slot_count - 1
+
+
+class _Label:
+    """A jump target, placed once the instruction it points to is known."""
+
+    __slots__ = ('position',)
+
+    def __init__(self):
+        self.position = None
+
+
+class _Binding:
+    """Where a declared variable is stored: its kind, its slot and the level of the block it is declared in."""
+
+    __slots__ = ('kind', 'slot', 'level')
+
+    def __init__(self, kind, slot, level):
+        self.kind = kind
+        self.slot = slot
+        self.level = level
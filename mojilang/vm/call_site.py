@@ -0,0 +1,28 @@
+class CallSite:
+    """
+    The CallSite class describes the point a function is called from, so the called function can look up
+    and reassign the variables of the calling frame that are declared at that point, exactly like it would
+    walk up the chain of scope contexts in the tree-walker.
+
+    Attributes:
+        names (dict): The slot of each variable declared at the call, the innermost one for shadowed names.
+        distances (dict): The number of blocks between the call and the block each variable is declared in.
+        depth (int): The number of scopes of the calling frame at the call, i.e. its block nesting plus one.
+        in_loop (bool): Whether the call is within a loop of the calling frame.
+    """
+
+    __slots__ = ('names', 'distances', 'depth', 'in_loop')
+
+    def __init__(self, names, distances, depth, in_loop):
+        """
+        Initializes the CallSite.
+
+        :param names: The slot of each variable declared at the call.
+        :param distances: The number of blocks between the call and the block each variable is declared in.
+        :param depth: The number of scopes of the calling frame at the call.
+        :param in_loop: Whether the call is within a loop of the calling frame.
+        """
+        self.names = names
+        self.distances = distances
+        self.depth = depth
+        self.in_loop = in_loop
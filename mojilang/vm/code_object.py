@@ -0,0 +1,71 @@
+from mojilang.vm.opcode import Opcode
+
+# The opcodes whose operand holds another opcode among their own operands, by the position of that opcode.
+MERGED_OPCODES = {
+    Opcode.BINARY_CONST: 0,
+    Opcode.JUMP_IF_NOT: 0,
+    Opcode.JUMP_IF_NOT_CONST: 0,
+    Opcode.GLOBAL_BINARY_CONST: 1,
+    Opcode.LOCAL_BINARY_CONST: 1,
+    Opcode.UPDATE_GLOBAL: 1,
+    Opcode.UPDATE_LOCAL: 1,
+    Opcode.JUMP_IF_NOT_GLOBAL_CONST: 1,
+    Opcode.JUMP_IF_NOT_LOCAL_CONST: 1,
+}
+
+
+class CodeObject:
+    """
+    The CodeObject class holds the compiled instructions of the top level of a program or of a function,
+    along with what the virtual machine needs to know to set up a frame running them.
+
+    Attributes:
+        name (str): The name of the function, or '<program>' for the top level of a program.
+        instructions (tuple): The (opcode, operand) pairs, jump targets are indices into this tuple.
+        slot_count (int): The number of local variable slots a frame running the code needs.
+        argument_slots (tuple): The slot of each argument, in the order of the function's arguments.
+        outer_names (frozenset): The names a calling frame may declare, i.e. that are declared at one of the calls
+                                 of the program, so the variables of other names are only looked up in the globals.
+                                 None if unknown, for the code of a function, which looks every name up through the
+                                 calling frames.
+    """
+
+    __slots__ = ('name', 'instructions', 'slot_count', 'argument_slots', 'outer_names')
+
+    def __init__(self, name, instructions, slot_count, argument_slots=(), outer_names=None):
+        """
+        Initializes the CodeObject.
+
+        :param name: The name of the function, or '<program>' for the top level of a program.
+        :param instructions: The (opcode, operand) pairs.
+        :param slot_count: The number of local variable slots.
+        :param argument_slots: The slot of each argument.
+        :param outer_names: The names a calling frame may declare, None if unknown.
+        """
+        self.name = name
+        self.instructions = tuple(instructions)
+        self.slot_count = slot_count
+        self.argument_slots = tuple(argument_slots)
+        self.outer_names = outer_names
+
+    def disassemble(self):
+        """
+        Lists the instructions in a human readable form, one per line.
+
+        :return: The listing, e.g. '0 LOAD_CONST 1.0'.
+        """
+        lines = []
+        for index, (opcode, operand) in enumerate(self.instructions):
+            opcode = Opcode(opcode)
+            line = f'{index} {opcode.name}'
+            if opcode in MERGED_OPCODES:
+                position = MERGED_OPCODES[opcode]
+                items = [Opcode(item).name if i == position else repr(item) for i, item in enumerate(operand)]
+                line += ' ' + ' '.join(items)
+            elif operand is not None or opcode in (Opcode.LOAD_CONST, Opcode.SET_VALUE):
+                line += f' {operand!r}'
+            lines.append(line)
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return f'<code {self.name}>'
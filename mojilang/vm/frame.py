@@ -0,0 +1,34 @@
+class Frame:
+    """
+    The Frame class holds the state of a running call: the local variable slots, and where to resume the
+    frame once the function it calls returns. The operands of all frames live on a single stack.
+
+    Attributes:
+        code_object (CodeObject): The code the frame runs.
+        slots (list): The local variable slots, UNSET for arguments the call did not pass.
+        caller (Frame): The calling frame, None for the top level of the program.
+        call_site (CallSite): The point of the calling frame the call was made from.
+        in_loop (bool): Whether the call is within a loop, of the calling frame or of one of its callers.
+        pc (int): The index of the instruction to resume at.
+        value (object): The value register.
+    """
+
+    __slots__ = ('code_object', 'slots', 'caller', 'call_site', 'in_loop', 'pc', 'value')
+
+    def __init__(self, code_object, slots, caller=None, call_site=None, in_loop=False):
+        """
+        Initializes the Frame.
+
+        :param code_object: The code the frame runs.
+        :param slots: The local variable slots.
+        :param caller: The calling frame.
+        :param call_site: The point of the calling frame the call was made from.
+        :param in_loop: Whether the call is within a loop.
+        """
+        self.code_object = code_object
+        self.slots = slots
+        self.caller = caller
+        self.call_site = call_site
+        self.in_loop = in_loop
+        self.pc = 0
+        self.value = None
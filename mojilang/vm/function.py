@@ -0,0 +1,25 @@
+class Function:
+    """
+    The Function class is the value a Mojilang function declaration assigns to the function's name when the
+    program is run by the virtual machine. Since Mojilang scopes are dynamic, a function captures nothing
+    but its code.
+
+    Attributes:
+        code_object (CodeObject): The compiled body of the function.
+    """
+
+    __slots__ = ('code_object',)
+
+    def __init__(self, code_object):
+        """
+        Initializes the Function.
+
+        :param code_object: The compiled body of the function.
+        """
+        self.code_object = code_object
+
+    def get_function_name(self):
+        return self.code_object.name
+
+    def __repr__(self):
+        return f'<function {self.code_object.name}>'
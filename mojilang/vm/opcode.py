@@ -0,0 +1,90 @@
+from enum import IntEnum
+
+
+class Opcode(IntEnum):
+    """
+    The Opcode Enum defines the instruction set of the Mojilang virtual machine.
+
+    Every instruction is a pair of an opcode and a single operand (None, a value or a tuple of values). Some
+    instructions stand for a common sequence of others, so the dispatch loop runs fewer instructions.
+    Instructions work on the operand stack of the running frame: they pop their inputs from it and push
+    their result onto it. Besides the stack, a frame has an array of local variable slots and a value
+    register holding the value the running block completes with, see BlockNode.
+
+    Variables are loaded and stored according to where the compiler resolved them:
+        LOCAL: A slot of the running frame, declared in one of the enclosing blocks of the same function.
+        PARAMETER: The slot of an argument, which is only declared if the call passed a value for it.
+        OUTER: A variable of one of the calling frames, looked up by name at the point they made the call.
+        GLOBAL: A variable declared at the top level of the program, before the instruction runs.
+    A load with a None line number pushes None for an undefined variable instead of raising.
+    """
+
+    # Constants and variables
+    LOAD_CONST = 0          # value: push the value
+    LOAD_LOCAL = 1          # slot: push the slot's value
+    LOAD_PARAMETER = 2      # (slot, name, line): push the argument, or the outer variable if it was not passed
+    LOAD_OUTER = 3          # (name, line): push the variable of the calling frames, or the global
+    LOAD_GLOBAL = 4         # name: push the global, declared by then
+    STORE_LOCAL = 5         # slot: pop a value into the slot
+    STORE_GLOBAL = 6        # name: pop a value into the global
+    DECLARE_PARAMETER = 7   # (slot, line): pop a value into the argument slot, unless the argument was passed
+    DECLARE_CHECKED = 8     # (slot, name, line, guard_slot): pop a value into the slot, unless the variable is
+                            # declared in the guard slot, the calling frames or the globals
+    DECLARE_GLOBAL = 9      # (name, line): pop a value into the global, unless it is already declared
+    REASSIGN_DEEP = 10      # (slot, name): pop a value into the slot, and into the global of the same name if any
+    REASSIGN_PARAMETER = 11  # (slot, name, line, depth): pop a value into the argument, or into the outer
+                             # variable if it was not passed
+    REASSIGN_OUTER = 12     # (name, line, depth): pop a value into the variable of the calling frames, or into
+                            # the global
+    RAISE = 13              # (message, line): pop a value and raise a RuntimeException
+
+    # Operations, the right operand is on top of the left one
+    ADD = 14
+    SUBTRACT = 15
+    MULTIPLY = 16
+    DIVIDE = 17
+    MODULUS = 18
+    EXPONENT = 19
+    EQUALS = 20
+    NOT_EQUALS = 21
+    LESS = 22
+    LESS_EQUALS = 23
+    GREATER = 24
+    GREATER_EQUALS = 25
+    AND = 26
+    OR = 27
+    NOT = 28
+    BINARY_CONST = 29       # (opcode, constant): the operation of the opcode with the constant as its right operand
+
+    # Input and output
+    PRINT = 30              # None: pop a value and print it
+    INPUT = 31              # message: push a line read from the standard input
+
+    # Control flow
+    JUMP = 32               # target: continue at the target instruction
+    JUMP_IF_FALSE = 33      # target: pop a value and continue at the target instruction if it is falsy
+    JUMP_IF_NOT = 34        # (opcode, target): the operation of the opcode followed by JUMP_IF_FALSE
+    JUMP_IF_NOT_CONST = 35  # (opcode, constant, target): BINARY_CONST followed by JUMP_IF_FALSE
+    STORE_VALUE = 36        # None: pop a value into the value register
+    SET_VALUE = 37          # value: set the value register to the value
+    EXIT_IF_MARKER = 38     # (break_target, continue_target): continue at the target of the break or continue
+                            # marker in the value register, if any
+    RETURN_IF_MARKER = 39   # None: return the value register if it holds a marker and the call is within a loop
+    CALL = 40               # (argument_count, call_site): pop the arguments and the function and call it
+    RETURN = 41             # None: return the value register to the calling frame
+    JUMP_IF_FALSE_OR_POP = 42  # target: continue at the target instruction if the value on top of the stack is
+                               # falsy, pop it otherwise
+    JUMP_IF_TRUE_OR_POP = 43   # target: continue at the target instruction if the value on top of the stack is
+                               # truthy, pop it otherwise
+
+    # Loads and stores merged with the operations of the hot paths of loops
+    GLOBAL_BINARY_CONST = 44  # (name, opcode, constant): LOAD_GLOBAL followed by BINARY_CONST
+    LOCAL_BINARY_CONST = 45   # (slot, opcode, constant): LOAD_LOCAL followed by BINARY_CONST
+    UPDATE_GLOBAL = 46        # (name, opcode, constant, target_name): GLOBAL_BINARY_CONST followed by STORE_GLOBAL
+    UPDATE_LOCAL = 47         # (slot, opcode, constant, target_slot): LOCAL_BINARY_CONST followed by STORE_LOCAL
+    JUMP_IF_NOT_GLOBAL_CONST = 48  # (name, opcode, constant, target): GLOBAL_BINARY_CONST followed by
+                                   # JUMP_IF_FALSE
+    JUMP_IF_NOT_LOCAL_CONST = 49   # (slot, opcode, constant, target): LOCAL_BINARY_CONST followed by JUMP_IF_FALSE
+    SET_VALUE_AND_JUMP = 50   # (value, target): SET_VALUE followed by JUMP
+    MOVE_GLOBAL = 51          # (name, target_name): LOAD_GLOBAL followed by STORE_GLOBAL
+    MOVE_LOCAL = 52           # (slot, target_slot): LOAD_LOCAL followed by STORE_LOCAL
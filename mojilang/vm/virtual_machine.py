@@ -0,0 +1,371 @@
+import operator
+
+from mojilang.lexer import SyntaxException
+from mojilang.parser.runtime_exception import RuntimeException
+from mojilang.compiler.runtime import BREAK, CONTINUE, divide, logical_and, logical_or, print_value
+from mojilang.vm.frame import Frame
+from mojilang.vm.function import Function
+from mojilang.vm.opcode import Opcode
+
+# The opcodes as plain ints, which the dispatch loop compares faster than Opcode members.
+LOAD_CONST = int(Opcode.LOAD_CONST)
+LOAD_LOCAL = int(Opcode.LOAD_LOCAL)
+LOAD_PARAMETER = int(Opcode.LOAD_PARAMETER)
+LOAD_OUTER = int(Opcode.LOAD_OUTER)
+LOAD_GLOBAL = int(Opcode.LOAD_GLOBAL)
+STORE_LOCAL = int(Opcode.STORE_LOCAL)
+STORE_GLOBAL = int(Opcode.STORE_GLOBAL)
+DECLARE_PARAMETER = int(Opcode.DECLARE_PARAMETER)
+DECLARE_CHECKED = int(Opcode.DECLARE_CHECKED)
+DECLARE_GLOBAL = int(Opcode.DECLARE_GLOBAL)
+REASSIGN_DEEP = int(Opcode.REASSIGN_DEEP)
+REASSIGN_PARAMETER = int(Opcode.REASSIGN_PARAMETER)
+REASSIGN_OUTER = int(Opcode.REASSIGN_OUTER)
+RAISE = int(Opcode.RAISE)
+ADD = int(Opcode.ADD)
+SUBTRACT = int(Opcode.SUBTRACT)
+MULTIPLY = int(Opcode.MULTIPLY)
+DIVIDE = int(Opcode.DIVIDE)
+MODULUS = int(Opcode.MODULUS)
+EXPONENT = int(Opcode.EXPONENT)
+EQUALS = int(Opcode.EQUALS)
+NOT_EQUALS = int(Opcode.NOT_EQUALS)
+LESS = int(Opcode.LESS)
+LESS_EQUALS = int(Opcode.LESS_EQUALS)
+GREATER = int(Opcode.GREATER)
+GREATER_EQUALS = int(Opcode.GREATER_EQUALS)
+AND = int(Opcode.AND)
+OR = int(Opcode.OR)
+NOT = int(Opcode.NOT)
+BINARY_CONST = int(Opcode.BINARY_CONST)
+PRINT = int(Opcode.PRINT)
+INPUT = int(Opcode.INPUT)
+JUMP = int(Opcode.JUMP)
+JUMP_IF_FALSE = int(Opcode.JUMP_IF_FALSE)
+JUMP_IF_NOT = int(Opcode.JUMP_IF_NOT)
+JUMP_IF_NOT_CONST = int(Opcode.JUMP_IF_NOT_CONST)
+STORE_VALUE = int(Opcode.STORE_VALUE)
+SET_VALUE = int(Opcode.SET_VALUE)
+EXIT_IF_MARKER = int(Opcode.EXIT_IF_MARKER)
+RETURN_IF_MARKER = int(Opcode.RETURN_IF_MARKER)
+CALL = int(Opcode.CALL)
+RETURN = int(Opcode.RETURN)
+JUMP_IF_FALSE_OR_POP = int(Opcode.JUMP_IF_FALSE_OR_POP)
+JUMP_IF_TRUE_OR_POP = int(Opcode.JUMP_IF_TRUE_OR_POP)
+GLOBAL_BINARY_CONST = int(Opcode.GLOBAL_BINARY_CONST)
+LOCAL_BINARY_CONST = int(Opcode.LOCAL_BINARY_CONST)
+UPDATE_GLOBAL = int(Opcode.UPDATE_GLOBAL)
+UPDATE_LOCAL = int(Opcode.UPDATE_LOCAL)
+JUMP_IF_NOT_GLOBAL_CONST = int(Opcode.JUMP_IF_NOT_GLOBAL_CONST)
+JUMP_IF_NOT_LOCAL_CONST = int(Opcode.JUMP_IF_NOT_LOCAL_CONST)
+SET_VALUE_AND_JUMP = int(Opcode.SET_VALUE_AND_JUMP)
+MOVE_GLOBAL = int(Opcode.MOVE_GLOBAL)
+MOVE_LOCAL = int(Opcode.MOVE_LOCAL)
+
+# The operation of each binary opcode, see Opcode.
+BINARY_OPERATIONS = {
+    int(Opcode.ADD): operator.add,
+    int(Opcode.SUBTRACT): operator.sub,
+    int(Opcode.MULTIPLY): operator.mul,
+    int(Opcode.DIVIDE): divide,
+    int(Opcode.MODULUS): operator.mod,
+    int(Opcode.EXPONENT): operator.pow,
+    int(Opcode.EQUALS): operator.eq,
+    int(Opcode.NOT_EQUALS): operator.ne,
+    int(Opcode.LESS): operator.lt,
+    int(Opcode.LESS_EQUALS): operator.le,
+    int(Opcode.GREATER): operator.gt,
+    int(Opcode.GREATER_EQUALS): operator.ge,
+    int(Opcode.AND): logical_and,
+    int(Opcode.OR): logical_or,
+}
+
+# The value of the slot of an argument the call did not pass, or of a variable that is not declared.
+UNSET = object()
+
+
+class VirtualMachine:
+    """
+    The VirtualMachine class runs the CodeObjects of the BytecodeCompiler in a single dispatch loop.
+
+    Each call gets a Frame with an array of local variable slots instead of a chain of scope dictionaries,
+    and calls and returns switch frames within the loop rather than recursing into Python, so deep Mojilang
+    recursion is only limited by memory. Variables of the calling frames are looked up by name through the
+    CallSite of each call, exactly like the tree-walker walks up the chain of scope contexts. A name no call of
+    the program declares (see CodeObject.outer_names), e.g. the name of a function calling itself, is only looked
+    up in the globals, so looking it up does not take longer the deeper the recursion.
+
+    Attributes:
+        _global_variables (dict): The variables declared at the top level of the program.
+    """
+
+    def __init__(self, global_variables=None):
+        """
+        Initializes the VirtualMachine.
+
+        :param global_variables: The variables declared at the top level of the program. Defaults to an empty
+                                 dictionary.
+        """
+        self._global_variables = {} if global_variables is None else global_variables
+
+    def run(self, code_object):
+        """
+        Runs the top level of a program.
+
+        :param code_object: The CodeObject of the top level of the program.
+        :return: The value the top level of the program completes with.
+        :raises SyntaxException: If an undefined variable is used.
+        :raises RuntimeException: If a variable is declared twice or reassigned before being declared.
+        """
+        global_variables = self._global_variables
+        outer_names = code_object.outer_names
+        frame = Frame(code_object, [UNSET] * code_object.slot_count)
+        instructions = code_object.instructions
+        slots = frame.slots
+        # The frames share the operand stack, a call leaves the caller's operands below its own.
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        value = None
+        in_loop = False
+        pc = 0
+        # The instructions are tested roughly from the most to the least frequently run.
+        while True:
+            opcode, operand = instructions[pc]
+            pc += 1
+            if opcode == LOAD_LOCAL:
+                push(slots[operand])
+            elif opcode == LOAD_GLOBAL:
+                push(global_variables[operand])
+            elif opcode == GLOBAL_BINARY_CONST:
+                variable_name, operation, constant = operand
+                push(BINARY_OPERATIONS[operation](global_variables[variable_name], constant))
+            elif opcode == LOCAL_BINARY_CONST:
+                slot, operation, constant = operand
+                push(BINARY_OPERATIONS[operation](slots[slot], constant))
+            elif ADD <= opcode <= OR:
+                right = pop()
+                stack[-1] = BINARY_OPERATIONS[opcode](stack[-1], right)
+            elif opcode == LOAD_CONST:
+                push(operand)
+            elif opcode == BINARY_CONST:
+                operation, constant = operand
+                stack[-1] = BINARY_OPERATIONS[operation](stack[-1], constant)
+            elif opcode == STORE_GLOBAL:
+                global_variables[operand] = pop()
+            elif opcode == STORE_LOCAL:
+                slots[operand] = pop()
+            elif opcode == MOVE_GLOBAL:
+                variable_name, target_name = operand
+                global_variables[target_name] = global_variables[variable_name]
+            elif opcode == MOVE_LOCAL:
+                slot, target_slot = operand
+                slots[target_slot] = slots[slot]
+            elif opcode == UPDATE_GLOBAL:
+                variable_name, operation, constant, target_name = operand
+                global_variables[target_name] = BINARY_OPERATIONS[operation](global_variables[variable_name], constant)
+            elif opcode == UPDATE_LOCAL:
+                slot, operation, constant, target_slot = operand
+                slots[target_slot] = BINARY_OPERATIONS[operation](slots[slot], constant)
+            elif opcode == SET_VALUE_AND_JUMP:
+                value, pc = operand
+            elif opcode == JUMP_IF_NOT_GLOBAL_CONST:
+                variable_name, operation, constant, target = operand
+                if not BINARY_OPERATIONS[operation](global_variables[variable_name], constant):
+                    pc = target
+            elif opcode == JUMP_IF_NOT_LOCAL_CONST:
+                slot, operation, constant, target = operand
+                if not BINARY_OPERATIONS[operation](slots[slot], constant):
+                    pc = target
+            elif opcode == LOAD_PARAMETER:
+                slot, variable_name, line_number = operand
+                variable_value = slots[slot]
+                if variable_value is UNSET:
+                    variable_value = _find_outer_variable(frame, variable_name, global_variables, outer_names)
+                push(variable_value if variable_value is not UNSET else _undefined(variable_name, line_number))
+            elif opcode == CALL:
+                argument_count, call_site = operand
+                arguments = stack[len(stack) - argument_count:]
+                del stack[len(stack) - argument_count:]
+                function = pop()
+                if function.__class__ is not Function:
+                    raise AttributeError(f"'{type(function).__name__}' object has no attribute 'call'")
+                frame.pc = pc
+                frame.value = value
+                callee = function.code_object
+                slots = [UNSET] * callee.slot_count
+                for slot, argument in zip(callee.argument_slots, arguments):
+                    slots[slot] = argument
+                in_loop = call_site.in_loop or in_loop
+                frame = Frame(callee, slots, frame, call_site, in_loop)
+                instructions = callee.instructions
+                value = None
+                pc = 0
+            elif opcode == RETURN:
+                frame = frame.caller
+                if frame is None:
+                    return value
+                instructions = frame.code_object.instructions
+                slots = frame.slots
+                push(value)
+                value = frame.value
+                in_loop = frame.in_loop
+                pc = frame.pc
+            elif opcode == JUMP_IF_NOT_CONST:
+                operation, constant, target = operand
+                if not BINARY_OPERATIONS[operation](pop(), constant):
+                    pc = target
+            elif opcode == JUMP_IF_NOT:
+                operation, target = operand
+                right = pop()
+                if not BINARY_OPERATIONS[operation](pop(), right):
+                    pc = target
+            elif opcode == STORE_VALUE:
+                value = pop()
+            elif opcode == RETURN_IF_MARKER:
+                if (value is BREAK or value is CONTINUE) and in_loop:
+                    pc = len(instructions) - 1
+            elif opcode == JUMP:
+                pc = operand
+            elif opcode == SET_VALUE:
+                value = operand
+            elif opcode == JUMP_IF_FALSE:
+                if not pop():
+                    pc = operand
+            elif opcode == JUMP_IF_FALSE_OR_POP:
+                if stack[-1]:
+                    pop()
+                else:
+                    pc = operand
+            elif opcode == JUMP_IF_TRUE_OR_POP:
+                if stack[-1]:
+                    pc = operand
+                else:
+                    pop()
+            elif opcode == EXIT_IF_MARKER:
+                if value is BREAK:
+                    pc = operand[0]
+                elif value is CONTINUE:
+                    pc = operand[1]
+            elif opcode == LOAD_OUTER:
+                variable_value = _find_outer_variable(frame, operand[0], global_variables, outer_names)
+                push(variable_value if variable_value is not UNSET else _undefined(*operand))
+            elif opcode == NOT:
+                stack[-1] = not stack[-1]
+            elif opcode == PRINT:
+                print_value(pop())
+            elif opcode == DECLARE_CHECKED:
+                slot, variable_name, line_number, guard_slot = operand
+                if (guard_slot is not None and slots[guard_slot] is not UNSET) or (
+                    _find_outer_variable(frame, variable_name, global_variables, outer_names) is not UNSET
+                ):
+                    raise RuntimeException("Variable has already been declared. Cannot redeclare.", line_number)
+                slots[slot] = pop()
+            elif opcode == DECLARE_GLOBAL:
+                variable_name, line_number = operand
+                if variable_name in global_variables:
+                    raise RuntimeException("Variable has already been declared. Cannot redeclare.", line_number)
+                global_variables[variable_name] = pop()
+            elif opcode == DECLARE_PARAMETER:
+                slot, line_number = operand
+                if slots[slot] is not UNSET:
+                    raise RuntimeException("Variable has already been declared. Cannot redeclare.", line_number)
+                slots[slot] = pop()
+            elif opcode == REASSIGN_DEEP:
+                slot, variable_name = operand
+                slots[slot] = variable_value = pop()
+                if variable_name in global_variables:
+                    global_variables[variable_name] = variable_value
+            elif opcode == REASSIGN_PARAMETER:
+                slot, variable_name, line_number, depth = operand
+                variable_value = pop()
+                if slots[slot] is not UNSET:
+                    slots[slot] = variable_value
+                    if depth > 2 and variable_name in global_variables:
+                        global_variables[variable_name] = variable_value
+                elif depth == 1:
+                    # Only the function's own scope is checked at its top level.
+                    raise RuntimeException("Variable has not been declared yet.", line_number)
+                else:
+                    _reassign_outer_variable(
+                        frame, variable_name, variable_value, line_number, depth, global_variables, outer_names
+                    )
+            elif opcode == REASSIGN_OUTER:
+                variable_name, line_number, depth = operand
+                _reassign_outer_variable(
+                    frame, variable_name, pop(), line_number, depth, global_variables, outer_names
+                )
+            elif opcode == INPUT:
+                push(input(operand))
+            elif opcode == RAISE:
+                message, line_number = operand
+                raise RuntimeException(message, line_number)
+            else:
+                raise ValueError(f"Unknown opcode {opcode}.")
+
+
+def _undefined(variable_name, line_number):
+    """
+    Handles the load of an undefined variable, see VariableNode.
+
+    :param variable_name: The name of the variable.
+    :param line_number: The line of the variable, None to load None instead of raising.
+    :return: None.
+    :raises SyntaxException: If the line is not None.
+    """
+    if line_number is None:
+        return None
+    raise SyntaxException(line_number, f"Undefined variable '{variable_name}'")
+
+
+def _find_outer_variable(frame, variable_name, global_variables, outer_names):
+    """
+    Looks a variable up in the calling frames, at the point they made their call, then in the globals.
+
+    :param frame: The running frame.
+    :param variable_name: The name of the variable.
+    :param global_variables: The globals.
+    :param outer_names: The names a calling frame may declare, None if any name may be.
+    :return: The value of the variable, UNSET if it is not defined.
+    """
+    if outer_names is not None and variable_name not in outer_names:
+        return global_variables.get(variable_name, UNSET)
+    while frame.caller is not None:
+        slot = frame.call_site.names.get(variable_name)
+        frame = frame.caller
+        if slot is not None and frame.slots[slot] is not UNSET:
+            return frame.slots[slot]
+    return global_variables.get(variable_name, UNSET)
+
+
+def _reassign_outer_variable(frame, variable_name, variable_value, line_number, depth, global_variables,
+                             outer_names):
+    """
+    Reassigns a variable of the calling frames, or the global if none of them declares it, see
+    ScopeContext.reassign_value.
+
+    :param frame: The running frame.
+    :param variable_name: The name of the variable.
+    :param variable_value: The new value.
+    :param line_number: The line of the reassignment.
+    :param depth: The number of scopes between the reassignment and the calling frame, i.e. the block nesting
+                  of the reassignment plus one.
+    :param global_variables: The globals.
+    :param outer_names: The names a calling frame may declare, None if any name may be.
+    :raises RuntimeException: If the variable is not defined.
+    """
+    if outer_names is None or variable_name in outer_names:
+        while frame.caller is not None:
+            call_site = frame.call_site
+            slot = call_site.names.get(variable_name)
+            frame = frame.caller
+            if slot is not None and frame.slots[slot] is not UNSET:
+                frame.slots[slot] = variable_value
+                # A variable two scopes out or more also reassigns the global of the same name.
+                if depth + call_site.distances[variable_name] >= 2 and variable_name in global_variables:
+                    global_variables[variable_name] = variable_value
+                return
+            depth += call_site.depth
+    if variable_name not in global_variables:
+        raise RuntimeException("Variable has not been declared yet.", line_number)
+    global_variables[variable_name] = variable_value
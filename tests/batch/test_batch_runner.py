@@ -0,0 +1,112 @@
+import io
+import re
+
+import pytest
+from mojilang import Interpreter
+from mojilang.batch import BatchRunner, TreeCache, print_batch_report
+from mojilang.parser import AstCache
+
+PROGRAMS = {
+    'a.moji': "🥸 x ✍️ 1; 🗣️ x ➕ 2;",
+    'b.moji': "🛠 fib(🥸 n) { 🤔 (n 👇 2) { 🫡 n; } 💅 { 🫡 👀 fib(n ➖ 1) ➕ 👀 fib(n ➖ 2); } } 🗣️ 👀 fib(15);",
+    'c.moji': "🥸 x ✍️ \"declared again\"; 🗣️ x; 🗣️ 1 ➗ 0;",
+}
+
+
+@pytest.fixture
+def directory(tmp_path):
+    for name, source_code in PROGRAMS.items():
+        (tmp_path / name).write_text(source_code)
+    (tmp_path / 'notes.txt').write_text('not a program')
+    return tmp_path
+
+
+def test_directory_programs_run_in_order_with_their_output_captured(directory, capsys):
+    results = BatchRunner().run_directory(directory)
+
+    assert [result.get_path().name for result in results] == ['a.moji', 'b.moji', 'c.moji']
+    assert [result.get_output() for result in results] == ['3.0\n', '610.0\n', 'declared again\n']
+    assert [result.is_successful() for result in results] == [True, True, False]
+    assert isinstance(results[2].get_error(), RuntimeError)
+    assert capsys.readouterr().out == ''
+
+
+@pytest.mark.parametrize('backend', Interpreter.BACKENDS)
+def test_each_program_runs_in_its_own_global_context(directory, backend):
+    # Both programs declare x, and a.moji runs twice from the same tree.
+    results = BatchRunner(interpreter_backend=backend).run_paths(
+        [directory / 'a.moji', directory / 'c.moji', directory / 'a.moji']
+    )
+
+    assert [result.get_output() for result in results] == ['3.0\n', 'declared again\n', '3.0\n']
+    assert [result.is_successful() for result in results] == [True, False, True]
+
+
+def test_manifest_lists_programs_relative_to_itself(directory):
+    manifest_path = directory / 'programs.txt'
+    manifest_path.write_text("a.moji\n\n# b.moji\nmissing.moji\na.moji\n")
+    batch_runner = BatchRunner()
+
+    results = batch_runner.run_manifest(manifest_path)
+
+    assert [result.get_path() for result in results] == [
+        directory / 'a.moji', directory / 'missing.moji', directory / 'a.moji'
+    ]
+    assert isinstance(results[1].get_error(), OSError)
+    assert [result.is_cached() for result in results] == [False, False, True]
+    assert batch_runner.get_tree_cache().get_hits() == 1
+
+
+def test_edited_programs_are_parsed_again(directory):
+    batch_runner = BatchRunner()
+    batch_runner.run_path(directory / 'a.moji')
+    (directory / 'a.moji').write_text("🗣️ 7;")
+
+    result = batch_runner.run_path(directory / 'a.moji')
+
+    assert not result.is_cached()
+    assert result.get_output() == '7.0\n'
+
+
+def test_trees_are_loaded_from_the_ast_cache_on_a_miss(directory):
+    ast_cache = AstCache(directory / 'cache')
+    BatchRunner(ast_cache=ast_cache).run_path(directory / 'b.moji')
+
+    assert ast_cache.get_cache_path(directory / 'b.moji').exists()
+    assert BatchRunner(ast_cache=ast_cache).run_path(directory / 'b.moji').get_output() == '610.0\n'
+
+
+def test_tree_cache_evicts_the_least_recently_used_tree():
+    tree_cache = TreeCache(2)
+    tree_cache.put('a', (), 'tree a')
+    tree_cache.put('b', (), 'tree b')
+    assert tree_cache.get('a', ()) == 'tree a'
+    tree_cache.put('c', (), 'tree c')
+
+    assert tree_cache.get('b', ()) is None
+    assert tree_cache.get('a', ()) == 'tree a'
+    assert tree_cache.get('a', (True,)) is None
+    assert len(tree_cache) == 2
+    assert (tree_cache.get_hits(), tree_cache.get_misses()) == (2, 2)
+
+
+def test_tree_cache_of_size_zero_keeps_nothing(directory):
+    batch_runner = BatchRunner(tree_cache_size=0)
+
+    results = batch_runner.run_paths([directory / 'a.moji', directory / 'a.moji'])
+
+    assert [result.is_cached() for result in results] == [False, False]
+    assert len(batch_runner.get_tree_cache()) == 0
+
+
+def test_report_lists_each_program_and_the_totals(directory):
+    results = BatchRunner().run_directory(directory)
+    report = io.StringIO()
+
+    print_batch_report(results, report)
+
+    lines = report.getvalue().splitlines()
+    assert lines[0] == 'Batch report:'
+    assert re.fullmatch(rf'  {re.escape(str(directory / "a.moji"))}: [\d.]+ ms parsed, [\d.]+ ms run, ok', lines[1])
+    assert 'failed: Execution error' in lines[3]
+    assert lines[4].startswith('  total: 3 programs, 1 failed, ')
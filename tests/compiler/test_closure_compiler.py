@@ -0,0 +1,47 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.compiler import ClosureCompiler
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext
+from mojilang.interpreter.scope.scope_context import ScopeContext
+from tests.e2e.utils.run_interpreter import parse_program, run_program
+
+
+def test_program_is_compiled_to_closure(capsys):
+    program = ClosureCompiler().compile(parse_program("🥸 x ✍️ 1 ➕ 2;\n🗣️ x ✖️ 3;"))
+    assert capsys.readouterr().out == ''
+    program(ScopeContext(BlockScopeContext(BlockScope.GLOBAL)))
+    assert capsys.readouterr().out == '9.0\n'
+
+
+def test_compiled_program_can_run_more_than_once(capsys):
+    program = ClosureCompiler().compile(parse_program("🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; }\n🗣️ i;"))
+    for _ in range(2):
+        program(ScopeContext(BlockScopeContext(BlockScope.GLOBAL)))
+        assert capsys.readouterr().out == '3.0\n'
+
+
+@pytest.mark.parametrize('source_code', [
+    # A return only ends the block it is in.
+    "🛠 f(🥸 n) { 🤔 n ☝️ 1 { 🫡 1; } 🗣️ n; 🫡 2; }\n🗣️ 👀 f(5);",
+    # A function completes with the value of its last statement.
+    "🛠 f(🥸 n) { 🤔 n ☝️ 1 { 🫡 1; } 💅 { 🫡 2; } }\n🗣️ 👀 f(5);\n🗣️ 👀 f(0);",
+    # A loop ending with a break ends the loop it is in too.
+    "🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; 🥸 j ✍️ 0; 🔁 (j 👇 3) { j ✍️ j ➕ 1; 💥; } 🗣️ i; }\n🗣️ i;",
+    # A break in a function called within a loop ends that loop.
+    "🛠 stop() { 💥; }\n🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; 👀 stop(); 🗣️ i; }\n🗣️ i;",
+    # A break outside of any loop is a statement like any other.
+    "💥;\n🗣️ 1;\n🛠 f() { 💥; 🫡 2; }\n🗣️ 👀 f();",
+    # A return at the top level ends the program.
+    "🗣️ 1;\n🫡 1;\n🗣️ 2;",
+    # Each iteration declares its variables in a scope of its own.
+    "🥸 i ✍️ 2;\n🔁 (i ☝️ 0) { 🥸 j ✍️ i ✖️ 2; 🗣️ j; i ✍️ i ➖ 1; }",
+    "🥸 i ✍️ 5;\n🔁 (i ☝️ 0) { i ✍️ i ➖ 1; 🤔 i 🍕 2 🤝 0 { 🤓; } 💅 { 🫡 i; } 🗣️ i; }",
+    "🥸 x ✍️ 1;\n🤔 😤 { 🥸 x ✍️ 2; }",
+    "🗣️ 1 ➗ 0;",
+    "🗣️ y;",
+    "🗣️ 👀 missing();",
+    "🗣️ 1 ➕ \"s\";",
+])
+def test_closure_compiled_program_matches_tree_walker(capsys, source_code):
+    expected = run_program(parse_program(source_code), capsys, Interpreter.TREE_WALKER_BACKEND)
+    assert run_program(parse_program(source_code), capsys, Interpreter.CLOSURE_BACKEND) == expected
@@ -0,0 +1,49 @@
+import ast
+
+import pytest
+from mojilang import Interpreter
+from mojilang.compiler import PythonCompiler
+from tests.e2e.utils.run_interpreter import parse_program, run_program
+
+
+def test_program_is_lowered_to_python_module():
+    module = PythonCompiler().lower(parse_program("🥸 x ✍️ 1 ➕ 2;\n🗣️ x ✖️ 3;"))
+    assert isinstance(module, ast.Module)
+    source = ast.unparse(module)
+    assert "declare_variable(context_0, 'x', 1.0 + 2.0, 1)" in source
+    assert "print_value(load_variable(context_0, 'x', 2) * 3.0)" in source
+
+
+def test_each_function_is_lowered_to_python_function():
+    module = PythonCompiler().lower(parse_program("🛠 f() { 🛠 g() { 🫡 1; } 🫡 👀 g(); }\n🗣️ 👀 f();"))
+    assert [statement.name for statement in module.body] == ['function_0', 'function_1', 'program']
+
+
+@pytest.mark.parametrize('source_code', [
+    # A return only ends the block it is in.
+    "🛠 f(🥸 n) { 🤔 n ☝️ 1 { 🫡 1; } 🗣️ n; 🫡 2; }\n🗣️ 👀 f(5);",
+    # A function completes with the value of its last statement.
+    "🛠 f(🥸 n) { 🤔 n ☝️ 1 { 🫡 1; } 💅 { 🫡 2; } }\n🗣️ 👀 f(5);\n🗣️ 👀 f(0);",
+    # A loop ending with a break ends the loop it is in too.
+    "🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; 🥸 j ✍️ 0; 🔁 (j 👇 3) { j ✍️ j ➕ 1; 💥; } 🗣️ i; }\n🗣️ i;",
+    # A break in a function called within a loop ends that loop.
+    "🛠 stop() { 💥; }\n🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; 👀 stop(); 🗣️ i; }\n🗣️ i;",
+    # A break outside of any loop is a statement like any other.
+    "💥;\n🗣️ 1;\n🛠 f() { 💥; 🫡 2; }\n🗣️ 👀 f();",
+    # A return at the top level ends the program.
+    "🗣️ 1;\n🫡 1;\n🗣️ 2;",
+    "🥸 i ✍️ 5;\n🔁 (i ☝️ 0) { i ✍️ i ➖ 1; 🤔 i 🍕 2 🤝 0 { 🤓; } 💅 { 🫡 i; } 🗣️ i; }",
+    "🥸 x ✍️ 1;\n🤔 😤 { 🥸 x ✍️ 2; }",
+    "🗣️ 1 ➗ 0;",
+    "🗣️ y;",
+    "🗣️ 👀 missing();",
+    "🗣️ 1 ➕ \"s\";",
+])
+def test_compiled_program_matches_tree_walker(capsys, source_code):
+    expected = run_program(parse_program(source_code), capsys, Interpreter.TREE_WALKER_BACKEND)
+    assert run_program(parse_program(source_code), capsys, Interpreter.PYCOMPILE_BACKEND) == expected
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        Interpreter(parse_program("🗣️ 1;"), 'unknown')
@@ -0,0 +1,22 @@
+import pathlib
+
+import pytest
+
+from mojilang.interpreter import Interpreter
+from mojilang.mojilang import main
+
+SAMPLE_FILES = sorted((pathlib.Path(__file__).parents[2] / 'sample_mojilang_files').rglob('*.moji'))
+
+
+@pytest.mark.parametrize('sample_file', SAMPLE_FILES, ids=lambda path: path.name)
+def test_sample_program_output_matches_tree_walker(capsys, sample_file):
+    """
+    Test that every backend prints exactly what the tree-walker prints for the sample programs. The
+    programs of the other e2e tests are run with every backend by run_interpreter_and_retrieve_output.
+    """
+    source_code = sample_file.read_text()
+    main(source_code)
+    expected = capsys.readouterr().out
+    for backend in Interpreter.BACKENDS:
+        main(source_code, interpreter_backend=backend)
+        assert capsys.readouterr().out == expected
@@ -1,3 +1,7 @@
+import pytest
+
+from mojilang.interpreter import Interpreter
+from mojilang.mojilang import main
 from tests.e2e.utils.run_interpreter import run_interpreter_and_retrieve_output
 
 
@@ -208,4 +212,62 @@ def test_complex_nested_logical_operations(capsys):
     """
     expected_output = "😔\n"
     captured = run_interpreter_and_retrieve_output(source_code, capsys)
-    assert captured.out == expected_output
\ No newline at end of file
+    assert captured.out == expected_output
+
+
+GUARDED_CALLS = """
+🛠 loud(🥸 value) {
+    🗣️("called");
+    🫡 value;
+}
+🗣️(😔 and 👀 loud(😤));
+🗣️(😤 or 👀 loud(😔));
+🗣️(😤 and 👀 loud(0));
+🗣️(0 or 👀 loud("right"));
+"""
+
+
+def test_right_operand_is_skipped_when_the_left_one_decides(capsys):
+    captured = run_interpreter_and_retrieve_output(GUARDED_CALLS, capsys)
+    assert captured.out == "😔\n😤\ncalled\n0.0\ncalled\nright\n"
+
+
+@pytest.mark.parametrize('backend', Interpreter.BACKENDS)
+def test_both_operands_are_evaluated_without_short_circuit(capsys, backend):
+    main(GUARDED_CALLS, interpreter_backend=backend, short_circuit=False)
+    assert capsys.readouterr().out == "called\n😔\ncalled\n😤\ncalled\n0.0\ncalled\nright\n"
+
+
+def test_skipped_right_operand_does_not_fail(capsys):
+    source_code = """
+    🥸 divisor ✍️ 0;
+    🗣️(divisor 🤝 0 or 10 ➗ divisor ☝️ 1);
+    🗣️(divisor 🙅🤝 0 and 10 ➗ divisor ☝️ 1);
+    """
+    captured = run_interpreter_and_retrieve_output(source_code, capsys)
+    assert captured.out == "😤\n😔\n"
+
+
+def test_short_circuit_value_in_arithmetic_and_conditions(capsys):
+    source_code = """
+    🥸 a ✍️ 0;
+    🥸 b ✍️ 5;
+    🗣️(1 ➕ (a and 2));
+    🗣️(1 ➕ (b and 2));
+    🗣️((a or 3) ✖️ 2);
+    🤔 (a or b 👇 6) {
+        🗣️("first");
+    }
+    🤔 (b and a 👇 1 and b ☝️ 6) {
+        🗣️("second");
+    } 💅 {
+        🗣️("third");
+    }
+    🥸 i ✍️ 0;
+    🔁 (i 👇 3 and (a or 1)) {
+        i ✍️ i ➕ 1;
+    }
+    🗣️(i);
+    """
+    captured = run_interpreter_and_retrieve_output(source_code, capsys)
+    assert captured.out == "1.0\n3.0\n6.0\nfirst\nthird\n3.0\n"
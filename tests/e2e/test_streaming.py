@@ -0,0 +1,70 @@
+import runpy
+import sys
+
+import pytest
+
+from mojilang import mojilang
+from mojilang.lexer import SyntaxException
+from mojilang.mojilang import main_flat
+from tests.e2e.utils.run_interpreter import (
+    run_interpreter_and_retrieve_output,
+    run_streamed_interpreter_and_retrieve_output,
+)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 4096])
+def test_streamed_program_matches_in_memory_program(capsys, chunk_size):
+    """
+    Test that a program lexed and parsed while it is streamed prints exactly what it prints when
+    its source code is read into memory first.
+    """
+    source_code = """
+    🥸 i ✍️ 0;
+    🛠 describe(🥸 number) {
+        🤔(number 🍕 2 🤝 0 and number 👇🤝 4) {
+            🫡 "small even 🙅🤝 odd";
+        }
+        🫡 "other";
+    }
+    🔁(i 👇 6) {
+        🗣️(👀describe(i));
+        i ✍️ i ➕ 1;
+    }
+    """
+    expected = run_interpreter_and_retrieve_output(source_code, capsys)
+    captured = run_streamed_interpreter_and_retrieve_output(source_code, capsys, chunk_size)
+    assert captured.out == expected.out
+
+
+def test_streamed_program_reports_lexer_errors(capsys):
+    """
+    Test that an unexpected character is reported even though the parser fails on the statement it broke.
+    """
+    source_code = '🥸 x ✍️ @;\n🗣️(x);'
+    with pytest.raises(SyntaxException, match='Unexpected character'):
+        run_streamed_interpreter_and_retrieve_output(source_code, capsys)
+
+
+@pytest.mark.parametrize('options, rejected_option', [
+    (['--lexer', 'character'], '--lexer'),
+    (['--cache-dir', 'cache'], '--cache-dir'),
+])
+def test_cli_rejects_the_options_streaming_cannot_honour(options, rejected_option, capsys, monkeypatch, tmp_path):
+    source_path = tmp_path / 'program.moji'
+    source_path.write_text('🗣️ 1;')
+    monkeypatch.setattr(sys, 'argv', ['mojilang', str(source_path), '--stream', *options])
+    with pytest.raises(SystemExit) as exit_info:
+        runpy.run_path(mojilang.__file__, run_name='__main__')
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out.startswith(f"Error: {rejected_option} cannot be used with --stream")
+
+
+def test_cli_writes_the_flat_tree_of_a_streamed_program(capsys, monkeypatch, tmp_path):
+    source_path = tmp_path / 'program.moji'
+    source_path.write_text('🥸 x ✍️ 1 ➕ 2;\n🗣️ x;')
+    flat_tree_path = tmp_path / 'program.mojif'
+    monkeypatch.setattr(sys, 'argv', ['mojilang', str(source_path), '--stream', '--emit-flat', str(flat_tree_path)])
+    runpy.run_path(mojilang.__file__, run_name='__main__')
+    assert capsys.readouterr().out == ''
+    main_flat(flat_tree_path)
+    assert capsys.readouterr().out == '3.0\n'
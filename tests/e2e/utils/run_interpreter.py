@@ -1,14 +1,94 @@
-from mojilang import Parser, Interpreter, Lexer
+import io
 
+from mojilang import Interpreter, Lexer
+from mojilang.flat import FlatTree, FlatTreeEncoder
+from mojilang.interpreter import Resolver, TailCallAnalyzer
+from mojilang.mojilang import main_stream, parse, run_flat_tree
 
-def run_interpreter_and_retrieve_output(source_code, capsys):
+# The name the results of running the flat tree of the program are checked under, along with the backends.
+FLAT_TREE = 'flat tree'
+
+
+def scan_program(source_code):
+    """
+    Scans a program with the default lexer.
+
+    :param source_code: The source code of the program.
+    :return: The tokens of the program.
+    """
     lexer = Lexer(source_code)
     lexer.scan_tokens()
+    return lexer.get_tokens()
+
+
+def parse_program(source_code, resolve=False):
+    """
+    Scans and parses a program, see mojilang.parse.
+
+    :param source_code: The source code of the program.
+    :param resolve: Whether to bind the variables of the program and mark its tail calls like the CLI does, see
+                    Resolver and TailCallAnalyzer. Unlike the CLI, the undefined variables still fail at run time.
+    :return: The AST of the program.
+    """
+    abstract_syntax_tree = parse(source_code)
+    if resolve:
+        Resolver().resolve(abstract_syntax_tree)
+        TailCallAnalyzer().analyze(abstract_syntax_tree)
+    return abstract_syntax_tree
+
+
+def run_program(abstract_syntax_tree, capsys, backend=Interpreter.TREE_WALKER_BACKEND):
+    """
+    Runs a program with an interpreter backend.
+
+    :return: The output the program printed, and the message of the error it failed with, None if it did not.
+    """
+    captured, error = _execute(abstract_syntax_tree, backend, capsys)
+    return captured.out, None if error is None else str(error)
+
+
+def run_interpreter_and_retrieve_output(source_code, capsys):
+    """
+    Runs the program with every interpreter backend, and from its flat tree, and checks that they all print the
+    same output and fail with the same error as the tree-walker, so every e2e program doubles as a differential
+    test of the backends.
+
+    :return: The output captured while the tree-walker ran the program.
+    :raises RuntimeError: If the program fails to execute.
+    """
+    # The tree-walker runs the bound AST like the CLI does.
+    ast = parse_program(source_code, resolve=True)
+
+    results = {backend: _execute(ast, backend, capsys) for backend in Interpreter.BACKENDS}
+    results[FLAT_TREE] = _execute_flat_tree(ast, capsys)
+    expected_captured, expected_error = results[Interpreter.TREE_WALKER_BACKEND]
+    for backend, (captured, error) in results.items():
+        assert captured.out == expected_captured.out, f"The {backend} backend printed a different output."
+        assert str(error) == str(expected_error), f"The {backend} backend failed differently."
+
+    if expected_error is not None:
+        raise expected_error
+    return expected_captured
+
+
+def _execute(ast, backend, capsys):
+    interpreter = Interpreter(ast, backend)
+    try:
+        interpreter.execute()
+    except RuntimeError as e:
+        return capsys.readouterr(), e
+    return capsys.readouterr(), None
+
 
-    parser = Parser(lexer.get_tokens())
-    ast = parser.parse()
+def _execute_flat_tree(ast, capsys):
+    with FlatTree(FlatTreeEncoder().encode(ast)) as flat_tree:
+        try:
+            run_flat_tree(flat_tree)
+        except RuntimeError as e:
+            return capsys.readouterr(), e
+    return capsys.readouterr(), None
 
-    interpreter = Interpreter(ast)
-    interpreter.execute()
 
+def run_streamed_interpreter_and_retrieve_output(source_code, capsys, chunk_size=Lexer.STREAM_CHUNK_SIZE):
+    main_stream(io.StringIO(source_code), chunk_size)
     return capsys.readouterr()
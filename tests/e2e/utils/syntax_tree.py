@@ -0,0 +1,21 @@
+from mojilang.parser.nodes import AbstractSyntaxTreeNode
+
+
+def walk_nodes(node, skipped_attributes=()):
+    """
+    Yields a node and then every node below it, depth first. The nodes keep their children in the __slots__ of
+    their classes.
+
+    :param node: The node to start from.
+    :param skipped_attributes: The names of the attributes whose nodes are not walked.
+    :return: A generator of the nodes.
+    """
+    yield node
+    for cls in type(node).__mro__:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name in skipped_attributes:
+                continue
+            value = getattr(node, name)
+            for child in value if isinstance(value, list) else [value]:
+                if isinstance(child, AbstractSyntaxTreeNode):
+                    yield from walk_nodes(child, skipped_attributes)
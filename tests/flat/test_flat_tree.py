@@ -0,0 +1,136 @@
+import runpy
+import sys
+
+import pytest
+from mojilang.flat import FlatTree, FlatTreeEncoder, NodeKind
+from mojilang.flat.flat_tree import HEADER
+from mojilang import mojilang
+from mojilang.interpreter import ConstantFolder
+from mojilang.mojilang import main, main_flat, parse, run_flat_tree
+
+SOURCE_CODE = """
+🛠 describe(🥸 n) {
+    🤔 (n 🤝 0) { 🫡 "zero"; } 🙈 (n 👇 0) { 🫡 "negative"; } 💅 { 🫡 n ✖️ 1.5; }
+}
+🥸 i ✍️ 0 ➖ 1;
+🔁 (😤) {
+    🤔 (i ☝️ 1) { 💥; }
+    🗣️ 👀 describe(i);
+    i ✍️ i ➕ 1;
+}
+🗣️ 😔 or 🙅 😔;
+"""
+EXPECTED_OUTPUT = 'negative\nzero\n1.5\n😤\n'
+
+
+def _flat_tree(source_code, optimize=False):
+    abstract_syntax_tree = parse(source_code)
+    if optimize:
+        ConstantFolder().fold(abstract_syntax_tree)
+    return FlatTree(FlatTreeEncoder().encode(abstract_syntax_tree))
+
+
+def test_flat_tree_runs_like_the_tree(capsys):
+    with _flat_tree(SOURCE_CODE) as flat_tree:
+        run_flat_tree(flat_tree)
+    assert capsys.readouterr().out == EXPECTED_OUTPUT
+
+
+def test_flat_tree_file_is_memory_mapped(capsys, tmp_path):
+    flat_tree_path = tmp_path / 'program.mojif'
+    main(SOURCE_CODE, flat_tree_path=flat_tree_path)
+    assert capsys.readouterr().out == ''
+    main_flat(flat_tree_path)
+    assert capsys.readouterr().out == EXPECTED_OUTPUT
+
+    flat_tree = FlatTree.load(flat_tree_path)
+    assert flat_tree.get_kind(flat_tree.get_root()) == NodeKind.BLOCK
+    flat_tree.close()
+    with pytest.raises(ValueError):
+        flat_tree.get_kind(flat_tree.get_root())
+
+
+def test_records_are_read_without_building_nodes():
+    with _flat_tree("🥸 x ✍️ 1; 🗣️ x ➕ 1;") as flat_tree:
+        root = flat_tree.get_root()
+        assign, print_statement = flat_tree.get_list(flat_tree.get_operands(root)[0])
+        assert flat_tree.get_kind(assign) == NodeKind.ASSIGNMENT
+        name, value, _ = flat_tree.get_operands(assign)
+        assert flat_tree.get_string(name) == 'x'
+        assert flat_tree.get_number(flat_tree.get_operands(value)[0]) == 1.0
+        assert flat_tree.get_line_number(print_statement) == 1
+        addition = flat_tree.get_operands(print_statement)[0]
+        assert flat_tree.get_kind(addition) == NodeKind.ADDITION
+        # The same name and number are pooled once.
+        assert flat_tree.get_operands(flat_tree.get_operands(addition)[0])[0] == name
+        assert flat_tree.get_operands(flat_tree.get_operands(addition)[1])[0] == flat_tree.get_operands(value)[0]
+
+
+@pytest.mark.parametrize('source_code, expected_output', [
+    # Folded into an integer, which prints without a decimal point.
+    ("🗣️ 😤 ➕ 😤;", '2\n'),
+    ("🗣️ (0 ➖ 1) ✖️ 0; 🗣️ 0;", '-0.0\n0.0\n'),
+    ('🗣️ "🥸 ✍️"; 🗣️ "";', '🥸 ✍️\n\n'),
+])
+def test_literals_keep_their_type(capsys, source_code, expected_output):
+    with _flat_tree(source_code, optimize=True) as flat_tree:
+        run_flat_tree(flat_tree)
+    assert capsys.readouterr().out == expected_output
+
+
+def test_errors_are_reported_like_the_interpreter(capsys):
+    with _flat_tree("🗣️ 1; 🥸 x ✍️ 1; 🥸 x ✍️ 2;") as flat_tree:
+        with pytest.raises(RuntimeError, match='Execution error: .*Cannot redeclare'):
+            run_flat_tree(flat_tree)
+    assert capsys.readouterr().out == '1.0\n'
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: data[:HEADER.size - 1],
+    lambda data: b'NOPE!' + data[5:],
+    lambda data: data[:-4],
+])
+def test_invalid_buffers_are_rejected(corrupt):
+    data = FlatTreeEncoder().encode(parse(SOURCE_CODE))
+    with pytest.raises(ValueError):
+        FlatTree(corrupt(data))
+
+
+@pytest.mark.parametrize('corrupt', [
+    lambda data: b'',
+    lambda data: b'garbage',
+    lambda data: data[:5] + bytes([9]) + data[6:],
+    lambda data: data[:-4],
+])
+def test_invalid_files_are_rejected(corrupt, tmp_path):
+    flat_tree_path = tmp_path / 'program.mojif'
+    flat_tree_path.write_bytes(corrupt(FlatTreeEncoder().encode(parse(SOURCE_CODE))))
+    with pytest.raises(ValueError):
+        FlatTree.load(flat_tree_path)
+
+
+def test_cli_reports_invalid_files(capsys, monkeypatch, tmp_path):
+    flat_tree_path = tmp_path / 'program.mojif'
+    flat_tree_path.write_bytes(b'garbage')
+    monkeypatch.setattr(sys, 'argv', ['mojilang', str(flat_tree_path)])
+    with pytest.raises(SystemExit) as exit_info:
+        runpy.run_path(mojilang.__file__, run_name='__main__')
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out.startswith(f"Error: Cannot run '{flat_tree_path}': ")
+
+
+@pytest.mark.parametrize('options, rejected_option', [
+    (['--backend', 'vm'], '--backend'),
+    (['--vm'], '--backend'),
+    (['-O'], '--optimize'),
+    (['--memo-size', '1024'], '--memo-size'),
+    (['--profile'], '--profile'),
+])
+def test_cli_rejects_the_options_of_source_files(options, rejected_option, capsys, monkeypatch, tmp_path):
+    flat_tree_path = tmp_path / 'program.mojif'
+    main(SOURCE_CODE, flat_tree_path=flat_tree_path)
+    monkeypatch.setattr(sys, 'argv', ['mojilang', str(flat_tree_path), *options])
+    with pytest.raises(SystemExit) as exit_info:
+        runpy.run_path(mojilang.__file__, run_name='__main__')
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().out.startswith(f"Error: {rejected_option} cannot be used")
@@ -0,0 +1,67 @@
+from array import array
+
+import pytest
+from mojilang import Interpreter
+from mojilang.flat import FlatTree, FlatTreeDecoder, FlatTreeEncoder, NodeKind
+from mojilang.interpreter import ConstantFolder
+from mojilang.mojilang import parse
+
+SOURCE_CODE = """
+🛠 describe(🥸 n, 🥸 unit) {
+    🤔 (n 🤝 0) { 🫡 "zero"; } 🙈 (n 👇 0) { 🫡 "negative"; } 💅 { 🫡 n ✖️ 1.5; }
+}
+🥸 i ✍️ 0 ➖ 1;
+🔁 (😤) {
+    🤔 (i ☝️ 1) { 💥; }
+    🗣️ 👀 describe(i, "cm");
+    i ✍️ i ➕ 1;
+}
+🗣️ 😔 or 🙅 😔;
+"""
+
+
+def _decode(abstract_syntax_tree):
+    with FlatTree(FlatTreeEncoder().encode(abstract_syntax_tree)) as flat_tree:
+        return FlatTreeDecoder().decode(flat_tree)
+
+
+@pytest.mark.parametrize('short_circuit', [True, False])
+@pytest.mark.parametrize('optimize', [False, True])
+def test_decoded_tree_encodes_like_the_tree(short_circuit, optimize):
+    abstract_syntax_tree = parse(SOURCE_CODE, short_circuit=short_circuit)
+    if optimize:
+        ConstantFolder().fold(abstract_syntax_tree)
+    data = FlatTreeEncoder().encode(abstract_syntax_tree)
+    assert FlatTreeEncoder().encode(_decode(abstract_syntax_tree)) == data
+
+
+@pytest.mark.parametrize('backend', Interpreter.BACKENDS)
+def test_decoded_tree_runs_like_the_tree(capsys, backend):
+    Interpreter(_decode(parse(SOURCE_CODE)), backend=backend).execute()
+    assert capsys.readouterr().out == 'negative\nzero\n1.5\n😤\n'
+
+
+def _records(*records):
+    return array('i', [value for record in records for value in record])
+
+
+@pytest.mark.parametrize('records, lists', [
+    # A block holding itself.
+    (_records((NodeKind.BLOCK, 1, 0, 0, 0)), [1, 0]),
+    # A block holding a record encoded after it.
+    (_records((NodeKind.BLOCK, 1, 0, 0, 0), (NodeKind.BREAK, 1, 0, 0, 0)), [1, 1]),
+    # A record of no kind.
+    (_records((99, 1, 0, 0, 0), (NodeKind.BLOCK, 1, 0, 0, 0)), [1, 0]),
+    # A loop whose body is no block.
+    (_records((NodeKind.BREAK, 1, 0, 0, 0), (NodeKind.LOOP, 1, 0, 0, 0), (NodeKind.BLOCK, 1, 0, 0, 0)), [1, 1]),
+    # A variable whose name is not in the string pool.
+    (_records((NodeKind.VARIABLE, 1, 5, 0, 0), (NodeKind.BLOCK, 1, 0, 0, 0)), [1, 0]),
+    # A block whose list is not in the list array.
+    (_records((NodeKind.BLOCK, 1, 7, 0, 0)), [0]),
+])
+def test_corrupt_records_are_rejected(records, lists):
+    root = len(records) // 5 - 1
+    data = FlatTree.to_bytes(root, records, array('i', lists), array('d'), [])
+    with FlatTree(data) as flat_tree:
+        with pytest.raises(ValueError):
+            FlatTreeDecoder().decode(flat_tree)
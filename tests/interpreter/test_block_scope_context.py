@@ -0,0 +1,34 @@
+import pytest
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext
+
+
+def _enter(block_scopes):
+    block_scope_context = BlockScopeContext(BlockScope.GLOBAL)
+    for block_scope in block_scopes:
+        block_scope_context = block_scope_context.enter_scope(block_scope)
+    return block_scope_context
+
+
+def test_depths_count_the_loops_and_functions_in_the_chain():
+    block_scope_context = _enter([BlockScope.LOOP, BlockScope.CONDITIONAL, BlockScope.FUNCTION, BlockScope.LOOP])
+    assert block_scope_context.get_loop_depth() == 2
+    assert block_scope_context.get_function_depth() == 1
+
+
+@pytest.mark.parametrize('block_scopes, block_scope, expected', [
+    ([], BlockScope.LOOP, False),
+    ([BlockScope.LOOP, BlockScope.CONDITIONAL], BlockScope.LOOP, True),
+    ([BlockScope.FUNCTION, BlockScope.CONDITIONAL], BlockScope.FUNCTION, True),
+    ([BlockScope.CONDITIONAL], BlockScope.FUNCTION, False),
+    ([BlockScope.CONDITIONAL, BlockScope.LOOP], BlockScope.CONDITIONAL, True),
+    ([BlockScope.LOOP], BlockScope.CONDITIONAL, False),
+    ([BlockScope.FUNCTION], BlockScope.GLOBAL, True),
+])
+def test_within_block_scope(block_scopes, block_scope, expected):
+    assert _enter(block_scopes).within_block_scope(block_scope) == expected
+
+
+def test_within_block_scope_of_deeply_nested_scopes():
+    block_scope_context = _enter([BlockScope.LOOP] + [BlockScope.CONDITIONAL, BlockScope.FUNCTION] * 10_000)
+    assert block_scope_context.within_block_scope(BlockScope.LOOP)
+    assert block_scope_context.within_block_scope(BlockScope.GLOBAL)
@@ -0,0 +1,79 @@
+import io
+
+import pytest
+from mojilang import Interpreter
+from mojilang.interpreter import Resolver
+from mojilang.interpreter.scope import ScopeContext
+from mojilang.mojilang import main, print_call_profile
+from tests.e2e.utils.run_interpreter import parse_program
+
+
+def _resolve(source_code):
+    abstract_syntax_tree = parse_program(source_code)
+    resolver = Resolver()
+    assert resolver.resolve(abstract_syntax_tree) == []
+    return abstract_syntax_tree, resolver.get_function_call_nodes()
+
+
+@pytest.mark.parametrize('source_code, is_bound', [
+    ("🛠 g() { 🫡 1; } 🗣️ 👀 g();", True),
+    ("🛠 g() { 🫡 1; } 🛠 f() { 🥸 x ✍️ 1; 🫡 👀 g(); } 🗣️ 👀 f();", True),
+    ("🛠 g() { 🫡 1; } 🥸 i ✍️ 0; 🔁 (i 👇 2) { 🗣️ 👀 g(); i ✍️ i ➕ 1; }", True),
+    # A name declared anywhere else may shadow the global binding wherever the call is made from.
+    ("🛠 g() { 🫡 1; } 🛠 f() { 🛠 g() { 🫡 2; } 🫡 1; } 🗣️ 👀 g();", False),
+    ("🛠 g() { 🫡 1; } 🛠 f(🥸 g) { 🫡 g; } 🗣️ 👀 g();", False),
+    ("🛠 g() { 🫡 1; } 🤔 (😤) { 🥸 g ✍️ 1; } 🗣️ 👀 g();", False),
+])
+def test_calls_are_bound_to_the_global_context_if_nothing_can_shadow_it(source_code, is_bound):
+    _, function_call_nodes = _resolve(source_code)
+    expected_address = ScopeContext.GLOBAL_DEPTH if is_bound else None
+    addresses = {node.get_address() for node in function_call_nodes if node.get_function_name() == 'g'}
+    assert addresses == {expected_address}
+
+
+@pytest.mark.parametrize('source_code, expected_output', [
+    # A function declared again replaces the one bound calls read.
+    ("🛠 g() { 🫡 1; } 🛠 f() { 🫡 👀 g(); } 🗣️ 👀 f(); 🛠 g() { 🫡 2; } 🗣️ 👀 f();", '1.0\n2.0\n'),
+    ("🛠 g() { 🫡 1; } 🛠 f() { 🛠 g() { 🫡 2; } 🫡 👀 g(); } 🗣️ 👀 f(); 🗣️ 👀 g();", '2.0\n1.0\n'),
+    ("🛠 g() { 🫡 1; } 🛠 f() { 🫡 👀 g(); } 🛠 h() { 🛠 g() { 🫡 3; } 🫡 👀 f(); } 🗣️ 👀 h();", '3.0\n'),
+])
+def test_bound_calls_see_every_change_of_the_binding(capsys, source_code, expected_output):
+    for backend in Interpreter.BACKENDS:
+        main(source_code, interpreter_backend=backend)
+        assert capsys.readouterr().out == expected_output
+
+
+def test_lookups_are_counted_per_call():
+    source_code = """
+        🛠 g(🥸 n) { 🫡 n; }
+        🛠 f(🥸 n) { 🛠 h() { 🫡 n; } 🫡 👀 h() ➕ 👀 g(n); }
+        🥸 i ✍️ 0;
+        🔁 (i 👇 3) {
+            🥸 value ✍️ 👀 f(i);
+            i ✍️ i ➕ 1;
+        }
+    """
+    abstract_syntax_tree, function_call_nodes = _resolve(source_code)
+    Interpreter(abstract_syntax_tree).execute()
+    lookups = [
+        (node.get_function_name(), node.get_address_lookups(), node.get_chain_lookups())
+        for node in function_call_nodes
+    ]
+    assert lookups == [('h', 0, 3), ('g', 3, 0), ('f', 3, 0)]
+
+    profile = io.StringIO()
+    print_call_profile(function_call_nodes, profile)
+    assert profile.getvalue().splitlines() == [
+        'Function call profile:',
+        '  line 3 h: 3 calls, 0 bound lookups (0%)',
+        '  line 3 g: 3 calls, 3 bound lookups (100%)',
+        '  line 6 f: 3 calls, 3 bound lookups (100%)',
+        '  total: 9 calls, 6 bound lookups (67%)',
+    ]
+
+
+def test_profile_is_printed_to_stderr(capsys):
+    main("🛠 g() { 🫡 1; } 🗣️ 👀 g();", profile=True)
+    output = capsys.readouterr()
+    assert output.out == '1.0\n'
+    assert output.err.splitlines()[-1] == '  total: 1 calls, 1 bound lookups (100%)'
@@ -0,0 +1,175 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext
+from mojilang.interpreter.scope.scope_context import ScopeContext
+from mojilang.mojilang import main
+from mojilang.parser.nodes.control import function_node
+from tests.e2e.utils.run_interpreter import parse_program
+
+
+def test_recursion_runs_far_past_the_python_recursion_limit(capsys):
+    source_code = """
+        🛠 depth(🥸 n) {
+            🤔 (n 🤝 0) {
+                🫡 0;
+            } 💅 {
+                🫡 1 ➕ 👀 depth(n ➖ 1);
+            }
+        }
+        🗣️ 👀 depth(20000);
+    """
+    main(source_code)
+    assert capsys.readouterr().out == '20000.0\n'
+
+
+def test_recursion_within_loops_and_conditionals_runs_far_past_the_python_recursion_limit(capsys):
+    source_code = """
+        🛠 positive(🥸 n) { 🫡 n ☝️ 0; }
+        🛠 sum_to(🥸 n) {
+            🥸 total ✍️ n;
+            🥸 i ✍️ 0;
+            🔁 (i 👇 1) {
+                i ✍️ i ➕ 1;
+                🤔 🙅 (n 🤝 0) and (👀 positive(n) or 😔) {
+                    total ✍️ total ➕ 👀 sum_to(n ➖ 1);
+                }
+            }
+            🫡 total;
+        }
+        🗣️ 👀 sum_to(5000);
+    """
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == '12502500.0\n'
+
+
+@pytest.mark.parametrize('source_code', [
+    # Declares a variable in a conditional block.
+    """
+        🛠 f(🥸 n) { 🤔 (n 👇 1) { 🫡 0; } 💅 { 🥸 r ✍️ 👀 f(n ➖ 1) ➕ 1; 🫡 r; } }
+        🗣️ 👀 f(2500);
+    """,
+    # Declares a variable in a loop.
+    """
+        🛠 f(🥸 n) {
+            🥸 total ✍️ 0;
+            🥸 i ✍️ 0;
+            🔁 (i 👇 1) {
+                🥸 step ✍️ 1;
+                i ✍️ i ➕ step;
+            }
+            🤔 (n ☝️ 0) { total ✍️ 👀 f(n ➖ 1) ➕ i; }
+            🫡 total;
+        }
+        🗣️ 👀 f(2500);
+    """,
+    # Declares the recursive function inside another function.
+    """
+        🛠 outer(🥸 n) {
+            🛠 f(🥸 n) { 🤔 (n 👇 1) { 🫡 0; } 💅 { 🫡 👀 f(n ➖ 1) ➕ 1; } }
+            🫡 👀 f(n);
+        }
+        🗣️ 👀 outer(2500);
+    """,
+    # Declares the name of the recursive function in an unrelated function.
+    """
+        🛠 g() { 🥸 f ✍️ 1; 🫡 f; }
+        🛠 f(🥸 n) { 🤔 (n 👇 1) { 🫡 0; } 💅 { 🫡 👀 f(n ➖ 1) ➕ 1; } }
+        🗣️ 👀 f(2500);
+    """,
+], ids=['conditional declaration', 'loop declaration', 'nested function', 'name declared elsewhere'])
+def test_recursion_through_unresolved_lookups_runs_past_the_python_recursion_limit(source_code, capsys):
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == '2500.0\n'
+
+
+def test_remembered_recursion_runs_far_past_the_python_recursion_limit(capsys):
+    source_code = """
+        🛠 fib(🥸 n) {
+            🤔 (n 👇 2) {
+                🫡 n;
+            } 💅 {
+                🫡 👀 fib(n ➖ 1) ➕ 👀 fib(n ➖ 2);
+            }
+        }
+        🗣️ 👀 fib(1200);
+    """
+    interpreter = Interpreter(parse_program(source_code, resolve=True), memo_size=1024)
+    interpreter.execute()
+    previous, current = 0.0, 1.0
+    for _ in range(1199):
+        previous, current = current, previous + current
+    assert capsys.readouterr().out == f'{current}\n'
+    assert interpreter.get_memo_caches()[0].get_hits() == 1198
+
+
+def test_errors_deep_in_the_call_stack_stop_the_program():
+    source_code = """
+        🛠 fail(🥸 n) {
+            🤔 (n 🤝 0) {
+                🫡 1 ➗ 0;
+            } 💅 {
+                🫡 1 ➕ 👀 fail(n ➖ 1);
+            }
+        }
+        👀 fail(5000);
+    """
+    with pytest.raises(RuntimeError, match='Attempting to divide by zero.'):
+        Interpreter(parse_program(source_code, resolve=True)).execute()
+
+
+@pytest.mark.parametrize('source_code', [
+    """
+        🛠 fact(🥸 n) { 🤔 (n 👇 2) { 🫡 1; } 💅 { 🫡 n ✖️ 👀 fact(n ➖ 1); } }
+        🗣️ 👀 fact(10);
+    """,
+    """
+        🛠 show() { 🗣️ secret; 🫡 secret; }
+        🛠 reveal(🥸 n) { 🥸 secret ✍️ n; 🫡 👀 show() ➕ 1; }
+        🥸 secret ✍️ 0;
+        🗣️ 👀 reveal(3) 🤝 4;
+        🗣️ 👀 show();
+    """,
+    """
+        🛠 stop() { 💥; }
+        🥸 i ✍️ 0;
+        🔁 (i 👇 5) { i ✍️ i ➕ 1; 🤔 (i 🤝 3) { 👀 stop(); } 🗣️ i; }
+    """,
+    """
+        🛠 count(🥸 n) { 🤔 (n 🤝 0) { 🫡 "done"; } 💅 { 🫡 👀 count(n ➖ 1); } }
+        🛠 both(🥸 n) { 🗣️ 👀 count(n); 🫡 🙅 (n ☝️ 1) or 👀 count(n) 🤝 "done"; }
+        🗣️ 👀 both(4);
+    """,
+    """
+        🛠 add(🥸 a, 🥸 b) { 🫡 a ➕ b; }
+        🛠 twice(🥸 a) { 🫡 👀 add(a); }
+        🥸 b ✍️ 10;
+        🗣️ 👀 twice(1);
+        🗣️ 👀 add(👀 add(1, 2), 👀 add(3, 4));
+    """,
+])
+def test_calls_on_the_call_stack_run_like_nested_calls(source_code, capsys, monkeypatch):
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    expected_output = capsys.readouterr().out
+
+    # Every call then runs on the explicit call stack.
+    monkeypatch.setattr(function_node, 'MAX_NESTED_CALLS', 0)
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == expected_output
+
+
+def test_calls_are_nested_up_to_the_function_depth_of_their_scope(monkeypatch):
+    function = parse_program("🛠 one() { 🫡 1; }").get_nodes()[0]
+    stacked_contexts = []
+    monkeypatch.setattr(function_node, 'MAX_NESTED_CALLS', 1)
+    monkeypatch.setattr(
+        function_node, 'run_on_call_stack', lambda function, context, arguments: stacked_contexts.append(context)
+    )
+
+    # Each run counts the calls of its own scope chain.
+    for _ in range(2):
+        first_context = ScopeContext(BlockScopeContext(BlockScope.GLOBAL)).create_new_scope_context(BlockScope.FUNCTION)
+        assert function.call(first_context, []) == 1.0
+        second_context = first_context.create_new_scope_context(BlockScope.FUNCTION)
+        function.call(second_context, [])
+        assert stacked_contexts.pop() is second_context
+    assert stacked_contexts == []
@@ -0,0 +1,46 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext, ScopeContext
+from mojilang.parser.nodes import BreakNode, ContinueNode
+from mojilang.parser.nodes.completion import BREAK, CONTINUE, NORMAL
+from tests.e2e.utils.run_interpreter import parse_program
+
+
+def _loop_context():
+    return ScopeContext(BlockScopeContext(BlockScope.GLOBAL)).create_new_scope_context(BlockScope.LOOP)
+
+
+@pytest.mark.parametrize('source_code, expected_status, expected_value', [
+    ("🥸 a ✍️ 1 ➕ 2;", NORMAL, None),
+    ("🗣️ 1; 💥; 🗣️ 2;", BREAK, BreakNode),
+    ("🗣️ 1; 🤓; 🗣️ 2;", CONTINUE, ContinueNode),
+    ("🤔 (😤) { 💥; } 🗣️ 2;", BREAK, BreakNode),
+    ("🫡 3; 💥;", NORMAL, 3.0),
+])
+def test_block_completes_with_a_status_and_a_value(capsys, source_code, expected_status, expected_value):
+    context = _loop_context()
+    status = parse_program(source_code).execute(context)
+    assert status == expected_status
+    if isinstance(expected_value, type):
+        assert isinstance(context.completion_value, expected_value)
+    else:
+        assert context.completion_value == expected_value
+
+
+def test_markers_do_not_end_blocks_outside_of_loops(capsys):
+    context = ScopeContext(BlockScopeContext(BlockScope.GLOBAL))
+    assert parse_program("💥; 🤓; 🗣️ 2;").execute(context) == NORMAL
+    assert capsys.readouterr().out == '2.0\n'
+
+
+def test_markers_returned_by_calls_complete_with_their_status():
+    source_code = "🛠 skip() { 🤓; } 👀 skip(); 🥸 a ✍️ 1;"
+    context = _loop_context()
+    assert parse_program(source_code).execute(context) == CONTINUE
+    assert isinstance(context.completion_value, ContinueNode)
+
+
+def test_break_in_an_inner_loop_still_reaches_the_outer_loop(capsys):
+    source_code = "🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; 🔁 (😤) { 💥; } 🗣️ i; }\n🗣️ i;"
+    Interpreter(parse_program(source_code)).execute()
+    assert capsys.readouterr().out == '1.0\n'
@@ -0,0 +1,123 @@
+import pathlib
+
+import pytest
+from mojilang import Lexer, Parser, Interpreter
+from mojilang.interpreter import ConstantFolder
+from mojilang.lexer import SyntaxException
+from mojilang.mojilang import main
+from mojilang.parser.nodes import (
+    AndNode,
+    BooleanLiteralNode,
+    DivisionNode,
+    IfNode,
+    NotNode,
+    NumberLiteralNode,
+    PrintNode,
+    StringLiteralNode,
+    VariableNode,
+)
+from tests.e2e.utils.run_interpreter import parse_program
+
+SAMPLE_FILES = sorted((pathlib.Path(__file__).parents[2] / 'sample_mojilang_files').rglob('*.moji'))
+
+PROGRAMS = [
+    "🥸 x ✍️ 2 ➕ 3 ✖️ 4; 🗣️ x ➖ 1 ➗ 4;",
+    "🗣️ 😤 and 1 ➕ 1; 🗣️ 😔 or 0; 🗣️ 0 and 😤; 🗣️ 🙅 (1 🤝 1);",
+    "🥸 x ✍️ 😔; 🗣️ 😤 and x; 🗣️ 😔 or x; 🗣️ 🙅 🙅 🙅 x; 🗣️ 🙅 🙅 x;",
+    "🗣️ \"a\" ➕ \"b\"; 🗣️ (😤 ➕ 😤) ✖️ 2; 🗣️ 2 🥕 10;",
+    "🥸 x ✍️ 1; 🤔 (1 👇 0) { 🗣️ 1; } 🙈 (x) { 🗣️ 2; } 💅 { 🗣️ 3; }",
+    "🤔 (😔) { 🗣️ 1; } 🙈 (0 🤝 1) { 🗣️ 2; } 💅 { 🥸 y ✍️ 3; 🗣️ y; }",
+    "🥸 x ✍️ 2; 🤔 (x 👇 3) { 🗣️ 1; } 🙈 (😤) { 🗣️ 2; } 💅 { 🗣️ 3; } 🗣️ x;",
+    "🛠 f() { 🗣️ 1; 🤔 (😔) { 🫡 2; } } 🗣️ 👀 f();",
+    "🛠 f(🥸 n) { 🫡 n ✖️ (2 ➕ 1); } 🥸 i ✍️ 0; 🔁 (i 👇 1 ➕ 2) { 🗣️ 👀 f(i ➕ 0 ✖️ 5); i ✍️ i ➕ 1; }",
+    "🗣️ 1; 🗣️ 1 ➗ 0;",
+    "🗣️ 1; 🗣️ \"a\" ➖ 1;",
+    "🛠 f() { 🗣️ n; } 🤔 (😔) { 🥸 n ✍️ 1; } 🗣️ \"ok\";",
+]
+
+
+def _fold_expression(expression):
+    print_node = ConstantFolder().fold(parse_program(f"🗣️ {expression};")).get_nodes()[0]
+    assert isinstance(print_node, PrintNode)
+    return print_node.get_node_to_print()
+
+
+@pytest.mark.parametrize('expression, literal_class, value', [
+    ("2 ➕ 3 ✖️ 4", NumberLiteralNode, 14.0),
+    ("(1 👇 2) and 3", NumberLiteralNode, 3.0),
+    ("🙅😤", BooleanLiteralNode, False),
+    ('"a" ➕ "b"', StringLiteralNode, 'ab'),
+    ("😤 ➕ 😤", NumberLiteralNode, 2),
+    # The right operand of a short-circuiting operation decided by the left one is never evaluated.
+    ("😔 and x", BooleanLiteralNode, False),
+    ("1 or x", NumberLiteralNode, 1.0),
+])
+def test_constant_expressions_are_folded(expression, literal_class, value):
+    folded = _fold_expression(expression)
+    assert type(folded) is literal_class
+    assert folded.get_value() == value and type(folded.get_value()) is type(value)
+
+
+@pytest.mark.parametrize('expression, node_class', [
+    ("😤 and x", VariableNode),
+    ("😔 or x", VariableNode),
+    ("🙅🙅🙅x", NotNode),
+    ("x ➕ 0", None),
+    ("x ✖️ 1", None),
+    ("1 ➗ 0", DivisionNode),
+])
+def test_expressions_are_only_simplified_if_their_value_cannot_change(expression, node_class):
+    folded = _fold_expression(expression)
+    if node_class is None:
+        assert not isinstance(folded, (VariableNode, NumberLiteralNode, BooleanLiteralNode))
+    else:
+        assert type(folded) is node_class
+    if node_class is NotNode:
+        assert isinstance(folded.get_condition_node(), VariableNode)
+
+
+def test_dead_conditional_branches_are_dropped():
+    abstract_syntax_tree = ConstantFolder().fold(
+        parse_program("🤔 (😔) { 🗣️ 1; } 🙈 (x) { 🗣️ 2; } 🙈 (😤) { 🗣️ 3; } 💅 { 🗣️ 4; } 🤔 (0) { 🗣️ 5; } 🗣️ 6;")
+    )
+    conditional, print_node = abstract_syntax_tree.get_nodes()
+    assert isinstance(conditional, IfNode)
+    assert isinstance(conditional.get_condition_node(), VariableNode)
+    last_branch = conditional.get_next_conditional_node()
+    assert last_branch.get_condition_node().get_value() is True
+    assert last_branch.get_next_conditional_node() is None
+    assert isinstance(print_node, PrintNode)
+
+
+def test_conditional_running_no_branch_is_kept_as_the_value_of_a_function(capsys):
+    abstract_syntax_tree = ConstantFolder().fold(parse_program("🛠 f() { 🗣️ 1; 🤔 (😔) { 🫡 2; } } 🗣️ 👀 f();"))
+    Interpreter(abstract_syntax_tree).execute()
+    assert capsys.readouterr().out == '1.0\nNone\n'
+
+
+@pytest.mark.parametrize('backend', Interpreter.BACKENDS)
+@pytest.mark.parametrize('source_code', PROGRAMS + [path.read_text() for path in SAMPLE_FILES])
+def test_folding_does_not_change_the_output(capsys, backend, source_code):
+    outputs = []
+    for optimize in (False, True):
+        try:
+            main(source_code, interpreter_backend=backend, optimize=optimize)
+            error = None
+        except RuntimeError as e:
+            error = str(e)
+        outputs.append((capsys.readouterr().out, error))
+    assert outputs[0] == outputs[1]
+
+
+def test_undefined_variables_in_dropped_branches_are_still_rejected():
+    for optimize in (False, True):
+        with pytest.raises(SyntaxException, match="Undefined variable 'x'"):
+            main("🤔 (😔) { 🗣️ x; } 🗣️ 1;", optimize=optimize)
+
+
+def test_right_operand_is_kept_without_short_circuit():
+    lexer = Lexer("🗣️ 😔 and x;")
+    lexer.scan_tokens()
+    abstract_syntax_tree = ConstantFolder().fold(Parser(lexer.get_tokens(), short_circuit=False).parse())
+    folded = abstract_syntax_tree.get_nodes()[0].get_node_to_print()
+    assert isinstance(folded, AndNode) and not folded.is_short_circuit()
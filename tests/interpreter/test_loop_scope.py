@@ -0,0 +1,42 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.interpreter.scope import ScopeContext
+from tests.e2e.utils.run_interpreter import parse_program
+
+
+def _count_new_scopes(monkeypatch):
+    created = []
+    create_new_scope_context = ScopeContext.create_new_scope_context
+
+    def counting(self, block_scope):
+        created.append(block_scope)
+        return create_new_scope_context(self, block_scope)
+    monkeypatch.setattr(ScopeContext, 'create_new_scope_context', counting)
+    return created
+
+
+@pytest.mark.parametrize('body', ["i ✍️ i ➕ 1;", "🥸 j ✍️ i; i ✍️ j ➕ 1;"])
+def test_loop_iterations_share_one_scope(monkeypatch, capsys, body):
+    created = _count_new_scopes(monkeypatch)
+    Interpreter(parse_program(f"🥸 i ✍️ 0;\n🔁 (i 👇 100) {{ {body} }}\n🗣️ i;")).execute()
+    assert capsys.readouterr().out == '100.0\n'
+    assert len(created) == 1
+
+
+def test_loop_that_never_runs_creates_no_scope(monkeypatch):
+    created = _count_new_scopes(monkeypatch)
+    Interpreter(parse_program("🔁 (😔) { 🥸 j ✍️ 1; }")).execute()
+    assert created == []
+
+
+def test_variables_do_not_outlive_their_iteration(capsys):
+    source_code = "🥸 i ✍️ 0;\n🔁 (i 👇 2) { 🤔 i 🤝 1 { 🗣️ x; } 🥸 x ✍️ i; 🗣️ x; i ✍️ i ➕ 1; }"
+    with pytest.raises(RuntimeError, match="Undefined variable 'x'"):
+        Interpreter(parse_program(source_code)).execute()
+    assert capsys.readouterr().out == '0.0\n'
+
+
+def test_functions_do_not_outlive_their_iteration(capsys):
+    source_code = "🥸 i ✍️ 0;\n🔁 (i 👇 2) { 🗣️ 👀 f(); 🛠 f() { 🫡 1; } i ✍️ i ➕ 1; }"
+    with pytest.raises(RuntimeError, match="'NoneType' object has no attribute 'call'"):
+        Interpreter(parse_program(source_code)).execute()
@@ -0,0 +1,149 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.interpreter import PurityAnalyzer
+from tests.e2e.utils.run_interpreter import parse_program
+
+MEMO_SIZE = 1024
+
+
+def _run(source_code, capsys, memo_size=MEMO_SIZE):
+    interpreter = Interpreter(parse_program(source_code, resolve=True), memo_size=memo_size)
+    interpreter.execute()
+    caches = {cache.get_function_name(): cache for cache in interpreter.get_memo_caches()}
+    return capsys.readouterr().out, caches
+
+
+FIBONACCI = """
+    🛠 fibonacci(🥸 n) {
+        🤔 (n 👇 2) {
+            🫡 n;
+        } 💅 {
+            🫡 👀 fibonacci(n ➖ 1) ➕ 👀 fibonacci(n ➖ 2);
+        }
+    }
+    🗣️ 👀 fibonacci(25);
+"""
+
+
+@pytest.mark.parametrize('body, is_pure', [
+    ("🫡 n ✖️ 2;", True),
+    ("🥸 i ✍️ 0; 🔁 (i 👇 n) { 🥸 step ✍️ i; i ✍️ step ➕ 1; } 🫡 i;", True),
+    ("🛠 inner() { 🫡 1; } 🫡 👀 inner();", True),
+    ("🫡 👀 pure(n);", True),
+    ("🗣️ n;", False),
+    ("total ✍️ n;", False),
+    ("🥸 local ✍️ 1; 🤔 (n) { 🫡 local; } 💥;", False),
+    ("🫡 👀 printing(n);", False),
+    ("🫡 👀 missing(n);", False),
+    ("🫡 👀 alias(n);", False),
+    # A variable declared outside of functions may be a global, which the reassignment could reach too.
+    ("🥸 total ✍️ 0; 🤔 (n) { 🔁 (😔) { total ✍️ 1; } } 🫡 total;", False),
+])
+def test_pure_functions_are_found(body, is_pure):
+    abstract_syntax_tree = parse_program(f"""
+        🥸 total ✍️ 0;
+        🛠 pure(🥸 n) {{ 🫡 n; }}
+        🛠 printing(🥸 n) {{ 🗣️ n; }}
+        🛠 alias(🥸 n) {{ 🫡 n; }}
+        🥸 alias ✍️ 0;
+        🛠 f(🥸 n) {{ {body} }}
+    """, resolve=True)
+    pure_names = {node.get_function_name() for node in PurityAnalyzer().analyze(abstract_syntax_tree)}
+    assert ('f' in pure_names) == is_pure
+
+
+def test_calls_with_the_same_arguments_are_remembered(capsys):
+    output, caches = _run(FIBONACCI, capsys)
+    assert output == '75025.0\n'
+    assert (caches['fibonacci'].get_hits(), caches['fibonacci'].get_misses()) == (23, 26)
+
+
+def test_least_recently_used_values_are_evicted(capsys):
+    output, caches = _run(FIBONACCI.replace('25', '15'), capsys, memo_size=2)
+    assert output == '610.0\n'
+    assert len(caches['fibonacci']) == 2
+    assert caches['fibonacci'].get_size() == 2
+
+
+def test_memoization_is_off_by_default(capsys):
+    interpreter = Interpreter(parse_program(FIBONACCI.replace('25', '10'), resolve=True))
+    interpreter.execute()
+    assert capsys.readouterr().out == '55.0\n'
+    assert interpreter.get_memo_caches() == []
+
+
+def test_memo_size_zero_remembers_nothing(capsys):
+    output, caches = _run(FIBONACCI.replace('25', '10'), capsys, memo_size=0)
+    assert output == '55.0\n'
+    assert caches == {}
+
+
+def test_negative_memo_size_is_rejected():
+    with pytest.raises(ValueError):
+        Interpreter(parse_program("🗣️ 1;", resolve=True), memo_size=-1)
+
+
+def test_variables_of_the_calling_scopes_are_part_of_the_key(capsys):
+    source_code = """
+        🛠 scaled(🥸 n) { 🫡 n ✖️ factor; }
+        🛠 first() { 🥸 factor ✍️ 2; 🗣️ 👀 scaled(5); }
+        🛠 second() { 🥸 factor ✍️ 3; 🗣️ 👀 scaled(5); }
+        👀 first();
+        👀 second();
+        👀 first();
+    """
+    output, caches = _run(source_code, capsys)
+    assert output == '10.0\n15.0\n10.0\n'
+    assert (caches['scaled'].get_hits(), caches['scaled'].get_misses()) == (1, 2)
+
+
+def test_names_declared_outside_the_global_scope_are_local():
+    abstract_syntax_tree = parse_program("""
+        🛠 f(🥸 n) { 🥸 local ✍️ n; 🛠 inner() { 🫡 1; } 🫡 👀 inner(); }
+        🥸 total ✍️ 0;
+        🔁 (total 👇 1) { 🥸 step ✍️ 1; total ✍️ total ➕ step; }
+    """, resolve=True)
+    purity_analyzer = PurityAnalyzer()
+    purity_analyzer.analyze(abstract_syntax_tree)
+    assert purity_analyzer.get_local_names() == {'n', 'local', 'inner', 'step'}
+
+
+def test_global_variables_in_the_key_are_read_from_the_global_scope(capsys):
+    source_code = """
+        🛠 scaled(🥸 n) { 🫡 n ✖️ factor; }
+        🥸 factor ✍️ 2;
+        🗣️ 👀 scaled(5);
+        factor ✍️ 4;
+        🗣️ 👀 scaled(5);
+        🗣️ 👀 scaled(5);
+    """
+    output, caches = _run(source_code, capsys)
+    assert output == '10.0\n20.0\n20.0\n'
+    assert (caches['scaled'].get_hits(), caches['scaled'].get_misses()) == (1, 2)
+
+
+def test_equal_values_of_different_types_are_not_confused(capsys):
+    source_code = """
+        🛠 same(🥸 n) { 🫡 n; }
+        🗣️ 👀 same(1);
+        🗣️ 👀 same(😤);
+        🗣️ 👀 same(0);
+        🗣️ 👀 same((0 ➖ 1) ✖️ 0);
+    """
+    output, _ = _run(source_code, capsys)
+    assert output == '1.0\n😤\n0.0\n-0.0\n'
+
+
+def test_failing_calls_are_not_remembered(capsys):
+    source_code = """
+        🛠 inverse(🥸 n) { 🫡 1 ➗ n; }
+        🥸 i ✍️ 0;
+        🔁 (i 👇 2) {
+            🗣️ 👀 inverse(2);
+            i ✍️ i ➕ 1;
+        }
+        🗣️ 👀 inverse(0);
+    """
+    with pytest.raises(RuntimeError, match='divide by zero'):
+        _run(source_code, capsys)
+    assert capsys.readouterr().out == '0.5\n0.5\n'
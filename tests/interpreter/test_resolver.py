@@ -0,0 +1,85 @@
+import pytest
+from mojilang.interpreter import Resolver
+from mojilang.interpreter.scope import ScopeContext
+from mojilang.parser.nodes import VariableNode
+from tests.e2e.utils.run_interpreter import parse_program, run_program
+from tests.e2e.utils.syntax_tree import walk_nodes
+
+
+def _addresses(source_code):
+    abstract_syntax_tree = parse_program(source_code)
+    assert Resolver().resolve(abstract_syntax_tree) == []
+    # The variable an assignment declares or reassigns is never evaluated.
+    return [
+        (node.get_name(), node.get_address())
+        for node in walk_nodes(abstract_syntax_tree, skipped_attributes=('_variable_node',))
+        if isinstance(node, VariableNode)
+    ]
+
+
+def test_top_level_variables_are_global():
+    assert _addresses("🥸 x ✍️ 1;\n🤔 😤 { 🔁 (x 👇 3) { 🗣️ x; } }") == [
+        ('x', ScopeContext.GLOBAL_DEPTH), ('x', ScopeContext.GLOBAL_DEPTH)
+    ]
+
+
+def test_block_variables_are_bound_to_their_depth():
+    source_code = "🤔 😤 { 🥸 x ✍️ 1; 🤔 😤 { 🥸 y ✍️ 2; 🤔 😤 { 🥸 z ✍️ 3; 🗣️ x; } 🗣️ x; } }"
+    assert _addresses(source_code) == [('x', 2), ('x', 1)]
+
+
+def test_scope_free_blocks_are_not_counted():
+    assert _addresses("🤔 😤 { 🥸 x ✍️ 1; 🤔 😤 { 🤔 😤 { 🗣️ x; } 🗣️ x; } }") == [('x', 0), ('x', 0)]
+
+
+def test_function_variables_are_bound_within_the_function_only():
+    source_code = "🥸 y ✍️ 1;\n🛠 f(🥸 n) { 🥸 m ✍️ n; 🤔 😤 { 🥸 k ✍️ 1; 🫡 m ➕ n ➕ y; } }"
+    assert _addresses(source_code) == [('n', 0), ('m', 1), ('n', 1), ('y', None)]
+
+
+def test_declarations_are_bound_when_they_cannot_fail():
+    abstract_syntax_tree = parse_program("🥸 x ✍️ 1;\n🤔 😤 { 🥸 y ✍️ 2; }\n🛠 f() { 🥸 z ✍️ 3; 🤔 😤 { 🥸 w ✍️ 4; } }")
+    Resolver().resolve(abstract_syntax_tree)
+    declaration, conditional, function = abstract_syntax_tree.get_nodes()
+    function_declaration, function_conditional = function.get_function_block_node().get_nodes()
+    assert declaration.get_address() == ScopeContext.GLOBAL_DEPTH
+    assert conditional.get_block_node().get_nodes()[0].get_address() == 0
+    assert function_declaration.get_address() == 0
+    # The callers may have declared it already.
+    assert function_conditional.get_block_node().get_nodes()[0].get_address() is None
+
+
+def test_undefined_variables_are_reported():
+    abstract_syntax_tree = parse_program(
+        "🗣️ x;\n🥸 x ✍️ 1;\n🤔 😤 { 🥸 y ✍️ 2; }\n🗣️ y;\n🛠 f() { 🫡 z; }\n🛠 g() { 🫡 x ➕ y; }"
+    )
+    exceptions = Resolver().resolve(abstract_syntax_tree)
+    assert [str(exception) for exception in exceptions] == [
+        "Syntax error at line 1: Undefined variable 'x'",
+        "Syntax error at line 4: Undefined variable 'y'",
+        "Syntax error at line 5: Undefined variable 'z'",
+    ]
+
+
+def test_statements_that_never_run_are_not_reported():
+    assert Resolver().resolve(parse_program("🫡 1;\n🗣️ x;")) == []
+
+
+@pytest.mark.parametrize('source_code', [
+    "🥸 x ✍️ 1;\n🛠 f() { 🥸 x ✍️ 5; 🤔 😤 { 🤔 😤 { x ✍️ 9; } } 🫡 x; }\n🗣️ 👀 f();\n🗣️ x;",
+    "🥸 x ✍️ 1;\n🤔 😤 { 🤔 😤 { x ✍️ 9; } }\n🗣️ x;",
+    "🥸 n ✍️ 7;\n🛠 f(🥸 n) { 🫡 n; }\n🗣️ 👀 f();\n🗣️ 👀 f(1);",
+    "🛠 f(🥸 n) { 🥸 n ✍️ 2; 🫡 n; }\n🗣️ 👀 f();\n🗣️ 👀 f(1);",
+    "🛠 f(🥸 n) { n ✍️ n ➕ 1; 🫡 n; }\n🥸 n ✍️ 1;\n🗣️ 👀 f();\n🗣️ n;",
+    "🛠 f() { y ✍️ y ➕ 1; }\n🛠 g() { 🥸 y ✍️ 3; 👀 f(); 🫡 y; }\n🗣️ 👀 g();",
+    "🥸 f ✍️ 1;\n🤔 😤 { 🛠 f() { 🫡 2; } 🗣️ 👀 f(); f ✍️ 3; 🗣️ f; }\n🗣️ f;",
+    "🥸 i ✍️ 2;\n🔁 (i ☝️ 0) { 🥸 j ✍️ i ✖️ 2; 🗣️ j; i ✍️ i ➖ 1; }",
+    "🛠 f() { 🥸 x ✍️ 1; 🥸 x ✍️ 2; }\n👀 f();",
+    "🥸 x ✍️ 1;\n🤔 😤 { 🥸 x ✍️ 2; }",
+    "🗣️ 1;\n🗣️ y;",
+])
+def test_bound_program_matches_tree_walker(capsys, source_code):
+    expected = run_program(parse_program(source_code), capsys)
+    abstract_syntax_tree = parse_program(source_code)
+    Resolver().resolve(abstract_syntax_tree)
+    assert run_program(abstract_syntax_tree, capsys) == expected
@@ -0,0 +1,100 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.parser.nodes import FunctionCallNode, FunctionNode
+from tests.e2e.utils.run_interpreter import parse_program
+from tests.e2e.utils.syntax_tree import walk_nodes
+
+
+def _tail_calls(abstract_syntax_tree):
+    return {
+        node.get_function_name(): node.is_tail_call()
+        for node in walk_nodes(abstract_syntax_tree) if isinstance(node, FunctionCallNode)
+    }
+
+
+def _functions(abstract_syntax_tree):
+    return {node.get_function_name(): node for node in walk_nodes(abstract_syntax_tree) if isinstance(node, FunctionNode)}
+
+
+@pytest.mark.parametrize('body, expected', [
+    ("👀 a();", {'a': True}),
+    ("🫡 👀 a(); 👀 b();", {'a': True, 'b': False}),
+    ("👀 a(); 🫡 👀 b();", {'a': False, 'b': True}),
+    ("🤔 (😤) { 🫡 👀 a(); } 💅 { 👀 b(); }", {'a': True, 'b': True}),
+    ("🤔 (😤) { 🫡 👀 a(); } 🫡 👀 b();", {'a': False, 'b': True}),
+    ("🫡 👀 a() ➕ 1;", {'a': False}),
+    ("🥸 i ✍️ 0; 🔁 (i 👇 1) { 🫡 👀 a(); }", {'a': False}),
+])
+def test_calls_in_tail_position_are_marked(body, expected):
+    abstract_syntax_tree = parse_program(f"🛠 a() {{ 🫡 1; }} 🛠 b() {{ 🫡 2; }} 🛠 f() {{ {body} }} 👀 f();", resolve=True)
+    assert _tail_calls(abstract_syntax_tree) == {**expected, 'f': False}
+
+
+def test_free_variable_names_include_the_functions_called():
+    abstract_syntax_tree = parse_program("""
+        🛠 show() { 🗣️ secret; }
+        🛠 f(🥸 n) { 🥸 local ✍️ n; 👀 show(); 🫡 👀 f(local ➖ 1); }
+        🛠 g(🥸 n) { 🫡 👀 h(n); }
+    """, resolve=True)
+    functions = _functions(abstract_syntax_tree)
+    assert functions['show'].get_free_variable_names() == {'secret'}
+    assert functions['f'].get_free_variable_names() == {'secret', 'show', 'f'}
+    # h is not a function of the program.
+    assert functions['g'].get_free_variable_names() is None
+
+
+def test_tail_recursion_runs_a_hundred_thousand_levels_deep(capsys):
+    source_code = """
+        🛠 count_down(🥸 n) {
+            🤔 (n 🤝 0) {
+                🫡 0;
+            } 💅 {
+                🫡 👀 count_down(n ➖ 1);
+            }
+        }
+        🗣️ 👀 count_down(100000);
+    """
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == '0.0\n'
+
+
+def test_mutual_tail_recursion_runs_a_hundred_thousand_levels_deep(capsys):
+    source_code = """
+        🛠 is_even(🥸 n) {
+            🤔 (n 🤝 0) {
+                🫡 😤;
+            } 💅 {
+                🫡 👀 is_odd(n ➖ 1);
+            }
+        }
+        🛠 is_odd(🥸 n) {
+            🤔 (n 🤝 0) {
+                🫡 😔;
+            } 💅 {
+                🫡 👀 is_even(n ➖ 1);
+            }
+        }
+        🗣️ 👀 is_even(100000);
+    """
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == '😤\n'
+
+
+def test_tail_call_keeps_the_variables_the_function_called_looks_up(capsys):
+    source_code = """
+        🛠 show() { 🗣️ secret; }
+        🛠 reveal() { 🥸 secret ✍️ 5; 🫡 👀 show(); }
+        👀 reveal();
+    """
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == '5.0\n'
+
+
+def test_tail_call_missing_arguments_are_looked_up_in_the_calling_scopes(capsys):
+    source_code = """
+        🛠 show(🥸 n) { 🗣️ n; }
+        🛠 call_show(🥸 n) { 🫡 👀 show(); }
+        👀 call_show(7);
+    """
+    Interpreter(parse_program(source_code, resolve=True)).execute()
+    assert capsys.readouterr().out == '7.0\n'
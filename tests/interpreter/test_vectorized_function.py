@@ -0,0 +1,128 @@
+import cmath
+
+import pytest
+from mojilang import Lexer, Parser
+from mojilang.interpreter.scope import BlockScope, BlockScopeContext, ScopeContext
+
+np = pytest.importorskip('numpy')
+from mojilang.interpreter import VectorizedFunction  # noqa: E402
+
+
+def _function_node(source_code, short_circuit=True):
+    lexer = Lexer(source_code)
+    lexer.scan_tokens()
+    return Parser(lexer.get_tokens(), short_circuit=short_circuit).parse().get_nodes()[0]
+
+
+def _evaluate_row(function_node, row):
+    context = ScopeContext(BlockScopeContext(BlockScope.GLOBAL))
+    for name, value in zip(function_node.get_argument_names(), row):
+        context.assign_value(name, value)
+    return function_node.get_function_block_node().get_nodes()[0].get_return_value_node().evaluate(context)
+
+
+def _assert_same_values(values, expected_values):
+    assert len(values) == len(expected_values)
+    for value, expected_value in zip(values, expected_values):
+        value = value.item() if isinstance(value, np.generic) else value
+        assert type(value) is type(expected_value)
+        if isinstance(value, (float, complex)) and cmath.isnan(value):
+            assert cmath.isnan(expected_value)
+        else:
+            assert value == expected_value
+
+
+X = [0.0, 1.0, 2.0, -3.0, 4.5, 7.0]
+Y = [1.0, 2.0, -1.0, 0.5, 3.0, -2.0]
+
+
+@pytest.mark.parametrize('expression', [
+    "x ➕ y ✖️ 2",
+    "(x ➖ y) ➗ (y ➕ 3)",
+    "x 🍕 y",
+    "y 🥕 2 ➖ x 🥕 0.5",
+    "x ☝️ y",
+    "x 👇 y or x 🤝 2",
+    "🙅 (x ☝️ 1) and y",
+    "x and y ➕ 1",
+    "(x ☝️ 1) or (y 👇 0)",
+    "(x ☝️ 1) ➕ (y ☝️ 1)",
+    "😤 ➕ x",
+    # Constant subexpressions are evaluated once, over no rows.
+    "(0 ➖ 1) 🥕 0.5 ➕ x",
+    "🙅 (0.5 🥕 😔) and x",
+    "🙅 (😤 🍕 😤) or y",
+    "(x ☝️ 100) and 1 ➗ 0",
+    "(0 ➖ 1) or (0 ➗ 0)",
+])
+def test_rows_evaluate_like_the_scalar_expression(expression):
+    function_node = _function_node(f"🛠 f(🥸 x, 🥸 y) {{ 🫡 {expression}; }}")
+
+    values = VectorizedFunction(function_node)(np.array(X), np.array(Y))
+
+    _assert_same_values(values, [_evaluate_row(function_node, row) for row in zip(X, Y)])
+
+
+@pytest.mark.parametrize('short_circuit', [True, False])
+def test_short_circuit_only_evaluates_the_rows_the_left_operand_does_not_decide(short_circuit):
+    function_node = _function_node("🛠 f(🥸 x, 🥸 y) { 🫡 (y 🤝 0) or (x ➗ y ☝️ 1); }", short_circuit)
+    vectorized_function = VectorizedFunction(function_node)
+
+    if short_circuit:
+        values = vectorized_function(np.array([1.0, 4.0, 1.0]), np.array([0.0, 2.0, 2.0]))
+        _assert_same_values(values, [True, True, False])
+    else:
+        with pytest.raises(ZeroDivisionError):
+            vectorized_function(np.array([1.0, 4.0, 1.0]), np.array([0.0, 2.0, 2.0]))
+
+
+@pytest.mark.parametrize('expression', ["x ➗ y", "x 🍕 y", "x ➕ 1 ➗ 0", "x ✖️ (1 🍕 0)"])
+def test_division_by_zero_raises_like_the_scalar_expression(expression):
+    vectorized_function = VectorizedFunction(_function_node(f"🛠 f(🥸 x, 🥸 y) {{ 🫡 {expression}; }}"))
+
+    with pytest.raises(ZeroDivisionError):
+        vectorized_function(np.array([1.0, 2.0]), np.array([1.0, 0.0]))
+
+
+def test_values_without_a_float_result_become_python_objects():
+    function_node = _function_node("🛠 f(🥸 x) { 🫡 x 🥕 0.5; }")
+
+    values = VectorizedFunction(function_node)(np.array([4.0, -1.0]))
+
+    assert values.dtype == object
+    _assert_same_values(values, [2.0, (-1.0) ** 0.5])
+
+
+def test_expressions_default_to_their_variables_in_order_and_accept_named_arrays():
+    function_node = _function_node("🛠 f(🥸 x, 🥸 y) { 🫡 y ➖ x; }")
+    vectorized_function = VectorizedFunction(function_node.get_function_block_node().get_nodes()[0]
+                                             .get_return_value_node())
+
+    assert vectorized_function.get_argument_names() == ('y', 'x')
+    _assert_same_values(vectorized_function(x=np.array([1, 2]), y=3), [2.0, 1.0])
+
+
+def test_from_source_vectorizes_a_function_of_a_program():
+    vectorized_function = VectorizedFunction.from_source(
+        "🛠 f(🥸 x) { 🫡 x; } 🛠 f(🥸 x) { 🫡 x ✖️ 2; } 🗣️ 👀 f(1);", 'f'
+    )
+
+    _assert_same_values(vectorized_function(np.array([1, 2])), [2.0, 4.0])
+
+
+@pytest.mark.parametrize('source_code', [
+    "🛠 f(🥸 x) { 🥸 y ✍️ x; 🫡 y; }",
+    "🛠 f(🥸 x) { 🫡 x ➕ z; }",
+    "🛠 f(🥸 x) { 🫡 👀 g(x); }",
+    "🛠 f(🥸 x) { 🫡 \"x\"; }",
+])
+def test_functions_that_cannot_be_vectorized_are_rejected(source_code):
+    with pytest.raises(ValueError):
+        VectorizedFunction(_function_node(source_code))
+
+
+def test_arrays_of_different_lengths_are_rejected():
+    vectorized_function = VectorizedFunction(_function_node("🛠 f(🥸 x, 🥸 y) { 🫡 x ➕ y; }"))
+
+    with pytest.raises(ValueError):
+        vectorized_function(np.array([1.0, 2.0]), np.array([1.0, 2.0, 3.0]))
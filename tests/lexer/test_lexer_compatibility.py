@@ -0,0 +1,138 @@
+import pytest
+
+from mojilang.lexer import Lexer, TokenType
+
+
+@pytest.mark.parametrize('backend', Lexer.BACKENDS)
+class TestLexerCompatibility:
+    """
+    Pins down the exact token stream (type, lexeme, literal and line) produced by every lexer backend,
+    including its quirks, so that changes to how the lexer scans characters cannot change what it produces.
+    """
+
+    SOURCE_CODE = '(){};,.✍🤝🖊💥🤓🫡🛠👀😤😔🤔🙈💅🔁🗣🥸➕+➖-✖*➗/🍕%🥕^\n= == 🙅 🙅🤝 ! != < <= 👇 👇🤝 ☝ ☝🤝 > >=\n🧐 a comment ➕ 🥸\n🥸 snake_case ✍️ 12.5 and 3. or "multi\nline" android\n'
+
+    def _scan(self, source_code, backend):
+        lexer = Lexer(source_code, backend)
+        exceptions = lexer.scan_tokens()
+        tokens = [
+            (token.get_token_type(), token.get_lexeme(), token.get_literal(), token.get_line())
+            for token in lexer.get_tokens()
+        ]
+        return tokens, [str(exception) for exception in exceptions]
+
+    def test_every_token_kind(self, backend):
+        tokens, exceptions = self._scan(self.SOURCE_CODE, backend)
+        assert exceptions == []
+        assert tokens == [
+            (TokenType.LEFT_PAREN, '(', None, 1),
+            (TokenType.RIGHT_PAREN, ')', None, 1),
+            (TokenType.LEFT_BRACE, '{', None, 1),
+            (TokenType.RIGHT_BRACE, '}', None, 1),
+            (TokenType.SEMI_COLON, ';', None, 1),
+            (TokenType.COMMA, ',', None, 1),
+            (TokenType.PERIOD, '.', None, 1),
+            (TokenType.EQUAL, '✍', None, 1),
+            (TokenType.EQUAL_EQUAL, '🤝', None, 1),
+            (TokenType.INPUT, '🖊', None, 1),
+            (TokenType.BREAK, '💥', None, 1),
+            (TokenType.CONTINUE, '🤓', None, 1),
+            (TokenType.RETURN, '🫡', None, 1),
+            (TokenType.FUNCTION, '🛠', None, 1),
+            (TokenType.FUNCTION_CALL, '👀', None, 1),
+            (TokenType.TRUE, '😤', None, 1),
+            (TokenType.FALSE, '😔', None, 1),
+            (TokenType.IF, '🤔', None, 1),
+            (TokenType.ELSEIF, '🙈', None, 1),
+            (TokenType.ELSE, '💅', None, 1),
+            (TokenType.LOOP, '🔁', None, 1),
+            (TokenType.PRINT, '🗣', None, 1),
+            (TokenType.VAR, '🥸', None, 1),
+            (TokenType.PLUS, '➕', None, 1),
+            (TokenType.PLUS, '+', None, 1),
+            (TokenType.MINUS, '➖', None, 1),
+            (TokenType.MINUS, '-', None, 1),
+            (TokenType.MULTIPLY, '✖', None, 1),
+            (TokenType.MULTIPLY, '*', None, 1),
+            (TokenType.DIVIDE, '➗', None, 1),
+            (TokenType.DIVIDE, '/', None, 1),
+            (TokenType.MODULUS, '🍕', None, 1),
+            (TokenType.MODULUS, '%', None, 1),
+            (TokenType.EXPONENT, '🥕', None, 1),
+            (TokenType.EXPONENT, '^', None, 1),
+            (TokenType.EQUAL, '=', None, 2),
+            (TokenType.EQUAL_EQUAL, '==', None, 2),
+            (TokenType.BANG, '🙅', None, 2),
+            (TokenType.BANG_EQUAL, '🙅🤝', None, 2),
+            (TokenType.BANG, '!', None, 2),
+            (TokenType.BANG_EQUAL, '!=', None, 2),
+            (TokenType.LESS, '<', None, 2),
+            (TokenType.LESS_EQUAL, '<=', None, 2),
+            (TokenType.LESS, '👇', None, 2),
+            (TokenType.LESS_EQUAL, '👇🤝', None, 2),
+            (TokenType.GREATER, '☝', None, 2),
+            (TokenType.GREATER_EQUAL, '☝🤝', None, 2),
+            (TokenType.GREATER, '>', None, 2),
+            (TokenType.GREATER_EQUAL, '>=', None, 2),
+            (TokenType.VAR, '🥸', None, 4),
+            (TokenType.IDENTIFIER, 'snake_case', None, 4),
+            (TokenType.EQUAL, '✍', None, 4),
+            (TokenType.NUMBER, '12.5', 12.5, 4),
+            (TokenType.AND, 'and', None, 4),
+            (TokenType.NUMBER, '3.', 3.0, 4),
+            (TokenType.OR, 'or', None, 4),
+            (TokenType.STRING, '"multi\nline"', 'multi\nline', 5),
+            (TokenType.AND, 'and', None, 5),
+            (TokenType.IDENTIFIER, 'roid', None, 5),
+            (TokenType.EOF, '', None, 6),
+        ]
+
+    def test_unexpected_characters_are_reported_per_line(self, backend):
+        tokens, exceptions = self._scan("🥸 x ✍️ 1 @;\n#", backend)
+        assert [token[0] for token in tokens] == [
+            TokenType.VAR,
+            TokenType.IDENTIFIER,
+            TokenType.EQUAL,
+            TokenType.NUMBER,
+            TokenType.SEMI_COLON,
+            TokenType.EOF
+        ]
+        assert exceptions == [
+            "Syntax error at line 1: Unexpected character [@]",
+            "Syntax error at line 2: Unexpected character [#]"
+        ]
+
+    def test_non_ascii_identifiers_and_digits(self, backend):
+        tokens, exceptions = self._scan("café ٣ x²", backend)
+        assert exceptions == []
+        assert tokens == [
+            (TokenType.IDENTIFIER, 'café', None, 1),
+            (TokenType.NUMBER, '٣', 3.0, 1),
+            (TokenType.IDENTIFIER, 'x²', None, 1),
+            (TokenType.EOF, '', None, 1),
+        ]
+
+    def test_unterminated_string_is_reported(self, backend):
+        tokens, exceptions = self._scan('🗣️ 1;\n🗣️ "never\nclosed;', backend)
+        assert [token[0] for token in tokens] == [
+            TokenType.PRINT,
+            TokenType.NUMBER,
+            TokenType.SEMI_COLON,
+            TokenType.PRINT,
+            TokenType.EOF
+        ]
+        assert exceptions == ["Syntax error at line 3: Unterminated string."]
+
+    def test_lexemes_are_shared(self, backend):
+        lexer = Lexer(''.join(['🥸 counter ✍️ counter 🙅🤝 1 and 2;\n'] * 2), backend)
+        lexer.scan_tokens()
+        first, second = lexer.get_tokens()[:9], lexer.get_tokens()[9:18]
+        for first_token, second_token in zip(first, second):
+            if first_token.get_token_type() != TokenType.NUMBER:
+                assert first_token.get_lexeme() is second_token.get_lexeme()
+        assert not hasattr(first[0], '__dict__')
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        Lexer("🥸 x ✍️ 1;", backend='unknown')
@@ -0,0 +1,73 @@
+import io
+
+import pytest
+
+from mojilang.lexer import Lexer
+from mojilang.lexer.regex_scanner import RegexScanner
+from tests.lexer.test_lexer_compatibility import TestLexerCompatibility
+
+
+def _describe(tokens):
+    return [(token.get_token_type(), token.get_lexeme(), token.get_literal(), token.get_line()) for token in tokens]
+
+
+def _scan(source_code):
+    lexer = Lexer(source_code)
+    exceptions = lexer.scan_tokens()
+    return _describe(lexer.get_tokens()), [str(exception) for exception in exceptions]
+
+
+def _stream(source_code, chunk_size):
+    lexer = Lexer()
+    tokens = list(lexer.iter_tokens(io.StringIO(source_code), chunk_size))
+    return _describe(tokens), [str(exception) for exception in lexer.get_exceptions()]
+
+
+SOURCE_CODES = [
+    TestLexerCompatibility.SOURCE_CODE,
+    '🥸 x ✍️ 1 🙅🤝 2 and 3 👇🤝 4 or 5 ☝🤝 6;\n🗣️ "a string\ncrossing chunks" ➕ 12.75;',
+    '🧐 a comment\n🥸 android ✍️ "unterminated\n',
+    '@ café ٣ x² and',
+    '🗣️ "a longer string\nspread over\nmany chunks" ➕ "";\n🧐 a longer comment spread over many chunks\n🗣️ 1;',
+    '🗣️ "";\n🗣️ "x"\n🧐 a comment ending the source',
+    '🗣️ 1;\n"an unterminated string\nspread over many chunks',
+]
+
+
+@pytest.mark.parametrize('source_code', SOURCE_CODES)
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 8, 1024])
+def test_streamed_tokens_match_scanned_tokens(source_code, chunk_size):
+    """
+    Whatever the chunk size, tokens (e.g. '🙅🤝', numbers and strings) split across chunk boundaries are
+    scanned exactly as they are when the whole source code is scanned at once.
+    """
+    assert _stream(source_code, chunk_size) == _scan(source_code)
+
+
+def test_tokens_are_yielded_before_the_stream_is_read_in_full():
+    class BoundedStream(io.StringIO):
+        def read(self, size=-1):
+            assert self.tell() < 64, 'The whole stream was read before yielding tokens.'
+            return super().read(size)
+
+    tokens = Lexer().iter_tokens(BoundedStream('🥸 x ✍️ 1;\n' * 1000), chunk_size=16)
+    assert next(tokens).get_lexeme() == '🥸'
+
+
+@pytest.mark.parametrize('source_code', [
+    '🗣️ "' + 'x' * 10000 + '";',
+    '🧐 ' + 'x' * 10000 + '\n🗣️ 1;',
+])
+def test_long_strings_and_comments_are_scanned_once(source_code, monkeypatch):
+    scanned_lengths = []
+    scan = RegexScanner.scan
+
+    def measured_scan(self, text, is_final=True):
+        scanned_lengths.append(len(text))
+        return scan(self, text, is_final)
+
+    monkeypatch.setattr(RegexScanner, 'scan', measured_scan)
+    lexer = Lexer()
+    list(lexer.iter_tokens(io.StringIO(source_code), chunk_size=16))
+    assert lexer.get_exceptions() == []
+    assert sum(scanned_lengths) < 2 * len(source_code)
@@ -0,0 +1,112 @@
+import pickle
+import zlib
+
+import pytest
+from mojilang import Interpreter
+from mojilang.mojilang import main, parse
+from mojilang.parser import AstCache
+from mojilang.parser.ast_cache import CACHE_DIRECTORY_NAME, _header
+
+SOURCE_CODE = """
+🛠 double(🥸 n) { 🫡 n ✖️ 2; }
+🥸 i ✍️ 0;
+🔁 (i 👇 3) {
+    🤔 (i 🤝 1 and 😤) { 🗣️ "one"; } 💅 { 🗣️ 👀 double(i); }
+    i ✍️ i ➕ 1;
+}
+"""
+
+
+@pytest.fixture
+def source_path(tmp_path):
+    path = tmp_path / 'program.moji'
+    path.write_text(SOURCE_CODE)
+    return path
+
+
+def test_stored_tree_is_loaded(source_path):
+    ast_cache = AstCache()
+    assert ast_cache.load(source_path, SOURCE_CODE) is None
+    assert ast_cache.store(source_path, SOURCE_CODE, parse(SOURCE_CODE))
+    assert ast_cache.get_cache_path(source_path) == source_path.parent / CACHE_DIRECTORY_NAME / 'program.mojic'
+    assert ast_cache.load(source_path, SOURCE_CODE) is not None
+
+
+@pytest.mark.parametrize('backend', Interpreter.BACKENDS)
+def test_loaded_tree_runs_like_the_parsed_one(capsys, source_path, backend):
+    ast_cache = AstCache()
+    for _ in range(2):
+        main(SOURCE_CODE, interpreter_backend=backend, source_path=source_path, ast_cache=ast_cache)
+        assert capsys.readouterr().out == '0.0\none\n4.0\n'
+    assert ast_cache.get_cache_path(source_path).exists()
+
+
+def test_changed_source_code_is_parsed_again(capsys, source_path):
+    ast_cache = AstCache()
+    main(SOURCE_CODE, source_path=source_path, ast_cache=ast_cache)
+    changed_source_code = SOURCE_CODE.replace('✖️ 2', '✖️ 3')
+    assert ast_cache.load(source_path, changed_source_code) is None
+    main(changed_source_code, source_path=source_path, ast_cache=ast_cache)
+    assert capsys.readouterr().out == '0.0\none\n4.0\n0.0\none\n6.0\n'
+    assert ast_cache.load(source_path, changed_source_code) is not None
+
+
+def test_tree_is_keyed_by_the_parser_options(source_path):
+    ast_cache = AstCache()
+    ast_cache.store(source_path, SOURCE_CODE, parse(SOURCE_CODE))
+    assert ast_cache.load(source_path, SOURCE_CODE, short_circuit=False) is None
+
+
+def test_tree_is_cached_before_it_is_changed(capsys, source_path):
+    ast_cache = AstCache()
+    main(SOURCE_CODE, optimize=True, source_path=source_path, ast_cache=ast_cache)
+    main(SOURCE_CODE, optimize=False, source_path=source_path, ast_cache=ast_cache)
+    assert capsys.readouterr().out == '0.0\none\n4.0\n' * 2
+    abstract_syntax_tree = ast_cache.load(source_path, SOURCE_CODE)
+    assert abstract_syntax_tree.get_nodes()[0].get_free_variable_names() is None
+
+
+@pytest.mark.parametrize('content', [b'', b'MOJIC', b'not a cache file', None])
+def test_unreadable_cache_files_are_ignored(capsys, source_path, content):
+    ast_cache = AstCache()
+    cache_path = ast_cache.get_cache_path(source_path)
+    cache_path.parent.mkdir()
+    if content is None:
+        ast_cache.store(source_path, SOURCE_CODE, parse(SOURCE_CODE))
+        content = cache_path.read_bytes()[:-10]
+    cache_path.write_bytes(content)
+    assert ast_cache.load(source_path, SOURCE_CODE) is None
+    main(SOURCE_CODE, source_path=source_path, ast_cache=ast_cache)
+    assert capsys.readouterr().out == '0.0\none\n4.0\n'
+    assert ast_cache.load(source_path, SOURCE_CODE) is not None
+
+
+class _Payload:
+    def __reduce__(self):
+        return print, ('The cache file ran code.',)
+
+
+def test_cache_files_are_never_unpickled(capsys, source_path):
+    ast_cache = AstCache()
+    cache_path = ast_cache.get_cache_path(source_path)
+    cache_path.parent.mkdir()
+    cache_path.write_bytes(_header(SOURCE_CODE, True) + zlib.compress(pickle.dumps(_Payload())))
+    assert ast_cache.load(source_path, SOURCE_CODE) is None
+    assert capsys.readouterr().out == ''
+
+
+def test_cache_directory_holds_the_files_of_every_source(tmp_path):
+    ast_cache = AstCache(tmp_path / 'cache')
+    paths = [tmp_path / 'a' / 'program.moji', tmp_path / 'b' / 'program.moji']
+    for path in paths:
+        ast_cache.store(path, SOURCE_CODE, parse(SOURCE_CODE))
+    cache_paths = {ast_cache.get_cache_path(path) for path in paths}
+    assert len(cache_paths) == 2
+    assert all(path.parent == tmp_path / 'cache' and path.exists() for path in cache_paths)
+
+
+def test_unwritable_cache_is_skipped(tmp_path, source_path):
+    blocking_file = tmp_path / 'cache'
+    blocking_file.write_text('')
+    assert not AstCache(blocking_file).store(source_path, SOURCE_CODE, parse(SOURCE_CODE))
+    assert set(tmp_path.iterdir()) == {blocking_file, source_path}
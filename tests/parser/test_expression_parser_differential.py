@@ -0,0 +1,123 @@
+import random
+
+import pytest
+
+from mojilang.lexer import SyntaxException
+from mojilang.parser import Parser
+from mojilang.parser.nodes import AdditionNode, FunctionCallNode, SubtractionNode
+from tests.e2e.utils.run_interpreter import scan_program
+
+OPERATORS = ['➕', '➖', '✖', '➗', '🍕', '🥕', 'and', 'or', '🤝', '🙅🤝', '👇', '☝🤝', '<', '>=']
+LOW_PRECEDENCE_OPERATORS = {'and', 'or', '🤝', '🙅🤝', '👇', '☝🤝', '<', '>='}
+OPERANDS = ['x', '1', '2.5', '"s"', '😤', '😔']
+
+
+def _attributes(node):
+    """The attributes of a node, the nodes keep them in the __slots__ of their classes."""
+    return {name: getattr(node, name) for cls in type(node).__mro__ for name in cls.__dict__.get('__slots__', ())}
+
+
+def _describe(node):
+    """Describes a tree of nodes as nested tuples so trees built by different parsers can be compared."""
+    if isinstance(node, list):
+        return [_describe(item) for item in node]
+    if type(node).__module__.startswith('mojilang'):
+        return type(node).__name__, {name: _describe(value) for name, value in sorted(_attributes(node).items())}
+    return node
+
+
+def _parse(source_code, expression_parser):
+    return _describe(Parser(scan_program(source_code), expression_parser).parse())
+
+
+def _random_expression(generator, depth=0, allow_not=True):
+    """
+    Generates a random expression. The recursive parser drops everything left of a '🙅' following an
+    operator of higher precedence than '🙅', so those expressions are not generated.
+    """
+    roll = generator.random()
+    if depth > 3 or roll < 0.3:
+        return generator.choice(OPERANDS)
+    if roll < 0.45:
+        return f'({_random_expression(generator, depth + 1)})'
+    if roll < 0.55 and allow_not:
+        return f'🙅 {_random_expression(generator, depth + 1)}'
+    if roll < 0.65:
+        return f'👀 f({_random_expression(generator, depth + 1)})'
+    operator = generator.choice(OPERATORS)
+    left = _random_expression(generator, depth + 1, allow_not)
+    right = _random_expression(generator, depth + 1, operator in LOW_PRECEDENCE_OPERATORS)
+    return f'{left} {operator} {right}'
+
+
+def _random_programs(count, seed=2024):
+    generator = random.Random(seed)
+    for _ in range(count):
+        expressions = [_random_expression(generator) for _ in range(4)]
+        source_code = (f'🥸 z ✍️ {expressions[0]};\n🗣️ {expressions[1]};\n'
+                       f'🤔 {expressions[2]} {{\n  x ✍️ {expressions[3]};\n}}')
+        # Spreading expressions over several lines checks the line numbers of the nodes too.
+        yield ''.join('\n' if character == ' ' and generator.random() < 0.15 else character
+                      for character in source_code)
+
+
+def test_pratt_parser_builds_the_same_trees_as_the_recursive_parser():
+    compared = 0
+    for source_code in _random_programs(1500):
+        try:
+            expected = _parse(source_code, Parser.RECURSIVE_EXPRESSION_PARSER)
+        except SyntaxException:
+            # e.g. the recursive parser cannot parse nested parentheses in function call arguments
+            continue
+        assert _parse(source_code, Parser.PRATT_EXPRESSION_PARSER) == expected, source_code
+        compared += 1
+    assert compared > 500
+
+
+@pytest.mark.parametrize('source_code', [
+    '🗣️ 1 ➖ 2 ➕ 3;',
+    '🗣️ 🙅 x ➕ 1 🤝 2 and 😤;',
+    '🗣️ ((1 ➕ 2)) ✖ (3);',
+    '🗣️ 👀 f(1, 2 ✖ 3) ➕ 👀 g();',
+    '🗣️ 2 🥕 3 🥕 2;',
+])
+def test_pratt_parser_matches_recursive_parser_examples(source_code):
+    assert _parse(source_code, Parser.PRATT_EXPRESSION_PARSER) == _parse(
+        source_code, Parser.RECURSIVE_EXPRESSION_PARSER)
+
+
+def test_pratt_parser_groups_same_level_operators_to_the_right():
+    ast = Parser(scan_program('🗣️ 1 ➖ 2 ➕ 3;')).parse()
+    subtraction = ast.get_nodes()[0].get_node_to_print()
+    assert isinstance(subtraction, SubtractionNode)
+    assert isinstance(subtraction.get_right_operand(), AdditionNode)
+
+
+def test_pratt_parser_parses_nested_function_call_arguments():
+    ast = Parser(scan_program('🗣️ 👀 f((1 ➕ 2), 👀 g(3));')).parse()
+    function_call = ast.get_nodes()[0].get_node_to_print()
+    assert isinstance(function_call, FunctionCallNode)
+    assert len(function_call.get_arguments()) == 2
+
+
+def test_pratt_parser_parses_long_expressions_without_recursing():
+    terms = 10_000
+    ast = Parser(scan_program('🗣️ ' + ' ➕ '.join(['1'] * terms) + ';')).parse()
+    assert isinstance(ast.get_nodes()[0].get_node_to_print(), AdditionNode)
+
+
+@pytest.mark.parametrize('source_code', [
+    '🗣️ 1 ➕;',
+    '🗣️ ➕ 1;',
+    '🗣️ (1 ➕ 2;',
+    '🗣️ 1 ➕ 2);',
+    '🗣️ 1 2;',
+])
+def test_pratt_parser_rejects_invalid_expressions(source_code):
+    with pytest.raises(SyntaxException):
+        Parser(scan_program(source_code)).parse()
+
+
+def test_unknown_expression_parser_is_rejected():
+    with pytest.raises(ValueError):
+        Parser(scan_program('🗣️ 1;'), expression_parser='unknown')
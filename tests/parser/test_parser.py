@@ -1,3 +1,4 @@
+import io
 import pytest
 from mojilang.lexer import Lexer, SyntaxException
 from mojilang.parser import Parser
@@ -6,6 +7,8 @@ from mojilang.parser.nodes import (
     AssignmentNode,
     AndNode,
     BlockNode,
+    ElseIfNode,
+    IfNode,
     PrintNode,
     VariableNode,
     MultiplicationNode
@@ -79,6 +82,24 @@ def test_print_statement(lexer):
     assert print_node.get_node_to_print().get_name() == "isTrueAnd"
 
 
+@pytest.mark.parametrize('source_code, conditional_count, block_count', [
+    ("🤔 (😤) { 🗣️ 1; }", 1, 1),
+    ("🤔 (😤) { 🗣️ 1; } 💅 { 🗣️ 2; }", 1, 2),
+    ("🤔 (😤) { 🗣️ 1; } 🙈 (😔) { 🗣️ 2; } 🙈 (😔) { } 💅 { 🗣️ 3; }", 3, 4),
+])
+def test_conditional_chain(lexer, source_code, conditional_count, block_count):
+    if_node = Parser(lexer(source_code)).parse().get_nodes()[0]
+
+    conditional_nodes = if_node.get_conditional_nodes()
+    assert isinstance(conditional_nodes[0], IfNode)
+    assert all(isinstance(node, ElseIfNode) for node in conditional_nodes[1:])
+    assert len(conditional_nodes) == conditional_count
+    block_nodes = if_node.get_branch_block_nodes()
+    assert all(isinstance(node, BlockNode) for node in block_nodes)
+    assert len(block_nodes) == block_count
+    assert block_nodes[0] is if_node.get_block_node()
+
+
 def test_invalid_syntax(lexer):
     source_code = "🥸 variable ✍️ ;"
     tokens = lexer(source_code)
@@ -86,3 +107,15 @@ def test_invalid_syntax(lexer):
 
     with pytest.raises(SyntaxException):
         parser.parse()
+
+
+def test_parser_starts_before_lexing_finishes():
+    class FailingStream(io.StringIO):
+        def read(self, size=-1):
+            if self.tell() > 64:
+                raise AssertionError('The parser waited for the rest of the source code.')
+            return super().read(size)
+
+    source_code = "🥸 x ✍️ ;\n" + "🥸 y ✍️ 1;\n" * 1000
+    with pytest.raises(SyntaxException):
+        Parser(Lexer().iter_tokens(FailingStream(source_code), chunk_size=16)).parse()
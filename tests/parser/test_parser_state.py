@@ -0,0 +1,34 @@
+import pytest
+from mojilang.lexer import SyntaxException
+from mojilang.parser import Parser
+from mojilang.parser.parser_state import ParserState, NO_MATCHING_PARENTHESIS
+from tests.e2e.utils.run_interpreter import scan_program
+
+
+def test_matching_parentheses_are_indexed():
+    # Token indices:     0  1 2  3 4 5 6 7 8 9 10
+    state = ParserState(scan_program('🗣️ ((1 ➕ 2) ✖️ 3);'))
+    assert state.matching_parenthesis_index(1) == 9
+    assert state.matching_parenthesis_index(9) == 1
+    assert state.matching_parenthesis_index(2) == 6
+    assert state.matching_parenthesis_index(6) == 2
+    assert state.matching_parenthesis_index(3) == NO_MATCHING_PARENTHESIS
+    state.validate_parentheses()
+
+
+def test_matching_parentheses_are_indexed_when_streamed():
+    source_code = '🗣️ (1 ➕\n' + '(2 ➕ ' * 50 + '3' + ')' * 50 + ');\n🗣️ 1;'
+    expected = ParserState(scan_program(source_code))
+    streamed = ParserState(iter(scan_program(source_code)))
+    assert streamed.matching_parenthesis_index(1) == expected.matching_parenthesis_index(1)
+    assert streamed.matching_parenthesis_index(4) == expected.matching_parenthesis_index(4)
+
+
+def test_unbalanced_parentheses_are_reported_before_parsing():
+    source_code = '🥸 x ✍️ ;\n🗣️ 1 ➕ 2);\n🗣️ 1;\n🗣️ (3;\n🗣️ (1;'
+    with pytest.raises(SyntaxException) as exception:
+        Parser(scan_program(source_code)).parse()
+    assert str(exception.value) == (
+        "Syntax error at line 2: Unbalanced parentheses: unmatched ')' on line 2, "
+        "unmatched '(' on line 4, unmatched '(' on line 5."
+    )
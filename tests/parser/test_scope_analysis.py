@@ -0,0 +1,47 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.interpreter.scope import ScopeContext
+from tests.e2e.utils.run_interpreter import parse_program
+
+
+@pytest.mark.parametrize('block, scope_free', [
+    ("🗣️ x ➕ 1;", True),
+    ("🤔 x { 💥; } 💅 { 🫡 x; }", True),
+    ("🔁 (😔) { 🥸 y ✍️ 1; }", True),
+    ("🥸 y ✍️ 1;", False),
+    ("🛠 f() { 🫡 1; }", False),
+    ("x ✍️ 1;", False),
+    ("🤔 😤 { x ✍️ 1; }", False),
+    ("🔁 (😔) { 🤔 😤 { 🤓; } 💅 { x ✍️ 1; } }", False),
+    ("🗣️ 👀 f();", True),
+])
+def test_blocks_declaring_or_reassigning_nothing_are_scope_free(block, scope_free):
+    conditional = parse_program(f"🤔 😤 {{ {block} }}").get_nodes()[0]
+    assert conditional.get_block_node().is_scope_free() == scope_free
+
+
+def test_scope_free_conditional_creates_no_scope(monkeypatch, capsys):
+    created = []
+    create_new_scope_context = ScopeContext.create_new_scope_context
+
+    def counting(self, block_scope):
+        created.append(block_scope)
+        return create_new_scope_context(self, block_scope)
+    monkeypatch.setattr(ScopeContext, 'create_new_scope_context', counting)
+
+    source_code = "🥸 i ✍️ 0;\n🔁 (i 👇 10) { i ✍️ i ➕ 1; 🤔 i 🍕 2 🤝 0 { 🤓; } 💅 { 🗣️ i; } }"
+    Interpreter(parse_program(source_code)).execute()
+    assert capsys.readouterr().out == '1.0\n3.0\n5.0\n7.0\n9.0\n'
+    assert len(created) == 1
+
+
+@pytest.mark.parametrize('source_code, expected', [
+    # A reassignment directly in a conditional of a function finds the variables of the callers.
+    ("🛠 f() { 🤔 😤 { y ✍️ 2; } }\n🛠 g() { 🥸 y ✍️ 1; 👀 f(); 🫡 y; }\n🗣️ 👀 g();", '2.0\n'),
+    # A variable found two scopes up also reassigns the global of the same name.
+    ("🥸 y ✍️ 0;\n🛠 f(🥸 y) { 🔁 (y 👇 1) { 🤔 😤 { y ✍️ 2; } } 🫡 y; }\n🗣️ 👀 f(0);\n🗣️ y;", '2.0\n2.0\n'),
+    ("🥸 y ✍️ 0;\n🛠 f(🥸 y) { 🤔 😤 { 🤔 😤 { y ✍️ 2; } } 🫡 y; }\n🗣️ 👀 f(0);\n🗣️ y;", '2.0\n2.0\n'),
+])
+def test_conditional_scope_is_kept_when_observable(capsys, source_code, expected):
+    Interpreter(parse_program(source_code)).execute()
+    assert capsys.readouterr().out == expected
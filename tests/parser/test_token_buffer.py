@@ -0,0 +1,40 @@
+from mojilang.lexer import TokenType
+from mojilang.parser.parser_state import ParserState
+from mojilang.parser.token_buffer import TokenBuffer, TOKEN_TYPE_CODES
+from tests.e2e.utils.run_interpreter import scan_program
+
+
+def _describe(token):
+    return token.get_token_type(), token.get_lexeme(), token.get_literal(), token.get_line()
+
+
+def test_token_buffer_round_tripsscan_program():
+    tokens = scan_program('🥸 x ✍️ 1.5;\n🗣️ "hi" ➕ x;')
+    buffer = TokenBuffer(tokens)
+    assert len(buffer) == len(tokens)
+    assert [_describe(buffer.get_token(index)) for index in range(len(buffer))] == [_describe(t) for t in tokens]
+    assert buffer.get_token_type(3) == TokenType.NUMBER
+    assert buffer.get_literal(3) == 1.5
+    assert buffer.get_lexeme(1) == 'x'
+    assert buffer.get_line(6) == 2
+    assert list(buffer.get_type_codes(0, 2)) == [TOKEN_TYPE_CODES[TokenType.VAR], TOKEN_TYPE_CODES[TokenType.IDENTIFIER]]
+
+
+def test_token_buffer_release_shifts_indices():
+    buffer = TokenBuffer(scan_program('🥸 x ✍️ 1;'))
+    buffer.release(2)
+    assert len(buffer) == 4
+    assert buffer.get_token_type(0) == TokenType.EQUAL
+
+
+def test_parser_state_reads_columns_withoutscan_program():
+    state = ParserState(scan_program('🥸 x ✍️ (1 ➕ 2);'))
+    assert state.current_token_type() == TokenType.VAR
+    assert state.lexeme_at(1) == 'x'
+    assert state.literal_at(4) == 1.0
+    assert state.line_at(4) == 1
+    assert list(state.type_codes_between(3, 7)) == [
+        TOKEN_TYPE_CODES[token_type] for token_type in (
+            TokenType.LEFT_PAREN, TokenType.NUMBER, TokenType.PLUS, TokenType.NUMBER, TokenType.RIGHT_PAREN
+        )
+    ]
@@ -0,0 +1,117 @@
+import pytest
+from mojilang import Interpreter
+from mojilang.vm import BytecodeCompiler, Function, Opcode, VirtualMachine
+from tests.e2e.utils.run_interpreter import parse_program, run_program
+
+
+def test_program_is_compiled_to_bytecode(capsys):
+    code_object = BytecodeCompiler().compile(parse_program("🥸 x ✍️ 1 ➕ 2;\n🗣️ x ✖️ 3;"))
+    assert code_object.disassemble().splitlines() == [
+        '0 LOAD_CONST 1.0',
+        '1 BINARY_CONST ADD 2.0',
+        "2 DECLARE_GLOBAL ('x', 1)",
+        "3 GLOBAL_BINARY_CONST 'x' MULTIPLY 3.0",
+        '4 PRINT',
+        '5 SET_VALUE None',
+        '6 RETURN',
+    ]
+    VirtualMachine().run(code_object)
+    assert capsys.readouterr().out == '9.0\n'
+
+
+def test_loop_condition_is_a_single_jump():
+    code_object = BytecodeCompiler().compile(parse_program("🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; }"))
+    assert [opcode for opcode, _ in code_object.instructions] == [
+        Opcode.LOAD_CONST, Opcode.DECLARE_GLOBAL, Opcode.SET_VALUE, Opcode.JUMP_IF_NOT_GLOBAL_CONST,
+        Opcode.UPDATE_GLOBAL, Opcode.SET_VALUE_AND_JUMP, Opcode.RETURN,
+    ]
+
+
+def test_function_loop_runs_merged_local_instructions():
+    code_object = BytecodeCompiler().compile(parse_program(
+        "🛠 f() { 🥸 i ✍️ 0; 🔁 (i 👇 3) { i ✍️ i ➕ 1; } 🫡 i; }"
+    ))
+    function = code_object.instructions[0][1]
+    assert [opcode for opcode, _ in function.code_object.instructions] == [
+        Opcode.LOAD_CONST, Opcode.STORE_LOCAL, Opcode.SET_VALUE, Opcode.JUMP_IF_NOT_LOCAL_CONST, Opcode.UPDATE_LOCAL,
+        Opcode.SET_VALUE_AND_JUMP, Opcode.RETURN_IF_MARKER, Opcode.LOAD_LOCAL, Opcode.STORE_VALUE,
+        Opcode.RETURN_IF_MARKER, Opcode.RETURN,
+    ]
+
+
+def test_function_locals_are_slots():
+    code_object = BytecodeCompiler().compile(parse_program("🛠 f(🥸 n) { 🥸 m ✍️ n ➕ 1; 🫡 m; }"))
+    function = code_object.instructions[0][1]
+    assert isinstance(function, Function)
+    assert function.get_function_name() == 'f'
+    assert function.code_object.slot_count == 2
+    assert [opcode for opcode, _ in function.code_object.instructions] == [
+        Opcode.LOAD_PARAMETER, Opcode.BINARY_CONST, Opcode.STORE_LOCAL, Opcode.LOAD_LOCAL, Opcode.STORE_VALUE,
+        Opcode.RETURN_IF_MARKER, Opcode.RETURN,
+    ]
+
+
+def test_global_variables_are_shared_between_runs(capsys):
+    global_variables = {}
+    VirtualMachine(global_variables).run(BytecodeCompiler().compile(parse_program("🥸 x ✍️ 4;")))
+    VirtualMachine(global_variables).run(BytecodeCompiler().compile(parse_program("🗣️ x;")))
+    assert capsys.readouterr().out == '4.0\n'
+
+
+def test_deep_recursion_does_not_use_the_python_stack(capsys):
+    source_code = (
+        "🛠 count(🥸 n) { 🤔 n 🤝 0 { 🫡 0; } 💅 { 🫡 1 ➕ 👀 count(n ➖ 1); } }\n"
+        "🗣️ 👀 count(5000);"
+    )
+    assert run_program(parse_program(source_code), capsys, Interpreter.VM_BACKEND) == ('5000.0\n', None)
+
+
+def test_deep_recursion_takes_linear_time(capsys):
+    # The function looks itself up in the globals rather than in each of the calling frames.
+    source_code = (
+        "🛠 count(🥸 n) { 🤔 n 🤝 0 { 🫡 0; } 💅 { 🫡 1 ➕ 👀 count(n ➖ 1); } }\n"
+        "🗣️ 👀 count(100000);"
+    )
+    assert run_program(parse_program(source_code), capsys, Interpreter.VM_BACKEND) == ('100000.0\n', None)
+
+
+def test_only_the_names_declared_at_calls_are_looked_up_in_the_calling_frames():
+    code_object = BytecodeCompiler().compile(parse_program(
+        "🛠 f(🥸 n) { 🫡 n; }\n🛠 g(🥸 m) { 🥸 k ✍️ m; 🫡 👀 f(k); }\n🥸 x ✍️ 1;\n🗣️ 👀 g(x);"
+    ))
+    assert code_object.outer_names == {'m', 'k'}
+
+
+@pytest.mark.parametrize('source_code', [
+    # A return only ends the block it is in.
+    "🛠 f(🥸 n) { 🤔 n ☝️ 1 { 🫡 1; } 🗣️ n; 🫡 2; }\n🗣️ 👀 f(5);",
+    "🛠 f(🥸 n) { 🤔 n ☝️ 1 { 🫡 1; } 💅 { 🫡 2; } }\n🗣️ 👀 f(5);\n🗣️ 👀 f(0);",
+    # A break in a function called within a loop ends that loop.
+    "🛠 stop() { 💥; }\n🥸 i ✍️ 0;\n🔁 (i 👇 3) { i ✍️ i ➕ 1; 👀 stop(); 🗣️ i; }\n🗣️ i;",
+    "💥;\n🗣️ 1;\n🛠 f() { 💥; 🫡 2; }\n🗣️ 👀 f();",
+    # Scopes are dynamic, a function sees the variables of its callers.
+    "🛠 f() { 🫡 y; }\n🛠 g() { 🥸 y ✍️ 3; 🫡 👀 f(); }\n🗣️ 👀 g();",
+    "🛠 f() { y ✍️ y ➕ 1; }\n🛠 g() { 🥸 y ✍️ 3; 👀 f(); 🫡 y; }\n🗣️ 👀 g();",
+    "🛠 f() { 🫡 1; }\n🛠 h() { 🫡 👀 f(); }\n🛠 g() { 🛠 f() { 🫡 2; } 🫡 👀 h(); }\n🗣️ 👀 g();\n🗣️ 👀 h();",
+    "🥸 x ✍️ 1;\n🛠 f() { x ✍️ x ➕ 1; }\n🛠 g(🥸 y) { 👀 f(); }\n👀 g(1);\n🗣️ x;",
+    # An argument the call does not pass is looked up like any other variable.
+    "🥸 n ✍️ 7;\n🛠 f(🥸 n) { 🫡 n; }\n🗣️ 👀 f();",
+    "🛠 f(🥸 n) { 🥸 n ✍️ 2; 🫡 n; }\n🗣️ 👀 f();\n🗣️ 👀 f(1);",
+    # A reassignment two blocks deep also reassigns the global of the same name.
+    "🥸 x ✍️ 1;\n🛠 f() { 🥸 x ✍️ 5; 🤔 😤 { 🤔 😤 { x ✍️ 9; } } 🫡 x; }\n🗣️ 👀 f();\n🗣️ x;",
+    "🥸 i ✍️ 2;\n🔁 (i ☝️ 0) { 🥸 j ✍️ i ✖️ 2; 🗣️ j; i ✍️ i ➖ 1; }",
+    # A load is not merged with an operation a jump lands on.
+    "🥸 a ✍️ 3;\n🥸 b ✍️ 10;\n🗣️ (a or b) ➕ 1;\n🗣️ (b 🤝 1 and a) ➕ 1;",
+    "🛠 f(🥸 n) { 🥸 m ✍️ n; 🔁 (m ☝️ 0) { 🤔 (m 🍕 2 🤝 0) { m ✍️ m ➖ 1; 🤓; } m ✍️ m ➖ 3; } 🫡 m; }\n🗣️ 👀 f(9);",
+    "🥸 x ✍️ 1;\n🤔 😤 { 🥸 x ✍️ 2; }",
+    "🛠 f() { 🥸 x ✍️ 1; 🥸 x ✍️ 2; }\n👀 f();",
+    "🛠 f() { x ✍️ 1; }\n👀 f();",
+    "🗣️ 1 ➗ 0;",
+    "🗣️ y;",
+    "🗣️ 👀 missing();",
+    "🥸 x ✍️ 1;\n🗣️ 👀 x();",
+    "🗣️ 1 ➕ \"s\";",
+])
+def test_vm_program_matches_tree_walker(capsys, source_code):
+    expected = run_program(parse_program(source_code), capsys, Interpreter.TREE_WALKER_BACKEND)
+    assert run_program(parse_program(source_code), capsys, Interpreter.VM_BACKEND) == expected